@@ -56,6 +56,7 @@ def scenario_plan_expectation(  # noqa: PLR0913
 
 
 INDEX_RELATION_NAMES: Mapping[str, str] = {
+    "articles__article_analytics_totals_model_pkey": "articles__article_analytics_totals_model",
     "articles__article_folder_model_pkey": "articles__article_folder_model",
     "articles__tag_model_pkey": "articles__tag_model",
     "articles_article_publish_status_published_updated_idx": "articles__article_model",
@@ -72,6 +73,9 @@ INDEX_RELATION_NAMES: Mapping[str, str] = {
     "cm_external_resource_name_en_trgm_idx": "competency_matrix__external_resource_model",
     "cm_external_resource_name_ru_trgm_idx": "competency_matrix__external_resource_model",
     "cm_external_resource_url_trgm_idx": "competency_matrix__external_resource_model",
+    "cm_published_item_sheet_key_order_idx": (
+        "competency_matrix__competency_matrix_published_item_model"
+    ),
     "cm_queued_question_fifo_idx": "competency_matrix__queued_question_model",
     "cm_queued_question_fingerprint_idx": "competency_matrix__queued_question_model",
     "cmi_question_en_fingerprint_idx": "competency_matrix__competency_matrix_item_model",
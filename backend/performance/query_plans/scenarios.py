@@ -22,7 +22,15 @@ from core.agent_access.schemas import (
     MatrixQuestionDraftCompletion,
 )
 from core.articles.enums import ArticleReactionKind, ArticleViewSourceCategory
-from core.articles.schemas import Article, ArticleFilters, ArticleFolder, ArticleMetadata, Tag, Tags
+from core.articles.schemas import (
+    Article,
+    ArticleDailyCounterIncrement,
+    ArticleFilters,
+    ArticleFolder,
+    ArticleMetadata,
+    Tag,
+    Tags,
+)
 from core.auth.enums import AuthSessionAuthMethodEnum, AuthSessionDeviceTypeEnum, RoleEnum
 from core.auth.schemas import AuthSessionClientMetadata, AuthSessionCreate
 from core.auth.types import SessionSecretHash
@@ -494,6 +502,13 @@ async def run_get_article_by_slug(session: AsyncSession) -> None:
     )
 
 
+async def run_list_published_articles_after(session: AsyncSession) -> None:
+    await ArticlesDatabaseStorage(session=session).list_published_articles_after(
+        after_slug="article-100",
+        limit=50,
+    )
+
+
 async def run_list_articles_en_full_text_tag_date(session: AsyncSession) -> None:
     await ArticlesDatabaseStorage(session=session).list_articles(
         filters=ArticleFilters(
@@ -664,19 +679,24 @@ async def run_delete_tag(session: AsyncSession) -> None:
     await ArticlesDatabaseStorage(session=session).delete_tag(tag_id=DELETABLE_TAG_ID)
 
 
-async def run_increment_view(session: AsyncSession) -> None:
-    await ArticleAnalyticsDatabaseStorage(session=session).increment_view(
-        article_id=article_id(100),
-        source_category=ArticleViewSourceCategory.DIRECT,
-        viewed_on=SEED_NOW.date(),
-    )
-
-
-async def run_increment_engaged_view(session: AsyncSession) -> None:
-    await ArticleAnalyticsDatabaseStorage(session=session).increment_engaged_view(
-        article_id=article_id(100),
-        source_category=ArticleViewSourceCategory.SEARCH,
-        viewed_on=SEED_NOW.date(),
+async def run_add_daily_counters(session: AsyncSession) -> None:
+    await ArticleAnalyticsDatabaseStorage(session=session).add_daily_counters(
+        increments=[
+            ArticleDailyCounterIncrement(
+                article_id=article_id(100),
+                date=SEED_NOW.date(),
+                source_category=ArticleViewSourceCategory.DIRECT,
+                view_count=3,
+                engaged_view_count=0,
+            ),
+            ArticleDailyCounterIncrement(
+                article_id=article_id(200),
+                date=SEED_NOW.date(),
+                source_category=ArticleViewSourceCategory.SEARCH,
+                view_count=2,
+                engaged_view_count=1,
+            ),
+        ],
     )
 
 
@@ -692,6 +712,10 @@ async def run_get_reaction_counts(session: AsyncSession) -> None:
     )
 
 
+async def run_rebuild_totals(session: AsyncSession) -> None:
+    await ArticleAnalyticsDatabaseStorage(session=session).rebuild_totals()
+
+
 async def run_set_reaction(session: AsyncSession) -> None:
     await ArticleAnalyticsDatabaseStorage(session=session).set_reaction(
         article_id=article_id(100),
@@ -807,6 +831,29 @@ async def run_list_competency_matrix_workspace_items(session: AsyncSession) -> N
     )
 
 
+async def run_list_competency_matrix_workspace_page(session: AsyncSession) -> None:
+    await CompetencyMatrixDatabaseStorage(session=session).list_competency_matrix_workspace_page(
+        filters=CompetencyMatrixWorkspaceFilters(
+            page=2,
+            page_size=20,
+            language=LanguageEnum.EN,
+            sort=CompetencyMatrixWorkspaceSortEnum.INTERVIEW_FREQUENCY,
+            search_query=None,
+            sheet_keys=("python",),
+            grades=(GradeEnum.JUNIOR,),
+            interview_frequencies=(InterviewFrequencyEnum.OFTEN,),
+            section_ids=(PYTHON_SECTION_ID,),
+            subsection_ids=(PYTHON_SUBSECTION_ID,),
+            sections=(),
+            subsections=(),
+            publish_statuses=(PublishStatusEnum.PUBLISHED,),
+            published_from=None,
+            published_to=None,
+            has_missing_fields=None,
+        ),
+    )
+
+
 async def run_list_competency_matrix_workspace_filter_options(session: AsyncSession) -> None:
     await CompetencyMatrixDatabaseStorage(
         session=session,
@@ -2892,6 +2939,16 @@ STORAGE_SCENARIOS = (
         allow_seq_scan_reason=None,
         run=run_get_article_by_slug,
     ),
+    scenario(
+        name="articles_published_keyset_chunk",
+        storage_class="ArticlesDatabaseStorage",
+        method_name="list_published_articles_after",
+        group=QueryThresholdGroup.LIST_READ,
+        expected_index_names=(),
+        forbidden_seq_scan_relations=("articles__article_model",),
+        allow_seq_scan_reason=None,
+        run=run_list_published_articles_after,
+    ),
     scenario(
         name="articles_list_en_full_text_tag_date",
         storage_class="ArticlesDatabaseStorage",
@@ -3152,32 +3209,22 @@ STORAGE_SCENARIOS = (
         run=run_delete_tag,
     ),
     scenario(
-        name="article_analytics_increment_view",
-        storage_class="ArticleAnalyticsDatabaseStorage",
-        method_name="increment_view",
-        group=QueryThresholdGroup.SMALL_WRITE,
-        expected_index_names=(),
-        forbidden_seq_scan_relations=(),
-        allow_seq_scan_reason=None,
-        run=run_increment_view,
-    ),
-    scenario(
-        name="article_analytics_increment_engaged_view",
+        name="article_analytics_add_daily_counters",
         storage_class="ArticleAnalyticsDatabaseStorage",
-        method_name="increment_engaged_view",
+        method_name="add_daily_counters",
         group=QueryThresholdGroup.SMALL_WRITE,
         expected_index_names=(),
         forbidden_seq_scan_relations=(),
         allow_seq_scan_reason=None,
-        run=run_increment_engaged_view,
+        run=run_add_daily_counters,
     ),
     scenario(
         name="article_analytics_public_stats",
         storage_class="ArticleAnalyticsDatabaseStorage",
         method_name="get_public_stats",
-        group=QueryThresholdGroup.AGGREGATE,
-        expected_index_names=(),
-        forbidden_seq_scan_relations=(),
+        group=QueryThresholdGroup.POINT_READ,
+        expected_index_names=("articles__article_analytics_totals_model_pkey",),
+        forbidden_seq_scan_relations=("articles__article_analytics_totals_model",),
         allow_seq_scan_reason=None,
         run=run_get_public_stats,
     ),
@@ -3185,12 +3232,24 @@ STORAGE_SCENARIOS = (
         name="article_analytics_reaction_counts",
         storage_class="ArticleAnalyticsDatabaseStorage",
         method_name="get_reaction_counts",
-        group=QueryThresholdGroup.AGGREGATE,
-        expected_index_names=(),
-        forbidden_seq_scan_relations=(),
+        group=QueryThresholdGroup.POINT_READ,
+        expected_index_names=("articles__article_analytics_totals_model_pkey",),
+        forbidden_seq_scan_relations=("articles__article_analytics_totals_model",),
         allow_seq_scan_reason=None,
         run=run_get_reaction_counts,
     ),
+    scenario(
+        name="article_analytics_rebuild_totals",
+        storage_class="ArticleAnalyticsDatabaseStorage",
+        method_name="rebuild_totals",
+        group=QueryThresholdGroup.HEAVY,
+        expected_index_names=(),
+        forbidden_seq_scan_relations=(),
+        allow_seq_scan_reason=(
+            "repair command recomputes totals from every analytics and reaction row"
+        ),
+        run=run_rebuild_totals,
+    ),
     scenario(
         name="article_analytics_set_reaction",
         storage_class="ArticleAnalyticsDatabaseStorage",
@@ -3305,13 +3364,10 @@ STORAGE_SCENARIOS = (
         name="matrix_list_items",
         storage_class="CompetencyMatrixDatabaseStorage",
         method_name="list_competency_matrix_items",
-        group=QueryThresholdGroup.HEAVY,
-        expected_index_names=(),
-        forbidden_seq_scan_relations=(),
-        allow_seq_scan_reason=(
-            "public sheet matrix listing reads a large published slice and sorts by normalized "
-            "structure"
-        ),
+        group=QueryThresholdGroup.LIST_READ,
+        expected_index_names=("cm_published_item_sheet_key_order_idx",),
+        forbidden_seq_scan_relations=("competency_matrix__competency_matrix_published_item_model",),
+        allow_seq_scan_reason=None,
         run=run_list_competency_matrix_items,
     ),
     scenario(
@@ -3324,6 +3380,16 @@ STORAGE_SCENARIOS = (
         allow_seq_scan_reason=None,
         run=run_list_competency_matrix_workspace_items,
     ),
+    scenario(
+        name="matrix_workspace_page",
+        storage_class="CompetencyMatrixDatabaseStorage",
+        method_name="list_competency_matrix_workspace_page",
+        group=QueryThresholdGroup.HEAVY,
+        expected_index_names=(),
+        forbidden_seq_scan_relations=(),
+        allow_seq_scan_reason=None,
+        run=run_list_competency_matrix_workspace_page,
+    ),
     scenario(
         name="matrix_workspace_filter_options",
         storage_class="CompetencyMatrixDatabaseStorage",
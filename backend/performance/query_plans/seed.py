@@ -37,6 +37,7 @@ from infra.postgresql.models import (
     AgentCertificateModel,
     AgentCertificateRotationModel,
     AgentClientModel,
+    ArticleAnalyticsTotalsModel,
     ArticleDailyAnalyticsModel,
     ArticleFileUsageModel,
     ArticleFolderModel,
@@ -45,6 +46,7 @@ from infra.postgresql.models import (
     ArticleToTagSecondaryModel,
     AuthSessionModel,
     CompetencyMatrixItemModel,
+    CompetencyMatrixPublishedItemModel,
     CompetencyMatrixSectionModel,
     CompetencyMatrixSheetModel,
     CompetencyMatrixSubsectionModel,
@@ -68,6 +70,10 @@ from infra.postgresql.models import (
     UserModel,
 )
 from infra.postgresql.models.competency_matrix import ResourceToItemSecondaryModel
+from infra.postgresql.storages.articles import build_article_analytics_totals_rebuild
+from infra.postgresql.storages.competency_matrix import (
+    build_published_competency_matrix_items_refresh,
+)
 from performance.query_plans.models import QueryPlanProfile
 
 SEED_NOW = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)
@@ -113,11 +119,13 @@ QUERY_PLAN_SEEDED_MODELS = (
     KnowledgeItemModel,
     ResourceToItemSecondaryModel,
     QueuedQuestionModel,
+    CompetencyMatrixPublishedItemModel,
     CompetencyMatrixItemModel,
     CompetencyMatrixSubsectionModel,
     CompetencyMatrixSectionModel,
     CompetencyMatrixSheetModel,
     ExternalResourceModel,
+    ArticleAnalyticsTotalsModel,
     ArticleReactionModel,
     ArticleDailyAnalyticsModel,
     ArticleFileUsageModel,
@@ -185,6 +193,7 @@ async def seed_profile(*, connection: AsyncConnection, profile: QueryPlanProfile
     await insert_article_file_usage(connection=connection)
     await insert_article_analytics(connection=connection, profile=profile)
     await insert_article_reactions(connection=connection, profile=profile)
+    await insert_article_analytics_totals(connection=connection)
     await insert_resumes(connection=connection, profile=profile)
     await insert_knowledge_items(connection=connection, profile=profile)
     await insert_knowledge_dates(connection=connection, profile=profile)
@@ -198,6 +207,7 @@ async def seed_profile(*, connection: AsyncConnection, profile: QueryPlanProfile
     await insert_resources(connection=connection, profile=profile)
     await insert_competency_matrix_structure(connection=connection, profile=profile)
     await insert_competency_matrix_items(connection=connection, profile=profile)
+    await insert_published_competency_matrix_items(connection=connection)
     await insert_competency_matrix_resource_links(connection=connection, profile=profile)
     await insert_queued_competency_matrix_questions(connection=connection, profile=profile)
     await insert_agent_access_records(connection=connection, profile=profile)
@@ -623,6 +633,10 @@ async def insert_article_reactions(
     )
 
 
+async def insert_article_analytics_totals(*, connection: AsyncConnection) -> None:
+    await connection.execute(build_article_analytics_totals_rebuild())
+
+
 async def insert_resumes(*, connection: AsyncConnection, profile: QueryPlanProfile) -> None:
     series = generate_series_subquery(
         end=profile.cardinalities.resumes.resumes,
@@ -1401,6 +1415,10 @@ async def insert_competency_matrix_items(
     )
 
 
+async def insert_published_competency_matrix_items(*, connection: AsyncConnection) -> None:
+    await connection.execute(build_published_competency_matrix_items_refresh())
+
+
 async def insert_competency_matrix_resource_links(
     *,
     connection: AsyncConnection,
@@ -1638,6 +1656,7 @@ async def vacuum_analyze_seeded_tables(*, connection: AsyncConnection) -> None:
         "articles__article_to_tag_secondary_model",
         "articles__article_daily_analytics_model",
         "articles__article_reaction_model",
+        "articles__article_analytics_totals_model",
         "files__file_model",
         "resumes__resume_model",
         "knowledge__knowledge_item_model",
@@ -1652,6 +1671,7 @@ async def vacuum_analyze_seeded_tables(*, connection: AsyncConnection) -> None:
         "auth__auth_session_model",
         "competency_matrix__external_resource_model",
         "competency_matrix__competency_matrix_item_model",
+        "competency_matrix__competency_matrix_published_item_model",
         "competency_matrix__resource_to_item_secondary_model",
         "competency_matrix__queued_question_model",
         "agent_access__agent_client_model",
@@ -38,6 +38,9 @@ case "$action" in
     initbuckets)
         run_cli initbuckets
         ;;
+    rebuildarticlestats)
+        run_cli rebuildarticlestats
+        ;;
     taskiq-worker)
         PYTHONPATH=src uv run taskiq worker entrypoints.taskiq.worker:broker
         ;;
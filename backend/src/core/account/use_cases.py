@@ -26,7 +26,8 @@ from core.account.storages import ManagedAccountStorage
 from core.auth.enums import RoleEnum
 from core.auth.exceptions import UserNotFoundError
 from core.auth.password_hashers import PasswordHasher
-from core.auth.storages import AuthSessionStorage
+from core.auth.schemas import VerifiedAccessTokenInvalidation
+from core.auth.storages import AuthSessionStorage, VerifiedAccessTokenInvalidator
 
 
 @dataclass(kw_only=True, slots=True, frozen=True)
@@ -34,6 +35,7 @@ class AccountsUseCase:
     storage: ManagedAccountStorage
     hasher: PasswordHasher
     auth_session_storage: AuthSessionStorage
+    verified_token_invalidator: VerifiedAccessTokenInvalidator
 
     async def list_accounts(self, *, filters: ManagedAccountFilters) -> ManagedAccounts:
         accounts, total_count = await self.storage.list_managed_accounts(filters=filters)
@@ -86,6 +88,11 @@ class AccountsUseCase:
             username=params.target_username,
             session_id=params.target_session_id,
         )
+        await self.verified_token_invalidator.invalidate(
+            invalidation=VerifiedAccessTokenInvalidation.for_session(
+                session_id=params.target_session_id,
+            ),
+        )
         return ManagedAccountSessionRevocationResult(
             current_session_revoked=params.target_session_id == params.current_session_id,
         )
@@ -102,6 +109,7 @@ class AccountsUseCase:
             action=ManagedAccountActionEnum.MANAGE_SESSIONS,
         )
         await self.auth_session_storage.revoke_user_sessions(username=params.target_username)
+        await self._invalidate_verified_tokens(username=params.target_username)
         return ManagedAccountSessionRevocationResult(
             current_session_revoked=(
                 params.target_username.casefold() == params.current_username.casefold()
@@ -125,6 +133,7 @@ class AccountsUseCase:
             username=params.target_username,
             except_session_id=params.current_session_id,
         )
+        await self._invalidate_verified_tokens(username=params.target_username)
         return ManagedAccountSessionRevocationResult(current_session_revoked=False)
 
     async def create_account(
@@ -143,7 +152,9 @@ class AccountsUseCase:
         return await self.storage.create_managed_account(
             username=create_params.username,
             role=create_params.role,
-            password_hash=self.hasher.hash_password(create_params.password.get_secret_value()),
+            password_hash=await self.hasher.hash_password(
+                create_params.password.get_secret_value(),
+            ),
             is_active=create_params.is_active,
         )
 
@@ -158,10 +169,12 @@ class AccountsUseCase:
         target_account = await self.storage.get_managed_account(username=params.target_username)
         current_account = await self.storage.get_managed_account(username=params.current_username)
         current_account.ensure_can_update_account_role(target=target_account, role=role_params.role)
-        return await self.storage.update_managed_account_role(
+        account = await self.storage.update_managed_account_role(
             username=params.target_username,
             role=role_params.role,
         )
+        await self._invalidate_verified_tokens(username=params.target_username)
+        return account
 
     async def update_password(
         self,
@@ -177,9 +190,12 @@ class AccountsUseCase:
         )
         account = await self.storage.update_managed_account_password(
             username=params.target_username,
-            password_hash=self.hasher.hash_password(password_params.password.get_secret_value()),
+            password_hash=await self.hasher.hash_password(
+                password_params.password.get_secret_value(),
+            ),
         )
         await self.auth_session_storage.revoke_user_sessions(username=params.target_username)
+        await self._invalidate_verified_tokens(username=params.target_username)
         return account
 
     async def activate_account(
@@ -193,7 +209,9 @@ class AccountsUseCase:
             target=target_account,
             action=ManagedAccountActionEnum.ACTIVATE,
         )
-        return await self.storage.activate_managed_account(username=params.target_username)
+        account = await self.storage.activate_managed_account(username=params.target_username)
+        await self._invalidate_verified_tokens(username=params.target_username)
+        return account
 
     async def deactivate_account(
         self,
@@ -208,6 +226,7 @@ class AccountsUseCase:
         )
         account = await self.storage.deactivate_managed_account(username=params.target_username)
         await self.auth_session_storage.revoke_user_sessions(username=params.target_username)
+        await self._invalidate_verified_tokens(username=params.target_username)
         return account
 
     async def delete_account(self, *, params: ManagedAccountTargetOperationParams) -> None:
@@ -219,3 +238,9 @@ class AccountsUseCase:
         )
         await self.storage.delete_managed_account(username=params.target_username)
         await self.auth_session_storage.revoke_user_sessions(username=params.target_username)
+        await self._invalidate_verified_tokens(username=params.target_username)
+
+    async def _invalidate_verified_tokens(self, *, username: str) -> None:
+        await self.verified_token_invalidator.invalidate(
+            invalidation=VerifiedAccessTokenInvalidation.for_username(username=username),
+        )
@@ -65,7 +65,10 @@ from core.competency_matrix.schemas import (
     ExternalResources,
     NewExternalResourceAttachment,
 )
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.enums import PublishStatusEnum
 from core.generators import HexUuidIdGenerator
 
@@ -461,6 +464,7 @@ class AgentCertificateRotationUseCase:
 class MatrixAgentUseCase:
     storage: MatrixAgentStorage
     matrix_storage: CompetencyMatrixStorage
+    workspace_summary_cache: CompetencyMatrixWorkspaceSummaryCache
     id_generator: HexUuidIdGenerator
 
     async def get_matrix_authoring_context(
@@ -632,6 +636,7 @@ class MatrixAgentUseCase:
             suggested_by_username=claim.question.suggested_by_username,
         )
         created_item = await self.matrix_storage.create_competency_matrix_item(item=item)
+        await self.workspace_summary_cache.invalidate()
         completion = MatrixQuestionDraftCompletion(
             claim_id=claim.id,
             agent_client_id=identity.agent_client_id,
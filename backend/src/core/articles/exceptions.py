@@ -19,3 +19,7 @@ class ArticleFolderAlreadyExistsError(DomainError):
 
 class ArticleFolderPriorityInvalidError(DomainError):
     message = "Article folder priority order is invalid"
+
+
+class ArticleCursorInvalidError(DomainError):
+    message = "Article list cursor is invalid"
@@ -1,3 +1,5 @@
+import base64
+import json
 from collections.abc import Mapping
 from dataclasses import dataclass, replace
 from datetime import date, datetime
@@ -5,7 +7,7 @@ from math import ceil
 from typing import Self
 
 from core.articles.enums import ArticleReactionKind, ArticleViewSourceCategory
-from core.articles.exceptions import ArticleFolderPriorityInvalidError
+from core.articles.exceptions import ArticleCursorInvalidError, ArticleFolderPriorityInvalidError
 from core.enums import PublishStatusEnum
 from core.files.markdown import extract_file_ids_from_markdown
 from core.files.schemas import StoredFile
@@ -156,17 +158,94 @@ class PublishedArticlesForSeo(ValuedDataclass[PublishedArticleForSeo]):
         )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArticleCursor:
+    search_rank: float | None
+    is_published: bool
+    published_at: datetime | None
+    updated_at: datetime
+    title: str
+    article_id: str
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [
+                self.search_rank,
+                self.is_published,
+                self.published_at.isoformat() if self.published_at is not None else None,
+                self.updated_at.isoformat(),
+                self.title,
+                self.article_id,
+            ],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> Self:
+        try:
+            search_rank, is_published, published_at, updated_at, title, article_id = json.loads(
+                base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)),
+            )
+            cursor = cls(
+                search_rank=float(search_rank) if search_rank is not None else None,
+                is_published=bool(is_published),
+                published_at=(
+                    datetime.fromisoformat(published_at) if published_at is not None else None
+                ),
+                updated_at=datetime.fromisoformat(updated_at),
+                title=str(title),
+                article_id=str(article_id),
+            )
+        except (TypeError, ValueError) as exc:
+            raise ArticleCursorInvalidError from exc
+        return cursor
+
+    @classmethod
+    def from_article(
+        cls,
+        *,
+        article: Article,
+        language: LanguageEnum,
+        search_rank: float | None,
+    ) -> Self:
+        return cls(
+            search_rank=search_rank,
+            is_published=article.publish_status == PublishStatusEnum.PUBLISHED,
+            published_at=article.published_at,
+            updated_at=article.updated_at,
+            title=article.title_ru if language == LanguageEnum.RU else article.title_en,
+            article_id=article.id,
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArticleListPage:
+    articles: list[Article]
+    total_count: int | None
+    next_cursor: ArticleCursor | None
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Articles(ValuedDataclass[Article]):
-    total_count: int
-    total_pages: int
+    total_count: int | None
+    total_pages: int | None
+    next_cursor: ArticleCursor | None = None
 
     @classmethod
-    def from_page(cls, *, values: list[Article], total_count: int, page_size: int) -> Self:
+    def from_page(
+        cls,
+        *,
+        values: list[Article],
+        total_count: int | None,
+        page_size: int,
+        next_cursor: ArticleCursor | None = None,
+    ) -> Self:
         return cls(
             values=values,
             total_count=total_count,
-            total_pages=ceil(total_count / page_size) if total_count > 0 else 0,
+            total_pages=ceil(total_count / page_size) if total_count is not None else None,
+            next_cursor=next_cursor,
         )
 
 
@@ -174,6 +253,8 @@ class Articles(ValuedDataclass[Article]):
 class ArticleFilters:
     page: int | None = None
     page_size: int | None = None
+    cursor: ArticleCursor | None = None
+    include_count: bool = True
     language: LanguageEnum = LanguageEnum.EN
     only_published: bool | None = None
     publish_status: PublishStatusEnum | None = None
@@ -477,6 +558,15 @@ class ArticleAnalyticsDailyStats:
     engaged_view_count: int
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArticleDailyCounterIncrement:
+    article_id: str
+    date: date
+    source_category: ArticleViewSourceCategory
+    view_count: int
+    engaged_view_count: int
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ArticleAnalyticsStats:
     date_from: date
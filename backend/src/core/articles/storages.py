@@ -5,9 +5,11 @@ from core.articles.enums import ArticleReactionKind, ArticleViewSourceCategory
 from core.articles.schemas import (
     Article,
     ArticleAnalyticsDailyStats,
+    ArticleDailyCounterIncrement,
     ArticleFilters,
     ArticleFolder,
     ArticleFolders,
+    ArticleListPage,
     ArticlePublicStatsCollection,
     ArticleReactionCounts,
     ArticleTreeItemData,
@@ -29,7 +31,16 @@ class ArticlesStorage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def list_articles(self, *, filters: ArticleFilters) -> tuple[list[Article], int]:
+    async def list_articles(self, *, filters: ArticleFilters) -> ArticleListPage:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_published_articles_after(
+        self,
+        *,
+        after_slug: str | None,
+        limit: int,
+    ) -> list[Article]:
         raise NotImplementedError
 
     @abstractmethod
@@ -126,7 +137,7 @@ class ArticlesStorage(ABC):
         raise NotImplementedError
 
 
-class ArticleAnalyticsStorage(ABC):
+class ArticleViewCounterBuffer(ABC):
     @abstractmethod
     async def increment_view(
         self,
@@ -147,6 +158,20 @@ class ArticleAnalyticsStorage(ABC):
     ) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def claim_pending(self) -> list[ArticleDailyCounterIncrement]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def acknowledge_pending(self) -> None:
+        raise NotImplementedError
+
+
+class ArticleAnalyticsStorage(ABC):
+    @abstractmethod
+    async def add_daily_counters(self, *, increments: list[ArticleDailyCounterIncrement]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_public_stats(self, *, article_ids: list[str]) -> ArticlePublicStatsCollection:
         raise NotImplementedError
@@ -178,3 +203,7 @@ class ArticleAnalyticsStorage(ABC):
         article_ids: list[str],
     ) -> dict[str, ArticleReactionCounts]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild_totals(self) -> int:
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 import hmac
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import date, datetime
 from hashlib import sha256
@@ -7,6 +8,7 @@ from urllib.parse import urlparse
 from core.articles.enums import ArticleReactionKind, ArticleViewSourceCategory
 from core.articles.event_dispatchers import ArticleAnalyticsErrorReporter
 from core.articles.exceptions import (
+    ArticleCursorInvalidError,
     ArticleFolderAlreadyExistsError,
     ArticleNotFoundError,
     TagNotFoundError,
@@ -31,7 +33,11 @@ from core.articles.schemas import (
     Tags,
     TagUpdateParams,
 )
-from core.articles.storages import ArticleAnalyticsStorage, ArticlesStorage
+from core.articles.storages import (
+    ArticleAnalyticsStorage,
+    ArticlesStorage,
+    ArticleViewCounterBuffer,
+)
 from core.enums import PublishStatusEnum
 from core.files.clients import FileClient
 from core.files.enums import FilePurpose
@@ -52,41 +58,40 @@ class ArticlesUseCase:
         )
         if only_published and not article.is_available():
             raise ArticleNotFoundError
-        cover_image_file = article.metadata.cover_image_file
-        if cover_image_file is None:
-            return article.with_cover_image_url(cover_image_url=None)
-        return article.with_cover_image_url(
-            cover_image_url=self.file_client.get_access_url(
-                object_name=cover_image_file.relative_path,
-                namespace=cover_image_file.namespace,
-            ),
-        )
+        return self._with_cover_image_url(article=article)
+
+    async def iter_published_articles(self, *, chunk_size: int) -> AsyncIterator[list[Article]]:
+        after_slug: str | None = None
+        while True:
+            articles = await self.storage.list_published_articles_after(
+                after_slug=after_slug,
+                limit=chunk_size,
+            )
+            if not articles:
+                return
+            yield [self._with_cover_image_url(article=article) for article in articles]
+            if len(articles) < chunk_size:
+                return
+            after_slug = articles[-1].slug
 
     async def list_articles(self, *, filters: ArticleFilters) -> Articles:
         if filters.page is None or filters.page_size is None:
             message = "pagination required"
             raise ValueError(message)
-        articles, total_count = await self.storage.list_articles(filters=filters)
-        hydrated_articles: list[Article] = []
-        for article in articles:
-            cover_image_file = article.metadata.cover_image_file
-            cover_image_url = (
-                self.file_client.get_access_url(
-                    object_name=cover_image_file.relative_path,
-                    namespace=cover_image_file.namespace,
-                )
-                if cover_image_file is not None
-                else None
-            )
-            hydrated_articles.append(article.with_cover_image_url(cover_image_url=cover_image_url))
+        if filters.cursor is not None and (filters.cursor.search_rank is None) != (
+            filters.search_query is None
+        ):
+            raise ArticleCursorInvalidError
+        page = await self.storage.list_articles(filters=filters)
         return Articles.from_page(
-            values=hydrated_articles,
-            total_count=total_count,
+            values=[self._with_cover_image_url(article=article) for article in page.articles],
+            total_count=page.total_count,
             page_size=filters.page_size,
+            next_cursor=page.next_cursor,
         )
 
     async def list_published_articles_for_seo(self) -> PublishedArticlesForSeo:
-        articles, _total_count = await self.storage.list_articles(
+        page = await self.storage.list_articles(
             filters=ArticleFilters(
                 only_published=True,
                 include_tags=False,
@@ -94,7 +99,7 @@ class ArticlesUseCase:
                 order_for_seo=True,
             ),
         )
-        available_articles = [article for article in articles if article.is_available()]
+        available_articles = [article for article in page.articles if article.is_available()]
         return PublishedArticlesForSeo.from_articles(articles=available_articles)
 
     async def list_tree(self, *, only_published: bool, language: LanguageEnum) -> ArticleTree:
@@ -278,11 +283,23 @@ class ArticlesUseCase:
         folders.ensure_priority_order_matches(ordered_ids=params.ordered_ids)
         await self.storage.update_folder_priorities(ordered_ids=params.ordered_ids)
 
+    def _with_cover_image_url(self, *, article: Article) -> Article:
+        cover_image_file = article.metadata.cover_image_file
+        if cover_image_file is None:
+            return article.with_cover_image_url(cover_image_url=None)
+        return article.with_cover_image_url(
+            cover_image_url=self.file_client.get_access_url(
+                object_name=cover_image_file.relative_path,
+                namespace=cover_image_file.namespace,
+            ),
+        )
+
 
 @dataclass(kw_only=True, slots=True, frozen=True)
 class ArticleAnalyticsUseCase:
     articles_storage: ArticlesStorage
     analytics_storage: ArticleAnalyticsStorage
+    view_counter_buffer: ArticleViewCounterBuffer
     error_reporter: ArticleAnalyticsErrorReporter
 
     async def track_public_view(
@@ -308,7 +325,7 @@ class ArticleAnalyticsUseCase:
     ) -> None:
         if not article.is_available():
             return
-        await self.analytics_storage.increment_view(
+        await self.view_counter_buffer.increment_view(
             article_id=article.id,
             source_category=source_category,
             viewed_on=None,
@@ -321,12 +338,21 @@ class ArticleAnalyticsUseCase:
         source_category: ArticleViewSourceCategory,
     ) -> None:
         article = await self._get_published_article(slug=slug)
-        await self.analytics_storage.increment_engaged_view(
+        await self.view_counter_buffer.increment_engaged_view(
             article_id=article.id,
             source_category=source_category,
             viewed_on=None,
         )
 
+    async def flush_view_counters(self) -> int:
+        increments = await self.view_counter_buffer.claim_pending()
+        if increments:
+            await self.analytics_storage.add_daily_counters(increments=increments)
+        return len(increments)
+
+    async def rebuild_totals(self) -> int:
+        return await self.analytics_storage.rebuild_totals()
+
     async def get_public_stats(self, *, article_ids: list[str]) -> ArticlePublicStatsCollection:
         unique_article_ids = list(dict.fromkeys(article_ids))
         stats = await self.analytics_storage.get_public_stats(article_ids=unique_article_ids)
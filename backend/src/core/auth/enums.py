@@ -1,3 +1,4 @@
+from enum import StrEnum
 from typing import Self
 
 from core.enums import LabeledStrEnum
@@ -11,6 +12,12 @@ class RoleEnum(LabeledStrEnum):
     OWNER = "owner", "Владелец"
 
 
+class VerifiedAccessTokenInvalidationKindEnum(StrEnum):
+    TOKEN = "token"  # noqa: S105
+    SESSION = "session"
+    USERNAME = "username"
+
+
 class AuthSessionAuthMethodEnum(LabeledStrEnum):
     PASSWORD = "password", "Пароль"
 
@@ -9,6 +9,10 @@ class ForbiddenError(DomainError):
     message = "Forbidden error"
 
 
+class PasswordHashingOverloadedError(DomainError):
+    message = "Too many password checks in progress, try again later"
+
+
 class UserNotFoundError(EntryNotFoundError):
     message = "User not found"
 
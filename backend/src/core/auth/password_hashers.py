@@ -6,7 +6,7 @@ type PasswordVerified = bool
 
 class PasswordHasher(ABC):
     @abstractmethod
-    def verify_password(
+    async def verify_password(
         self,
         plain_password: str | bytes,
         hashed_password: str | bytes,
@@ -14,5 +14,5 @@ class PasswordHasher(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def hash_password(self, password: str | bytes) -> str:
+    async def hash_password(self, password: str | bytes) -> str:
         raise NotImplementedError
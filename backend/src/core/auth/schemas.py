@@ -2,7 +2,12 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
-from core.auth.enums import AuthSessionAuthMethodEnum, AuthSessionDeviceTypeEnum, RoleEnum
+from core.auth.enums import (
+    AuthSessionAuthMethodEnum,
+    AuthSessionDeviceTypeEnum,
+    RoleEnum,
+    VerifiedAccessTokenInvalidationKindEnum,
+)
 from core.auth.types import SessionSecret, SessionSecretHash, Token
 from core.schemas import Secret, ValuedDataclass
 
@@ -92,6 +97,7 @@ class JwtUser(BaseUser):
 class AccessTokenPayload:
     username: str
     session_id: str
+    expires_at: datetime | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {"username": self.username, "session_id": self.session_id}
@@ -104,6 +110,43 @@ class AccessTokenPayload:
         )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VerifiedAccessToken:
+    user: User
+    session_id: str
+    expires_at: datetime
+
+    def is_valid_at(self, *, now: datetime) -> bool:
+        return self.expires_at > now
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VerifiedAccessTokenInvalidation:
+    kind: VerifiedAccessTokenInvalidationKindEnum
+    value: str
+
+    @classmethod
+    def for_token(cls, *, token: Token) -> VerifiedAccessTokenInvalidation:
+        return cls(kind=VerifiedAccessTokenInvalidationKindEnum.TOKEN, value=token.to_hash())
+
+    @classmethod
+    def for_session(cls, *, session_id: str) -> VerifiedAccessTokenInvalidation:
+        return cls(kind=VerifiedAccessTokenInvalidationKindEnum.SESSION, value=session_id)
+
+    @classmethod
+    def for_username(cls, *, username: str) -> VerifiedAccessTokenInvalidation:
+        return cls(kind=VerifiedAccessTokenInvalidationKindEnum.USERNAME, value=username)
+
+    def matches(self, *, token_hash: str, verified_token: VerifiedAccessToken) -> bool:
+        match self.kind:
+            case VerifiedAccessTokenInvalidationKindEnum.TOKEN:
+                return token_hash == self.value
+            case VerifiedAccessTokenInvalidationKindEnum.SESSION:
+                return verified_token.session_id == self.value
+            case VerifiedAccessTokenInvalidationKindEnum.USERNAME:
+                return verified_token.user.username.casefold() == self.value.casefold()
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class AccessTokenResult:
     token: Token
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-from core.auth.schemas import AuthSession, AuthSessionCleanupCounts, AuthSessionCreate
+from core.auth.schemas import (
+    AuthSession,
+    AuthSessionCleanupCounts,
+    AuthSessionCreate,
+    VerifiedAccessToken,
+    VerifiedAccessTokenInvalidation,
+)
 from core.auth.types import SessionSecretHash, Token
 
 
@@ -15,6 +21,22 @@ class TokenRevocationStorage(ABC):
         raise NotImplementedError
 
 
+class VerifiedAccessTokenCache(ABC):
+    @abstractmethod
+    async def get(self, *, token: Token, now: datetime) -> VerifiedAccessToken | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, *, token: Token, verified_token: VerifiedAccessToken) -> None:
+        raise NotImplementedError
+
+
+class VerifiedAccessTokenInvalidator(ABC):
+    @abstractmethod
+    async def invalidate(self, *, invalidation: VerifiedAccessTokenInvalidation) -> None:
+        raise NotImplementedError
+
+
 class AuthStorage(ABC):
     @abstractmethod
     async def update_user_password_hash(self, username: str, password_hash: str) -> None:
@@ -71,7 +93,7 @@ class AuthSessionStorage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def revoke_session_by_secret_hash(self, *, secret_hash: SessionSecretHash) -> None:
+    async def revoke_session_by_secret_hash(self, *, secret_hash: SessionSecretHash) -> str:
         raise NotImplementedError
 
     @abstractmethod
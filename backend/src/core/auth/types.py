@@ -1,10 +1,20 @@
+import hashlib
+
+
 class RawToken(str):
     __slots__ = ()
 
 
+class TokenHash(str):
+    __slots__ = ()
+
+
 class Token(bytes):
     __slots__ = ()
 
+    def to_hash(self) -> TokenHash:
+        return TokenHash(hashlib.sha256(self).hexdigest())
+
 
 class SessionSecret(str):
     __slots__ = ()
@@ -30,8 +30,16 @@ from core.auth.schemas import (
     AuthSessionCredentials,
     AuthUseCaseConfig,
     User,
+    VerifiedAccessToken,
+    VerifiedAccessTokenInvalidation,
+)
+from core.auth.storages import (
+    AuthSessionStorage,
+    AuthStorage,
+    TokenRevocationStorage,
+    VerifiedAccessTokenCache,
+    VerifiedAccessTokenInvalidator,
 )
-from core.auth.storages import AuthSessionStorage, AuthStorage, TokenRevocationStorage
 from core.auth.token_handlers import TokenHandler
 from core.auth.types import Token
 
@@ -46,6 +54,8 @@ class AuthUseCase:
     user_storage: UserAccountStorage
     event_reporter: AuthEventReporter
     auth_session_secret_generator: AuthSessionSecretGenerator
+    verified_token_cache: VerifiedAccessTokenCache
+    verified_token_invalidator: VerifiedAccessTokenInvalidator
 
     async def login(
         self,
@@ -67,7 +77,7 @@ class AuthUseCase:
         if not user.is_active:
             self.event_reporter.report_login_inactive_user(username=user.username)
             raise UnauthorizedError
-        verified, need_rehash = self.hasher.verify_password(
+        verified, need_rehash = await self.hasher.verify_password(
             plain_password=params.password,
             hashed_password=user.password_hash.get_secret_value(),
         )
@@ -77,7 +87,7 @@ class AuthUseCase:
         if need_rehash:
             await self.auth_storage.update_user_password_hash(
                 username=params.username,
-                password_hash=self.hasher.hash_password(params.password),
+                password_hash=await self.hasher.hash_password(params.password),
             )
         session_secret = self.auth_session_secret_generator.generate_secret()
         session_absolute_expires_at = params.current_datetime + timedelta(
@@ -113,25 +123,14 @@ class AuthUseCase:
         )
 
     async def authenticate(self, *, params: AuthAuthenticateParams) -> User:
-        if await self.token_revocation_storage.is_token_revoked(token=params.token):
-            self.event_reporter.report_authentication_revoked_token_used()
-            raise UnauthorizedError
-        payload = self.token_handler.decode_token(params.token)
-        try:
-            session = await self.auth_session_storage.get_session_by_id(
-                session_id=payload.session_id,
-            )
-        except AuthSessionNotFoundError as exc:
-            raise UnauthorizedError from exc
-        if not session.is_active_at(now=params.current_datetime):
-            raise UnauthorizedError
-        if session.username != payload.username:
-            raise UnauthorizedError
-        try:
-            user = await self.user_storage.get_user_by_username(username=payload.username)
-        except UserNotFoundError as exc:
-            self.event_reporter.report_authentication_user_not_found(username=payload.username)
-            raise UnauthorizedError from exc
+        verified_token = await self.verified_token_cache.get(
+            token=params.token,
+            now=params.current_datetime,
+        )
+        if verified_token is None:
+            verified_token = await self._verify_access_token(params=params)
+            await self.verified_token_cache.set(token=params.token, verified_token=verified_token)
+        user = verified_token.user
         if not user.has_role(role=params.required_role):
             self.event_reporter.report_authentication_role_forbidden(
                 username=user.username,
@@ -199,13 +198,21 @@ class AuthUseCase:
         )
 
     async def logout(self, *, params: AuthLogoutParams) -> None:
+        await self.verified_token_invalidator.invalidate(
+            invalidation=VerifiedAccessTokenInvalidation.for_token(token=params.token),
+        )
         if params.session_secret is not None:
             with suppress(AuthSessionNotFoundError):
-                await self.auth_session_storage.revoke_session_by_secret_hash(
+                session_id = await self.auth_session_storage.revoke_session_by_secret_hash(
                     secret_hash=self.auth_session_secret_generator.hash_secret(
                         secret=params.session_secret
                     ),
                 )
+                await self.verified_token_invalidator.invalidate(
+                    invalidation=VerifiedAccessTokenInvalidation.for_session(
+                        session_id=session_id,
+                    ),
+                )
         try:
             remaining_seconds = self.token_handler.get_token_remaining_seconds(params.token)
         except UnauthorizedError:
@@ -219,6 +226,31 @@ class AuthUseCase:
             expires_in_seconds=remaining_seconds,
         )
 
+    async def _verify_access_token(self, *, params: AuthAuthenticateParams) -> VerifiedAccessToken:
+        if await self.token_revocation_storage.is_token_revoked(token=params.token):
+            self.event_reporter.report_authentication_revoked_token_used()
+            raise UnauthorizedError
+        payload = self.token_handler.decode_token(params.token)
+        try:
+            session = await self.auth_session_storage.get_session_by_id(
+                session_id=payload.session_id,
+            )
+        except AuthSessionNotFoundError as exc:
+            raise UnauthorizedError from exc
+        if not session.is_active_at(now=params.current_datetime):
+            raise UnauthorizedError
+        if session.username != payload.username:
+            raise UnauthorizedError
+        try:
+            user = await self.user_storage.get_user_by_username(username=payload.username)
+        except UserNotFoundError as exc:
+            self.event_reporter.report_authentication_user_not_found(username=payload.username)
+            raise UnauthorizedError from exc
+        expires_at = min(session.expires_at, session.absolute_expires_at)
+        if payload.expires_at is not None:
+            expires_at = min(expires_at, payload.expires_at)
+        return VerifiedAccessToken(user=user, session_id=session.id, expires_at=expires_at)
+
     def _issue_access_token(
         self,
         *,
@@ -9,12 +9,16 @@ class CacheWarmSummary:
     attempted: int
     written: int
     skipped: int
+    collect_ms: int = 0
+    write_ms: int = 0
 
     def as_dict(self) -> dict[str, int]:
         return {
             "attempted": self.attempted,
             "written": self.written,
             "skipped": self.skipped,
+            "collect_ms": self.collect_ms,
+            "write_ms": self.write_ms,
         }
 
 
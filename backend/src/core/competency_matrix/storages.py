@@ -117,6 +117,14 @@ class CompetencyMatrixStorage(ABC):
     ]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_competency_matrix_workspace_page(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+    ) -> list[CompetencyMatrixWorkspaceItem]:
+        raise NotImplementedError
+
     @abstractmethod
     async def list_competency_matrix_workspace_filter_options(
         self,
@@ -242,3 +250,26 @@ class QuestionSuggestionQuotaStorage(ABC):
         ttl_seconds: int,
     ) -> QuestionSuggestionQuota:
         raise NotImplementedError
+
+
+class CompetencyMatrixWorkspaceSummaryCache(ABC):
+    @abstractmethod
+    async def get_summary(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+    ) -> CompetencyMatrixWorkspaceSummary | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_summary(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+        summary: CompetencyMatrixWorkspaceSummary,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self) -> None:
+        raise NotImplementedError
@@ -42,7 +42,10 @@ from core.competency_matrix.schemas import (
     Sheets,
 )
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.enums import PublishStatusEnum
 from core.i18n.enums import LanguageEnum
 
@@ -51,6 +54,7 @@ from core.i18n.enums import LanguageEnum
 class CompetencyMatrixUseCase:
     storage: CompetencyMatrixStorage
     question_suggestion_limiter: QuestionSuggestionLimiter
+    workspace_summary_cache: CompetencyMatrixWorkspaceSummaryCache
 
     async def list_sheets(self) -> Sheets:
         return await self.storage.list_sheets()
@@ -159,12 +163,21 @@ class CompetencyMatrixUseCase:
         *,
         filters: CompetencyMatrixWorkspaceFilters,
     ) -> CompetencyMatrixWorkspace:
-        items, total_count, summary = await self.storage.list_competency_matrix_workspace_items(
-            filters=filters,
-        )
+        summary = await self.workspace_summary_cache.get_summary(filters=filters)
+        if summary is not None:
+            items = await self.storage.list_competency_matrix_workspace_page(filters=filters)
+        else:
+            (
+                items,
+                _total_count,
+                summary,
+            ) = await self.storage.list_competency_matrix_workspace_items(
+                filters=filters,
+            )
+            await self.workspace_summary_cache.save_summary(filters=filters, summary=summary)
         return CompetencyMatrixWorkspace.from_page(
             values=items,
-            total_count=total_count,
+            total_count=summary.total,
             page_size=filters.page_size,
             summary=summary,
         )
@@ -203,7 +216,9 @@ class CompetencyMatrixUseCase:
         )
         if item.publish_status == PublishStatusEnum.PUBLISHED:
             item.ensure_public_ready()
-        return await self.storage.create_competency_matrix_item(item=item)
+        created_item = await self.storage.create_competency_matrix_item(item=item)
+        await self.workspace_summary_cache.invalidate()
+        return created_item
 
     async def create_item_from_queue(
         self,
@@ -240,6 +255,7 @@ class CompetencyMatrixUseCase:
             item.ensure_public_ready()
         created_item = await self.storage.create_competency_matrix_item(item=item)
         await self.storage.delete_queued_question(question_id=params.queued_question_id)
+        await self.workspace_summary_cache.invalidate()
         return created_item
 
     async def update_item(
@@ -267,10 +283,13 @@ class CompetencyMatrixUseCase:
         )
         if item.publish_status == PublishStatusEnum.PUBLISHED:
             item.ensure_public_ready()
-        return await self.storage.update_competency_matrix_item(item=item)
+        updated_item = await self.storage.update_competency_matrix_item(item=item)
+        await self.workspace_summary_cache.invalidate()
+        return updated_item
 
     async def delete_item(self, *, item_id: str) -> None:
         await self.storage.delete_competency_matrix_item(item_id=item_id)
+        await self.workspace_summary_cache.invalidate()
 
     async def switch_item_publish_status(
         self,
@@ -284,6 +303,7 @@ class CompetencyMatrixUseCase:
             item_id=params.item_id,
             publish_status=params.publish_status,
         )
+        await self.workspace_summary_cache.invalidate()
 
     async def suggest_question(
         self,
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from io import BytesIO
+from typing import BinaryIO
 
-from core.files.schemas import FileUploadResult
+from core.files.schemas import (
+    CompletedUploadPart,
+    FileUploadResult,
+    ObjectDigest,
+    UploadPartUrl,
+)
 
 
 class FileClient(ABC):
@@ -12,17 +17,25 @@ class FileClient(ABC):
     @abstractmethod
     async def upload_file(
         self,
-        file_data: BytesIO,
+        file_data: BinaryIO,
         object_name: str,
         namespace: str,
         content_type: str,
     ) -> FileUploadResult:
         raise NotImplementedError
 
+    @abstractmethod
+    async def download_file(self, object_name: str, namespace: str) -> bytes:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_file(self, object_name: str, namespace: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_files(self, object_names: tuple[str, ...], namespace: str) -> frozenset[str]:
+        raise NotImplementedError
+
     @abstractmethod
     async def init_storage(self) -> None:
         raise NotImplementedError
@@ -30,3 +43,42 @@ class FileClient(ABC):
     @abstractmethod
     def get_access_url(self, object_name: str, namespace: str) -> str:
         raise NotImplementedError
+
+
+class MultipartUploadClient(ABC):
+    @abstractmethod
+    async def create_upload(self, *, object_name: str, content_type: str) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def presign_part_urls(
+        self,
+        *,
+        object_name: str,
+        upload_id: str,
+        part_count: int,
+        expires_in_seconds: int,
+    ) -> tuple[UploadPartUrl, ...]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete_upload(
+        self,
+        *,
+        object_name: str,
+        upload_id: str,
+        parts: tuple[CompletedUploadPart, ...],
+    ) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def abort_upload(self, *, object_name: str, upload_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_digest(self, *, object_name: str) -> ObjectDigest:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_object(self, *, object_name: str) -> None:
+        raise NotImplementedError
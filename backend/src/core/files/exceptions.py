@@ -1,4 +1,4 @@
-from core.exceptions import DomainError
+from core.exceptions import DomainError, EntryNotFoundError
 
 
 class InvalidFileDataError(DomainError):
@@ -41,6 +41,14 @@ class FileImageOptimizationError(InvalidFileDataError):
     message = "File image data is invalid."
 
 
+class DirectUploadVerificationError(InvalidFileDataError):
+    message = "Uploaded file does not match the declared size or checksum."
+
+
+class DirectUploadSessionNotFoundError(EntryNotFoundError):
+    message = "Upload session not found"
+
+
 class FileClientInternalError(DomainError):
     message = "File client error"
 
@@ -1,9 +1,20 @@
 from abc import ABC, abstractmethod
 
-from core.files.schemas import FileUploadParams
+from core.files.schemas import FileUploadParams, FileVariantRendition
 
 
 class FileContentProcessor(ABC):
     @abstractmethod
-    def process(self, *, params: FileUploadParams) -> FileUploadParams:
+    async def process(self, *, params: FileUploadParams) -> FileUploadParams:
+        raise NotImplementedError
+
+
+class FileVariantGenerator(ABC):
+    @abstractmethod
+    async def generate(
+        self,
+        *,
+        content: bytes,
+        mime_type: str,
+    ) -> tuple[FileVariantRendition, ...]:
         raise NotImplementedError
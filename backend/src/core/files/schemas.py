@@ -1,18 +1,26 @@
+import hashlib
+import re
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from io import BytesIO
+from math import ceil
 from mimetypes import guess_extension
 from pathlib import PurePath
+from typing import BinaryIO, Self
 
 from core.files.enums import FilePurpose
 from core.files.exceptions import (
     ContentTypeNotAllowedError,
     FileNameInvalidError,
     FileSizeTooLargeError,
+    InvalidFileDataError,
 )
 from core.files.types import Namespace
 from core.schemas import ValuedDataclass
 
+SHA256_HEX_PATTERN = re.compile(r"[0-9a-f]{64}")
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class FileRule:
@@ -35,12 +43,45 @@ class FileServiceConfig:
     rules: FileRules
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FileVariantsConfig:
+    purposes: frozenset[FilePurpose]
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class FileOrphanCleanupConfig:
     namespace: Namespace
     batch_size: int
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DirectUploadConfig:
+    part_size_bytes: int
+    max_size_bytes: int
+    url_expires_in_seconds: int
+    session_ttl_seconds: int
+    original_name_max_length: int
+    mime_type_max_length: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FileVariant:
+    width_px: int
+    height_px: int
+    mime_type: str
+    relative_path: str
+    size_bytes: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FileVariantRendition:
+    width_px: int
+    height_px: int
+    mime_type: str
+    file_extension: str
+    content: bytes
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class StoredFile:
     id: str
@@ -55,6 +96,15 @@ class StoredFile:
     orphaned_at: datetime | None
     created_at: datetime
     updated_at: datetime
+    variants: tuple[FileVariant, ...] = ()
+
+    @property
+    def object_names(self) -> tuple[str, ...]:
+        return (self.relative_path, *(variant.relative_path for variant in self.variants))
+
+    def variant_relative_path(self, *, rendition: FileVariantRendition) -> str:
+        stem = PurePath(self.relative_path).with_suffix("").as_posix()
+        return f"{stem}-{rendition.width_px}w{rendition.file_extension}"
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -67,6 +117,38 @@ class FileOrphanCleanupResult:
     deleted_count: int
     failed_count: int
     skipped_in_use_count: int
+    has_more: bool = False
+
+    def combine(self, other: Self) -> Self:
+        return replace(
+            other,
+            scanned_count=self.scanned_count + other.scanned_count,
+            deleted_count=self.deleted_count + other.deleted_count,
+            failed_count=self.failed_count + other.failed_count,
+            skipped_in_use_count=self.skipped_in_use_count + other.skipped_in_use_count,
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UploadContent:
+    file: BinaryIO = field(compare=False)
+    size_bytes: int
+    sha256: str
+
+    @classmethod
+    def from_bytes(cls, content: bytes) -> Self:
+        return cls(
+            file=BytesIO(content),
+            size_bytes=len(content),
+            sha256=hashlib.sha256(content).hexdigest(),
+        )
+
+    def rewind(self) -> BinaryIO:
+        self.file.seek(0)
+        return self.file
+
+    def read(self) -> bytes:
+        return self.rewind().read()
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -76,11 +158,11 @@ class FileUploadParams:
     name: str
     original_name: str
     mime_type: str
-    content: bytes
+    content: UploadContent
 
     @property
     def size_bytes(self) -> int:
-        return len(self.content)
+        return self.content.size_bytes
 
     @property
     def file_extension(self) -> str:
@@ -113,11 +195,18 @@ class FileUpdateParams:
             raise FileNameInvalidError
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FileVariantRead:
+    variant: FileVariant
+    access_url: str
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class FileRead:
     file: StoredFile
     access_url: str
     markdown_url: str
+    variants: tuple[FileVariantRead, ...] = ()
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -126,3 +215,83 @@ class FileUploadResult:
     bucket: str
     object_name: str
     size: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DirectUploadParams:
+    name: str
+    original_name: str
+    mime_type: str
+    size_bytes: int
+    sha256: str
+
+    @property
+    def file_extension(self) -> str:
+        return guess_extension(self.mime_type) or PurePath(self.original_name).suffix
+
+    def part_count(self, *, part_size_bytes: int) -> int:
+        return ceil(self.size_bytes / part_size_bytes)
+
+    def validate(self, *, config: DirectUploadConfig, allowed_mime_types: frozenset[str]) -> None:
+        if not self.name.strip() or not self.original_name.strip():
+            raise FileNameInvalidError
+        if len(self.original_name) > config.original_name_max_length:
+            raise FileNameInvalidError
+        if "\r" in self.mime_type or "\n" in self.mime_type or not self.mime_type.strip():
+            raise InvalidFileDataError
+        if len(self.mime_type) > config.mime_type_max_length:
+            raise InvalidFileDataError
+        if "*/*" not in allowed_mime_types and self.mime_type not in allowed_mime_types:
+            raise ContentTypeNotAllowedError(content_type=self.mime_type)
+        if self.size_bytes <= 0:
+            raise InvalidFileDataError
+        if self.size_bytes > config.max_size_bytes:
+            raise FileSizeTooLargeError(
+                size_bytes=self.size_bytes,
+                max_size_bytes=config.max_size_bytes,
+            )
+        if SHA256_HEX_PATTERN.fullmatch(self.sha256) is None:
+            raise InvalidFileDataError
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DirectUploadSession:
+    id: str
+    owner_username: str
+    scope: str
+    upload_id: str
+    object_name: str
+    params: DirectUploadParams
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UploadPartUrl:
+    part_number: int
+    url: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompletedUploadPart:
+    part_number: int
+    etag: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ObjectDigest:
+    size_bytes: int
+    sha256: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompletedDirectUpload:
+    session: DirectUploadSession
+    object_etag: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DirectUploadStart:
+    session_id: str
+    part_size_bytes: int
+    parts: tuple[UploadPartUrl, ...]
+    expires_at: datetime
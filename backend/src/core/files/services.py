@@ -1,27 +1,42 @@
-import hashlib
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import BytesIO
 
-from core.files.clients import FileClient
+from core.exceptions import EntryNotFoundError
+from core.files.clients import FileClient, MultipartUploadClient
 from core.files.enums import FilePurpose
 from core.files.exceptions import (
+    DirectUploadSessionNotFoundError,
+    DirectUploadVerificationError,
     FileClientInternalError,
     FileInUseError,
     FilePurposeNotAllowedError,
 )
 from core.files.file_name_generators import FileNameGenerator
-from core.files.processors import FileContentProcessor
+from core.files.processors import FileContentProcessor, FileVariantGenerator
 from core.files.schemas import (
+    CompletedDirectUpload,
+    CompletedUploadPart,
+    DirectUploadConfig,
+    DirectUploadParams,
+    DirectUploadSession,
+    DirectUploadStart,
     FileOrphanCleanupConfig,
     FileOrphanCleanupResult,
     FileRead,
+    FileRule,
     FileServiceConfig,
     FileUpdateParams,
     FileUploadParams,
+    FileVariant,
+    FileVariantRead,
+    FileVariantsConfig,
+    ObjectDigest,
     StoredFile,
 )
-from core.files.storages import FileStorage
+from core.files.storages import DirectUploadSessionStorage, FileStorage
+from core.files.types import Namespace
 
 
 @dataclass(kw_only=True, slots=True, frozen=True)
@@ -42,21 +57,16 @@ class FileService:
         params.validate_name()
         params.validate_mime_type(allowed_mime_types=rule.allowed_mime_types)
         params.validate_size(max_size_bytes=rule.max_size_bytes)
-        original_sha256 = hashlib.sha256(params.content).hexdigest()
-        duplicate = await self.file_storage.find_file_by_original_sha256(
-            namespace=self.config.namespace,
+        original_sha256 = params.content.sha256
+        duplicate = await self.find_duplicate(
             purpose=params.purpose,
             original_sha256=original_sha256,
+            current_datetime=current_datetime,
         )
         if duplicate is not None:
-            if duplicate.orphaned_at is not None:
-                duplicate = await self.file_storage.refresh_file_orphaned_at(
-                    file_id=duplicate.id,
-                    orphaned_at=current_datetime,
-                )
-            return self._to_read(file=duplicate)
+            return duplicate
 
-        upload_params = self.file_content_processor.process(params=params)
+        upload_params = await self.file_content_processor.process(params=params)
         upload_params.validate_size(max_size_bytes=rule.max_size_bytes)
         relative_path = self.file_name_generator(
             folder=rule.folder,
@@ -78,19 +88,40 @@ class FileService:
         )
         file = await self.file_storage.create_file(file=file)
         await self.file_client.upload_file(
-            file_data=BytesIO(upload_params.content),
+            file_data=upload_params.content.rewind(),
             object_name=relative_path,
             namespace=self.config.namespace,
             content_type=upload_params.mime_type,
         )
-        return self._to_read(file=file)
+        return self.to_read(file=file)
+
+    async def find_duplicate(
+        self,
+        *,
+        purpose: FilePurpose,
+        original_sha256: str,
+        current_datetime: datetime,
+    ) -> FileRead | None:
+        duplicate = await self.file_storage.find_file_by_original_sha256(
+            namespace=self.config.namespace,
+            purpose=purpose,
+            original_sha256=original_sha256,
+        )
+        if duplicate is None:
+            return None
+        if duplicate.orphaned_at is not None:
+            duplicate = await self.file_storage.refresh_file_orphaned_at(
+                file_id=duplicate.id,
+                orphaned_at=current_datetime,
+            )
+        return self.to_read(file=duplicate)
 
     async def get_file(self, *, file_id: str) -> FileRead:
-        return self._to_read(file=await self.file_storage.get_file(file_id=file_id))
+        return self.to_read(file=await self.file_storage.get_file(file_id=file_id))
 
     async def list_files(self, *, purpose: FilePurpose) -> list[FileRead]:
         files = await self.file_storage.list_files(purpose=purpose)
-        return [self._to_read(file=file) for file in files]
+        return [self.to_read(file=file) for file in files]
 
     async def update_file(
         self,
@@ -100,7 +131,7 @@ class FileService:
         current_datetime: datetime,
     ) -> FileRead:
         params.validate_name()
-        return self._to_read(
+        return self.to_read(
             file=await self.file_storage.update_file_name(
                 file_id=file_id,
                 name=params.name,
@@ -124,10 +155,11 @@ class FileService:
         if await self.file_storage.file_has_usages(file_id=file_id):
             raise FileInUseError
         file = await self.file_storage.get_file(file_id=file_id)
-        await self.file_client.delete_file(
-            object_name=file.relative_path,
-            namespace=file.namespace,
-        )
+        for object_name in file.object_names:
+            await self.file_client.delete_file(
+                object_name=object_name,
+                namespace=file.namespace,
+            )
         await self.file_storage.delete_file(file_id=file_id)
 
     async def lock_file_usage_transitions(self, *, file_ids: frozenset[str]) -> None:
@@ -152,7 +184,7 @@ class FileService:
                 orphaned_at=orphaned_at,
             )
 
-    def _to_read(self, *, file: StoredFile) -> FileRead:
+    def to_read(self, *, file: StoredFile) -> FileRead:
         access_url = self.file_client.get_access_url(
             object_name=file.relative_path,
             namespace=file.namespace,
@@ -161,9 +193,323 @@ class FileService:
             file=file,
             access_url=access_url,
             markdown_url=f"{access_url}#fileId={file.id}",
+            variants=tuple(
+                FileVariantRead(
+                    variant=variant,
+                    access_url=self.file_client.get_access_url(
+                        object_name=variant.relative_path,
+                        namespace=file.namespace,
+                    ),
+                )
+                for variant in file.variants
+            ),
         )
 
 
+@dataclass(kw_only=True, slots=True, frozen=True)
+class DirectUploadService:
+    client: MultipartUploadClient
+    session_storage: DirectUploadSessionStorage
+    config: DirectUploadConfig
+
+    async def start(  # noqa: PLR0913
+        self,
+        *,
+        session_id: str,
+        owner_username: str,
+        scope: str,
+        object_name: str,
+        params: DirectUploadParams,
+        allowed_mime_types: frozenset[str],
+        current_datetime: datetime,
+    ) -> DirectUploadStart:
+        params.validate(config=self.config, allowed_mime_types=allowed_mime_types)
+        upload_id = await self.client.create_upload(
+            object_name=object_name,
+            content_type=params.mime_type,
+        )
+        parts = await self.client.presign_part_urls(
+            object_name=object_name,
+            upload_id=upload_id,
+            part_count=params.part_count(part_size_bytes=self.config.part_size_bytes),
+            expires_in_seconds=self.config.url_expires_in_seconds,
+        )
+        session = DirectUploadSession(
+            id=session_id,
+            owner_username=owner_username,
+            scope=scope,
+            upload_id=upload_id,
+            object_name=object_name,
+            params=params,
+            expires_at=current_datetime + timedelta(seconds=self.config.session_ttl_seconds),
+        )
+        await self.session_storage.save_session(
+            session=session,
+            ttl_seconds=self.config.session_ttl_seconds,
+        )
+        return DirectUploadStart(
+            session_id=session.id,
+            part_size_bytes=self.config.part_size_bytes,
+            parts=parts,
+            expires_at=session.expires_at,
+        )
+
+    async def complete(
+        self,
+        *,
+        session_id: str,
+        owner_username: str,
+        scope: str,
+        parts: tuple[CompletedUploadPart, ...],
+        current_datetime: datetime,
+    ) -> CompletedDirectUpload:
+        session = await self._take_session(
+            session_id=session_id,
+            owner_username=owner_username,
+            scope=scope,
+            current_datetime=current_datetime,
+        )
+        try:
+            object_etag = await self.client.complete_upload(
+                object_name=session.object_name,
+                upload_id=session.upload_id,
+                parts=parts,
+            )
+        except DirectUploadVerificationError:
+            await self._abort(session=session)
+            raise
+        except FileClientInternalError:
+            # The upload is still intact, so the client may retry the same session.
+            await self._restore(session=session, current_datetime=current_datetime)
+            raise
+        try:
+            digest = await self.client.read_digest(object_name=session.object_name)
+        except FileClientInternalError:
+            await self.discard_object(session=session)
+            raise
+        if digest != ObjectDigest(
+            size_bytes=session.params.size_bytes, sha256=session.params.sha256
+        ):
+            await self.discard_object(session=session)
+            raise DirectUploadVerificationError
+        return CompletedDirectUpload(session=session, object_etag=object_etag)
+
+    async def cancel(
+        self,
+        *,
+        session_id: str,
+        owner_username: str,
+        scope: str,
+        current_datetime: datetime,
+    ) -> None:
+        session = await self._take_session(
+            session_id=session_id,
+            owner_username=owner_username,
+            scope=scope,
+            current_datetime=current_datetime,
+        )
+        await self._abort(session=session)
+
+    async def discard_object(self, *, session: DirectUploadSession) -> None:
+        with suppress(FileClientInternalError):
+            await self.client.delete_object(object_name=session.object_name)
+
+    async def _take_session(
+        self,
+        *,
+        session_id: str,
+        owner_username: str,
+        scope: str,
+        current_datetime: datetime,
+    ) -> DirectUploadSession:
+        # Taking the session atomically keeps two concurrent finalizations from racing.
+        session = await self.session_storage.take_session(session_id=session_id)
+        if session is None:
+            raise DirectUploadSessionNotFoundError
+        if session.owner_username != owner_username or session.scope != scope:
+            await self._restore(session=session, current_datetime=current_datetime)
+            raise DirectUploadSessionNotFoundError
+        return session
+
+    async def _restore(self, *, session: DirectUploadSession, current_datetime: datetime) -> None:
+        ttl_seconds = int((session.expires_at - current_datetime).total_seconds())
+        if ttl_seconds > 0:
+            await self.session_storage.save_session(session=session, ttl_seconds=ttl_seconds)
+
+    async def _abort(self, *, session: DirectUploadSession) -> None:
+        with suppress(FileClientInternalError):
+            await self.client.abort_upload(
+                object_name=session.object_name,
+                upload_id=session.upload_id,
+            )
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class FileDirectUploadService:
+    file_service: FileService
+    file_storage: FileStorage
+    file_name_generator: FileNameGenerator
+    direct_uploads: DirectUploadService
+    config: FileServiceConfig
+    purposes: frozenset[FilePurpose]
+
+    async def start_upload(
+        self,
+        *,
+        session_id: str,
+        owner_username: str,
+        purpose: FilePurpose,
+        params: DirectUploadParams,
+        current_datetime: datetime,
+    ) -> DirectUploadStart:
+        rule = self._require_rule(purpose=purpose)
+        return await self.direct_uploads.start(
+            session_id=session_id,
+            owner_username=owner_username,
+            scope=self._scope(purpose=purpose),
+            object_name=self.file_name_generator(
+                folder=rule.folder,
+                file_extension=params.file_extension,
+            ),
+            params=params,
+            allowed_mime_types=rule.allowed_mime_types,
+            current_datetime=current_datetime,
+        )
+
+    async def complete_upload(  # noqa: PLR0913
+        self,
+        *,
+        file_id: str,
+        session_id: str,
+        owner_username: str,
+        purpose: FilePurpose,
+        parts: tuple[CompletedUploadPart, ...],
+        current_datetime: datetime,
+    ) -> FileRead:
+        self._require_rule(purpose=purpose)
+        completed = await self.direct_uploads.complete(
+            session_id=session_id,
+            owner_username=owner_username,
+            scope=self._scope(purpose=purpose),
+            parts=parts,
+            current_datetime=current_datetime,
+        )
+        session = completed.session
+        params = session.params
+        duplicate = await self.file_service.find_duplicate(
+            purpose=purpose,
+            original_sha256=params.sha256,
+            current_datetime=current_datetime,
+        )
+        if duplicate is not None:
+            await self.direct_uploads.discard_object(session=session)
+            return duplicate
+        file = await self.file_storage.create_file(
+            file=StoredFile(
+                id=file_id,
+                purpose=purpose,
+                namespace=self.config.namespace,
+                relative_path=session.object_name,
+                mime_type=params.mime_type,
+                size_bytes=params.size_bytes,
+                name=params.name,
+                original_name=params.original_name,
+                original_sha256=params.sha256,
+                orphaned_at=current_datetime,
+                created_at=current_datetime,
+                updated_at=current_datetime,
+            ),
+        )
+        return self.file_service.to_read(file=file)
+
+    async def cancel_upload(
+        self,
+        *,
+        session_id: str,
+        owner_username: str,
+        purpose: FilePurpose,
+        current_datetime: datetime,
+    ) -> None:
+        await self.direct_uploads.cancel(
+            session_id=session_id,
+            owner_username=owner_username,
+            scope=self._scope(purpose=purpose),
+            current_datetime=current_datetime,
+        )
+
+    @staticmethod
+    def _scope(*, purpose: FilePurpose) -> str:
+        return f"files:{purpose.value}"
+
+    def _require_rule(self, *, purpose: FilePurpose) -> FileRule:
+        if purpose not in self.purposes:
+            raise FilePurposeNotAllowedError
+        return self.config.rules.require(purpose)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class FileVariantService:
+    file_client: FileClient
+    file_storage: FileStorage
+    variant_generator: FileVariantGenerator
+    config: FileVariantsConfig
+
+    async def generate_variants(self, *, file_id: str) -> tuple[FileVariant, ...]:
+        try:
+            file = await self.file_storage.get_file(file_id=file_id)
+        except EntryNotFoundError:
+            return ()
+        if file.variants or file.purpose not in self.config.purposes:
+            return file.variants
+        renditions = await self.variant_generator.generate(
+            content=await self.file_client.download_file(
+                object_name=file.relative_path,
+                namespace=file.namespace,
+            ),
+            mime_type=file.mime_type,
+        )
+        variants: list[FileVariant] = []
+        try:
+            for rendition in renditions:
+                relative_path = file.variant_relative_path(rendition=rendition)
+                await self.file_client.upload_file(
+                    file_data=BytesIO(rendition.content),
+                    object_name=relative_path,
+                    namespace=file.namespace,
+                    content_type=rendition.mime_type,
+                )
+                variants.append(
+                    FileVariant(
+                        width_px=rendition.width_px,
+                        height_px=rendition.height_px,
+                        mime_type=rendition.mime_type,
+                        relative_path=relative_path,
+                        size_bytes=len(rendition.content),
+                    ),
+                )
+            await self.file_storage.set_file_variants(file_id=file.id, variants=tuple(variants))
+        except FileClientInternalError:
+            await self._delete_variants(namespace=file.namespace, variants=variants)
+            raise
+        except EntryNotFoundError:
+            await self._delete_variants(namespace=file.namespace, variants=variants)
+            return ()
+        return tuple(variants)
+
+    async def _delete_variants(
+        self,
+        *,
+        namespace: Namespace,
+        variants: list[FileVariant],
+    ) -> None:
+        for variant in variants:
+            with suppress(FileClientInternalError):
+                await self.file_client.delete_file(
+                    object_name=variant.relative_path,
+                    namespace=namespace,
+                )
+
+
 @dataclass(kw_only=True, slots=True, frozen=True)
 class FileOrphanCleanupService:
     file_client: FileClient
@@ -176,27 +522,30 @@ class FileOrphanCleanupService:
             cutoff=cutoff,
             limit=self.config.batch_size,
         )
-        deleted_count = 0
-        failed_count = 0
-        skipped_in_use_count = 0
-        for file in candidates:
-            if await self.file_storage.file_has_usages(file_id=file.id):
-                await self.file_storage.set_files_attached(file_ids=frozenset({file.id}))
-                skipped_in_use_count += 1
-                continue
-            try:
-                await self.file_client.delete_file(
-                    object_name=file.relative_path,
-                    namespace=file.namespace,
-                )
-            except FileClientInternalError:
-                failed_count += 1
-                continue
-            await self.file_storage.delete_file(file_id=file.id)
-            deleted_count += 1
+        in_use_file_ids = await self.file_storage.list_file_ids_with_usages(
+            file_ids=frozenset(file.id for file in candidates),
+        )
+        if in_use_file_ids:
+            await self.file_storage.set_files_attached(file_ids=in_use_file_ids)
+        unused_files = [file for file in candidates if file.id not in in_use_file_ids]
+        failed_object_names = await self.file_client.delete_files(
+            object_names=tuple(
+                object_name for file in unused_files for object_name in file.object_names
+            ),
+            namespace=self.config.namespace,
+        )
+        deleted_file_ids = frozenset(
+            file.id for file in unused_files if failed_object_names.isdisjoint(file.object_names)
+        )
+        if deleted_file_ids:
+            await self.file_storage.delete_files(file_ids=deleted_file_ids)
+        scanned_count = len(candidates.values)
         return FileOrphanCleanupResult(
-            scanned_count=len(candidates.values),
-            deleted_count=deleted_count,
-            failed_count=failed_count,
-            skipped_in_use_count=skipped_in_use_count,
+            scanned_count=scanned_count,
+            deleted_count=len(deleted_file_ids),
+            failed_count=len(unused_files) - len(deleted_file_ids),
+            skipped_in_use_count=len(in_use_file_ids),
+            # Failed rows stay orphaned, so a batch without progress would be selected again.
+            has_more=scanned_count == self.config.batch_size
+            and bool(deleted_file_ids or in_use_file_ids),
         )
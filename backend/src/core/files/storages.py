@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from core.files.enums import FilePurpose
-from core.files.schemas import StoredFile, StoredFiles
+from core.files.schemas import DirectUploadSession, FileVariant, StoredFile, StoredFiles
 from core.files.types import Namespace
 
 
@@ -48,10 +48,23 @@ class FileStorage(ABC):
     ) -> StoredFile:
         raise NotImplementedError
 
+    @abstractmethod
+    async def set_file_variants(
+        self,
+        *,
+        file_id: str,
+        variants: tuple[FileVariant, ...],
+    ) -> StoredFile:
+        raise NotImplementedError
+
     @abstractmethod
     async def file_has_usages(self, *, file_id: str) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_file_ids_with_usages(self, *, file_ids: frozenset[str]) -> frozenset[str]:
+        raise NotImplementedError
+
     @abstractmethod
     async def lock_files(self, *, file_ids: frozenset[str]) -> None:
         raise NotImplementedError
@@ -82,3 +95,17 @@ class FileStorage(ABC):
     @abstractmethod
     async def delete_file(self, *, file_id: str) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_files(self, *, file_ids: frozenset[str]) -> None:
+        raise NotImplementedError
+
+
+class DirectUploadSessionStorage(ABC):
+    @abstractmethod
+    async def save_session(self, *, session: DirectUploadSession, ttl_seconds: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def take_session(self, *, session_id: str) -> DirectUploadSession | None:
+        raise NotImplementedError
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from typing import BinaryIO
 
-from core.knowledge.files.schemas import KnowledgeFileUploadParams, ProcessedKnowledgePhoto
+from core.knowledge.files.schemas import (
+    ByteRange,
+    KnowledgeFileUploadParams,
+    ProcessedKnowledgePhoto,
+)
 
 
 class KnowledgeFileClient(ABC):
@@ -9,14 +14,20 @@ class KnowledgeFileClient(ABC):
     async def upload_file(
         self,
         *,
-        content: bytes,
+        content: BinaryIO,
         object_name: str,
         content_type: str,
-    ) -> None:
+    ) -> str:
         raise NotImplementedError
 
     @abstractmethod
-    def stream_file(self, *, object_name: str) -> AsyncIterator[bytes]:
+    def stream_file(
+        self,
+        *,
+        object_name: str,
+        byte_range: ByteRange | None = None,
+        object_etag: str | None = None,
+    ) -> AsyncIterator[bytes]:
         raise NotImplementedError
 
     @abstractmethod
@@ -38,5 +49,5 @@ class KnowledgeFileRollbackRegistrar(ABC):
 
 class KnowledgePhotoProcessor(ABC):
     @abstractmethod
-    def process(self, *, params: KnowledgeFileUploadParams) -> ProcessedKnowledgePhoto:
+    async def process(self, *, params: KnowledgeFileUploadParams) -> ProcessedKnowledgePhoto:
         raise NotImplementedError
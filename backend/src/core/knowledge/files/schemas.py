@@ -10,6 +10,7 @@ from core.files.exceptions import (
     FileSizeTooLargeError,
     InvalidFileDataError,
 )
+from core.files.schemas import UploadContent
 from core.knowledge.files.enums import KnowledgeFileKind
 
 
@@ -44,6 +45,12 @@ class KnowledgeFile:
     original_sha256: str
     created_at: datetime
     updated_at: datetime
+    object_etag: str | None = None
+
+    @property
+    def entity_tag(self) -> str:
+        # Stored objects never change under a file id, so the id is a safe fallback validator.
+        return self.object_etag or f'"{self.id}"'
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -55,11 +62,11 @@ class KnowledgeFileUploadParams:
     name: str
     original_name: str
     mime_type: str
-    content: bytes
+    content: UploadContent
 
     @property
     def size_bytes(self) -> int:
-        return len(self.content)
+        return self.content.size_bytes
 
     @property
     def file_extension(self) -> str:
@@ -98,10 +105,21 @@ class KnowledgeFileUpdateParams:
             raise FileNameInvalidError
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ByteRange:
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class KnowledgeFileContent:
     file: KnowledgeFile
     content: AsyncIterator[bytes]
+    byte_range: ByteRange | None = None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
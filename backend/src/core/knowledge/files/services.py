@@ -1,9 +1,9 @@
-import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 
 from core.files.exceptions import FileSizeTooLargeError
 from core.files.file_name_generators import FileNameGenerator
+from core.files.schemas import UploadContent
 from core.knowledge.files.clients import (
     KnowledgeFileClient,
     KnowledgeFileRollbackRegistrar,
@@ -11,6 +11,7 @@ from core.knowledge.files.clients import (
 )
 from core.knowledge.files.enums import KnowledgeFileKind
 from core.knowledge.files.schemas import (
+    ByteRange,
     KnowledgeFile,
     KnowledgeFileContent,
     KnowledgeFileRules,
@@ -40,12 +41,12 @@ class KnowledgeFileCrudService:
         content = params.content
         mime_type = params.mime_type
         if params.kind == KnowledgeFileKind.PERSON_PHOTO:
-            processed = self.photo_processor.process(params=params)
-            content = processed.content
+            processed = await self.photo_processor.process(params=params)
+            content = UploadContent.from_bytes(processed.content)
             mime_type = processed.mime_type
-            if len(content) > rule.max_size_bytes:
+            if content.size_bytes > rule.max_size_bytes:
                 raise FileSizeTooLargeError(
-                    size_bytes=len(content),
+                    size_bytes=content.size_bytes,
                     max_size_bytes=rule.max_size_bytes,
                 )
         relative_path = self.file_name_generator(
@@ -54,37 +55,44 @@ class KnowledgeFileCrudService:
                 ".webp" if params.kind == KnowledgeFileKind.PERSON_PHOTO else params.file_extension
             ),
         )
-        file = KnowledgeFile(
-            id=params.id,
-            item_id=params.item_id,
-            author_username=params.author_username,
-            kind=params.kind,
-            relative_path=relative_path,
-            mime_type=mime_type,
-            size_bytes=len(content),
-            name=params.name.strip(),
-            original_name=params.original_name,
-            original_sha256=hashlib.sha256(params.content).hexdigest(),
-            created_at=now,
-            updated_at=now,
+        object_etag = await self.client.upload_file(
+            content=content.rewind(),
+            object_name=relative_path,
+            content_type=mime_type,
         )
-        file = await self.storage.create_file(file=file)
-        await self.client.upload_file(
-            content=content,
-            object_name=file.relative_path,
-            content_type=file.mime_type,
+        rollback_registrar.register_new_object(object_name=relative_path)
+        return await self.storage.create_file(
+            file=KnowledgeFile(
+                id=params.id,
+                item_id=params.item_id,
+                author_username=params.author_username,
+                kind=params.kind,
+                relative_path=relative_path,
+                mime_type=mime_type,
+                size_bytes=content.size_bytes,
+                name=params.name.strip(),
+                original_name=params.original_name,
+                original_sha256=params.content.sha256,
+                created_at=now,
+                updated_at=now,
+                object_etag=object_etag,
+            ),
         )
-        rollback_registrar.register_new_object(object_name=file.relative_path)
-        return file
 
-    async def read_file(self, *, file_id: str, author_username: str) -> KnowledgeFileContent:
-        file = await self.storage.get_file(
-            file_id=file_id,
-            author_username=author_username,
-        )
+    def read_file(
+        self,
+        *,
+        file: KnowledgeFile,
+        byte_range: ByteRange | None,
+    ) -> KnowledgeFileContent:
         return KnowledgeFileContent(
             file=file,
-            content=self.client.stream_file(object_name=file.relative_path),
+            content=self.client.stream_file(
+                object_name=file.relative_path,
+                byte_range=byte_range,
+                object_etag=file.object_etag,
+            ),
+            byte_range=byte_range,
         )
 
     async def rename_file(
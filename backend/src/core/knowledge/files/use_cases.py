@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from core.files.file_name_generators import FileNameGenerator
+from core.files.schemas import CompletedUploadPart, DirectUploadParams, DirectUploadStart
+from core.files.services import DirectUploadService
 from core.knowledge.exceptions import (
     InvalidKnowledgeDataError,
     KnowledgeFileNotFoundError,
@@ -8,9 +11,11 @@ from core.knowledge.exceptions import (
 from core.knowledge.files.clients import KnowledgeFileRollbackRegistrar
 from core.knowledge.files.enums import KnowledgeFileKind
 from core.knowledge.files.schemas import (
+    ByteRange,
     KnowledgeFile,
     KnowledgeFileContent,
     KnowledgeFileMutationResult,
+    KnowledgeFileRule,
     KnowledgeFileUpdateParams,
     KnowledgeFileUploadParams,
 )
@@ -190,13 +195,124 @@ class KnowledgeFilesUseCase:
             object_names_to_delete=(deleted.relative_path,),
         )
 
-    async def get_file_content(
+    async def get_file(self, *, file_id: str, author_username: str) -> KnowledgeFile:
+        return await self.file_storage.get_file(
+            file_id=file_id,
+            author_username=author_username,
+        )
+
+    def get_file_content(
+        self,
+        *,
+        file: KnowledgeFile,
+        byte_range: ByteRange | None,
+    ) -> KnowledgeFileContent:
+        return self.file_service.read_file(file=file, byte_range=byte_range)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class KnowledgeAttachmentDirectUploadUseCase:
+    item_storage: KnowledgeItemsStorage
+    file_storage: KnowledgeFilesStorage
+    file_name_generator: FileNameGenerator
+    direct_uploads: DirectUploadService
+    rule: KnowledgeFileRule
+
+    async def start_upload(
+        self,
+        *,
+        session_id: str,
+        item_id: str,
+        author_username: str,
+        params: DirectUploadParams,
+        current_datetime: datetime,
+    ) -> DirectUploadStart:
+        item = await self.item_storage.get_item_for_author(
+            item_id=item_id,
+            author_username=author_username,
+        )
+        return await self.direct_uploads.start(
+            session_id=session_id,
+            owner_username=item.author_username,
+            scope=self._scope(item_id=item.id),
+            object_name=self.file_name_generator(
+                folder=self.rule.folder,
+                file_extension=params.file_extension,
+            ),
+            params=params,
+            allowed_mime_types=self.rule.allowed_mime_types,
+            current_datetime=current_datetime,
+        )
+
+    async def complete_upload(  # noqa: PLR0913
         self,
         *,
         file_id: str,
+        session_id: str,
+        item_id: str,
         author_username: str,
-    ) -> KnowledgeFileContent:
-        return await self.file_service.read_file(
-            file_id=file_id,
+        parts: tuple[CompletedUploadPart, ...],
+        rollback_registrar: KnowledgeFileRollbackRegistrar,
+        current_datetime: datetime,
+    ) -> KnowledgeFile:
+        item = await self.item_storage.get_item_for_author(
+            item_id=item_id,
             author_username=author_username,
         )
+        completed = await self.direct_uploads.complete(
+            session_id=session_id,
+            owner_username=item.author_username,
+            scope=self._scope(item_id=item.id),
+            parts=parts,
+            current_datetime=current_datetime,
+        )
+        session = completed.session
+        rollback_registrar.register_new_object(object_name=session.object_name)
+        params = session.params
+        file = await self.file_storage.create_file(
+            file=KnowledgeFile(
+                id=file_id,
+                item_id=item.id,
+                author_username=item.author_username,
+                kind=KnowledgeFileKind.ATTACHMENT,
+                relative_path=session.object_name,
+                mime_type=params.mime_type,
+                size_bytes=params.size_bytes,
+                name=params.name.strip(),
+                original_name=params.original_name,
+                original_sha256=params.sha256,
+                created_at=current_datetime,
+                updated_at=current_datetime,
+                object_etag=completed.object_etag,
+            ),
+        )
+        await self.item_storage.touch_items(
+            item_ids={item.id},
+            author_username=item.author_username,
+            kind=item.kind,
+            updated_at=current_datetime,
+        )
+        return file
+
+    async def cancel_upload(
+        self,
+        *,
+        session_id: str,
+        item_id: str,
+        author_username: str,
+        current_datetime: datetime,
+    ) -> None:
+        item = await self.item_storage.get_item_for_author(
+            item_id=item_id,
+            author_username=author_username,
+        )
+        await self.direct_uploads.cancel(
+            session_id=session_id,
+            owner_username=item.author_username,
+            scope=self._scope(item_id=item.id),
+            current_datetime=current_datetime,
+        )
+
+    @staticmethod
+    def _scope(*, item_id: str) -> str:
+        return f"knowledge:{item_id}"
@@ -1,5 +1,9 @@
-from core.exceptions import EntryNotFoundError
+from core.exceptions import DomainError, EntryNotFoundError
 
 
 class ResumeNotFoundError(EntryNotFoundError):
     message = "Resume not found"
+
+
+class ResumeExportOverloadedError(DomainError):
+    message = "Too many resume exports in progress, try again later"
@@ -5,5 +5,15 @@ from core.resumes.schemas import ResumeExport, ResumeExportParams
 
 class ResumeDocumentExporter(ABC):
     @abstractmethod
-    def export_resume(self, *, params: ResumeExportParams) -> ResumeExport:
+    async def export_resume(self, *, params: ResumeExportParams) -> ResumeExport:
+        raise NotImplementedError
+
+
+class ResumeExportCache(ABC):
+    @abstractmethod
+    async def get_content(self, *, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_content(self, *, key: str, content: bytes) -> None:
         raise NotImplementedError
@@ -69,4 +69,4 @@ class ResumesUseCase:
             resume_id=resume_id,
             author_username=author_username,
         )
-        return self.exporter.export_resume(params=params)
+        return await self.exporter.export_resume(params=params)
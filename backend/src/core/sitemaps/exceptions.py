@@ -0,0 +1,5 @@
+from core.exceptions import EntryNotFoundError
+
+
+class SitemapPageNotFoundError(EntryNotFoundError):
+    message = "Sitemap page not found"
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class SitemapDocument:
+    name: str
+    content: bytes
+    entity_tag: str
+    last_modified: datetime
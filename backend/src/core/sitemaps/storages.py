@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from core.sitemaps.schemas import SitemapDocument
+
+
+class SitemapStorage(ABC):
+    @abstractmethod
+    async def get_document(self, *, name: str) -> SitemapDocument | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_documents(self, *, documents: list[SitemapDocument]) -> None:
+        raise NotImplementedError
@@ -66,6 +66,8 @@ class CacheWarmSummaryResponseSchema(CamelCaseSchema):
     attempted: Annotated[int, Field(title="Attempted cache targets")]
     written: Annotated[int, Field(title="Written cache targets")]
     skipped: Annotated[int, Field(title="Skipped cache targets")]
+    collect_ms: Annotated[int, Field(title="Target collection time in milliseconds")]
+    write_ms: Annotated[int, Field(title="Cache write time in milliseconds")]
 
     @classmethod
     def from_domain_schema(
@@ -77,6 +79,8 @@ class CacheWarmSummaryResponseSchema(CamelCaseSchema):
             attempted=schema.attempted,
             written=schema.written,
             skipped=schema.skipped,
+            collect_ms=schema.collect_ms,
+            write_ms=schema.write_ms,
         )
 
 
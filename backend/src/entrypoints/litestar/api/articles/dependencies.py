@@ -1,5 +1,7 @@
-from core.articles.schemas import ArticleFilters
+from core.articles.schemas import ArticleCursor, ArticleFilters
 from entrypoints.litestar.api.parameters import (
+    ArticleCursorQuery,
+    IncludeCountQuery,
     LanguageQuery,
     PageQuery,
     PageSizeQuery,
@@ -19,19 +21,20 @@ def provide_public_article_filters(  # noqa: PLR0913
     published_from: PublishedFromQuery = None,
     published_to: PublishedToQuery = None,
     search_query: SearchQueryFilter = None,
+    cursor: ArticleCursorQuery = None,
+    include_count: IncludeCountQuery = None,
 ) -> ArticleFilters:
-    normalized_search_query = (
-        search_query.strip() if search_query is not None and search_query.strip() else None
-    )
     return ArticleFilters(
         page=page,
         page_size=page_size,
+        cursor=decode_article_cursor(cursor=cursor),
+        include_count=include_count is not False,
         language=language,
         only_published=True,
         tag_slug=tag_slug,
         published_from=published_from,
         published_to=published_to,
-        search_query=normalized_search_query,
+        search_query=normalize_search_query(search_query=search_query),
         include_tags=True,
     )
 
@@ -45,19 +48,30 @@ def provide_article_filters(  # noqa: PLR0913
     published_from: PublishedFromQuery = None,
     published_to: PublishedToQuery = None,
     search_query: SearchQueryFilter = None,
+    cursor: ArticleCursorQuery = None,
+    include_count: IncludeCountQuery = None,
 ) -> ArticleFilters:
-    normalized_search_query = (
-        search_query.strip() if search_query is not None and search_query.strip() else None
-    )
     return ArticleFilters(
         page=page,
         page_size=page_size,
+        cursor=decode_article_cursor(cursor=cursor),
+        include_count=include_count is not False,
         language=language,
         only_published=False,
         publish_status=publish_status,
         tag_slug=tag_slug,
         published_from=published_from,
         published_to=published_to,
-        search_query=normalized_search_query,
+        search_query=normalize_search_query(search_query=search_query),
         include_tags=True,
     )
+
+
+def normalize_search_query(*, search_query: str | None) -> str | None:
+    return search_query.strip() if search_query is not None and search_query.strip() else None
+
+
+def decode_article_cursor(*, cursor: str | None) -> ArticleCursor | None:
+    if cursor is None or not cursor.strip():
+        return None
+    return ArticleCursor.decode(cursor.strip())
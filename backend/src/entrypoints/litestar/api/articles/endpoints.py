@@ -46,9 +46,13 @@ from entrypoints.litestar.api.parameters import (
     api_json_body,
 )
 from entrypoints.litestar.guards import content_manager_guard
+from entrypoints.litestar.public.sitemaps import enqueue_sitemap_refresh
 from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
     ResponseCacheDomain,
     invalidate_response_cache_domain_for_mutation,
+    record_response_cache_dependencies,
 )
 from infra.config.constants import constants
 from infra.config.settings import settings
@@ -74,6 +78,9 @@ class PublicArticlesApiController(Controller):
         filters: NamedDependency[ArticleFilters],
     ) -> ArticleListResponseSchema:
         articles = await use_case.list_articles(filters=filters)
+        record_response_cache_dependencies(
+            ResponseCacheDependencies.for_articles(articles=articles),
+        )
         return ArticleListResponseSchema.from_domain_schema(
             schema=articles,
             language=filters.language,
@@ -93,6 +100,7 @@ class PublicArticlesApiController(Controller):
         use_case: FromDishka[ArticlesUseCase],
     ) -> ArticleTreeResponseSchema:
         tree = await use_case.list_tree(only_published=True, language=language)
+        record_response_cache_dependencies(ResponseCacheDependencies.for_article_tree(tree=tree))
         return ArticleTreeResponseSchema.from_domain_schema(schema=tree)
 
     @get(
@@ -110,6 +118,7 @@ class PublicArticlesApiController(Controller):
         language: LanguageQuery,
     ) -> ArticleDetailResponseSchema:
         article = await use_case.get_article(slug=slug, only_published=True)
+        record_response_cache_dependencies(ResponseCacheDependencies.for_article(article=article))
         return ArticleDetailResponseSchema.from_domain_schema(
             schema=article,
             language=language,
@@ -218,6 +227,7 @@ class PublicArticlesApiController(Controller):
             language=language,
             only_with_published_articles=True,
         )
+        record_response_cache_dependencies(ResponseCacheDependencies.for_tags(tags=tags))
         return TagsResponseSchema.from_domain_schema(schema=tags, language=language)
 
 
@@ -300,7 +310,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies.for_article_mutation(slugs=(article.slug,)),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
         return ArticleDetailResponseSchema.from_domain_schema(
             schema=article,
             language=language,
@@ -374,6 +386,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TREE}),
+            ),
         )
         return ArticleFolderResponseSchema.from_domain_schema(
             schema=folder,
@@ -405,6 +420,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TREE}),
+            ),
         )
 
     @get(
@@ -500,7 +518,11 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies.for_article_mutation(
+                slugs=(slug, article.slug),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
         return ArticleDetailResponseSchema.from_domain_schema(
             schema=article,
             language=language,
@@ -528,7 +550,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies.for_article_mutation(slugs=(slug,)),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
 
     @post(
         "/detail/{slug:str}/set-draft",
@@ -551,7 +575,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies.for_article_mutation(slugs=(slug,)),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
 
     @post(
         "/detail/{slug:str}/set-published",
@@ -574,7 +600,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies.for_article_mutation(slugs=(slug,)),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
 
     @get(
         "/tags",
@@ -650,6 +678,9 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+            ),
         )
         return TagResponseSchema.from_domain_schema(schema=tag, language=language)
 
@@ -691,6 +722,10 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+                tag_ids=frozenset({tag_id}),
+            ),
         )
         return TagResponseSchema.from_domain_schema(schema=tag, language=language)
 
@@ -712,6 +747,10 @@ class AdminArticlesApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.ARTICLES,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+                tag_ids=frozenset({tag_id}),
+            ),
         )
 
 
@@ -283,8 +283,9 @@ class ArticleDetailResponseSchema(ArticleSummaryResponseSchema):
 
 
 class ArticleListResponseSchema(CamelCaseSchema):
-    total_count: Annotated[int, Field(title="Article count")]
-    total_pages: Annotated[int, Field(title="Page count")]
+    total_count: Annotated[int | None, Field(title="Article count")]
+    total_pages: Annotated[int | None, Field(title="Page count")]
+    next_cursor: Annotated[str | None, Field(title="Next page cursor")]
     articles: Annotated[list[ArticleSummaryResponseSchema], Field(title="Articles")]
 
     @classmethod
@@ -297,6 +298,7 @@ class ArticleListResponseSchema(CamelCaseSchema):
         return cls(
             total_count=schema.total_count,
             total_pages=schema.total_pages,
+            next_cursor=schema.next_cursor.encode() if schema.next_cursor is not None else None,
             articles=[
                 ArticleSummaryResponseSchema.from_domain_schema(
                     schema=article,
@@ -69,9 +69,13 @@ from entrypoints.litestar.api.parameters import (
     api_multipart_body,
 )
 from entrypoints.litestar.guards import content_manager_guard
+from entrypoints.litestar.public.sitemaps import enqueue_sitemap_refresh
 from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
     ResponseCacheDomain,
     invalidate_response_cache_domain_for_mutation,
+    record_response_cache_dependencies,
 )
 from infra.config.constants import constants
 from infra.config.settings import settings
@@ -96,6 +100,7 @@ class PublicCompetencyMatrixApiController(Controller):
         language: LanguageQuery,
     ) -> CompetencyMatrixSheetsListResponseSchema:
         sheets = await use_case.list_sheets()
+        record_response_cache_dependencies(ResponseCacheDependencies.for_matrix_sheets())
         return CompetencyMatrixSheetsListResponseSchema.from_domain_schema(
             schema=sheets,
             language=language,
@@ -117,6 +122,9 @@ class PublicCompetencyMatrixApiController(Controller):
     ) -> PublicCompetencyMatrixItemsListResponseSchema:
         filters = CompetencyMatrixItemFilters(sheet_key=sheet_key, only_published=True)
         items = await use_case.list_items(filters=filters)
+        record_response_cache_dependencies(
+            ResponseCacheDependencies.for_matrix_items(sheet_key=sheet_key, items=items),
+        )
         return PublicCompetencyMatrixItemsListResponseSchema.from_domain_schema(
             sheet_key=sheet_key,
             schema=items,
@@ -144,6 +152,7 @@ class PublicCompetencyMatrixApiController(Controller):
         language: LanguageQuery,
     ) -> PublicCompetencyMatrixItemDetailResponseSchema:
         item = await use_case.get_item_by_slug(params=params)
+        record_response_cache_dependencies(ResponseCacheDependencies.for_matrix_item(item=item))
         return PublicCompetencyMatrixItemDetailResponseSchema.from_domain_schema(
             schema=item,
             language=language,
@@ -358,6 +367,9 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+            ),
         )
 
     @put(
@@ -388,6 +400,9 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_ITEMS}),
+            ),
         )
 
     @put(
@@ -418,6 +433,9 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_ITEMS}),
+            ),
         )
 
     @get(
@@ -650,7 +668,13 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({item.id}),
+                matrix_sheet_keys=frozenset({item.sheet_key.lower()}),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
         return CompetencyMatrixItemDetailResponseSchema.from_domain_schema(
             schema=item,
             language=language,
@@ -777,7 +801,13 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({item.id}),
+                matrix_sheet_keys=frozenset({item.sheet_key.lower()}),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
         return CompetencyMatrixItemDetailResponseSchema.from_domain_schema(
             schema=item,
             language=language,
@@ -863,7 +893,13 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({item.id}),
+                matrix_sheet_keys=frozenset({item.sheet_key.lower()}),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
         return CompetencyMatrixItemDetailResponseSchema.from_domain_schema(
             schema=item,
             language=language,
@@ -887,7 +923,12 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({pk}),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
 
     @post(
         "/items/detail/{pk:str}/set-draft",
@@ -913,7 +954,12 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({params.item_id}),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
 
     @post(
         "/items/detail/{pk:str}/set-published",
@@ -939,7 +985,14 @@ class AdminCompetencyMatrixApiController(Controller):
             request=request,
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             post_commit_actions=post_commit_actions,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset(
+                    {ResponseCacheCollection.MATRIX_ITEMS, ResponseCacheCollection.MATRIX_SHEETS},
+                ),
+                matrix_item_ids=frozenset({params.item_id}),
+            ),
         )
+        post_commit_actions.add(action=enqueue_sitemap_refresh)
 
 
 api_router = DishkaRouter("", route_handlers=[PublicCompetencyMatrixApiController])
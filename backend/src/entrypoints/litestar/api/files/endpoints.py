@@ -1,14 +1,21 @@
 from datetime import datetime
+from functools import partial
 from typing import Annotated
 
 from dishka.integrations.litestar import DishkaRouter, FromDishka
-from litestar import Controller, delete, get, post, put, status_codes
+from litestar import Controller, Request, delete, get, post, put, status_codes
+from litestar.datastructures import State
 
+from core.auth.schemas import JwtUser
+from core.auth.types import Token
 from core.files.exceptions import InvalidFileDataError
 from core.files.schemas import FileUpdateParams, FileUploadParams
-from core.files.services import FileService
+from core.files.services import FileDirectUploadService, FileService
 from core.generators import HexUuidIdGenerator
 from entrypoints.litestar.api.files.schemas import (
+    DirectUploadStartResponseSchema,
+    FileDirectUploadCompleteRequestSchema,
+    FileDirectUploadStartRequestSchema,
     FileResponseSchema,
     FilesResponseSchema,
     FileUpdateRequestSchema,
@@ -17,10 +24,20 @@ from entrypoints.litestar.api.files.schemas import (
 from entrypoints.litestar.api.parameters import (
     FileIdPath,
     FilePurposeQuery,
+    UploadSessionIdPath,
     api_json_body,
     api_multipart_body,
 )
+from entrypoints.litestar.api.uploads import spool_upload_content
 from entrypoints.litestar.guards import content_manager_guard
+from infra.config.constants import constants
+from infra.post_commit_actions import PostCommitActions
+
+
+async def enqueue_file_variants(*, file_id: str) -> None:
+    from entrypoints.taskiq.files.tasks import generate_file_variants  # noqa: PLC0415
+
+    await generate_file_variants.kiq(file_id)  # type: ignore[call-overload]
 
 
 class FilesApiController(Controller):
@@ -52,6 +69,7 @@ class FilesApiController(Controller):
         ],
         file_service: FromDishka[FileService],
         id_generator: FromDishka[HexUuidIdGenerator],
+        post_commit_actions: FromDishka[PostCommitActions],
         current_datetime: FromDishka[datetime],
     ) -> FileResponseSchema:
         if data.file.filename is None:
@@ -63,12 +81,113 @@ class FilesApiController(Controller):
                 name=data.name,
                 original_name=data.file.filename,
                 mime_type=data.file.content_type or "application/octet-stream",
-                content=await data.file.read(),
+                content=await spool_upload_content(data.file),
             ),
             current_datetime=current_datetime,
         )
+        if file.file.purpose in constants.files.variant_purposes and not file.file.variants:
+            post_commit_actions.add(action=partial(enqueue_file_variants, file_id=file.file.id))
         return FileResponseSchema.from_domain_schema(schema=file)
 
+    @post(
+        "/uploads",
+        description="Start a direct multipart upload of a large managed file.",
+        name="admin-files-direct-upload-start-api-handler",
+        status_code=status_codes.HTTP_201_CREATED,
+    )
+    async def start_direct_upload(
+        self,
+        data: Annotated[
+            FileDirectUploadStartRequestSchema,
+            api_json_body(
+                title="Direct upload start request",
+                description="Declared file metadata; parts are sent to object storage directly.",
+                examples=(
+                    {
+                        "purpose": "attachment",
+                        "name": "Dataset",
+                        "originalName": "dataset.zip",
+                        "mimeType": "application/zip",
+                        "sizeBytes": 104857600,
+                        "sha256": "0" * 64,
+                    },
+                ),
+            ),
+        ],
+        request: Request[JwtUser, Token | None, State],
+        direct_upload_service: FromDishka[FileDirectUploadService],
+        id_generator: FromDishka[HexUuidIdGenerator],
+        current_datetime: FromDishka[datetime],
+    ) -> DirectUploadStartResponseSchema:
+        return DirectUploadStartResponseSchema.from_domain_schema(
+            schema=await direct_upload_service.start_upload(
+                session_id=id_generator.get_next(),
+                owner_username=request.user.username,
+                purpose=data.purpose,
+                params=data.to_domain_schema(),
+                current_datetime=current_datetime,
+            ),
+        )
+
+    @post(
+        "/uploads/{session_id:str}/complete",
+        description="Verify a direct multipart upload and register the managed file.",
+        name="admin-files-direct-upload-complete-api-handler",
+        status_code=status_codes.HTTP_201_CREATED,
+    )
+    async def complete_direct_upload(  # noqa: PLR0913
+        self,
+        session_id: UploadSessionIdPath,
+        data: Annotated[
+            FileDirectUploadCompleteRequestSchema,
+            api_json_body(
+                title="Direct upload completion request",
+                description="Part numbers with the ETags returned by object storage.",
+                examples=(
+                    {
+                        "purpose": "attachment",
+                        "parts": [{"partNumber": 1, "etag": '"0123456789abcdef"'}],
+                    },
+                ),
+            ),
+        ],
+        request: Request[JwtUser, Token | None, State],
+        direct_upload_service: FromDishka[FileDirectUploadService],
+        id_generator: FromDishka[HexUuidIdGenerator],
+        current_datetime: FromDishka[datetime],
+    ) -> FileResponseSchema:
+        return FileResponseSchema.from_domain_schema(
+            schema=await direct_upload_service.complete_upload(
+                file_id=id_generator.get_next(),
+                session_id=session_id,
+                owner_username=request.user.username,
+                purpose=data.purpose,
+                parts=data.to_domain_schema(),
+                current_datetime=current_datetime,
+            ),
+        )
+
+    @delete(
+        "/uploads/{session_id:str}",
+        description="Abort a direct multipart upload.",
+        name="admin-files-direct-upload-cancel-api-handler",
+        status_code=status_codes.HTTP_204_NO_CONTENT,
+    )
+    async def cancel_direct_upload(
+        self,
+        session_id: UploadSessionIdPath,
+        purpose: FilePurposeQuery,
+        request: Request[JwtUser, Token | None, State],
+        direct_upload_service: FromDishka[FileDirectUploadService],
+        current_datetime: FromDishka[datetime],
+    ) -> None:
+        await direct_upload_service.cancel_upload(
+            session_id=session_id,
+            owner_username=request.user.username,
+            purpose=purpose,
+            current_datetime=current_datetime,
+        )
+
     @get(
         "",
         description="List managed files.",
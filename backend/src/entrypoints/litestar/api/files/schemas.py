@@ -5,7 +5,13 @@ from litestar.datastructures.upload_file import UploadFile
 from pydantic import ConfigDict, Field, HttpUrl
 
 from core.files.enums import FilePurpose
-from core.files.schemas import FileRead
+from core.files.schemas import (
+    CompletedUploadPart,
+    DirectUploadParams,
+    DirectUploadStart,
+    FileRead,
+    FileVariantRead,
+)
 from entrypoints.litestar.api.schemas import CamelCaseSchema
 
 
@@ -17,6 +23,31 @@ class FileUploadRequestSchema(CamelCaseSchema):
     file: Annotated[UploadFile, Field(title="Uploaded file")]
 
 
+class FileVariantResponseSchema(CamelCaseSchema):
+    width_px: Annotated[int, Field(title="Width in pixels")]
+    height_px: Annotated[int, Field(title="Height in pixels")]
+    mime_type: Annotated[str, Field(title="MIME type")]
+    size_bytes: Annotated[int, Field(title="File size in bytes")]
+    access_url: Annotated[
+        HttpUrl,
+        Field(
+            title="Access URL",
+            description="Responsive rendition access URL for srcset.",
+            examples=["https://example.com/path/to/file-640w.webp"],
+        ),
+    ]
+
+    @classmethod
+    def from_domain_schema(cls, *, schema: FileVariantRead) -> Self:
+        return cls(
+            width_px=schema.variant.width_px,
+            height_px=schema.variant.height_px,
+            mime_type=schema.variant.mime_type,
+            size_bytes=schema.variant.size_bytes,
+            access_url=HttpUrl(schema.access_url),
+        )
+
+
 class FileResponseSchema(CamelCaseSchema):
     id: Annotated[str, Field(title="File ID")]
     purpose: Annotated[FilePurpose, Field(title="File purpose")]
@@ -42,6 +73,13 @@ class FileResponseSchema(CamelCaseSchema):
             examples=["https://example.com/path/to/file#fileId=00000000000000000000000000000001"],
         ),
     ]
+    variants: Annotated[
+        list[FileVariantResponseSchema],
+        Field(
+            title="Responsive variants",
+            description="Width-bucketed renditions generated after upload.",
+        ),
+    ]
     created_at: Annotated[datetime, Field(title="Created at")]
     updated_at: Annotated[datetime, Field(title="Updated at")]
 
@@ -58,6 +96,10 @@ class FileResponseSchema(CamelCaseSchema):
             original_name=schema.file.original_name,
             access_url=HttpUrl(schema.access_url),
             markdown_url=HttpUrl(schema.markdown_url),
+            variants=[
+                FileVariantResponseSchema.from_domain_schema(schema=variant)
+                for variant in schema.variants
+            ],
             created_at=schema.file.created_at,
             updated_at=schema.file.updated_at,
         )
@@ -75,3 +117,81 @@ class FilesResponseSchema(CamelCaseSchema):
 
 class FileUpdateRequestSchema(CamelCaseSchema):
     name: Annotated[str, Field(title="Display name")]
+
+
+class DirectUploadStartRequestSchema(CamelCaseSchema):
+    name: Annotated[str, Field(title="Display name")]
+    original_name: Annotated[str, Field(title="Original upload name")]
+    mime_type: Annotated[str, Field(title="MIME type")]
+    size_bytes: Annotated[int, Field(title="File size in bytes", gt=0)]
+    sha256: Annotated[
+        str,
+        Field(
+            title="SHA-256",
+            description="Hex SHA-256 digest of the whole file, verified on completion.",
+            min_length=64,
+            max_length=64,
+        ),
+    ]
+
+    def to_domain_schema(self) -> DirectUploadParams:
+        return DirectUploadParams(
+            name=self.name,
+            original_name=self.original_name,
+            mime_type=self.mime_type,
+            size_bytes=self.size_bytes,
+            sha256=self.sha256.lower(),
+        )
+
+
+class FileDirectUploadStartRequestSchema(DirectUploadStartRequestSchema):
+    purpose: Annotated[FilePurpose, Field(title="File purpose")]
+
+
+class UploadPartUrlResponseSchema(CamelCaseSchema):
+    part_number: Annotated[int, Field(title="Part number")]
+    url: Annotated[str, Field(title="Presigned part upload URL")]
+
+
+class DirectUploadStartResponseSchema(CamelCaseSchema):
+    session_id: Annotated[str, Field(title="Upload session ID")]
+    part_size_bytes: Annotated[
+        int,
+        Field(
+            title="Part size in bytes",
+            description="Every part except the last one must have exactly this size.",
+        ),
+    ]
+    parts: Annotated[list[UploadPartUrlResponseSchema], Field(title="Part upload URLs")]
+    expires_at: Annotated[datetime, Field(title="Session expires at")]
+
+    @classmethod
+    def from_domain_schema(cls, *, schema: DirectUploadStart) -> Self:
+        return cls(
+            session_id=schema.session_id,
+            part_size_bytes=schema.part_size_bytes,
+            parts=[
+                UploadPartUrlResponseSchema(part_number=part.part_number, url=part.url)
+                for part in schema.parts
+            ],
+            expires_at=schema.expires_at,
+        )
+
+
+class UploadedPartRequestSchema(CamelCaseSchema):
+    part_number: Annotated[int, Field(title="Part number", ge=1)]
+    etag: Annotated[str, Field(title="ETag returned for the part upload", min_length=1)]
+
+
+class DirectUploadCompleteRequestSchema(CamelCaseSchema):
+    parts: Annotated[list[UploadedPartRequestSchema], Field(title="Uploaded parts", min_length=1)]
+
+    def to_domain_schema(self) -> tuple[CompletedUploadPart, ...]:
+        return tuple(
+            CompletedUploadPart(part_number=part.part_number, etag=part.etag)
+            for part in sorted(self.parts, key=lambda part: part.part_number)
+        )
+
+
+class FileDirectUploadCompleteRequestSchema(DirectUploadCompleteRequestSchema):
+    purpose: Annotated[FilePurpose, Field(title="File purpose")]
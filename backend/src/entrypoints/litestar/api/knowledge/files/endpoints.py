@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Annotated
 
 from dishka import FromDishka
-from litestar import Controller, Request, delete, get, post, put, status_codes
+from litestar import Controller, Request, Response, delete, get, post, put, status_codes
 from litestar.datastructures import State
 from litestar.response import Stream
 
@@ -14,7 +14,15 @@ from core.knowledge.files.clients import (
     KnowledgeFileObjectCleaner,
     KnowledgeFileRollbackRegistrar,
 )
-from core.knowledge.files.use_cases import KnowledgeFilesUseCase
+from core.knowledge.files.use_cases import (
+    KnowledgeAttachmentDirectUploadUseCase,
+    KnowledgeFilesUseCase,
+)
+from entrypoints.litestar.api.files.schemas import (
+    DirectUploadCompleteRequestSchema,
+    DirectUploadStartRequestSchema,
+    DirectUploadStartResponseSchema,
+)
 from entrypoints.litestar.api.knowledge.files.post_commit import (
     register_knowledge_object_cleanup,
 )
@@ -31,6 +39,7 @@ from entrypoints.litestar.api.parameters import (
     KnowledgeFileIdPath,
     KnowledgeItemIdPath,
     PersonIdPath,
+    UploadSessionIdPath,
     api_json_body,
     api_multipart_body,
 )
@@ -155,6 +164,103 @@ class AdminKnowledgeFilesApiController(Controller):
         )
         return KnowledgeFileResponseSchema.from_domain_schema(schema=file)
 
+    @post(
+        "/items/{item_id:str}/attachments/uploads",
+        description="Start a direct multipart upload of a large private attachment.",
+        name="admin-knowledge-attachment-direct-upload-start-api-handler",
+        status_code=status_codes.HTTP_201_CREATED,
+    )
+    async def start_attachment_direct_upload(  # noqa: PLR0913
+        self,
+        item_id: KnowledgeItemIdPath,
+        data: Annotated[
+            DirectUploadStartRequestSchema,
+            api_json_body(
+                title="Knowledge attachment direct upload start",
+                description="Declared attachment metadata; parts go to object storage directly.",
+                examples=(
+                    {
+                        "name": "Recording",
+                        "originalName": "recording.mp4",
+                        "mimeType": "video/mp4",
+                        "sizeBytes": 104857600,
+                        "sha256": "0" * 64,
+                    },
+                ),
+            ),
+        ],
+        request: Request[JwtUser, Token | None, State],
+        use_case: FromDishka[KnowledgeAttachmentDirectUploadUseCase],
+        id_generator: FromDishka[HexUuidIdGenerator],
+        current_datetime: FromDishka[datetime],
+    ) -> DirectUploadStartResponseSchema:
+        return DirectUploadStartResponseSchema.from_domain_schema(
+            schema=await use_case.start_upload(
+                session_id=id_generator.get_next(),
+                item_id=item_id,
+                author_username=request.user.username,
+                params=data.to_domain_schema(),
+                current_datetime=current_datetime,
+            ),
+        )
+
+    @post(
+        "/items/{item_id:str}/attachments/uploads/{session_id:str}/complete",
+        description="Verify a direct multipart upload and register the private attachment.",
+        name="admin-knowledge-attachment-direct-upload-complete-api-handler",
+        status_code=status_codes.HTTP_201_CREATED,
+    )
+    async def complete_attachment_direct_upload(  # noqa: PLR0913
+        self,
+        item_id: KnowledgeItemIdPath,
+        session_id: UploadSessionIdPath,
+        data: Annotated[
+            DirectUploadCompleteRequestSchema,
+            api_json_body(
+                title="Knowledge attachment direct upload completion",
+                description="Part numbers with the ETags returned by object storage.",
+                examples=({"parts": [{"partNumber": 1, "etag": '"0123456789abcdef"'}]},),
+            ),
+        ],
+        request: Request[JwtUser, Token | None, State],
+        use_case: FromDishka[KnowledgeAttachmentDirectUploadUseCase],
+        id_generator: FromDishka[HexUuidIdGenerator],
+        rollback_registrar: FromDishka[KnowledgeFileRollbackRegistrar],
+        current_datetime: FromDishka[datetime],
+    ) -> KnowledgeFileResponseSchema:
+        return KnowledgeFileResponseSchema.from_domain_schema(
+            schema=await use_case.complete_upload(
+                file_id=id_generator.get_next(),
+                session_id=session_id,
+                item_id=item_id,
+                author_username=request.user.username,
+                parts=data.to_domain_schema(),
+                rollback_registrar=rollback_registrar,
+                current_datetime=current_datetime,
+            ),
+        )
+
+    @delete(
+        "/items/{item_id:str}/attachments/uploads/{session_id:str}",
+        description="Abort a direct multipart upload of a private attachment.",
+        name="admin-knowledge-attachment-direct-upload-cancel-api-handler",
+        status_code=status_codes.HTTP_204_NO_CONTENT,
+    )
+    async def cancel_attachment_direct_upload(
+        self,
+        item_id: KnowledgeItemIdPath,
+        session_id: UploadSessionIdPath,
+        request: Request[JwtUser, Token | None, State],
+        use_case: FromDishka[KnowledgeAttachmentDirectUploadUseCase],
+        current_datetime: FromDishka[datetime],
+    ) -> None:
+        await use_case.cancel_upload(
+            session_id=session_id,
+            item_id=item_id,
+            author_username=request.user.username,
+            current_datetime=current_datetime,
+        )
+
     @put(
         "/items/{item_id:str}/attachments/{file_id:str}",
         description="Rename a private knowledge item attachment.",
@@ -217,7 +323,10 @@ class AdminKnowledgeFilesApiController(Controller):
 
     @get(
         "/files/{file_id:str}/content",
-        description="Stream private knowledge file content after an author check.",
+        description=(
+            "Stream private knowledge file content after an author check, "
+            "honouring Range, If-Range and If-None-Match."
+        ),
         name="admin-knowledge-file-content-api-handler",
         status_code=status_codes.HTTP_200_OK,
     )
@@ -226,10 +335,13 @@ class AdminKnowledgeFilesApiController(Controller):
         file_id: KnowledgeFileIdPath,
         request: Request[JwtUser, Token | None, State],
         use_case: FromDishka[KnowledgeFilesUseCase],
-    ) -> Stream:
+    ) -> Response[None] | Stream:
+        file = await use_case.get_file(file_id=file_id, author_username=request.user.username)
         return build_knowledge_file_content_response(
-            result=await use_case.get_file_content(
-                file_id=file_id,
-                author_username=request.user.username,
+            file=file,
+            headers=request.headers,
+            read_content=lambda byte_range: use_case.get_file_content(
+                file=file,
+                byte_range=byte_range,
             ),
         )
@@ -1,13 +1,65 @@
+import re
+from collections.abc import Callable, Mapping
 from urllib.parse import quote
 
+from litestar import Response, status_codes
 from litestar.response import Stream
 
 from core.knowledge.files.enums import KnowledgeFileKind
-from core.knowledge.files.schemas import KnowledgeFileContent
+from core.knowledge.files.schemas import ByteRange, KnowledgeFile, KnowledgeFileContent
 from infra.config.constants import constants
 
+BYTE_RANGE_PATTERN = re.compile(r"bytes=(?P<first>\d*)-(?P<last>\d*)", re.ASCII | re.IGNORECASE)
 
-def build_knowledge_file_content_response(*, result: KnowledgeFileContent) -> Stream:
+
+class RangeNotSatisfiableError(Exception): ...
+
+
+def build_knowledge_file_content_response(
+    *,
+    file: KnowledgeFile,
+    headers: Mapping[str, str],
+    read_content: Callable[[ByteRange | None], KnowledgeFileContent],
+) -> Response[None] | Stream:
+    validator_headers = build_validator_headers(file=file)
+    if_none_match = headers.get(constants.knowledge_files.if_none_match_header_name)
+    if if_none_match is not None and entity_tag_matches(
+        header=if_none_match,
+        entity_tag=file.entity_tag,
+    ):
+        return Response(
+            content=None,
+            status_code=status_codes.HTTP_304_NOT_MODIFIED,
+            headers=validator_headers,
+        )
+    range_header = headers.get(constants.knowledge_files.range_header_name)
+    if_range = headers.get(constants.knowledge_files.if_range_header_name)
+    byte_range = None
+    if range_header is not None and (if_range is None or if_range.strip() == file.entity_tag):
+        try:
+            byte_range = parse_byte_range(value=range_header, size_bytes=file.size_bytes)
+        except RangeNotSatisfiableError:
+            return Response(
+                content=None,
+                status_code=status_codes.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={
+                    **validator_headers,
+                    constants.knowledge_files.content_range_header_name: (
+                        f"bytes */{file.size_bytes}"
+                    ),
+                },
+            )
+    return build_knowledge_file_stream(
+        result=read_content(byte_range),
+        validator_headers=validator_headers,
+    )
+
+
+def build_knowledge_file_stream(
+    *,
+    result: KnowledgeFileContent,
+    validator_headers: Mapping[str, str],
+) -> Stream:
     is_photo = result.file.kind == KnowledgeFileKind.PERSON_PHOTO
     safe_ascii_name = "".join(
         character if character.isascii() and (character.isalnum() or character in " ._-") else "_"
@@ -23,16 +75,65 @@ def build_knowledge_file_content_response(*, result: KnowledgeFileContent) -> St
             f"filename*=UTF-8''{quote(result.file.original_name, safe='')}"
         )
     )
+    headers = {
+        **validator_headers,
+        constants.knowledge_files.content_disposition_header_name: content_disposition,
+        constants.knowledge_files.content_type_options_header_name: (
+            constants.knowledge_files.content_type_options_header_value
+        ),
+        constants.knowledge_files.content_length_header_name: str(result.file.size_bytes),
+    }
+    status_code = status_codes.HTTP_200_OK
+    if result.byte_range is not None:
+        status_code = status_codes.HTTP_206_PARTIAL_CONTENT
+        headers[constants.knowledge_files.content_length_header_name] = str(
+            result.byte_range.length,
+        )
+        headers[constants.knowledge_files.content_range_header_name] = (
+            f"bytes {result.byte_range.start}-{result.byte_range.end}/{result.file.size_bytes}"
+        )
     return Stream(
         result.content,
+        status_code=status_code,
         media_type="image/webp" if is_photo else "application/octet-stream",
-        headers={
-            constants.knowledge_files.content_disposition_header_name: content_disposition,
-            constants.knowledge_files.content_type_options_header_name: (
-                constants.knowledge_files.content_type_options_header_value
-            ),
-            constants.knowledge_files.cache_control_header_name: (
-                constants.knowledge_files.no_store_header_value
-            ),
-        },
+        headers=headers,
     )
+
+
+def build_validator_headers(*, file: KnowledgeFile) -> dict[str, str]:
+    return {
+        constants.knowledge_files.etag_header_name: file.entity_tag,
+        constants.knowledge_files.accept_ranges_header_name: (
+            constants.knowledge_files.accept_ranges_header_value
+        ),
+        # Photo paths are never reused, so a replaced photo is always served from a new file id.
+        constants.knowledge_files.cache_control_header_name: (
+            constants.knowledge_files.photo_cache_control_header_value
+            if file.kind == KnowledgeFileKind.PERSON_PHOTO
+            else constants.knowledge_files.no_store_header_value
+        ),
+    }
+
+
+def entity_tag_matches(*, header: str, entity_tag: str) -> bool:
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or entity_tag.removeprefix("W/") in candidates
+
+
+def parse_byte_range(*, value: str, size_bytes: int) -> ByteRange | None:
+    match = BYTE_RANGE_PATTERN.fullmatch(value.strip())
+    # Multiple ranges and malformed values fall back to the full representation.
+    if match is None or not (match["first"] or match["last"]):
+        return None
+    if not match["first"]:
+        suffix_length = int(match["last"])
+        if suffix_length == 0 or size_bytes == 0:
+            raise RangeNotSatisfiableError
+        return ByteRange(start=max(size_bytes - suffix_length, 0), end=size_bytes - 1)
+    start = int(match["first"])
+    if match["last"] and int(match["last"]) < start:
+        return None
+    if start >= size_bytes:
+        raise RangeNotSatisfiableError
+    end = int(match["last"]) if match["last"] else size_bytes - 1
+    return ByteRange(start=start, end=min(end, size_bytes - 1))
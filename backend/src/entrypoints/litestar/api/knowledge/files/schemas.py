@@ -10,6 +10,7 @@ from core.knowledge.files.schemas import (
     KnowledgeFileUploadParams,
 )
 from entrypoints.litestar.api.schemas import CamelCaseSchema
+from entrypoints.litestar.api.uploads import spool_upload_content
 from entrypoints.litestar.api.validation import RequiredShortText
 from infra.config.constants import constants
 
@@ -64,7 +65,7 @@ class KnowledgeUploadRequestSchema(CamelCaseSchema):
             raise ValueError(message)
         return self
 
-    async def build_upload_params(  # noqa: PLR0913
+    async def build_upload_params(
         self,
         *,
         file_id: str,
@@ -72,7 +73,6 @@ class KnowledgeUploadRequestSchema(CamelCaseSchema):
         author_username: str,
         kind: KnowledgeFileKind,
         name: str,
-        max_size_bytes: int,
     ) -> KnowledgeFileUploadParams:
         original_name = self.file.filename
         return KnowledgeFileUploadParams(
@@ -83,7 +83,7 @@ class KnowledgeUploadRequestSchema(CamelCaseSchema):
             name=name,
             original_name=original_name,
             mime_type=self.file.content_type or "application/octet-stream",
-            content=await self.file.read(max_size_bytes + 1),
+            content=await spool_upload_content(self.file),
         )
 
 
@@ -103,7 +103,6 @@ class KnowledgeAttachmentUploadRequestSchema(KnowledgeUploadRequestSchema):
             author_username=author_username,
             kind=KnowledgeFileKind.ATTACHMENT,
             name=self.name,
-            max_size_bytes=constants.knowledge_files.attachment_max_size_bytes,
         )
 
 
@@ -122,7 +121,6 @@ class KnowledgePhotoUploadRequestSchema(KnowledgeUploadRequestSchema):
             author_username=author_username,
             kind=KnowledgeFileKind.PERSON_PHOTO,
             name=original_name,
-            max_size_bytes=constants.knowledge_files.photo_max_size_bytes,
         )
 
 
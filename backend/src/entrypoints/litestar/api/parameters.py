@@ -263,6 +263,34 @@ SearchQueryFilter: TypeAlias = Annotated[
         max_items=None,
     ),
 ]
+ArticleCursorQuery: TypeAlias = Annotated[
+    str | None,
+    api_query_parameter(
+        name="cursor",
+        title="Article list cursor",
+        description=(
+            "Opaque nextCursor value from the previous page. When set, the page number is ignored."
+        ),
+        examples=("WzAsIjIwMjYtMDctMTRUMTI6MDA6MDArMDA6MDAiXQ",),
+        ge=None,
+        le=None,
+        min_items=None,
+        max_items=None,
+    ),
+]
+IncludeCountQuery: TypeAlias = Annotated[
+    bool | None,
+    api_query_parameter(
+        name="includeCount",
+        title="Include total count",
+        description="Whether to count all matching items. Defaults to true.",
+        examples=(False,),
+        ge=None,
+        le=None,
+        min_items=None,
+        max_items=None,
+    ),
+]
 TagSlugQuery: TypeAlias = Annotated[
     str | None,
     api_query_parameter(
@@ -686,6 +714,15 @@ FileIdPath: TypeAlias = Annotated[
         examples=("00000000000000000000000000000003",),
     ),
 ]
+UploadSessionIdPath: TypeAlias = Annotated[
+    str,
+    api_path_parameter(
+        name="session_id",
+        title="Upload session identifier",
+        description="Direct multipart upload session identifier.",
+        examples=("00000000000000000000000000000005",),
+    ),
+]
 ResumeIdPath: TypeAlias = Annotated[
     str,
     api_path_parameter(
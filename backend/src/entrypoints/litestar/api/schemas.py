@@ -1,10 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-import msgspec
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel as camel_case
 from pydantic.alias_generators import to_snake as snake_case
 
+from entrypoints.litestar.response_cache import ResponseCacheValue
 from infra.config.constants import constants
 
 
@@ -17,7 +17,7 @@ class CamelCaseSchema(BaseModel):
     )
 
     def response_cache_payload(self) -> bytes:
-        messages = [
+        messages: list[dict[str, Any]] = [
             {
                 "type": "http.response.start",
                 "status": 200,
@@ -33,7 +33,7 @@ class CamelCaseSchema(BaseModel):
                 "body": self.model_dump_json(by_alias=True).encode(),
             },
         ]
-        return msgspec.msgpack.encode(messages)
+        return ResponseCacheValue.from_messages(messages=messages).to_stored()
 
 
 class SnakeCaseSchema(BaseModel):
@@ -0,0 +1,24 @@
+import hashlib
+from typing import BinaryIO, cast
+
+from litestar.datastructures.upload_file import UploadFile
+
+from core.files.schemas import UploadContent
+from infra.config.constants import constants
+
+
+async def spool_upload_content(upload: UploadFile) -> UploadContent:
+    # Litestar already spools multipart files to disk past a threshold; hashing in chunks keeps
+    # the upload out of a single bytes object on its way to processing and storage.
+    digest = hashlib.sha256()
+    size_bytes = 0
+    await upload.seek(0)
+    while chunk := await upload.read(constants.files.upload_read_chunk_size_bytes):
+        digest.update(chunk)
+        size_bytes += len(chunk)
+    await upload.seek(0)
+    return UploadContent(
+        file=cast("BinaryIO", upload.file),
+        size_bytes=size_bytes,
+        sha256=digest.hexdigest(),
+    )
@@ -13,7 +13,7 @@ async def create_admin_command(username: str, password: str) -> None:
     async with container() as request_container:
         hasher = await request_container.get(PasswordHasher)
         session = await request_container.get(AsyncSession)
-        hashed_password = hasher.hash_password(password)
+        hashed_password = await hasher.hash_password(password)
         try:
             stmt = (
                 insert(UserModel)
@@ -0,0 +1,16 @@
+from dishka import make_async_container
+
+from core.articles.use_cases import ArticleAnalyticsUseCase
+from infra.config.loggers import logger
+from infra.ioc.registry import get_providers
+
+
+async def rebuild_article_stats_command() -> None:
+    command_container = make_async_container(*get_providers())
+    try:
+        async with command_container() as request_container:
+            use_case = await request_container.get(ArticleAnalyticsUseCase)
+            rebuilt_count = await use_case.rebuild_totals()
+    finally:
+        await command_container.close()
+    logger.info("Article stats totals rebuilt.", article_count=rebuilt_count)
@@ -3,6 +3,7 @@ from litestar import Litestar
 from litestar.plugins import CLIPluginProtocol
 
 from entrypoints.litestar.cli.commands.admin import create_admin_command
+from entrypoints.litestar.cli.commands.articles import rebuild_article_stats_command
 from entrypoints.litestar.cli.commands.cache import invalidate_cache_command
 from entrypoints.litestar.cli.commands.storage import init_buckets_command
 from entrypoints.litestar.cli.utils import run_sync
@@ -25,3 +26,9 @@ class CLIPlugin(CLIPluginProtocol):
         @cli.command()
         def invalidatecache(app: Litestar) -> None:
             run_sync(invalidate_cache_command(app))
+
+        @cli.command()
+        def rebuildarticlestats(app: Litestar) -> None:  # noqa: ARG001
+            """Backfill or repair per-article view and reaction totals."""
+
+            run_sync(rebuild_article_stats_command())
@@ -0,0 +1,13 @@
+def accepts_content_encoding(*, header: str | None, encoding: str) -> bool:
+    if header is None:
+        return False
+    for coding in header.split(","):
+        name, _, parameters = coding.partition(";")
+        if name.strip().lower() not in {encoding, "*"}:
+            continue
+        quality = parameters.strip().removeprefix("q=")
+        try:
+            return not parameters.strip() or float(quality) > 0
+        except ValueError:
+            return False
+    return False
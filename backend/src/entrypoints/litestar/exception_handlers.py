@@ -7,6 +7,7 @@ from verbose_http_exceptions import (
     ForbiddenHTTPException,
     InternalServerErrorHTTPException,
     NotFoundHTTPException,
+    ServiceUnavailableHTTPException,
     TooManyRequestsHTTPException,
     UnauthorizedHTTPException,
     status,
@@ -34,10 +35,15 @@ from core.agent_access.exceptions import (
     MatrixQuestionDraftValidationError,
 )
 from core.articles.exceptions import (
+    ArticleCursorInvalidError,
     ArticleFolderAlreadyExistsError,
     ArticleFolderPriorityInvalidError,
 )
-from core.auth.exceptions import ForbiddenError, UnauthorizedError
+from core.auth.exceptions import (
+    ForbiddenError,
+    PasswordHashingOverloadedError,
+    UnauthorizedError,
+)
 from core.competency_matrix.exceptions import (
     CompetencyMatrixItemNotPublicReadyError,
     CompetencyMatrixStructureAlreadyExistsError,
@@ -51,12 +57,15 @@ from core.competency_matrix.exceptions import (
 from core.exceptions import DomainError, EntryNotFoundError
 from core.files.exceptions import FileClientInternalError, FileInUseError, InvalidFileDataError
 from core.knowledge.exceptions import InvalidKnowledgeDataError, KnowledgeConflictError
+from core.resumes.exceptions import ResumeExportOverloadedError
 from infra.healthcheck import ReadinessCheckError
 
 DOMAIN_ERROR_MAPPING: dict[type[DomainError], type[BaseVerboseHTTPException]] = {
     EntryNotFoundError: NotFoundHTTPException,
     UnauthorizedError: UnauthorizedHTTPException,
     ForbiddenError: ForbiddenHTTPException,
+    PasswordHashingOverloadedError: ServiceUnavailableHTTPException,
+    ResumeExportOverloadedError: ServiceUnavailableHTTPException,
     AgentAuthenticationError: UnauthorizedHTTPException,
     AgentScopeDeniedError: ForbiddenHTTPException,
     AgentCertificateRequestError: BadRequestHTTPException,
@@ -79,6 +88,7 @@ DOMAIN_ERROR_MAPPING: dict[type[DomainError], type[BaseVerboseHTTPException]] =
     InvalidManagedAccountRoleError: BadRequestHTTPException,
     SelfAccountActionForbiddenError: ForbiddenHTTPException,
     ManagedAccountActionForbiddenError: ForbiddenHTTPException,
+    ArticleCursorInvalidError: BadRequestHTTPException,
     ArticleFolderAlreadyExistsError: BadRequestHTTPException,
     ArticleFolderPriorityInvalidError: BadRequestHTTPException,
     InvalidKnowledgeDataError: BadRequestHTTPException,
@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Callable, Sequence
 from contextlib import AbstractAsyncContextManager
 
@@ -16,7 +17,9 @@ from litestar.plugins.structlog import StructlogConfig, StructlogPlugin
 from litestar.stores.base import Store
 from litestar.stores.valkey import ValkeyStore
 from litestar.types import Middleware
+from valkey.asyncio import Valkey
 
+from core.cache_tools.enums import CacheDomainEnum
 from entrypoints.litestar.api.agent_access.endpoints import agent_api_router
 from entrypoints.litestar.api.routers import api_router
 from entrypoints.litestar.cli.plugins import CLIPlugin
@@ -28,34 +31,122 @@ from entrypoints.litestar.middlewares.logging import (
     PrivacySafeLoggingMiddleware,
     RequestIdLoggingMiddleware,
 )
+from entrypoints.litestar.middlewares.response_cache import ResponseCacheRevalidationMiddleware
 from entrypoints.litestar.openapi_metadata import install_openapi_request_body_metadata
 from entrypoints.litestar.public.endpoints import public_router
-from entrypoints.litestar.response_cache import ResponseCacheDomain, ResponseCacheDomainStore
+from entrypoints.litestar.response_cache import (
+    ResponseCacheBatchWriter,
+    ResponseCacheDependencyIndex,
+    ResponseCacheDomain,
+    ResponseCacheDomainStore,
+    ResponseCacheExpiryIndex,
+    ResponseCacheInvalidationChannel,
+    ResponseCacheLocalTier,
+    ResponseCacheRevalidation,
+    ResponseCacheRevalidationLock,
+    ResponseCacheSingleFlight,
+)
 from infra.config import loggers
 from infra.config.constants import constants
 from infra.config.settings import settings
+from infra.valkey.connection_pools import create_monitored_valkey_client
 
 Lifespan = Sequence[Callable[[Litestar], AbstractAsyncContextManager] | AbstractAsyncContextManager]
 
 
+def create_response_cache_valkey_store(*, valkey: Valkey, namespace: str) -> ValkeyStore:
+    return ValkeyStore(valkey=valkey, namespace=namespace)
+
+
 def create_response_cache_domain_store() -> ResponseCacheDomainStore:
+    valkey = create_monitored_valkey_client(
+        url=settings.valkey.url_for_http_cache.get_secret_value(),
+        name=constants.response_cache.store_name,
+        max_connections=constants.valkey.connection_pools.response_cache_max_connections,
+        checkout_timeout_seconds=constants.valkey.connection_pools.checkout_timeout_seconds,
+        slow_checkout_log_threshold_ms=(
+            constants.valkey.connection_pools.slow_checkout_log_threshold_ms
+        ),
+    )
     return ResponseCacheDomainStore(
         stores={
-            domain: ValkeyStore.with_client(
-                url=settings.valkey.url_for_http_cache.get_secret_value(),
-                db=constants.valkey.databases.response_cache,
-                port=settings.valkey.port,
+            domain: create_response_cache_valkey_store(
+                valkey=valkey,
                 namespace=f"{constants.valkey.namespaces.framework}_{domain.value}",
             )
             for domain in ResponseCacheDomain
         },
+        local_tiers={
+            ResponseCacheDomain(domain.value): ResponseCacheLocalTier(
+                max_entries=constants.response_cache.local_tier_max_entries,
+                ttl_seconds=constants.response_cache.local_tier_ttl_seconds,
+            )
+            for domain in CacheDomainEnum
+        },
+        invalidation_channel=ResponseCacheInvalidationChannel(
+            valkey=valkey,
+            channel=constants.response_cache.invalidation_channel,
+        ),
+        revalidation=ResponseCacheRevalidation(
+            stale_stores={
+                ResponseCacheDomain(domain.value): create_response_cache_valkey_store(
+                    valkey=valkey,
+                    namespace=f"{constants.valkey.namespaces.framework_stale}_{domain.value}",
+                )
+                for domain in CacheDomainEnum
+            },
+            single_flight=ResponseCacheSingleFlight(
+                claim_ttl_seconds=constants.response_cache.revalidation_lock_ttl_seconds,
+            ),
+            lock=ResponseCacheRevalidationLock(
+                valkey=valkey,
+                namespace=constants.valkey.namespaces.response_cache_revalidation_locks,
+                ttl_seconds=constants.response_cache.revalidation_lock_ttl_seconds,
+            ),
+            stale_ttl_seconds=constants.response_cache.stale_ttl_seconds,
+            wait_timeout_seconds=constants.response_cache.revalidation_wait_timeout_seconds,
+            poll_interval_seconds=constants.response_cache.revalidation_poll_interval_seconds,
+        ),
+        dependency_index=ResponseCacheDependencyIndex(
+            valkey=valkey,
+            namespace=constants.valkey.namespaces.response_cache_dependencies,
+            ttl_seconds=constants.response_cache.default_ttl_seconds,
+            domains=frozenset(
+                {ResponseCacheDomain.ARTICLES, ResponseCacheDomain.COMPETENCY_MATRIX},
+            ),
+        ),
+        expiry_index=ResponseCacheExpiryIndex(
+            valkey=valkey,
+            namespace=constants.valkey.namespaces.response_cache_expiry_index,
+            domains=frozenset(ResponseCacheDomain(domain.value) for domain in CacheDomainEnum),
+        ),
+        batch_writer=ResponseCacheBatchWriter(
+            valkey=valkey,
+            namespaces={
+                domain: f"{constants.valkey.namespaces.framework}_{domain.value}"
+                for domain in ResponseCacheDomain
+            },
+            stale_namespaces={
+                ResponseCacheDomain(domain.value): (
+                    f"{constants.valkey.namespaces.framework_stale}_{domain.value}"
+                )
+                for domain in CacheDomainEnum
+            },
+            stale_ttl_seconds=constants.response_cache.stale_ttl_seconds,
+        ),
     )
 
 
+@functools.cache
+def get_response_cache_domain_store() -> ResponseCacheDomainStore:
+    # The app stores and the cache tools provider share one store, so one pool serves both.
+    return create_response_cache_domain_store()
+
+
 def create_stores() -> dict[str, Store]:
     store_name = constants.response_cache.store_name
     response_cache_domain_store = (
-        create_response_cache_domain_store() if settings.app.use_cache else None
+        get_response_cache_domain_store() if settings.app.use_cache else None
     )
     return {
         **(
@@ -123,6 +214,7 @@ def create_middlewares(container: AsyncContainer) -> list[Middleware]:
             exclude_http_methods=None,
             scopes=None,
         ),
+        *([ResponseCacheRevalidationMiddleware()] if settings.app.use_cache else []),
     ]
 
 
@@ -1,13 +1,90 @@
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from litestar import Litestar
+from valkey.exceptions import ValkeyError
 
+from entrypoints.litestar.response_cache import ResponseCacheDomainStore
+from infra.auth.token_caches import LocalVerifiedAccessTokenCache
+from infra.config.constants import constants
 from infra.config.initializers import before_app_create
+from infra.config.loggers import log_sanitized_exception
+from infra.config.settings import settings
+
+
+async def listen_for_response_cache_invalidations(store: ResponseCacheDomainStore) -> None:
+    if store.invalidation_channel is None:
+        return
+    while True:
+        try:
+            async for invalidation in store.invalidation_channel.listen():
+                store.forget_local(invalidation=invalidation)
+        except (OSError, ValkeyError) as exc:
+            log_sanitized_exception(
+                event="Response cache invalidation listener disconnected",
+                error=exc,
+            )
+        # Messages published while the subscription was down are lost, so the local tier
+        # cannot be trusted anymore.
+        store.forget_all_local()
+        await asyncio.sleep(constants.response_cache.invalidation_listener_retry_delay_seconds)
+
+
+@asynccontextmanager
+async def response_cache_invalidation_listener(app: Litestar) -> AsyncGenerator[None]:
+    store = app.stores.get(constants.response_cache.store_name) if settings.app.use_cache else None
+    if not isinstance(store, ResponseCacheDomainStore):
+        yield
+        return
+    async with store:
+        task = asyncio.create_task(listen_for_response_cache_invalidations(store))
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+async def listen_for_verified_access_token_invalidations(
+    cache: LocalVerifiedAccessTokenCache,
+) -> None:
+    if cache.invalidation_channel is None:
+        return
+    while True:
+        try:
+            async for invalidation in cache.invalidation_channel.listen():
+                cache.forget(invalidation=invalidation)
+        except (OSError, ValkeyError) as exc:
+            log_sanitized_exception(
+                event="Verified access token invalidation listener disconnected",
+                error=exc,
+            )
+        # A missed revocation must not keep a token usable, so cached verifications are dropped.
+        cache.forget_all()
+        await asyncio.sleep(constants.auth.authentication_invalidation_listener_retry_delay_seconds)
+
+
+@asynccontextmanager
+async def verified_access_token_invalidation_listener(app: Litestar) -> AsyncGenerator[None]:
+    cache = await app.state.dishka_container.get(LocalVerifiedAccessTokenCache)
+    task = asyncio.create_task(listen_for_verified_access_token_invalidations(cache))
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
 
 @asynccontextmanager
 async def app_lifespan(app: Litestar) -> AsyncGenerator[None]:
     before_app_create()
-    yield
+    async with (
+        response_cache_invalidation_listener(app),
+        verified_access_token_invalidation_listener(app),
+    ):
+        yield
     await app.state.dishka_container.close()
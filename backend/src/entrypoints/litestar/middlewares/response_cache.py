@@ -0,0 +1,18 @@
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Receive, Scope, Send
+
+from entrypoints.litestar.response_cache import ResponseCacheDomainStore
+
+
+class ResponseCacheRevalidationMiddleware(ASGIMiddleware):
+    scopes = (ScopeType.HTTP,)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        app = scope["litestar_app"]
+        store = app.response_cache_config.get_store_from_app(app)
+        if not isinstance(store, ResponseCacheDomainStore):
+            await next_app(scope, receive, send)
+            return
+        async with store.revalidating():
+            await next_app(scope, receive, send)
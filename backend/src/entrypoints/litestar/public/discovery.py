@@ -92,13 +92,41 @@ class SitemapXml:
         )
 
     def _escape(self, value: str) -> str:
-        return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        return escape_xml(value)
 
     def _quoteattr(self, value: str) -> str:
         escaped = self._escape(value).replace('"', "&quot;")
         return f'"{escaped}"'
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SitemapIndexEntry:
+    path: str
+    updated_at: str
+
+
+class SitemapIndexXml:
+    def __init__(self, entries: Iterable[SitemapIndexEntry]) -> None:
+        self.entries = entries
+
+    def render(self) -> str:
+        entries = "\n".join(self.render_entry(entry=entry) for entry in self.entries)
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{entries}\n"
+            "</sitemapindex>\n"
+        )
+
+    def render_entry(self, *, entry: SitemapIndexEntry) -> str:
+        return (
+            "  <sitemap>\n"
+            f"    <loc>{escape_xml(settings.app.get_url(entry.path))}</loc>\n"
+            f"    <lastmod>{escape_xml(entry.updated_at)}</lastmod>\n"
+            "  </sitemap>"
+        )
+
+
 class RobotsTxt:
     def render(self) -> str:
         return (
@@ -115,3 +143,7 @@ class RobotsTxt:
             "Disallow: /sitemap\n"
             f"Sitemap: {settings.app.get_url('/sitemap.xml')}\n"
         )
+
+
+def escape_xml(value: str) -> str:
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
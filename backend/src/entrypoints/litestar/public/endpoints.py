@@ -1,10 +1,23 @@
+from datetime import datetime
+from typing import Annotated, Any
+
 from dishka.integrations.litestar import DishkaRouter, FromDishka
-from litestar import Controller, Response, get
+from litestar import Controller, Request, Response, get
+from litestar.params import QueryParameter
 from verbose_http_exceptions import status
 
-from core.articles.use_cases import ArticlesUseCase
-from core.competency_matrix.use_cases import CompetencyMatrixUseCase
-from entrypoints.litestar.public.discovery import PublicDiscoveryUrls, RobotsTxt, SitemapXml
+from entrypoints.litestar.public.discovery import RobotsTxt
+from entrypoints.litestar.public.sitemaps import (
+    SitemapPublisher,
+    build_sitemap_response,
+    sitemap_page_name,
+)
+from infra.config.constants import constants
+
+SitemapPageQuery = Annotated[
+    int | None,
+    QueryParameter(name=constants.sitemaps.page_query_parameter, ge=1),
+]
 
 
 class PublicDiscoveryController(Controller):
@@ -13,19 +26,16 @@ class PublicDiscoveryController(Controller):
     @get("/sitemap.xml")
     async def sitemap(
         self,
-        articles_use_case: FromDishka[ArticlesUseCase],
-        matrix_use_case: FromDishka[CompetencyMatrixUseCase],
-    ) -> Response:
-        articles = await articles_use_case.list_published_articles_for_seo()
-        matrix_items = await matrix_use_case.list_published_items_for_seo()
-        sitemap = SitemapXml(
-            urls=PublicDiscoveryUrls(articles=articles, matrix_items=matrix_items).build(),
-        ).render()
-        return Response(
-            content=sitemap,
-            media_type="application/xml",
-            status_code=status.HTTP_200_OK,
+        request: Request[Any, Any, Any],
+        publisher: FromDishka[SitemapPublisher],
+        current_datetime: FromDishka[datetime],
+        page: SitemapPageQuery = None,
+    ) -> Response[bytes | None]:
+        document = await publisher.get_document(
+            name=(constants.sitemaps.index_name if page is None else sitemap_page_name(page=page)),
+            current_datetime=current_datetime,
         )
+        return build_sitemap_response(document=document, headers=request.headers)
 
     @get("/robots.txt")
     async def robots(self) -> Response:
@@ -0,0 +1,202 @@
+import gzip
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from litestar import Response, status_codes
+
+from core.articles.use_cases import ArticlesUseCase
+from core.competency_matrix.use_cases import CompetencyMatrixUseCase
+from core.sitemaps.exceptions import SitemapPageNotFoundError
+from core.sitemaps.schemas import SitemapDocument
+from core.sitemaps.storages import SitemapStorage
+from entrypoints.litestar.content_encoding import accepts_content_encoding
+from entrypoints.litestar.public.discovery import (
+    PublicDiscoveryUrls,
+    PublicUrl,
+    SitemapIndexEntry,
+    SitemapIndexXml,
+    SitemapXml,
+)
+from infra.config.constants import constants
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class SitemapPublisher:
+    articles_use_case: ArticlesUseCase
+    matrix_use_case: CompetencyMatrixUseCase
+    storage: SitemapStorage
+
+    async def get_document(
+        self,
+        *,
+        name: str,
+        current_datetime: datetime,
+    ) -> SitemapDocument:
+        document = await self.storage.get_document(name=name)
+        if document is not None:
+            return document
+        if name != constants.sitemaps.index_name:
+            raise SitemapPageNotFoundError
+        # An empty store is filled by the first crawler hit instead of waiting for the schedule.
+        documents = await self.refresh(current_datetime=current_datetime)
+        return documents[-1]
+
+    async def refresh(self, *, current_datetime: datetime) -> list[SitemapDocument]:
+        urls = PublicDiscoveryUrls(
+            articles=await self.articles_use_case.list_published_articles_for_seo(),
+            matrix_items=await self.matrix_use_case.list_published_items_for_seo(),
+        ).build()
+        max_urls = constants.sitemaps.max_urls_per_sitemap
+        if len(urls) <= max_urls:
+            documents = [
+                await self._build_document(
+                    name=constants.sitemaps.index_name,
+                    content=SitemapXml(urls=urls).render(),
+                    current_datetime=current_datetime,
+                ),
+            ]
+        else:
+            documents = [
+                await self._build_page(
+                    page=page,
+                    urls=urls[offset : offset + max_urls],
+                    current_datetime=current_datetime,
+                )
+                for page, offset in enumerate(range(0, len(urls), max_urls), start=1)
+            ]
+            documents.append(
+                await self._build_document(
+                    name=constants.sitemaps.index_name,
+                    content=SitemapIndexXml(
+                        entries=[
+                            SitemapIndexEntry(
+                                path=sitemap_page_path(page=page),
+                                updated_at=document.last_modified.isoformat(),
+                            )
+                            for page, document in enumerate(documents, start=1)
+                        ],
+                    ).render(),
+                    current_datetime=current_datetime,
+                ),
+            )
+        await self.storage.replace_documents(documents=documents)
+        return documents
+
+    async def _build_page(
+        self,
+        *,
+        page: int,
+        urls: list[PublicUrl],
+        current_datetime: datetime,
+    ) -> SitemapDocument:
+        return await self._build_document(
+            name=sitemap_page_name(page=page),
+            content=SitemapXml(urls=urls).render(),
+            current_datetime=current_datetime,
+        )
+
+    async def _build_document(
+        self,
+        *,
+        name: str,
+        content: str,
+        current_datetime: datetime,
+    ) -> SitemapDocument:
+        encoded_content = content.encode()
+        # The same tag is sent for the gzip and identity representations, so it is weak.
+        entity_tag = f'W/"{hashlib.sha256(encoded_content).hexdigest()}"'
+        previous = await self.storage.get_document(name=name)
+        last_modified = (
+            previous.last_modified
+            if previous is not None and previous.entity_tag == entity_tag
+            else current_datetime.replace(microsecond=0)
+        )
+        return SitemapDocument(
+            name=name,
+            content=gzip.compress(
+                encoded_content,
+                compresslevel=constants.sitemaps.gzip_compress_level,
+                mtime=0,
+            ),
+            entity_tag=entity_tag,
+            last_modified=last_modified,
+        )
+
+
+def sitemap_page_name(*, page: int) -> str:
+    return f"sitemap-{page}.xml"
+
+
+def sitemap_page_path(*, page: int) -> str:
+    return f"/{constants.sitemaps.index_name}?{constants.sitemaps.page_query_parameter}={page}"
+
+
+def build_sitemap_response(
+    *,
+    document: SitemapDocument,
+    headers: Mapping[str, str],
+) -> Response[bytes | None]:
+    validator_headers = {
+        constants.sitemaps.etag_header_name: document.entity_tag,
+        constants.sitemaps.last_modified_header_name: format_datetime(
+            document.last_modified,
+            usegmt=True,
+        ),
+        constants.sitemaps.cache_control_header_name: (
+            constants.sitemaps.cache_control_header_value
+        ),
+        constants.sitemaps.vary_header_name: constants.sitemaps.accept_encoding_header_name,
+    }
+    if is_not_modified(document=document, headers=headers):
+        return Response(
+            content=None,
+            status_code=status_codes.HTTP_304_NOT_MODIFIED,
+            headers=validator_headers,
+        )
+    if accepts_content_encoding(
+        header=headers.get(constants.sitemaps.accept_encoding_header_name),
+        encoding=constants.sitemaps.gzip_encoding,
+    ):
+        return Response(
+            content=document.content,
+            media_type=constants.sitemaps.media_type,
+            status_code=status_codes.HTTP_200_OK,
+            headers={
+                **validator_headers,
+                constants.sitemaps.content_encoding_header_name: (constants.sitemaps.gzip_encoding),
+            },
+        )
+    return Response(
+        content=gzip.decompress(document.content),
+        media_type=constants.sitemaps.media_type,
+        status_code=status_codes.HTTP_200_OK,
+        headers=validator_headers,
+    )
+
+
+def is_not_modified(*, document: SitemapDocument, headers: Mapping[str, str]) -> bool:
+    if_none_match = headers.get(constants.sitemaps.if_none_match_header_name)
+    if if_none_match is not None:
+        candidates = {
+            candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+        }
+        return "*" in candidates or document.entity_tag.removeprefix("W/") in candidates
+    if_modified_since = headers.get(constants.sitemaps.if_modified_since_header_name)
+    if if_modified_since is None:
+        return False
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except TypeError, ValueError:
+        return False
+    if modified_since.tzinfo is None:
+        return False
+    return document.last_modified <= modified_since
+
+
+async def enqueue_sitemap_refresh() -> None:
+    from entrypoints.taskiq.sitemaps.tasks import refresh_sitemap  # noqa: PLC0415
+
+    await refresh_sitemap.kiq()  # type: ignore[call-overload]
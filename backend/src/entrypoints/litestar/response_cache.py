@@ -1,22 +1,41 @@
-from collections.abc import Mapping
-from dataclasses import dataclass
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import math
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 from enum import StrEnum
 from functools import partial
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
+import msgspec
 from litestar import Request
 from litestar.config.response_cache import default_cache_key_builder
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.stores.base import Store
 from litestar.types.callable_types import CacheKeyBuilder
+from valkey.asyncio import Valkey
+from valkey.asyncio.client import Pipeline
 
+from core.articles.schemas import Article, Articles, ArticleTree, Tags
 from core.cache_tools.enums import CacheDomainEnum
 from core.cache_tools.storages import ResponseCacheInvalidationStorage
+from core.competency_matrix.schemas import CompetencyMatrixItem, CompetencyMatrixItems
+from entrypoints.litestar.content_encoding import accepts_content_encoding
 from infra.config.constants import constants
 from infra.config.settings import settings
 from infra.post_commit_actions import PostCommitActions
 
+LockReleaseScript = Callable[..., Awaitable[int]]
+type ResponseCacheDependenciesPayload = dict[str, list[str]]
+
 
 class ResponseCacheDomain(StrEnum):
     HEALTHCHECK = "healthcheck"
@@ -27,15 +46,798 @@ class ResponseCacheDomain(StrEnum):
     @property
     def cache_key_builder(self) -> CacheKeyBuilder:
         def cache_key_builder(request: Request[Any, Any, Any]) -> str:
+            # Litestar reads the cached response right after building its key, so the store can
+            # answer a conditional request and pick an encoding without decoding the cached body.
+            _requested_response_cache_headers.set(
+                ResponseCacheRequestHeaders(
+                    if_none_match=request.headers.get(
+                        constants.response_cache.if_none_match_header_name,
+                    ),
+                    accept_encoding=request.headers.get(
+                        constants.response_cache.accept_encoding_header_name,
+                    ),
+                ),
+            )
             separator = constants.response_cache.domain_key_separator
             return f"{self.value}{separator}{default_cache_key_builder(request)}"
 
         return cache_key_builder
 
 
+class ResponseCacheCollection(StrEnum):
+    ARTICLE_LIST = "article-list"
+    ARTICLE_TREE = "article-tree"
+    ARTICLE_TAGS = "article-tags"
+    MATRIX_SHEETS = "matrix-sheets"
+    MATRIX_ITEMS = "matrix-items"
+
+
+ARTICLE_COLLECTIONS = frozenset(
+    {
+        ResponseCacheCollection.ARTICLE_LIST,
+        ResponseCacheCollection.ARTICLE_TREE,
+        ResponseCacheCollection.ARTICLE_TAGS,
+    },
+)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheDependencies:
+    collections: frozenset[ResponseCacheCollection] = frozenset()
+    article_slugs: frozenset[str] = frozenset()
+    tag_ids: frozenset[str] = frozenset()
+    folder_ids: frozenset[str] = frozenset()
+    matrix_item_ids: frozenset[str] = frozenset()
+    matrix_sheet_keys: frozenset[str] = frozenset()
+
+    @classmethod
+    def for_article(cls, *, article: Article) -> Self:
+        return cls(
+            article_slugs=frozenset({article.slug}),
+            tag_ids=frozenset(tag.id for tag in article.tags),
+            folder_ids=frozenset({article.folder.id}),
+        )
+
+    @classmethod
+    def for_articles(cls, *, articles: Articles) -> Self:
+        return cls(
+            collections=frozenset({ResponseCacheCollection.ARTICLE_LIST}),
+            article_slugs=frozenset(article.slug for article in articles),
+            tag_ids=frozenset(tag.id for article in articles for tag in article.tags),
+            folder_ids=frozenset(article.folder.id for article in articles),
+        )
+
+    @classmethod
+    def for_article_tree(cls, *, tree: ArticleTree) -> Self:
+        return cls(
+            collections=frozenset({ResponseCacheCollection.ARTICLE_TREE}),
+            article_slugs=frozenset(
+                article.slug for folder in tree.folders for article in folder.articles
+            ),
+            folder_ids=frozenset(folder.folder_id for folder in tree.folders),
+        )
+
+    @classmethod
+    def for_tags(cls, *, tags: Tags) -> Self:
+        return cls(
+            collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+            tag_ids=frozenset(tag.id for tag in tags),
+        )
+
+    @classmethod
+    def for_article_mutation(cls, *, slugs: Iterable[str]) -> Self:
+        # Publication state, ordering and titles feed every article collection, so any article
+        # mutation refreshes them together with the detail pages of the touched slugs.
+        return cls(collections=ARTICLE_COLLECTIONS, article_slugs=frozenset(slugs))
+
+    @classmethod
+    def for_matrix_item(cls, *, item: CompetencyMatrixItem) -> Self:
+        return cls(matrix_item_ids=frozenset({item.id}))
+
+    @classmethod
+    def for_matrix_items(cls, *, sheet_key: str, items: CompetencyMatrixItems) -> Self:
+        return cls(
+            collections=frozenset({ResponseCacheCollection.MATRIX_ITEMS}),
+            matrix_item_ids=frozenset(item.id for item in items),
+            # Sheet keys match case-insensitively, so every producer tags the lowered key.
+            matrix_sheet_keys=frozenset({sheet_key.lower()}),
+        )
+
+    @classmethod
+    def for_matrix_sheets(cls) -> Self:
+        return cls(collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}))
+
+    @classmethod
+    def from_payload(cls, payload: ResponseCacheDependenciesPayload) -> Self:
+        return cls(
+            collections=frozenset(
+                ResponseCacheCollection(value) for value in payload.get("collections", [])
+            ),
+            article_slugs=frozenset(payload.get("article_slugs", [])),
+            tag_ids=frozenset(payload.get("tag_ids", [])),
+            folder_ids=frozenset(payload.get("folder_ids", [])),
+            matrix_item_ids=frozenset(payload.get("matrix_item_ids", [])),
+            matrix_sheet_keys=frozenset(payload.get("matrix_sheet_keys", [])),
+        )
+
+    def to_payload(self) -> ResponseCacheDependenciesPayload:
+        return {
+            "collections": sorted(self.collections),
+            "article_slugs": sorted(self.article_slugs),
+            "tag_ids": sorted(self.tag_ids),
+            "folder_ids": sorted(self.folder_ids),
+            "matrix_item_ids": sorted(self.matrix_item_ids),
+            "matrix_sheet_keys": sorted(self.matrix_sheet_keys),
+        }
+
+    def to_tags(self) -> frozenset[str]:
+        return frozenset(
+            {
+                *(f"collection:{collection.value}" for collection in self.collections),
+                *(f"article:{slug}" for slug in self.article_slugs),
+                *(f"tag:{tag_id}" for tag_id in self.tag_ids),
+                *(f"folder:{folder_id}" for folder_id in self.folder_ids),
+                *(f"matrix-item:{item_id}" for item_id in self.matrix_item_ids),
+                *(f"matrix-sheet:{sheet_key}" for sheet_key in self.matrix_sheet_keys),
+            },
+        )
+
+
+_recorded_response_cache_dependencies: ContextVar[ResponseCacheDependencies | None] = ContextVar(
+    "recorded_response_cache_dependencies",
+    default=None,
+)
+
+
+def record_response_cache_dependencies(dependencies: ResponseCacheDependencies) -> None:
+    # Litestar writes the cached response from the task that ran the handler, so the
+    # dependencies recorded here are the ones ``ResponseCacheDomainStore.set`` indexes.
+    _recorded_response_cache_dependencies.set(dependencies)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheRequestHeaders:
+    if_none_match: str | None = None
+    accept_encoding: str | None = None
+
+
+_requested_response_cache_headers: ContextVar[ResponseCacheRequestHeaders | None] = ContextVar(
+    "requested_response_cache_headers",
+    default=None,
+)
+_revalidating_response_cache_keys: ContextVar[set[str] | None] = ContextVar(
+    "revalidating_response_cache_keys",
+    default=None,
+)
+_response_cache_messages_decoder = msgspec.msgpack.Decoder(list[dict[str, Any]])
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheValue:
+    messages: bytes
+    entity_tag: str | None = None
+    content_encoding: str | None = None
+
+    @classmethod
+    def from_messages(cls, *, messages: list[dict[str, Any]]) -> Self:
+        body = b"".join(
+            message.get("body", b"")
+            for message in messages
+            if message["type"] == "http.response.body"
+        )
+        entity_tag = f'"{hashlib.sha256(body).hexdigest()}"'
+        content_encoding = None
+        start_message = messages[0]
+        headers = [
+            (name, value)
+            for name, value in start_message.get("headers", [])
+            if name
+            not in {
+                constants.response_cache.etag_header_name,
+                constants.response_cache.content_encoding_header_name,
+                constants.response_cache.content_length_header_name,
+                constants.response_cache.vary_header_name,
+            }
+        ]
+        # Only the compressed body is kept, so small payloads stay as they are.
+        if len(body) >= constants.response_cache.compression_min_size_bytes:
+            content_encoding = constants.response_cache.gzip_encoding
+            body = gzip.compress(
+                body,
+                compresslevel=constants.response_cache.gzip_compress_level,
+                mtime=0,
+            )
+            headers.extend(
+                (
+                    (
+                        constants.response_cache.content_encoding_header_name,
+                        content_encoding.encode(),
+                    ),
+                    (
+                        constants.response_cache.vary_header_name,
+                        constants.response_cache.vary_header_value,
+                    ),
+                ),
+            )
+        headers.extend(
+            (
+                (
+                    constants.response_cache.content_length_header_name,
+                    str(len(body)).encode(),
+                ),
+                (
+                    constants.response_cache.etag_header_name,
+                    encoded_entity_tag(
+                        entity_tag=entity_tag,
+                        content_encoding=content_encoding,
+                    ).encode(),
+                ),
+            ),
+        )
+        return cls(
+            messages=msgspec.msgpack.encode(
+                [
+                    {**start_message, "headers": headers},
+                    {"type": "http.response.body", "body": body},
+                ],
+            ),
+            entity_tag=entity_tag,
+            content_encoding=content_encoding,
+        )
+
+    @classmethod
+    def from_stored(cls, value: bytes) -> Self:
+        prefix = constants.response_cache.entity_tag_value_prefix
+        if not value.startswith(prefix):
+            return cls(messages=value)
+        separator = constants.response_cache.entity_tag_value_separator
+        entity_tag_end = value.find(separator, len(prefix))
+        content_encoding_end = value.find(separator, entity_tag_end + 1)
+        return cls(
+            messages=value[content_encoding_end + 1 :],
+            entity_tag=value[len(prefix) : entity_tag_end].decode(),
+            content_encoding=value[entity_tag_end + 1 : content_encoding_end].decode() or None,
+        )
+
+    def to_stored(self) -> bytes:
+        if self.entity_tag is None:
+            return self.messages
+        separator = constants.response_cache.entity_tag_value_separator
+        return b"".join(
+            (
+                constants.response_cache.entity_tag_value_prefix,
+                self.entity_tag.encode(),
+                separator,
+                (self.content_encoding or "").encode(),
+                separator,
+                self.messages,
+            ),
+        )
+
+    def to_response_messages(self, *, request_headers: ResponseCacheRequestHeaders) -> bytes:
+        if self.entity_tag is None:
+            return self.messages
+        content_encoding = (
+            self.content_encoding
+            if self.content_encoding is not None
+            and accepts_content_encoding(
+                header=request_headers.accept_encoding,
+                encoding=self.content_encoding,
+            )
+            else None
+        )
+        if self.is_not_modified(if_none_match=request_headers.if_none_match):
+            return self._not_modified_messages(
+                entity_tag=self.entity_tag,
+                content_encoding=content_encoding,
+            )
+        if content_encoding == self.content_encoding:
+            return self.messages
+        return self._decoded_messages(entity_tag=self.entity_tag)
+
+    def is_not_modified(self, *, if_none_match: str | None) -> bool:
+        if self.entity_tag is None or if_none_match is None:
+            return False
+        candidates = {
+            candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+        }
+        # Every encoding of the same body is an equally fresh copy for the client.
+        return "*" in candidates or not candidates.isdisjoint(
+            {
+                self.entity_tag,
+                encoded_entity_tag(
+                    entity_tag=self.entity_tag,
+                    content_encoding=self.content_encoding,
+                ),
+            },
+        )
+
+    def _not_modified_messages(self, *, entity_tag: str, content_encoding: str | None) -> bytes:
+        headers = [
+            (
+                constants.response_cache.etag_header_name,
+                encoded_entity_tag(
+                    entity_tag=entity_tag,
+                    content_encoding=content_encoding,
+                ).encode(),
+            ),
+        ]
+        if self.content_encoding is not None:
+            headers.append(
+                (
+                    constants.response_cache.vary_header_name,
+                    constants.response_cache.vary_header_value,
+                ),
+            )
+        return msgspec.msgpack.encode(
+            [
+                {"type": "http.response.start", "status": 304, "headers": headers},
+                {"type": "http.response.body", "body": b""},
+            ],
+        )
+
+    def _decoded_messages(self, *, entity_tag: str) -> bytes:
+        start_message, *body_messages = _response_cache_messages_decoder.decode(self.messages)
+        headers = [
+            (name, value)
+            for name, value in start_message.get("headers", [])
+            if name
+            not in {
+                constants.response_cache.etag_header_name,
+                constants.response_cache.content_encoding_header_name,
+                constants.response_cache.content_length_header_name,
+            }
+        ]
+        body = gzip.decompress(b"".join(message.get("body", b"") for message in body_messages))
+        headers.extend(
+            (
+                (constants.response_cache.content_length_header_name, str(len(body)).encode()),
+                (constants.response_cache.etag_header_name, entity_tag.encode()),
+            ),
+        )
+        return msgspec.msgpack.encode(
+            [
+                {**start_message, "headers": headers},
+                {"type": "http.response.body", "body": body},
+            ],
+        )
+
+
+def encoded_entity_tag(*, entity_tag: str, content_encoding: str | None) -> str:
+    if content_encoding is None:
+        return entity_tag
+    return f'{entity_tag.removesuffix('"')}-{content_encoding}"'
+
+
+def to_stored_response_cache_value(value: bytes) -> bytes:
+    if value.startswith(constants.response_cache.entity_tag_value_prefix):
+        return value
+    try:
+        messages = _response_cache_messages_decoder.decode(value)
+    except msgspec.DecodeError:
+        # Values that are not cached ASGI responses are stored untouched.
+        return value
+    if not messages:
+        return value
+    return ResponseCacheValue.from_messages(messages=messages).to_stored()
+
+
+@dataclass(kw_only=True, slots=True)
+class ResponseCacheLocalTier:
+    max_entries: int
+    ttl_seconds: int
+    clock: Callable[[], float] = time.monotonic
+    entries: OrderedDict[str, tuple[float, bytes]] = field(default_factory=OrderedDict)
+
+    def get(self, *, key: str) -> bytes | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, *, key: str, value: bytes, expires_in: int | timedelta | None) -> None:
+        ttl_seconds = self.ttl_seconds
+        if expires_in is not None:
+            ttl_seconds = min(ttl_seconds, _to_seconds(expires_in))
+        if ttl_seconds <= 0:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = (self.clock() + ttl_seconds, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def delete(self, *, key: str) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheInvalidation:
+    domain: ResponseCacheDomain
+    store_key: str | None = None
+
+    def encode(self) -> str:
+        if self.store_key is None:
+            return self.domain.value
+        return f"{self.domain.value}{constants.response_cache.domain_key_separator}{self.store_key}"
+
+    @classmethod
+    def decode(cls, value: str) -> ResponseCacheInvalidation | None:
+        domain_value, separator, store_key = value.partition(
+            constants.response_cache.domain_key_separator,
+        )
+        try:
+            domain = ResponseCacheDomain(domain_value)
+        except ValueError:
+            return None
+        return cls(domain=domain, store_key=store_key if separator and store_key else None)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheInvalidationChannel:
+    valkey: Valkey
+    channel: str
+
+    async def publish(self, *, invalidations: tuple[ResponseCacheInvalidation, ...]) -> None:
+        if not invalidations:
+            return
+        async with self.valkey.pipeline(transaction=False) as pipeline:
+            for invalidation in invalidations:
+                pipeline.publish(self.channel, invalidation.encode())
+            await pipeline.execute()
+
+    async def listen(self) -> AsyncIterator[ResponseCacheInvalidation]:
+        async with self.valkey.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message is None or message["type"] != "message":
+                    continue
+                data = message["data"]
+                invalidation = ResponseCacheInvalidation.decode(
+                    data.decode() if isinstance(data, bytes) else str(data),
+                )
+                if invalidation is not None:
+                    yield invalidation
+
+    async def aclose(self) -> None:
+        await self.valkey.aclose(close_connection_pool=True)
+
+
+@dataclass(kw_only=True, slots=True)
+class ResponseCacheSingleFlight:
+    claim_ttl_seconds: float
+    clock: Callable[[], float] = time.monotonic
+    claims: dict[str, tuple[float, asyncio.Event]] = field(default_factory=dict)
+
+    def claim(self, *, key: str) -> bool:
+        current_claim = self.claims.get(key)
+        if current_claim is not None and current_claim[0] > self.clock():
+            return False
+        self.claims[key] = (self.clock() + self.claim_ttl_seconds, asyncio.Event())
+        return True
+
+    def release(self, *, key: str) -> None:
+        current_claim = self.claims.pop(key, None)
+        if current_claim is not None:
+            current_claim[1].set()
+
+    async def wait(self, *, key: str, timeout_seconds: float) -> None:
+        current_claim = self.claims.get(key)
+        if current_claim is None:
+            # The recomputation runs in another worker, so there is nothing local to await.
+            await asyncio.sleep(timeout_seconds)
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(current_claim[1].wait(), timeout=timeout_seconds)
+
+
+@dataclass(kw_only=True, slots=True)
+class ResponseCacheRevalidationLock:
+    valkey: Valkey
+    namespace: str
+    ttl_seconds: int
+    tokens: dict[str, str] = field(default_factory=dict)
+    _release_script: LockReleaseScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._release_script = self.valkey.register_script(
+            b"""
+            if redis.call('GET', KEYS[1]) == ARGV[1] then
+                return redis.call('DEL', KEYS[1])
+            end
+            return 0
+            """,
+        )
+
+    async def acquire(self, *, key: str) -> bool:
+        token = secrets.token_hex(16)
+        acquired = await self.valkey.set(
+            self._lock_key(key=key),
+            token,
+            nx=True,
+            ex=self.ttl_seconds,
+        )
+        if acquired:
+            self.tokens[key] = token
+        return bool(acquired)
+
+    async def release(self, *, key: str) -> None:
+        token = self.tokens.pop(key, None)
+        if token is None:
+            return
+        await self._release_script(keys=[self._lock_key(key=key)], args=[token])
+
+    def _lock_key(self, *, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheRevalidation:
+    stale_stores: Mapping[ResponseCacheDomain, Store]
+    single_flight: ResponseCacheSingleFlight
+    lock: ResponseCacheRevalidationLock | None
+    stale_ttl_seconds: int
+    wait_timeout_seconds: float
+    poll_interval_seconds: float
+
+    async def start(self, *, key: str) -> bool:
+        if not self.single_flight.claim(key=key):
+            return False
+        if self.lock is not None and not await self.lock.acquire(key=key):
+            self.single_flight.release(key=key)
+            return False
+        return True
+
+    async def finish(self, *, key: str) -> None:
+        self.single_flight.release(key=key)
+        if self.lock is not None:
+            await self.lock.release(key=key)
+
+    async def wait(
+        self,
+        *,
+        key: str,
+        load: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        while time.monotonic() < deadline:
+            await self.single_flight.wait(key=key, timeout_seconds=self.poll_interval_seconds)
+            if (value := await load()) is not None:
+                return value
+        return None
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheDependencyIndex:
+    valkey: Valkey
+    namespace: str
+    ttl_seconds: int
+    domains: frozenset[ResponseCacheDomain]
+    untracked_tag: str = "untracked"
+
+    async def add(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        store_key: str,
+        dependencies: ResponseCacheDependencies | None,
+    ) -> None:
+        if domain not in self.domains:
+            return
+        pipeline = self.valkey.pipeline(transaction=False)
+        self.add_to_pipeline(
+            pipeline=pipeline,
+            domain=domain,
+            store_key=store_key,
+            dependencies=dependencies,
+        )
+        await pipeline.execute()
+
+    def add_to_pipeline(
+        self,
+        *,
+        pipeline: Pipeline,
+        domain: ResponseCacheDomain,
+        store_key: str,
+        dependencies: ResponseCacheDependencies | None,
+    ) -> None:
+        if domain not in self.domains:
+            return
+        tags = dependencies.to_tags() if dependencies is not None else frozenset()
+        for tag in tags or {self.untracked_tag}:
+            index_key = self._index_key(domain=domain, tag=tag)
+            pipeline.sadd(index_key, store_key)
+            pipeline.expire(index_key, self.ttl_seconds)
+
+    async def pop(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        dependencies: ResponseCacheDependencies,
+    ) -> frozenset[str]:
+        # Keys cached without recorded dependencies are dropped on every targeted invalidation.
+        index_keys = [
+            self._index_key(domain=domain, tag=tag)
+            for tag in sorted({*dependencies.to_tags(), self.untracked_tag})
+        ]
+        pipeline = self.valkey.pipeline(transaction=True)
+        pipeline.sunion(index_keys)
+        pipeline.delete(*index_keys)
+        members, _ = await pipeline.execute()
+        return frozenset(
+            member.decode() if isinstance(member, bytes) else str(member) for member in members
+        )
+
+    async def clear(self, *, domain: ResponseCacheDomain) -> None:
+        index_keys = [
+            index_key
+            async for index_key in self.valkey.scan_iter(
+                match=f"{self._domain_namespace(domain=domain)}:*",
+                count=constants.response_cache.status_scan_batch_size,
+            )
+        ]
+        if index_keys:
+            await self.valkey.unlink(*index_keys)
+
+    def _index_key(self, *, domain: ResponseCacheDomain, tag: str) -> str:
+        return f"{self._domain_namespace(domain=domain)}:{tag}"
+
+    def _domain_namespace(self, *, domain: ResponseCacheDomain) -> str:
+        return f"{self.namespace}_{domain.value}"
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheExpiryIndex:
+    valkey: Valkey
+    namespace: str
+    domains: frozenset[ResponseCacheDomain]
+    clock: Callable[[], float] = time.time
+
+    async def add(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        store_key: str,
+        expires_in: int | timedelta | None,
+    ) -> None:
+        if domain not in self.domains:
+            return
+        pipeline = self.valkey.pipeline(transaction=False)
+        self.add_to_pipeline(
+            pipeline=pipeline,
+            domain=domain,
+            store_keys=(store_key,),
+            expires_in=expires_in,
+        )
+        await pipeline.execute()
+
+    def add_to_pipeline(
+        self,
+        *,
+        pipeline: Pipeline,
+        domain: ResponseCacheDomain,
+        store_keys: Iterable[str],
+        expires_in: int | timedelta | None,
+    ) -> None:
+        if domain not in self.domains:
+            return
+        now = self.clock()
+        expires_at = math.inf if expires_in is None else now + _to_seconds(expires_in)
+        index_key = self.index_key(domain=domain)
+        pipeline.zadd(index_key, dict.fromkeys(store_keys, expires_at))
+        # Expired members are trimmed on write, so the index never outgrows the live keys.
+        pipeline.zremrangebyscore(index_key, "-inf", now)
+
+    async def remove(self, *, domain: ResponseCacheDomain, store_keys: Iterable[str]) -> None:
+        members = list(store_keys)
+        if domain in self.domains and members:
+            await self.valkey.zrem(self.index_key(domain=domain), *members)
+
+    async def clear(self, *, domain: ResponseCacheDomain) -> None:
+        if domain in self.domains:
+            await self.valkey.unlink(self.index_key(domain=domain))
+
+    def index_key(self, *, domain: ResponseCacheDomain) -> str:
+        return f"{self.namespace}:{domain.value}"
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheEntry:
+    key: str
+    value: bytes
+    dependencies: ResponseCacheDependencies | None = None
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResponseCacheBatchWriter:
+    valkey: Valkey
+    namespaces: Mapping[ResponseCacheDomain, str]
+    stale_namespaces: Mapping[ResponseCacheDomain, str] = field(default_factory=dict)
+    stale_ttl_seconds: int | None = None
+
+    async def write(
+        self,
+        *,
+        entries: Sequence[tuple[ResponseCacheDomain, str, ResponseCacheEntry]],
+        expires_in_seconds: int,
+        dependency_index: ResponseCacheDependencyIndex | None,
+        expiry_index: ResponseCacheExpiryIndex | None = None,
+    ) -> None:
+        if not entries:
+            return
+        fresh_values = {
+            f"{self.namespaces[domain]}:{store_key}": entry.value
+            for domain, store_key, entry in entries
+        }
+        stale_values = {
+            f"{self.stale_namespaces[domain]}:{store_key}": entry.value
+            for domain, store_key, entry in entries
+            if domain in self.stale_namespaces
+        }
+        pipeline = self.valkey.pipeline(transaction=False)
+        self._set_with_expiry(
+            pipeline=pipeline,
+            values=fresh_values,
+            expires_in_seconds=expires_in_seconds,
+        )
+        if stale_values and self.stale_ttl_seconds is not None:
+            self._set_with_expiry(
+                pipeline=pipeline,
+                values=stale_values,
+                expires_in_seconds=self.stale_ttl_seconds,
+            )
+        if dependency_index is not None:
+            for domain, store_key, entry in entries:
+                dependency_index.add_to_pipeline(
+                    pipeline=pipeline,
+                    domain=domain,
+                    store_key=store_key,
+                    dependencies=entry.dependencies,
+                )
+        if expiry_index is not None:
+            store_keys_by_domain: dict[ResponseCacheDomain, list[str]] = {}
+            for domain, store_key, _ in entries:
+                store_keys_by_domain.setdefault(domain, []).append(store_key)
+            for domain, store_keys in store_keys_by_domain.items():
+                expiry_index.add_to_pipeline(
+                    pipeline=pipeline,
+                    domain=domain,
+                    store_keys=store_keys,
+                    expires_in=expires_in_seconds,
+                )
+        await pipeline.execute()
+
+    def _set_with_expiry(
+        self,
+        *,
+        pipeline: Pipeline,
+        values: Mapping[str, bytes],
+        expires_in_seconds: int,
+    ) -> None:
+        pipeline.mset(dict(values))
+        for raw_key in values:
+            pipeline.expire(raw_key, expires_in_seconds)
+
+
 @dataclass(kw_only=True, slots=True, frozen=True)
 class ResponseCacheDomainStore(Store, ResponseCacheInvalidationStorage):
     stores: Mapping[ResponseCacheDomain, Store]
+    local_tiers: Mapping[ResponseCacheDomain, ResponseCacheLocalTier] = field(
+        default_factory=dict,
+    )
+    invalidation_channel: ResponseCacheInvalidationChannel | None = None
+    revalidation: ResponseCacheRevalidation | None = None
+    dependency_index: ResponseCacheDependencyIndex | None = None
+    expiry_index: ResponseCacheExpiryIndex | None = None
+    batch_writer: ResponseCacheBatchWriter | None = None
 
     async def set(
         self,
@@ -43,37 +845,286 @@ class ResponseCacheDomainStore(Store, ResponseCacheInvalidationStorage):
         value: str | bytes,
         expires_in: int | timedelta | None = None,
     ) -> None:
-        store, store_key = self._get_domain_store(key=key)
-        await store.set(key=store_key, value=value, expires_in=expires_in)
+        dependencies = _recorded_response_cache_dependencies.get()
+        _recorded_response_cache_dependencies.set(None)
+        await self.set_with_dependencies(
+            key=key,
+            value=value,
+            expires_in=expires_in,
+            dependencies=dependencies,
+        )
+
+    async def set_with_dependencies(
+        self,
+        *,
+        key: str,
+        value: str | bytes,
+        expires_in: int | timedelta | None,
+        dependencies: ResponseCacheDependencies | None,
+    ) -> None:
+        domain, store_key = self._split_key(key=key)
+        if isinstance(value, bytes):
+            value = to_stored_response_cache_value(value)
+        await self.stores[domain].set(key=store_key, value=value, expires_in=expires_in)
+        if self.dependency_index is not None:
+            await self.dependency_index.add(
+                domain=domain,
+                store_key=store_key,
+                dependencies=dependencies,
+            )
+        if self.expiry_index is not None:
+            await self.expiry_index.add(
+                domain=domain,
+                store_key=store_key,
+                expires_in=expires_in,
+            )
+        if local_tier := self.local_tiers.get(domain):
+            local_tier.set(
+                key=store_key,
+                value=value if isinstance(value, bytes) else value.encode(),
+                expires_in=expires_in,
+            )
+        if self.revalidation is not None and (
+            stale_store := self.revalidation.stale_stores.get(domain)
+        ):
+            await stale_store.set(
+                key=store_key,
+                value=value,
+                expires_in=self.revalidation.stale_ttl_seconds,
+            )
+            revalidating_keys = _revalidating_response_cache_keys.get()
+            if revalidating_keys is not None and key in revalidating_keys:
+                # Only the request that claimed the key may release the claim and its lock.
+                revalidating_keys.discard(key)
+                await self.revalidation.finish(key=key)
+
+    async def set_many(self, *, entries: Sequence[ResponseCacheEntry], expires_in: int) -> None:
+        entries = [
+            replace(entry, value=to_stored_response_cache_value(entry.value)) for entry in entries
+        ]
+        if self.batch_writer is None:
+            for entry in entries:
+                await self.set_with_dependencies(
+                    key=entry.key,
+                    value=entry.value,
+                    expires_in=expires_in,
+                    dependencies=entry.dependencies,
+                )
+            return
+        split_entries = [(*self._split_key(key=entry.key), entry) for entry in entries]
+        await self.batch_writer.write(
+            entries=split_entries,
+            expires_in_seconds=expires_in,
+            dependency_index=self.dependency_index,
+            expiry_index=self.expiry_index,
+        )
+        for domain, store_key, entry in split_entries:
+            if local_tier := self.local_tiers.get(domain):
+                local_tier.set(key=store_key, value=entry.value, expires_in=expires_in)
 
     async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
-        store, store_key = self._get_domain_store(key=key)
-        return await store.get(key=store_key, renew_for=renew_for)
+        value = await self._get_stored(key=key, renew_for=renew_for)
+        if value is None:
+            return None
+        return ResponseCacheValue.from_stored(value).to_response_messages(
+            request_headers=(
+                _requested_response_cache_headers.get() or ResponseCacheRequestHeaders()
+            ),
+        )
 
     async def delete(self, key: str) -> None:
-        store, store_key = self._get_domain_store(key=key)
-        await store.delete(key=store_key)
+        domain, store_key = self._split_key(key=key)
+        await self.stores[domain].delete(key=store_key)
+        if self.expiry_index is not None:
+            await self.expiry_index.remove(domain=domain, store_keys=(store_key,))
+        await self._invalidate_local(
+            invalidations=(ResponseCacheInvalidation(domain=domain, store_key=store_key),),
+        )
 
     async def delete_all(self) -> None:
-        for store in self.stores.values():
-            await store.delete_all()
+        await asyncio.gather(
+            *(self._delete_domain_entries(domain=domain) for domain in self.stores)
+        )
+        await self._delete_stale_domains(domains=tuple(self.stores))
+        await self._invalidate_local(
+            invalidations=tuple(ResponseCacheInvalidation(domain=domain) for domain in self.stores),
+        )
 
     async def delete_domain(self, domain: ResponseCacheDomain) -> None:
-        await self.stores[domain].delete_all()
+        await self._delete_domain_entries(domain=domain)
+        await self._delete_stale_domains(domains=(domain,))
+        await self._invalidate_local(invalidations=(ResponseCacheInvalidation(domain=domain),))
+
+    async def delete_dependencies(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        dependencies: ResponseCacheDependencies,
+    ) -> int:
+        if self.dependency_index is None:
+            await self.delete_domain(domain=domain)
+            return 0
+        store_keys = await self.dependency_index.pop(domain=domain, dependencies=dependencies)
+        for store_key in sorted(store_keys):
+            await self.stores[domain].delete(key=store_key)
+        await self._delete_stale_keys(domain=domain, store_keys=store_keys)
+        if self.expiry_index is not None:
+            await self.expiry_index.remove(domain=domain, store_keys=store_keys)
+        await self._invalidate_local(
+            invalidations=tuple(
+                ResponseCacheInvalidation(domain=domain, store_key=store_key)
+                for store_key in sorted(store_keys)
+            ),
+        )
+        return len(store_keys)
 
     async def clear_domains(self, *, domains: tuple[CacheDomainEnum, ...]) -> None:
-        for domain in domains:
-            await self.delete_domain(domain=ResponseCacheDomain(domain.value))
+        response_cache_domains = tuple(ResponseCacheDomain(domain.value) for domain in domains)
+        await asyncio.gather(
+            *(self._delete_domain_entries(domain=domain) for domain in response_cache_domains),
+        )
+        await self._delete_stale_domains(domains=response_cache_domains)
+        await self._invalidate_local(
+            invalidations=tuple(
+                ResponseCacheInvalidation(domain=domain) for domain in response_cache_domains
+            ),
+        )
 
     async def exists(self, key: str) -> bool:
-        store, store_key = self._get_domain_store(key=key)
-        return await store.exists(key=store_key)
+        domain, store_key = self._split_key(key=key)
+        return await self.stores[domain].exists(key=store_key)
 
     async def expires_in(self, key: str) -> int | None:
-        store, store_key = self._get_domain_store(key=key)
-        return await store.expires_in(key=store_key)
+        domain, store_key = self._split_key(key=key)
+        return await self.stores[domain].expires_in(key=store_key)
 
-    def _get_domain_store(self, *, key: str) -> tuple[Store, str]:
+    @contextlib.asynccontextmanager
+    async def revalidating(self) -> AsyncIterator[None]:
+        # Litestar only stores cacheable responses, so claims left by error responses are
+        # finished here instead of in ``set``.
+        revalidating_keys: set[str] = set()
+        token = _revalidating_response_cache_keys.set(revalidating_keys)
+        try:
+            yield
+        finally:
+            _revalidating_response_cache_keys.reset(token)
+            if self.revalidation is not None:
+                for key in sorted(revalidating_keys):
+                    await self.revalidation.finish(key=key)
+
+    def forget_local(self, *, invalidation: ResponseCacheInvalidation) -> None:
+        local_tier = self.local_tiers.get(invalidation.domain)
+        if local_tier is None:
+            return
+        if invalidation.store_key is None:
+            local_tier.clear()
+        else:
+            local_tier.delete(key=invalidation.store_key)
+
+    def forget_all_local(self) -> None:
+        for local_tier in self.local_tiers.values():
+            local_tier.clear()
+
+    async def __aenter__(self) -> None:
+        for store in self.stores.values():
+            await store.__aenter__()
+        if self.revalidation is not None:
+            for stale_store in self.revalidation.stale_stores.values():
+                await stale_store.__aenter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for store in self.stores.values():
+            await store.__aexit__(exc_type, exc_val, exc_tb)
+        if self.revalidation is not None:
+            for stale_store in self.revalidation.stale_stores.values():
+                await stale_store.__aexit__(exc_type, exc_val, exc_tb)
+        if self.invalidation_channel is not None:
+            await self.invalidation_channel.aclose()
+
+    async def _get_stored(
+        self,
+        *,
+        key: str,
+        renew_for: int | timedelta | None,
+    ) -> bytes | None:
+        domain, store_key = self._split_key(key=key)
+        local_tier = self.local_tiers.get(domain) if renew_for is None else None
+        if local_tier is not None and (value := local_tier.get(key=store_key)) is not None:
+            return value
+        value = await self.stores[domain].get(key=store_key, renew_for=renew_for)
+        if local_tier is not None and value is not None:
+            local_tier.set(key=store_key, value=value, expires_in=None)
+        if value is not None or renew_for is not None:
+            return value
+        return await self._get_while_revalidating(domain=domain, key=key, store_key=store_key)
+
+    async def _get_while_revalidating(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        key: str,
+        store_key: str,
+    ) -> bytes | None:
+        revalidation = self.revalidation
+        if revalidation is None or (stale_store := revalidation.stale_stores.get(domain)) is None:
+            return None
+        if await revalidation.start(key=key):
+            # This request recomputes the response; ``set`` or ``revalidating`` finishes it.
+            if (revalidating_keys := _revalidating_response_cache_keys.get()) is not None:
+                revalidating_keys.add(key)
+            return None
+        if (stale_value := await stale_store.get(key=store_key)) is not None:
+            return stale_value
+        return await revalidation.wait(
+            key=key,
+            load=partial(self.stores[domain].get, key=store_key),
+        )
+
+    async def _delete_stale_domains(self, *, domains: tuple[ResponseCacheDomain, ...]) -> None:
+        if self.revalidation is None:
+            return
+        stale_stores = self.revalidation.stale_stores
+        await asyncio.gather(
+            *(stale_stores[domain].delete_all() for domain in domains if domain in stale_stores),
+        )
+
+    async def _delete_stale_keys(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        store_keys: frozenset[str],
+    ) -> None:
+        if (
+            self.revalidation is None
+            or (stale_store := self.revalidation.stale_stores.get(domain)) is None
+        ):
+            return
+        for store_key in sorted(store_keys):
+            await stale_store.delete(key=store_key)
+
+    async def _delete_domain_entries(self, *, domain: ResponseCacheDomain) -> None:
+        await self.stores[domain].delete_all()
+        if self.dependency_index is not None:
+            await self.dependency_index.clear(domain=domain)
+        if self.expiry_index is not None:
+            await self.expiry_index.clear(domain=domain)
+
+    async def _invalidate_local(
+        self,
+        *,
+        invalidations: tuple[ResponseCacheInvalidation, ...],
+    ) -> None:
+        for invalidation in invalidations:
+            self.forget_local(invalidation=invalidation)
+        if self.invalidation_channel is not None:
+            await self.invalidation_channel.publish(invalidations=invalidations)
+
+    def _split_key(self, *, key: str) -> tuple[ResponseCacheDomain, str]:
         domain_value, separator, store_key = key.partition(
             constants.response_cache.domain_key_separator,
         )
@@ -85,7 +1136,13 @@ class ResponseCacheDomainStore(Store, ResponseCacheInvalidationStorage):
         except ValueError as exc:
             msg = f"Unknown response cache domain: {domain_value}"
             raise ImproperlyConfiguredException(msg) from exc
-        return self.stores[domain], store_key
+        return domain, store_key
+
+
+def _to_seconds(value: int | timedelta) -> int:
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+    return value
 
 
 async def invalidate_response_cache_domain(
@@ -115,18 +1172,65 @@ async def invalidate_and_enqueue_response_cache_warm_domain(
     await cache_warm_domain.kiq(domain.value)  # type: ignore[call-overload]
 
 
+async def invalidate_response_cache_dependencies(
+    *,
+    request: Request[Any, Any, Any],
+    domain: ResponseCacheDomain,
+    dependencies: ResponseCacheDependencies,
+) -> None:
+    if not settings.app.use_cache:
+        return
+    store = request.app.response_cache_config.get_store_from_app(request.app)
+    if not isinstance(store, ResponseCacheDomainStore):
+        msg = "Response cache store must be domain-routed."
+        raise ImproperlyConfiguredException(msg)
+    await store.delete_dependencies(domain=domain, dependencies=dependencies)
+
+
+async def invalidate_and_enqueue_response_cache_warm_dependencies(
+    *,
+    request: Request[Any, Any, Any],
+    domain: ResponseCacheDomain,
+    dependencies: ResponseCacheDependencies,
+) -> None:
+    await invalidate_response_cache_dependencies(
+        request=request,
+        domain=domain,
+        dependencies=dependencies,
+    )
+    if not settings.app.use_cache:
+        return
+    from entrypoints.taskiq.cache_warm.tasks import cache_warm_dependencies  # noqa: PLC0415
+
+    await cache_warm_dependencies.kiq(  # type: ignore[call-overload]
+        domain.value,
+        dependencies.to_payload(),
+    )
+
+
 async def invalidate_response_cache_domain_for_mutation(
     *,
     request: Request[Any, Any, Any],
     domain: ResponseCacheDomain,
     post_commit_actions: PostCommitActions,
+    dependencies: ResponseCacheDependencies | None = None,
 ) -> None:
     if not settings.app.use_cache:
         return
+    if dependencies is None:
+        post_commit_actions.add(
+            action=partial(
+                invalidate_and_enqueue_response_cache_warm_domain,
+                request=request,
+                domain=domain,
+            ),
+        )
+        return
     post_commit_actions.add(
         action=partial(
-            invalidate_and_enqueue_response_cache_warm_domain,
+            invalidate_and_enqueue_response_cache_warm_dependencies,
             request=request,
             domain=domain,
+            dependencies=dependencies,
         ),
     )
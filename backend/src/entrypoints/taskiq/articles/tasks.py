@@ -0,0 +1,30 @@
+from dishka.integrations.taskiq import FromDishka, inject
+
+from core.articles.storages import ArticleViewCounterBuffer
+from core.articles.use_cases import ArticleAnalyticsUseCase
+from entrypoints.taskiq.broker import broker
+from infra.config.constants import constants
+from infra.config.settings import settings
+from infra.post_commit_actions import PostCommitActions
+
+
+@broker.task(
+    constants.taskiq.article_view_counter_flush_task_name,
+    schedule=[
+        {
+            "schedule_id": constants.taskiq.article_view_counter_flush_task_name,
+            "interval": settings.taskiq.article_view_counter_flush_interval_seconds,
+        },
+    ],
+)
+@inject(patch_module=True)
+async def flush_article_view_counters(
+    use_case: FromDishka[ArticleAnalyticsUseCase],
+    view_counter_buffer: FromDishka[ArticleViewCounterBuffer],
+    post_commit_actions: FromDishka[PostCommitActions],
+) -> dict[str, int]:
+    flushed_count = await use_case.flush_view_counters()
+    # The claimed batch stays in Valkey until the upsert commits, so a failed flush is retried.
+    if flushed_count:
+        post_commit_actions.add(action=view_counter_buffer.acknowledge_pending)
+    return {"flushedCount": flushed_count}
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+
+from dishka import AsyncContainer
+
+from entrypoints.taskiq.cache_warm.targets import ResponseCacheWarmTargetCollector
+
+
+class CacheWarmCollectorScopes(ABC):
+    @abstractmethod
+    def open(self) -> AbstractAsyncContextManager[ResponseCacheWarmTargetCollector]:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class DishkaCacheWarmCollectorScopes(CacheWarmCollectorScopes):
+    container: AsyncContainer
+
+    # Every scope owns its own database session, so partitions can be collected concurrently.
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[ResponseCacheWarmTargetCollector]:
+        async with self.container() as request_container:
+            yield await request_container.get(ResponseCacheWarmTargetCollector)
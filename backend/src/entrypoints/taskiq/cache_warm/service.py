@@ -1,11 +1,18 @@
-from collections.abc import Iterable
+import asyncio
+import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 
 from core.cache_tools.clients import CacheWarmExecutor
 from core.cache_tools.schemas import CacheWarmSummary
-from entrypoints.litestar.response_cache import ResponseCacheDomain
-from entrypoints.taskiq.cache_warm.targets import ResponseCacheWarmTargetCollector
-from entrypoints.taskiq.cache_warm.writer import ResponseCacheWarmWriter
+from entrypoints.litestar.response_cache import ResponseCacheDependencies, ResponseCacheDomain
+from entrypoints.taskiq.cache_warm.scopes import CacheWarmCollectorScopes
+from entrypoints.taskiq.cache_warm.targets import (
+    CacheWarmPartition,
+    ResponseCacheWarmTargetCollector,
+)
+from entrypoints.taskiq.cache_warm.writer import CacheWarmTimings, ResponseCacheWarmWriter
+from infra.config.constants import constants
 
 __all__ = ("CacheWarmSummary", "ResponseCacheWarmService")
 
@@ -16,6 +23,8 @@ class ResponseCacheWarmService(CacheWarmExecutor):
     writer: ResponseCacheWarmWriter
     use_cache: bool
     supported_domains: tuple[ResponseCacheDomain, ...]
+    collector_scopes: CacheWarmCollectorScopes | None = None
+    clock: Callable[[], float] = time.perf_counter
 
     async def warm_all(self) -> CacheWarmSummary:
         return await self.warm_domains(domains=self.supported_domains)
@@ -38,14 +47,82 @@ class ResponseCacheWarmService(CacheWarmExecutor):
                 skipped=len(requested_domains),
             )
 
-        targets = await self.target_collector.collect(domains=warmable_domains)
-        for target in targets:
-            await self.writer.write_target(target)
+        timings = CacheWarmTimings(clock=self.clock)
+        written = await self._warm_partitions(domains=warmable_domains, timings=timings)
         return CacheWarmSummary(
-            attempted=len(targets),
-            written=len(targets),
+            attempted=written,
+            written=written,
             skipped=skipped_domains_count,
+            collect_ms=timings.collect_ms,
+            write_ms=timings.write_ms,
+        )
+
+    async def warm_dependencies(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        dependencies: ResponseCacheDependencies,
+    ) -> CacheWarmSummary:
+        if not self.use_cache or not self.can_warm_domain(domain=domain):
+            return CacheWarmSummary(attempted=0, written=0, skipped=1)
+        timings = CacheWarmTimings(clock=self.clock)
+        written = await self.writer.write_stream(
+            timings.timed_targets(
+                self.target_collector.collect_dependencies(
+                    domain=domain,
+                    dependencies=dependencies,
+                ),
+            ),
+            timings=timings,
+        )
+        return CacheWarmSummary(
+            attempted=written,
+            written=written,
+            skipped=0,
+            collect_ms=timings.collect_ms,
+            write_ms=timings.write_ms,
         )
 
     def can_warm_domain(self, *, domain: ResponseCacheDomain) -> bool:
         return domain in self.supported_domains
+
+    async def _warm_partitions(
+        self,
+        *,
+        domains: tuple[ResponseCacheDomain, ...],
+        timings: CacheWarmTimings,
+    ) -> int:
+        collector_scopes = self.collector_scopes
+        if collector_scopes is None:
+            return await self.writer.write_stream(
+                timings.timed_targets(self.target_collector.collect(domains=domains)),
+                timings=timings,
+            )
+        semaphore = asyncio.Semaphore(constants.response_cache.warm_collect_concurrency)
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(
+                    self._warm_partition(
+                        collector_scopes=collector_scopes,
+                        partition=partition,
+                        semaphore=semaphore,
+                        timings=timings,
+                    ),
+                )
+                for partition in self.target_collector.partitions(domains=domains)
+            ]
+        return sum(task.result() for task in tasks)
+
+    async def _warm_partition(
+        self,
+        *,
+        collector_scopes: CacheWarmCollectorScopes,
+        partition: CacheWarmPartition,
+        semaphore: asyncio.Semaphore,
+        timings: CacheWarmTimings,
+    ) -> int:
+        async with semaphore, collector_scopes.open() as collector:
+            return await self.writer.write_stream(
+                timings.timed_targets(collector.collect_partition(partition=partition)),
+                timings=timings,
+            )
@@ -1,13 +1,16 @@
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
 from urllib.parse import urlencode
 
+from core.articles.exceptions import ArticleNotFoundError
 from core.articles.schemas import Article, ArticleFilters, Articles, ArticleTree, Tags
 from core.articles.use_cases import ArticlesUseCase
+from core.competency_matrix.exceptions import CompetencyMatrixItemNotFoundError
 from core.competency_matrix.schemas import (
     CompetencyMatrixItem,
     CompetencyMatrixItemBySlugGetParams,
     CompetencyMatrixItemFilters,
+    CompetencyMatrixItemGetParams,
     CompetencyMatrixItems,
     Sheets,
 )
@@ -31,7 +34,11 @@ from entrypoints.litestar.api.i18n.schemas import (
     LanguagesResponseSchema,
 )
 from entrypoints.litestar.api.schemas import CamelCaseSchema
-from entrypoints.litestar.response_cache import ResponseCacheDomain
+from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
+    ResponseCacheDomain,
+)
 from infra.config.constants import constants
 from infra.config.settings import settings
 
@@ -42,6 +49,7 @@ class CacheWarmTarget:
     path: str
     query: tuple[tuple[str, str], ...]
     response: CamelCaseSchema
+    dependencies: ResponseCacheDependencies = field(default_factory=ResponseCacheDependencies)
 
     def build_cache_key(self) -> str:
         query_string = urlencode(sorted(self.query), doseq=True)
@@ -55,6 +63,12 @@ class CacheWarmTarget:
         return self.response.response_cache_payload()
 
 
+@dataclass(frozen=True, slots=True)
+class CacheWarmPartition:
+    domain: ResponseCacheDomain
+    language: LanguageEnum | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class CacheWarmQueryBuilder:
     def build(self, *values: tuple[str, str]) -> tuple[tuple[str, str], ...]:
@@ -103,27 +117,76 @@ class ArticlesCacheWarmTargetCollector:
     articles_use_case: ArticlesUseCase
     query_builder: CacheWarmQueryBuilder
 
-    async def collect(self) -> list[CacheWarmTarget]:
-        targets: list[CacheWarmTarget] = []
+    async def collect(self) -> AsyncIterator[CacheWarmTarget]:
         for language in LanguageEnum:
-            targets.extend(await self._collect_language_targets(language=language))
-        return targets
+            async for target in self.collect_language(language=language):
+                yield target
 
-    async def _collect_language_targets(self, *, language: LanguageEnum) -> list[CacheWarmTarget]:
+    async def collect_language(self, *, language: LanguageEnum) -> AsyncIterator[CacheWarmTarget]:
         tags = await self.articles_use_case.list_tags(
             language=language,
             only_with_published_articles=True,
         )
+        yield self._tags_target(tags=tags, language=language)
         tree = await self.articles_use_case.list_tree(only_published=True, language=language)
+        yield self._tree_target(tree=tree, language=language)
         articles = await self.articles_use_case.list_articles(
             filters=self._build_list_filters(language=language),
         )
-        return [
-            self._tags_target(tags=tags, language=language),
-            self._tree_target(tree=tree, language=language),
-            self._list_target(articles=articles, language=language),
-            *await self._detail_targets(articles=articles, language=language),
+        yield self._list_target(articles=articles, language=language)
+        async for chunk in self.articles_use_case.iter_published_articles(
+            chunk_size=constants.response_cache.warm_detail_chunk_size,
+        ):
+            for article in chunk:
+                yield self._detail_target(article=article, language=language)
+
+    async def collect_dependencies(
+        self,
+        *,
+        dependencies: ResponseCacheDependencies,
+    ) -> AsyncIterator[CacheWarmTarget]:
+        details = [
+            detail
+            for slug in sorted(dependencies.article_slugs)
+            if (detail := await self._load_published_detail(slug=slug)) is not None
         ]
+        for language in LanguageEnum:
+            for target in await self._collect_dependency_collection_targets(
+                dependencies=dependencies,
+                language=language,
+            ):
+                yield target
+            for detail in details:
+                yield self._detail_target(article=detail, language=language)
+
+    async def _collect_dependency_collection_targets(
+        self,
+        *,
+        dependencies: ResponseCacheDependencies,
+        language: LanguageEnum,
+    ) -> list[CacheWarmTarget]:
+        targets: list[CacheWarmTarget] = []
+        if ResponseCacheCollection.ARTICLE_TAGS in dependencies.collections or dependencies.tag_ids:
+            tags = await self.articles_use_case.list_tags(
+                language=language,
+                only_with_published_articles=True,
+            )
+            targets.append(self._tags_target(tags=tags, language=language))
+        if ResponseCacheCollection.ARTICLE_TREE in dependencies.collections:
+            tree = await self.articles_use_case.list_tree(only_published=True, language=language)
+            targets.append(self._tree_target(tree=tree, language=language))
+        if ResponseCacheCollection.ARTICLE_LIST in dependencies.collections or dependencies.tag_ids:
+            articles = await self.articles_use_case.list_articles(
+                filters=self._build_list_filters(language=language),
+            )
+            targets.append(self._list_target(articles=articles, language=language))
+        return targets
+
+    async def _load_published_detail(self, *, slug: str) -> Article | None:
+        try:
+            return await self.articles_use_case.get_article(slug=slug, only_published=True)
+        except ArticleNotFoundError:
+            return None
 
     def _build_list_filters(self, *, language: LanguageEnum) -> ArticleFilters:
         return ArticleFilters(
@@ -148,6 +211,7 @@ class ArticlesCacheWarmTargetCollector:
                 schema=tags,
                 language=language,
             ),
+            dependencies=ResponseCacheDependencies.for_tags(tags=tags),
         )
 
     def _tree_target(self, *, tree: ArticleTree, language: LanguageEnum) -> CacheWarmTarget:
@@ -156,6 +220,7 @@ class ArticlesCacheWarmTargetCollector:
             path="/api/articles/tree",
             query=self.query_builder.build(("language", language.value)),
             response=ArticleTreeResponseSchema.from_domain_schema(schema=tree),
+            dependencies=ResponseCacheDependencies.for_article_tree(tree=tree),
         )
 
     def _list_target(self, *, articles: Articles, language: LanguageEnum) -> CacheWarmTarget:
@@ -171,41 +236,19 @@ class ArticlesCacheWarmTargetCollector:
                 schema=articles,
                 language=language,
             ),
+            dependencies=ResponseCacheDependencies.for_articles(articles=articles),
         )
 
-    async def _detail_targets(
-        self,
-        *,
-        articles: Articles,
-        language: LanguageEnum,
-    ) -> list[CacheWarmTarget]:
-        return [
-            self._detail_target(
-                article=article,
-                detail=await self._load_detail(article=article),
-                language=language,
-            )
-            for article in articles.values
-        ]
-
-    async def _load_detail(self, *, article: Article) -> Article:
-        return await self.articles_use_case.get_article(slug=article.slug, only_published=True)
-
-    def _detail_target(
-        self,
-        *,
-        article: Article,
-        detail: Article,
-        language: LanguageEnum,
-    ) -> CacheWarmTarget:
+    def _detail_target(self, *, article: Article, language: LanguageEnum) -> CacheWarmTarget:
         return CacheWarmTarget(
             domain=ResponseCacheDomain.ARTICLES,
             path=f"/api/articles/detail/{article.slug}",
             query=self.query_builder.build(("language", language.value)),
             response=ArticleDetailResponseSchema.from_domain_schema(
-                schema=detail,
+                schema=article,
                 language=language,
             ),
+            dependencies=ResponseCacheDependencies.for_article(article=article),
         )
 
 
@@ -214,18 +257,63 @@ class CompetencyMatrixCacheWarmTargetCollector:
     matrix_use_case: CompetencyMatrixUseCase
     query_builder: CacheWarmQueryBuilder
 
-    async def collect(self) -> list[CacheWarmTarget]:
-        targets: list[CacheWarmTarget] = []
+    async def collect(self) -> AsyncIterator[CacheWarmTarget]:
         for language in LanguageEnum:
-            targets.extend(await self._collect_language_targets(language=language))
-        return targets
+            async for target in self.collect_language(language=language):
+                yield target
 
-    async def _collect_language_targets(self, *, language: LanguageEnum) -> list[CacheWarmTarget]:
+    async def collect_language(self, *, language: LanguageEnum) -> AsyncIterator[CacheWarmTarget]:
         sheets = await self.matrix_use_case.list_sheets()
-        return [
-            self._sheets_target(sheets=sheets, language=language),
-            *await self._sheet_item_targets(sheets=sheets, language=language),
+        yield self._sheets_target(sheets=sheets, language=language)
+        for sheet in sheets:
+            items = await self.matrix_use_case.list_items(
+                filters=CompetencyMatrixItemFilters(
+                    sheet_key=sheet.key,
+                    only_published=True,
+                ),
+            )
+            yield self._items_target(sheet_key=sheet.key, items=items, language=language)
+            for item in items.values:
+                yield await self._public_detail_target(item=item, language=language)
+
+    async def collect_dependencies(
+        self,
+        *,
+        dependencies: ResponseCacheDependencies,
+    ) -> AsyncIterator[CacheWarmTarget]:
+        sheets = await self.matrix_use_case.list_sheets()
+        items = [
+            item
+            for item_id in sorted(dependencies.matrix_item_ids)
+            if (item := await self._load_item(item_id=item_id)) is not None
         ]
+        sheet_keys = {
+            *dependencies.matrix_sheet_keys,
+            *(item.sheet_key.lower() for item in items),
+        }
+        if ResponseCacheCollection.MATRIX_ITEMS in dependencies.collections:
+            sheet_keys.update(sheet.key.lower() for sheet in sheets)
+        for language in LanguageEnum:
+            if ResponseCacheCollection.MATRIX_SHEETS in dependencies.collections:
+                yield self._sheets_target(sheets=sheets, language=language)
+            for sheet_key in sorted(
+                sheet.key for sheet in sheets if sheet.key.lower() in sheet_keys
+            ):
+                sheet_items = await self.matrix_use_case.list_items(
+                    filters=CompetencyMatrixItemFilters(sheet_key=sheet_key, only_published=True),
+                )
+                yield self._items_target(sheet_key=sheet_key, items=sheet_items, language=language)
+            for item in items:
+                if item.is_available():
+                    yield await self._public_detail_target(item=item, language=language)
+
+    async def _load_item(self, *, item_id: str) -> CompetencyMatrixItem | None:
+        try:
+            return await self.matrix_use_case.get_item(
+                params=CompetencyMatrixItemGetParams(item_id=item_id, only_published=False),
+            )
+        except CompetencyMatrixItemNotFoundError:
+            return None
 
     def _sheets_target(self, *, sheets: Sheets, language: LanguageEnum) -> CacheWarmTarget:
         return CacheWarmTarget(
@@ -236,28 +324,9 @@ class CompetencyMatrixCacheWarmTargetCollector:
                 schema=sheets,
                 language=language,
             ),
+            dependencies=ResponseCacheDependencies.for_matrix_sheets(),
         )
 
-    async def _sheet_item_targets(
-        self,
-        *,
-        sheets: Sheets,
-        language: LanguageEnum,
-    ) -> list[CacheWarmTarget]:
-        targets: list[CacheWarmTarget] = []
-        for sheet in sheets:
-            items = await self.matrix_use_case.list_items(
-                filters=CompetencyMatrixItemFilters(
-                    sheet_key=sheet.key,
-                    only_published=True,
-                ),
-            )
-            targets.append(
-                self._items_target(sheet_key=sheet.key, items=items, language=language),
-            )
-            targets.extend(await self._item_detail_targets(items=items, language=language))
-        return targets
-
     def _items_target(
         self,
         *,
@@ -277,42 +346,24 @@ class CompetencyMatrixCacheWarmTargetCollector:
                 schema=items,
                 language=language,
             ),
+            dependencies=ResponseCacheDependencies.for_matrix_items(
+                sheet_key=sheet_key,
+                items=items,
+            ),
         )
 
-    async def _item_detail_targets(
-        self,
-        *,
-        items: CompetencyMatrixItems,
-        language: LanguageEnum,
-    ) -> list[CacheWarmTarget]:
-        targets: list[CacheWarmTarget] = []
-        for item in items.values:
-            targets.extend(await self._single_item_detail_targets(item=item, language=language))
-        return targets
-
-    async def _single_item_detail_targets(
+    async def _public_detail_target(
         self,
         *,
         item: CompetencyMatrixItem,
         language: LanguageEnum,
-    ) -> list[CacheWarmTarget]:
-        public_detail = await self.matrix_use_case.get_item_by_slug(
+    ) -> CacheWarmTarget:
+        detail = await self.matrix_use_case.get_item_by_slug(
             params=CompetencyMatrixItemBySlugGetParams(
                 slug=item.slug,
                 only_published=True,
             ),
         )
-        return [
-            self._public_detail_target(item=item, detail=public_detail, language=language),
-        ]
-
-    def _public_detail_target(
-        self,
-        *,
-        item: CompetencyMatrixItem,
-        detail: CompetencyMatrixItem,
-        language: LanguageEnum,
-    ) -> CacheWarmTarget:
         return CacheWarmTarget(
             domain=ResponseCacheDomain.COMPETENCY_MATRIX,
             path=f"/api/competency-matrix/items/public/{item.slug}",
@@ -321,6 +372,7 @@ class CompetencyMatrixCacheWarmTargetCollector:
                 schema=detail,
                 language=language,
             ),
+            dependencies=ResponseCacheDependencies.for_matrix_item(item=detail),
         )
 
 
@@ -330,13 +382,62 @@ class ResponseCacheWarmTargetCollector:
     articles_collector: ArticlesCacheWarmTargetCollector
     matrix_collector: CompetencyMatrixCacheWarmTargetCollector
 
-    async def collect(self, *, domains: Iterable[ResponseCacheDomain]) -> list[CacheWarmTarget]:
+    async def collect(
+        self,
+        *,
+        domains: Iterable[ResponseCacheDomain],
+    ) -> AsyncIterator[CacheWarmTarget]:
+        for partition in self.partitions(domains=domains):
+            async for target in self.collect_partition(partition=partition):
+                yield target
+
+    def partitions(self, *, domains: Iterable[ResponseCacheDomain]) -> list[CacheWarmPartition]:
         requested_domains = tuple(domains)
-        targets: list[CacheWarmTarget] = []
+        partitions: list[CacheWarmPartition] = []
         if ResponseCacheDomain.I18N in requested_domains:
-            targets.extend(self.i18n_collector.collect())
-        if ResponseCacheDomain.ARTICLES in requested_domains:
-            targets.extend(await self.articles_collector.collect())
-        if ResponseCacheDomain.COMPETENCY_MATRIX in requested_domains:
-            targets.extend(await self.matrix_collector.collect())
-        return targets
+            partitions.append(CacheWarmPartition(domain=ResponseCacheDomain.I18N))
+        for domain in (ResponseCacheDomain.ARTICLES, ResponseCacheDomain.COMPETENCY_MATRIX):
+            if domain in requested_domains:
+                partitions.extend(
+                    CacheWarmPartition(domain=domain, language=language)
+                    for language in LanguageEnum
+                )
+        return partitions
+
+    async def collect_partition(
+        self,
+        *,
+        partition: CacheWarmPartition,
+    ) -> AsyncIterator[CacheWarmTarget]:
+        if partition.domain == ResponseCacheDomain.I18N:
+            for target in self.i18n_collector.collect():
+                yield target
+        if partition.language is None:
+            return
+        if partition.domain == ResponseCacheDomain.ARTICLES:
+            async for target in self.articles_collector.collect_language(
+                language=partition.language,
+            ):
+                yield target
+        if partition.domain == ResponseCacheDomain.COMPETENCY_MATRIX:
+            async for target in self.matrix_collector.collect_language(
+                language=partition.language,
+            ):
+                yield target
+
+    async def collect_dependencies(
+        self,
+        *,
+        domain: ResponseCacheDomain,
+        dependencies: ResponseCacheDependencies,
+    ) -> AsyncIterator[CacheWarmTarget]:
+        if domain == ResponseCacheDomain.ARTICLES:
+            async for target in self.articles_collector.collect_dependencies(
+                dependencies=dependencies,
+            ):
+                yield target
+        if domain == ResponseCacheDomain.COMPETENCY_MATRIX:
+            async for target in self.matrix_collector.collect_dependencies(
+                dependencies=dependencies,
+            ):
+                yield target
@@ -1,7 +1,11 @@
 from dishka.integrations.taskiq import FromDishka, inject
 
 from core.cache_tools.use_cases import ManualCacheWarmUseCase
-from entrypoints.litestar.response_cache import ResponseCacheDomain
+from entrypoints.litestar.response_cache import (
+    ResponseCacheDependencies,
+    ResponseCacheDependenciesPayload,
+    ResponseCacheDomain,
+)
 from entrypoints.taskiq.broker import broker
 from entrypoints.taskiq.cache_warm.service import ResponseCacheWarmService
 from infra.config.constants import constants
@@ -31,6 +35,20 @@ async def cache_warm_domain(
     return (await service.warm_domain(domain=ResponseCacheDomain(domain_value))).as_dict()
 
 
+@broker.task(constants.taskiq.cache_warm_dependencies_task_name)
+@inject(patch_module=True)
+async def cache_warm_dependencies(
+    domain_value: str,
+    dependencies_payload: ResponseCacheDependenciesPayload,
+    service: FromDishka[ResponseCacheWarmService],
+) -> dict[str, int]:
+    summary = await service.warm_dependencies(
+        domain=ResponseCacheDomain(domain_value),
+        dependencies=ResponseCacheDependencies.from_payload(dependencies_payload),
+    )
+    return summary.as_dict()
+
+
 @broker.task(constants.taskiq.manual_cache_warm_task_name)
 @inject(patch_module=True)
 async def manual_cache_warm(
@@ -1,17 +1,120 @@
-from dataclasses import dataclass
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 
-from entrypoints.litestar.response_cache import ResponseCacheDomainStore
+from entrypoints.litestar.response_cache import ResponseCacheDomainStore, ResponseCacheEntry
 from entrypoints.taskiq.cache_warm.targets import CacheWarmTarget
 from infra.config.constants import constants
 
 
+@dataclass(slots=True)
+class CacheWarmPhaseSpan:
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def record(self, *, started_at: float, finished_at: float) -> None:
+        if self.started_at is None or started_at < self.started_at:
+            self.started_at = started_at
+        if self.finished_at is None or finished_at > self.finished_at:
+            self.finished_at = finished_at
+
+    @property
+    def ms(self) -> int:
+        if self.started_at is None or self.finished_at is None:
+            return 0
+        return round((self.finished_at - self.started_at) * 1_000)
+
+
+# Partitions and flushes run concurrently, so each phase reports the wall-clock span from its
+# first start to its last end rather than the sum of the per-task durations.
+@dataclass(slots=True)
+class CacheWarmTimings:
+    clock: Callable[[], float]
+    collect: CacheWarmPhaseSpan = field(default_factory=CacheWarmPhaseSpan)
+    write: CacheWarmPhaseSpan = field(default_factory=CacheWarmPhaseSpan)
+
+    async def timed_targets(
+        self,
+        targets: AsyncIterator[CacheWarmTarget],
+    ) -> AsyncIterator[CacheWarmTarget]:
+        while True:
+            started_at = self.clock()
+            try:
+                target = await anext(targets)
+            except StopAsyncIteration:
+                return
+            finally:
+                self.collect.record(started_at=started_at, finished_at=self.clock())
+            yield target
+
+    @asynccontextmanager
+    async def measure_write(self) -> AsyncIterator[None]:
+        started_at = self.clock()
+        try:
+            yield
+        finally:
+            self.write.record(started_at=started_at, finished_at=self.clock())
+
+    @property
+    def collect_ms(self) -> int:
+        return self.collect.ms
+
+    @property
+    def write_ms(self) -> int:
+        return self.write.ms
+
+
 @dataclass(frozen=True, slots=True)
 class ResponseCacheWarmWriter:
     store: ResponseCacheDomainStore
 
-    async def write_target(self, target: CacheWarmTarget) -> None:
-        await self.store.set(
-            key=target.build_cache_key(),
-            value=target.response_cache_payload(),
-            expires_in=constants.response_cache.default_ttl_seconds,
-        )
+    # Targets are encoded as they arrive and at most warm_write_concurrency batches are in
+    # flight, so memory is bounded by the batch size rather than by the number of targets.
+    async def write_stream(
+        self,
+        targets: AsyncIterable[CacheWarmTarget],
+        *,
+        timings: CacheWarmTimings,
+    ) -> int:
+        written = 0
+        batch: list[ResponseCacheEntry] = []
+        semaphore = asyncio.Semaphore(constants.response_cache.warm_write_concurrency)
+        async with asyncio.TaskGroup() as task_group:
+            async for target in targets:
+                batch.append(
+                    ResponseCacheEntry(
+                        key=target.build_cache_key(),
+                        value=target.response_cache_payload(),
+                        dependencies=target.dependencies,
+                    ),
+                )
+                written += 1
+                if len(batch) >= constants.response_cache.warm_write_batch_size:
+                    await semaphore.acquire()
+                    task_group.create_task(
+                        self._flush(entries=batch, semaphore=semaphore, timings=timings),
+                    )
+                    batch = []
+            if batch:
+                await semaphore.acquire()
+                task_group.create_task(
+                    self._flush(entries=batch, semaphore=semaphore, timings=timings),
+                )
+        return written
+
+    async def _flush(
+        self,
+        *,
+        entries: list[ResponseCacheEntry],
+        semaphore: asyncio.Semaphore,
+        timings: CacheWarmTimings,
+    ) -> None:
+        try:
+            async with timings.measure_write():
+                await self.store.set_many(
+                    entries=entries,
+                    expires_in=constants.response_cache.default_ttl_seconds,
+                )
+        finally:
+            semaphore.release()
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+
+from dishka import AsyncContainer
+
+from core.files.services import FileOrphanCleanupService
+
+
+class FileOrphanCleanupScopes(ABC):
+    @abstractmethod
+    def open(self) -> AbstractAsyncContextManager[FileOrphanCleanupService]:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class DishkaFileOrphanCleanupScopes(FileOrphanCleanupScopes):
+    container: AsyncContainer
+
+    # Every batch owns its own database session, so it commits before the next one is selected.
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[FileOrphanCleanupService]:
+        async with self.container() as request_container:
+            yield await request_container.get(FileOrphanCleanupService)
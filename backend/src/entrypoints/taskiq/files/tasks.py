@@ -2,8 +2,10 @@ from datetime import datetime, timedelta
 
 from dishka.integrations.taskiq import FromDishka, inject
 
-from core.files.services import FileOrphanCleanupService
+from core.files.schemas import FileOrphanCleanupResult
+from core.files.services import FileVariantService
 from entrypoints.taskiq.broker import broker
+from entrypoints.taskiq.files.scopes import FileOrphanCleanupScopes
 from infra.config.constants import constants
 from infra.config.settings import settings
 
@@ -19,15 +21,37 @@ from infra.config.settings import settings
 )
 @inject(patch_module=True)
 async def prune_file_orphans(
-    service: FromDishka[FileOrphanCleanupService],
+    scopes: FromDishka[FileOrphanCleanupScopes],
     current_datetime: FromDishka[datetime],
 ) -> dict[str, int]:
-    result = await service.prune(
-        cutoff=current_datetime - timedelta(seconds=settings.files.orphan_retention_seconds),
+    cutoff = current_datetime - timedelta(seconds=settings.files.orphan_retention_seconds)
+    result = FileOrphanCleanupResult(
+        scanned_count=0,
+        deleted_count=0,
+        failed_count=0,
+        skipped_in_use_count=0,
     )
+    batch_count = 0
+    while batch_count < constants.files.orphan_cleanup_max_batches_per_run:
+        async with scopes.open() as service:
+            result = result.combine(await service.prune(cutoff=cutoff))
+        batch_count += 1
+        if not result.has_more:
+            break
     return {
+        "batchCount": batch_count,
         "scannedCount": result.scanned_count,
         "deletedCount": result.deleted_count,
         "failedCount": result.failed_count,
         "skippedInUseCount": result.skipped_in_use_count,
     }
+
+
+@broker.task(constants.taskiq.file_variants_task_name)
+@inject(patch_module=True)
+async def generate_file_variants(
+    file_id: str,
+    service: FromDishka[FileVariantService],
+) -> dict[str, int]:
+    variants = await service.generate_variants(file_id=file_id)
+    return {"variantCount": len(variants)}
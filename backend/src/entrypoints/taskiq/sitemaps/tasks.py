@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from dishka.integrations.taskiq import FromDishka, inject
+
+from entrypoints.litestar.public.sitemaps import SitemapPublisher
+from entrypoints.taskiq.broker import broker
+from infra.config.constants import constants
+from infra.config.settings import settings
+
+
+@broker.task(
+    constants.taskiq.sitemap_refresh_task_name,
+    schedule=[
+        {
+            "schedule_id": constants.taskiq.sitemap_refresh_task_name,
+            "interval": settings.taskiq.sitemap_refresh_interval_seconds,
+        },
+    ],
+)
+@inject(patch_module=True)
+async def refresh_sitemap(
+    publisher: FromDishka[SitemapPublisher],
+    current_datetime: FromDishka[datetime],
+) -> dict[str, int]:
+    documents = await publisher.refresh(current_datetime=current_datetime)
+    return {"documentCount": len(documents)}
@@ -3,10 +3,12 @@ from taskiq import TaskiqScheduler
 from taskiq.schedule_sources import LabelScheduleSource
 
 from entrypoints.taskiq.agent_access import tasks as agent_access_tasks  # noqa: F401
+from entrypoints.taskiq.articles import tasks as article_tasks  # noqa: F401
 from entrypoints.taskiq.auth import tasks as auth_tasks  # noqa: F401
 from entrypoints.taskiq.broker import broker
 from entrypoints.taskiq.cache_warm import tasks  # noqa: F401
 from entrypoints.taskiq.files import tasks as file_tasks  # noqa: F401
+from entrypoints.taskiq.sitemaps import tasks as sitemap_tasks  # noqa: F401
 from infra.ioc.container import container
 
 setup_dishka(container=container, broker=broker)
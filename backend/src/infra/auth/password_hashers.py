@@ -4,16 +4,34 @@ from argon2 import PasswordHasher as Argon2CryptContext
 from argon2.exceptions import VerificationError
 
 from core.auth.password_hashers import NeedRehash, PasswordHasher, PasswordVerified
+from infra.executors import BoundedThreadPoolExecutor
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Argon2PasswordHasher(PasswordHasher):
     context: Argon2CryptContext
+    executor: BoundedThreadPoolExecutor
 
-    def verify_password(
+    async def verify_password(
         self,
         plain_password: str | bytes,
         hashed_password: str | bytes,
+    ) -> tuple[PasswordVerified, NeedRehash]:
+        return await self.executor.run(
+            lambda: self._verify_password(
+                plain_password=plain_password,
+                hashed_password=hashed_password,
+            ),
+        )
+
+    async def hash_password(self, password: str | bytes) -> str:
+        return await self.executor.run(lambda: self.context.hash(password))
+
+    def _verify_password(
+        self,
+        *,
+        plain_password: str | bytes,
+        hashed_password: str | bytes,
     ) -> tuple[PasswordVerified, NeedRehash]:
         hashed_password_str = (
             hashed_password if isinstance(hashed_password, str) else hashed_password.decode()
@@ -25,6 +43,3 @@ class Argon2PasswordHasher(PasswordHasher):
             )
         except VerificationError:
             return False, True
-
-    def hash_password(self, password: str | bytes) -> str:
-        return self.context.hash(password)
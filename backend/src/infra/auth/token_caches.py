@@ -0,0 +1,120 @@
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+
+from valkey.asyncio import Valkey
+
+from core.auth.enums import VerifiedAccessTokenInvalidationKindEnum
+from core.auth.schemas import VerifiedAccessToken, VerifiedAccessTokenInvalidation
+from core.auth.storages import VerifiedAccessTokenCache, VerifiedAccessTokenInvalidator
+from core.auth.types import Token, TokenHash
+from infra.config.constants import constants
+from infra.post_commit_actions import PostCommitActions
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ValkeyVerifiedAccessTokenInvalidationChannel:
+    valkey: Valkey
+    channel: str
+
+    async def publish(self, *, invalidation: VerifiedAccessTokenInvalidation) -> None:
+        await self.valkey.publish(self.channel, self.encode(invalidation=invalidation))
+
+    async def listen(self) -> AsyncIterator[VerifiedAccessTokenInvalidation]:
+        async with self.valkey.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message is None or message["type"] != "message":
+                    continue
+                data = message["data"]
+                invalidation = self.decode(data.decode() if isinstance(data, bytes) else str(data))
+                if invalidation is not None:
+                    yield invalidation
+
+    async def aclose(self) -> None:
+        await self.valkey.aclose(close_connection_pool=True)
+
+    @staticmethod
+    def encode(*, invalidation: VerifiedAccessTokenInvalidation) -> str:
+        separator = constants.auth.authentication_invalidation_separator
+        return f"{invalidation.kind.value}{separator}{invalidation.value}"
+
+    @staticmethod
+    def decode(value: str) -> VerifiedAccessTokenInvalidation | None:
+        kind_value, separator, invalidation_value = value.partition(
+            constants.auth.authentication_invalidation_separator,
+        )
+        if not separator or not invalidation_value:
+            return None
+        try:
+            kind = VerifiedAccessTokenInvalidationKindEnum(kind_value)
+        except ValueError:
+            return None
+        return VerifiedAccessTokenInvalidation(kind=kind, value=invalidation_value)
+
+
+@dataclass(kw_only=True, slots=True)
+class LocalVerifiedAccessTokenCache(VerifiedAccessTokenCache, VerifiedAccessTokenInvalidator):
+    max_entries: int
+    ttl_seconds: int
+    invalidation_channel: ValkeyVerifiedAccessTokenInvalidationChannel | None = None
+    clock: Callable[[], float] = time.monotonic
+    entries: OrderedDict[TokenHash, tuple[float, VerifiedAccessToken]] = field(
+        default_factory=OrderedDict,
+    )
+
+    async def get(self, *, token: Token, now: datetime) -> VerifiedAccessToken | None:
+        token_hash = token.to_hash()
+        entry = self.entries.get(token_hash)
+        if entry is None:
+            return None
+        expires_at, verified_token = entry
+        if expires_at <= self.clock() or not verified_token.is_valid_at(now=now):
+            del self.entries[token_hash]
+            return None
+        self.entries.move_to_end(token_hash)
+        return verified_token
+
+    async def set(self, *, token: Token, verified_token: VerifiedAccessToken) -> None:
+        token_hash = token.to_hash()
+        self.entries[token_hash] = (self.clock() + self.ttl_seconds, verified_token)
+        self.entries.move_to_end(token_hash)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def invalidate(self, *, invalidation: VerifiedAccessTokenInvalidation) -> None:
+        self.forget(invalidation=invalidation)
+        if self.invalidation_channel is not None:
+            await self.invalidation_channel.publish(invalidation=invalidation)
+
+    def forget(self, *, invalidation: VerifiedAccessTokenInvalidation) -> None:
+        if invalidation.kind is VerifiedAccessTokenInvalidationKindEnum.TOKEN:
+            self.entries.pop(TokenHash(invalidation.value), None)
+            return
+        for token_hash, (_, verified_token) in list(self.entries.items()):
+            if invalidation.matches(token_hash=token_hash, verified_token=verified_token):
+                del self.entries[token_hash]
+
+    def forget_all(self) -> None:
+        self.entries.clear()
+
+    async def aclose(self) -> None:
+        if self.invalidation_channel is not None:
+            await self.invalidation_channel.aclose()
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class PostCommitVerifiedAccessTokenInvalidator(VerifiedAccessTokenInvalidator):
+    cache: LocalVerifiedAccessTokenCache
+    post_commit_actions: PostCommitActions
+
+    async def invalidate(self, *, invalidation: VerifiedAccessTokenInvalidation) -> None:
+        # Dropping the local entry right away keeps this worker from serving it while the
+        # transaction is open; other workers are told once the change is committed.
+        self.cache.forget(invalidation=invalidation)
+        self.post_commit_actions.add(
+            action=partial(self.cache.invalidate, invalidation=invalidation),
+        )
@@ -2,7 +2,7 @@ import binascii
 import datetime
 import json
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -21,6 +21,13 @@ class PasetoTokenHandler(TokenHandler):
     public_key_pem: Secret[str]
     secret_key_pem: Secret[str]
     token_expire_seconds: int
+    _public_key: pyseto.KeyInterface = field(init=False, repr=False)
+    _secret_key: pyseto.KeyInterface = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Parsing the PEM dominates token verification cost, so keys are built once per handler.
+        object.__setattr__(self, "_public_key", self._create_public_key())
+        object.__setattr__(self, "_secret_key", self._create_secret_key())
 
     def _create_public_key(self) -> pyseto.KeyInterface:
         return pyseto.Key.new(
@@ -46,7 +53,7 @@ class PasetoTokenHandler(TokenHandler):
 
     def _decode_payload_dict(self, token: Token) -> dict[str, Any]:
         try:
-            decoded = pyseto.decode(keys=self._create_public_key(), token=token).payload
+            decoded = pyseto.decode(keys=self._public_key, token=token).payload
         except (pyseto.DecryptError, pyseto.VerifyError, binascii.Error, ValueError) as err:
             logger.warning(event="Pyseto decode error", exc=err)
             raise UnauthorizedError from err
@@ -73,7 +80,7 @@ class PasetoTokenHandler(TokenHandler):
             return expires_at.replace(tzinfo=ZoneInfo("Etc/UTC"))
         return expires_at
 
-    def _require_unexpired_payload(self, payload_dict: dict[str, Any]) -> None:
+    def _require_unexpired_payload(self, payload_dict: dict[str, Any]) -> datetime.datetime:
         expires_at = self._read_expires_at(payload_dict)
         if expires_at is None:
             logger.warning(event="Token exp claim is missing or invalid")
@@ -81,20 +88,21 @@ class PasetoTokenHandler(TokenHandler):
         if expires_at <= datetime.datetime.now(tz=ZoneInfo("Etc/UTC")):
             logger.warning(event="Token exp claim is expired")
             raise UnauthorizedError
+        return expires_at
 
     def decode_token(self, token: Token) -> AccessTokenPayload:
         payload_dict = self._decode_payload_dict(token)
         validation_result = self.validate_payload_dict(payload_dict)
         if validation_result.is_valid:
-            self._require_unexpired_payload(payload_dict)
-            return AccessTokenPayload.from_dict(payload_dict)
+            expires_at = self._require_unexpired_payload(payload_dict)
+            return replace(AccessTokenPayload.from_dict(payload_dict), expires_at=expires_at)
         logger.error(event=validation_result.message)
         raise UnauthorizedError
 
     def encode_token(self, payload: AccessTokenPayload) -> Token:
         return Token(
             pyseto.encode(
-                key=self._create_secret_key(),
+                key=self._secret_key,
                 payload=self.prepare_payload(payload),
             ),
         )
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from core.competency_matrix.schemas import (
+    CompetencyMatrixWorkspaceFilters,
+    CompetencyMatrixWorkspaceSummary,
+)
+from core.competency_matrix.storages import CompetencyMatrixWorkspaceSummaryCache
+from infra.post_commit_actions import PostCommitActions
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class PostCommitCompetencyMatrixWorkspaceSummaryCache(CompetencyMatrixWorkspaceSummaryCache):
+    cache: CompetencyMatrixWorkspaceSummaryCache
+    post_commit_actions: PostCommitActions
+
+    async def get_summary(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+    ) -> CompetencyMatrixWorkspaceSummary | None:
+        return await self.cache.get_summary(filters=filters)
+
+    async def save_summary(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+        summary: CompetencyMatrixWorkspaceSummary,
+    ) -> None:
+        await self.cache.save_summary(filters=filters, summary=summary)
+
+    async def invalidate(self) -> None:
+        # Dropping summaries before commit would let a concurrent read cache the old counts.
+        self.post_commit_actions.add(action=self.cache.invalidate)
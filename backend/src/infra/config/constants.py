@@ -4,6 +4,7 @@ from typing import Literal
 from core.competency_matrix.schemas import QuestionQueueImportRules
 from core.files.enums import FilePurpose
 from core.files.schemas import FileRule, FileRules
+from core.knowledge.files.schemas import KnowledgeFileRule
 
 
 class PathConstants:
@@ -21,24 +22,49 @@ class MinioBucketNamesConstants:
     knowledge_private: Literal["knowledge-private"] = "knowledge-private"
 
 
+class MinioConstants:
+    delete_objects_max_keys: int = 1000
+
+
 class ValkeyDatabaseConstants:
     response_cache: int = 0
     auth_revocations: int = 1
     question_suggestion_quota: int = 2
     taskiq_broker: int = 3
     taskiq_results: int = 4
+    direct_upload_sessions: int = 5
+    resume_exports: int = 6
+    article_view_counters: int = 7
+    sitemaps: int = 8
+    competency_matrix_workspace_summaries: int = 9
 
 
 class ValkeyNamespaceConstants:
     admin_cache_warm_operations: str = "ADMIN_CACHE_WARM_OPERATIONS"
     auth_revocations: str = "AUTH_REVOCATIONS"
+    direct_upload_sessions: str = "DIRECT_UPLOAD_SESSIONS"
     framework: str = "LITESTAR"
+    framework_stale: str = "LITESTAR_STALE"
+    response_cache_revalidation_locks: str = "LITESTAR_REVALIDATION_LOCKS"
+    response_cache_dependencies: str = "LITESTAR_DEPENDENCIES"
+    response_cache_expiry_index: str = "LITESTAR_EXPIRY_INDEX"
     matrix_question_suggestions: str = "MATRIX_QUESTION_SUGGESTIONS"
+    resume_exports: str = "RESUME_EXPORTS"
+    article_view_counters: str = "ARTICLE_VIEW_COUNTERS"
+    sitemaps: str = "SITEMAPS"
+    competency_matrix_workspace_summaries: str = "MATRIX_WORKSPACE_SUMMARIES"
+
+
+class ValkeyConnectionPoolConstants:
+    response_cache_max_connections: int = 32
+    checkout_timeout_seconds: int = 5
+    slow_checkout_log_threshold_ms: int = 50
 
 
 class ValkeyConstants:
     databases: ValkeyDatabaseConstants = ValkeyDatabaseConstants()
     namespaces: ValkeyNamespaceConstants = ValkeyNamespaceConstants()
+    connection_pools: ValkeyConnectionPoolConstants = ValkeyConnectionPoolConstants()
     missing_ttl_seconds: int = -2
     non_expiring_ttl_seconds: int = -1
 
@@ -48,8 +74,34 @@ class ResponseCacheConstants:
     domain_key_separator: Literal[":"] = ":"
     default_ttl_seconds: int = 86_400
     status_scan_batch_size: int = 200
+    local_tier_max_entries: int = 1_024
+    local_tier_ttl_seconds: int = 30
+    invalidation_channel: Literal["LITESTAR_RESPONSE_CACHE_INVALIDATIONS"] = (
+        "LITESTAR_RESPONSE_CACHE_INVALIDATIONS"
+    )
+    invalidation_listener_retry_delay_seconds: float = 1.0
+    stale_ttl_seconds: int = 7 * 86_400
+    revalidation_lock_ttl_seconds: int = 10
+    revalidation_wait_timeout_seconds: float = 5.0
+    revalidation_poll_interval_seconds: float = 0.05
+    warm_collect_concurrency: int = 4
+    warm_write_batch_size: int = 100
+    warm_write_concurrency: int = 4
+    warm_detail_chunk_size: int = 50
     json_content_type_header_name: bytes = b"content-type"
     json_content_type_header_value: bytes = b"application/json"
+    etag_header_name: bytes = b"etag"
+    if_none_match_header_name: Literal["if-none-match"] = "if-none-match"
+    accept_encoding_header_name: Literal["accept-encoding"] = "accept-encoding"
+    content_encoding_header_name: bytes = b"content-encoding"
+    content_length_header_name: bytes = b"content-length"
+    vary_header_name: bytes = b"vary"
+    vary_header_value: bytes = b"accept-encoding"
+    gzip_encoding: Literal["gzip"] = "gzip"
+    gzip_compress_level: int = 6
+    compression_min_size_bytes: int = 1_024
+    entity_tag_value_prefix: bytes = b"etag:"
+    entity_tag_value_separator: bytes = b"\n"
 
 
 class TaskiqConstants:
@@ -58,16 +110,25 @@ class TaskiqConstants:
     result_prefix: Literal["my_site_taskiq_results"] = "my_site_taskiq_results"
     cache_warm_all_task_name: Literal["cache_warm_all"] = "cache_warm_all"
     cache_warm_domain_task_name: Literal["cache_warm_domain"] = "cache_warm_domain"
+    cache_warm_dependencies_task_name: Literal["cache_warm_dependencies"] = (
+        "cache_warm_dependencies"
+    )
     manual_cache_warm_task_name: Literal["manual_cache_warm"] = "manual_cache_warm"
     cache_warm_operation_key_prefix: Literal["operation"] = "operation"
     cache_warm_latest_operation_key: Literal["latest"] = "latest"
     auth_session_prune_task_name: Literal["auth_session_prune"] = "auth_session_prune"
     agent_audit_prune_task_name: Literal["agent_audit_prune"] = "agent_audit_prune"
     file_orphan_prune_task_name: Literal["file_orphan_prune"] = "file_orphan_prune"
+    file_variants_task_name: Literal["file_variants"] = "file_variants"
+    article_view_counter_flush_task_name: Literal["article_view_counter_flush"] = (
+        "article_view_counter_flush"
+    )
+    sitemap_refresh_task_name: Literal["sitemap_refresh"] = "sitemap_refresh"
 
 
 class FilesConstants:
     orphan_cleanup_batch_size: int = 100
+    orphan_cleanup_max_batches_per_run: int = 50
     article_image_mime_types: frozenset[str] = frozenset(
         {"image/png", "image/jpeg", "image/webp", "image/gif"},
     )
@@ -85,6 +146,26 @@ class FilesConstants:
     content_image_webp_method: int = 6
     content_image_min_savings_ratio: float = 0.10
     attachment_max_size_bytes: int = 20 * 1024 * 1024
+    upload_read_chunk_size_bytes: int = 64 * 1024
+    image_processing_max_workers: int = 2
+    image_processing_max_concurrent_jobs: int = 2
+    image_processing_cpu_time_limit_seconds: int = 10
+    variant_widths_px: tuple[int, ...] = (320, 640, 1280, 1920)
+    variant_webp_quality: int = 80
+    variant_webp_method: int = 4
+    variant_avif_quality: int = 55
+    variant_avif_speed: int = 6
+    variant_purposes: frozenset[FilePurpose] = frozenset(
+        {FilePurpose.ARTICLE_COVER_IMAGE, FilePurpose.ARTICLE_CONTENT_IMAGE},
+    )
+    direct_upload_purposes: frozenset[FilePurpose] = frozenset({FilePurpose.ATTACHMENT})
+    direct_upload_max_size_bytes: int = 512 * 1024 * 1024
+    direct_upload_part_size_bytes: int = 16 * 1024 * 1024
+    direct_upload_url_expires_in_seconds: int = 3_600
+    direct_upload_session_ttl_seconds: int = 2 * 3_600
+    direct_upload_digest_chunk_size_bytes: int = 1024 * 1024
+    direct_upload_original_name_max_length: int = 255
+    direct_upload_mime_type_max_length: int = 255
     rules: FileRules = FileRules(
         values={
             FilePurpose.ARTICLE_CONTENT_IMAGE: FileRule(
@@ -112,6 +193,7 @@ class KnowledgeFilesConstants:
         {"image/jpeg", "image/png", "image/webp"},
     )
     attachment_max_size_bytes: int = 20 * 1024 * 1024
+    attachment_direct_upload_max_size_bytes: int = 512 * 1024 * 1024
     photo_max_size_bytes: int = 5 * 1024 * 1024
     multipart_overhead_max_size_bytes: int = 64 * 1024
     attachment_request_max_body_size_bytes: int = (
@@ -134,6 +216,29 @@ class KnowledgeFilesConstants:
     content_type_options_header_value: Literal["nosniff"] = "nosniff"
     cache_control_header_name: Literal["Cache-Control"] = "Cache-Control"
     no_store_header_value: Literal["no-store"] = "no-store"
+    photo_cache_control_header_value: str = "private, max-age=31536000, immutable"
+    etag_header_name: Literal["ETag"] = "ETag"
+    accept_ranges_header_name: Literal["Accept-Ranges"] = "Accept-Ranges"
+    accept_ranges_header_value: Literal["bytes"] = "bytes"
+    content_range_header_name: Literal["Content-Range"] = "Content-Range"
+    content_length_header_name: Literal["Content-Length"] = "Content-Length"
+    range_header_name: Literal["Range"] = "Range"
+    if_range_header_name: Literal["If-Range"] = "If-Range"
+    if_none_match_header_name: Literal["If-None-Match"] = "If-None-Match"
+    attachment_rule: KnowledgeFileRule = KnowledgeFileRule(
+        folder=attachment_folder,
+        allowed_mime_types=attachment_mime_types,
+        max_size_bytes=attachment_max_size_bytes,
+        original_name_max_length=original_name_max_length,
+        mime_type_max_length=mime_type_max_length,
+    )
+    person_photo_rule: KnowledgeFileRule = KnowledgeFileRule(
+        folder=person_photo_folder,
+        allowed_mime_types=photo_mime_types,
+        max_size_bytes=photo_max_size_bytes,
+        original_name_max_length=original_name_max_length,
+        mime_type_max_length=mime_type_max_length,
+    )
 
 
 class RequestLoggingConstants:
@@ -150,6 +255,12 @@ class ResumeExportConstants:
     font_license_path: Path = fonts_dir / "OFL.txt"
     font_regular_name: Literal["NotoSans"] = "NotoSans"
     font_bold_name: Literal["NotoSans-Bold"] = "NotoSans-Bold"
+    renderer_version: int = 1
+    render_max_workers: int = 2
+    render_max_queue_depth: int = 8
+    render_slow_queue_wait_log_threshold_ms: int = 500
+    cache_ttl_seconds: int = 24 * 60 * 60
+    cache_max_size_bytes: int = 5 * 1024 * 1024
     content_disposition_header_name: Literal["Content-Disposition"] = "Content-Disposition"
     pdf_media_type: Literal["application/pdf"] = "application/pdf"
     docx_media_type: Literal[
@@ -186,10 +297,37 @@ class ResumeExportConstants:
     word_body_style_id: Literal["ResumeBody"] = "ResumeBody"
 
 
+class ArticleAnalyticsConstants:
+    daily_counter_upsert_batch_size: int = 1_000
+    view_counter_flush_lock_ttl_milliseconds: int = 120_000
+
+
+class SitemapConstants:
+    max_urls_per_sitemap: int = 50_000
+    index_name: Literal["sitemap.xml"] = "sitemap.xml"
+    page_query_parameter: Literal["page"] = "page"
+    media_type: Literal["application/xml"] = "application/xml"
+    gzip_compress_level: int = 9
+    gzip_encoding: Literal["gzip"] = "gzip"
+    cache_control_header_value: str = "public, max-age=300"
+    cache_control_header_name: Literal["Cache-Control"] = "Cache-Control"
+    content_encoding_header_name: Literal["Content-Encoding"] = "Content-Encoding"
+    vary_header_name: Literal["Vary"] = "Vary"
+    etag_header_name: Literal["ETag"] = "ETag"
+    last_modified_header_name: Literal["Last-Modified"] = "Last-Modified"
+    accept_encoding_header_name: Literal["Accept-Encoding"] = "Accept-Encoding"
+    if_none_match_header_name: Literal["If-None-Match"] = "If-None-Match"
+    if_modified_since_header_name: Literal["If-Modified-Since"] = "If-Modified-Since"
+
+
 class SearchConstants:
     min_trigram_fuzzy_query_length: int = 6
 
 
+class CompetencyMatrixConstants:
+    workspace_summary_cache_ttl_seconds: int = 5 * 60
+
+
 class QuestionQueueImportConstants:
     rules: QuestionQueueImportRules = QuestionQueueImportRules(
         supported_text_extensions=frozenset({".txt", ".csv"}),
@@ -231,6 +369,16 @@ class AuthConstants:
     no_store_header_value: Literal["no-store"] = "no-store"
     session_secret_byte_count: int = 32
     session_expiring_soon_days: int = 7
+    password_hashing_max_workers: int = 2
+    password_hashing_max_queue_depth: int = 8
+    password_hashing_slow_queue_wait_log_threshold_ms: int = 100
+    authentication_cache_max_entries: int = 1_024
+    authentication_cache_ttl_seconds: int = 30
+    authentication_invalidation_channel: Literal["AUTH_VERIFIED_TOKEN_INVALIDATIONS"] = (
+        "AUTH_VERIFIED_TOKEN_INVALIDATIONS"
+    )
+    authentication_invalidation_separator: Literal[":"] = ":"
+    authentication_invalidation_listener_retry_delay_seconds: float = 1.0
 
 
 class AgentAccessConstants:
@@ -251,11 +399,14 @@ class AgentAccessConstants:
     desktop_directory_mode: int = 0o700
     desktop_private_key_mode: int = 0o600
     desktop_pending_file_mode: int = 0o600
+    client_max_connections: int = 4
+    client_keepalive_expiry_seconds: float = 60.0
 
 
 class Constants:
     path: PathConstants = PathConstants()
     minio_buckets: MinioBucketNamesConstants = MinioBucketNamesConstants()
+    minio: MinioConstants = MinioConstants()
     valkey: ValkeyConstants = ValkeyConstants()
     response_cache: ResponseCacheConstants = ResponseCacheConstants()
     taskiq: TaskiqConstants = TaskiqConstants()
@@ -263,7 +414,10 @@ class Constants:
     knowledge_files: KnowledgeFilesConstants = KnowledgeFilesConstants()
     request_logging: RequestLoggingConstants = RequestLoggingConstants()
     resume_export: ResumeExportConstants = ResumeExportConstants()
+    article_analytics: ArticleAnalyticsConstants = ArticleAnalyticsConstants()
+    sitemaps: SitemapConstants = SitemapConstants()
     search: SearchConstants = SearchConstants()
+    competency_matrix: CompetencyMatrixConstants = CompetencyMatrixConstants()
     question_queue_import: QuestionQueueImportConstants = QuestionQueueImportConstants()
     admin_validation: AdminValidationConstants = AdminValidationConstants()
     auth: AuthConstants = AuthConstants()
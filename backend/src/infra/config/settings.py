@@ -196,6 +196,8 @@ class TaskiqSettings(ProjectBaseSettings):
     agent_audit_prune_interval_seconds: PositiveInt
     cache_warm_interval_seconds: PositiveInt
     file_orphan_prune_interval_seconds: PositiveInt
+    article_view_counter_flush_interval_seconds: PositiveInt
+    sitemap_refresh_interval_seconds: PositiveInt
     result_expire_seconds: PositiveInt
 
 
@@ -0,0 +1,96 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from time import perf_counter_ns
+
+from core.exceptions import DomainError
+from infra.config.loggers import logger
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BoundedThreadPoolStats:
+    running: int
+    queued: int
+    completed: int
+    failed: int
+    rejected: int
+    max_queued: int
+
+
+@dataclass(slots=True, kw_only=True)
+class BoundedThreadPoolExecutor:
+    max_workers: int
+    max_queue_depth: int
+    thread_name_prefix: str
+    overloaded_error: type[DomainError]
+    saturated_log_event: str
+    slow_queue_wait_log_event: str
+    slow_queue_wait_log_threshold_ms: int
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    max_queued: int = 0
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.thread_name_prefix,
+        )
+
+    async def run[ResultT](self, func: Callable[[], ResultT]) -> ResultT:
+        if self.in_flight >= self.max_workers + self.max_queue_depth:
+            self.rejected += 1
+            logger.warning(event=self.saturated_log_event, **asdict(self.stats()))
+            raise self.overloaded_error
+        self.in_flight += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        submitted_at_ns = perf_counter_ns()
+        started_at_ns: int | None = None
+
+        def run_job() -> ResultT:
+            nonlocal started_at_ns
+            started_at_ns = perf_counter_ns()
+            return func()
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, run_job)
+        except BaseException:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            if started_at_ns is not None:
+                self._log_slow_queue_wait(wait_ms=(started_at_ns - submitted_at_ns) / 1_000_000)
+            self.in_flight -= 1
+
+    @property
+    def queued(self) -> int:
+        return max(self.in_flight - self.max_workers, 0)
+
+    def stats(self) -> BoundedThreadPoolStats:
+        return BoundedThreadPoolStats(
+            running=self.in_flight - self.queued,
+            queued=self.queued,
+            completed=self.completed,
+            failed=self.failed,
+            rejected=self.rejected,
+            max_queued=self.max_queued,
+        )
+
+    def _log_slow_queue_wait(self, *, wait_ms: float) -> None:
+        # Queue depth is only reported on rejection otherwise, when it is already too late.
+        if wait_ms >= self.slow_queue_wait_log_threshold_ms:
+            logger.warning(
+                event=self.slow_queue_wait_log_event,
+                wait_ms=round(wait_ms, 2),
+                threshold_ms=self.slow_queue_wait_log_threshold_ms,
+                **asdict(self.stats()),
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,149 @@
+import asyncio
+import resource
+import signal
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from math import ceil
+from types import FrameType
+
+from core.exceptions import DomainError
+from core.files.exceptions import FileImageOptimizationError
+from infra.config.loggers import logger
+
+
+class ImageProcessingCpuTimeExceededError(Exception): ...
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageProcessingJobFailure:
+    error_type: type[DomainError]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageProcessingStats:
+    running: int
+    waiting: int
+    completed: int
+    cpu_time_exceeded: int
+    pool_restarts: int
+
+
+_job_running = False
+
+
+def _raise_cpu_time_exceeded(_signum: int, _frame: FrameType | None) -> None:
+    # A SIGXCPU that lands after the job has finished must not kill the idle worker.
+    if _job_running:
+        raise ImageProcessingCpuTimeExceededError
+
+
+def _initialize_worker() -> None:
+    signal.signal(signal.SIGXCPU, _raise_cpu_time_exceeded)
+
+
+def _run_job[ResultT](
+    job: Callable[[], ResultT],
+    cpu_time_limit_seconds: int,
+) -> ResultT | ImageProcessingJobFailure:
+    global _job_running  # noqa: PLW0603
+    soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # RLIMIT_CPU counts the whole process lifetime, so the budget is moved forward per job.
+    job_limit = ceil(usage.ru_utime + usage.ru_stime) + cpu_time_limit_seconds
+    if hard_limit != resource.RLIM_INFINITY:
+        job_limit = min(job_limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_CPU, (job_limit, hard_limit))
+    _job_running = True
+    try:
+        return job()
+    except DomainError as error:
+        # Domain errors take no constructor arguments, so they cannot be unpickled as raised.
+        return ImageProcessingJobFailure(error_type=type(error))
+    finally:
+        _job_running = False
+        resource.setrlimit(resource.RLIMIT_CPU, (soft_limit, hard_limit))
+
+
+@dataclass(slots=True, kw_only=True)
+class ImageProcessingPool:
+    max_workers: int
+    max_concurrent_jobs: int
+    cpu_time_limit_seconds: int
+    running: int = 0
+    waiting: int = 0
+    completed: int = 0
+    cpu_time_exceeded: int = 0
+    pool_restarts: int = 0
+    _executor: ProcessPoolExecutor = field(init=False, repr=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._executor = self._create_executor()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+
+    async def run[ResultT](self, job: Callable[[], ResultT]) -> ResultT:
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            result = await self._submit(job)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._semaphore.release()
+        if isinstance(result, ImageProcessingJobFailure):
+            raise result.error_type
+        return result
+
+    def stats(self) -> ImageProcessingStats:
+        return ImageProcessingStats(
+            running=self.running,
+            waiting=self.waiting,
+            completed=self.completed,
+            cpu_time_exceeded=self.cpu_time_exceeded,
+            pool_restarts=self.pool_restarts,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _submit[ResultT](
+        self,
+        job: Callable[[], ResultT],
+    ) -> ResultT | ImageProcessingJobFailure:
+        executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor,
+                _run_job,
+                job,
+                self.cpu_time_limit_seconds,
+            )
+        except ImageProcessingCpuTimeExceededError as error:
+            self.cpu_time_exceeded += 1
+            logger.warning(
+                event="Image processing job exceeded its CPU time limit", **asdict(self.stats())
+            )
+            raise FileImageOptimizationError from error
+        except BrokenProcessPool as error:
+            self._restart(executor=executor)
+            raise FileImageOptimizationError from error
+
+    def _restart(self, *, executor: ProcessPoolExecutor) -> None:
+        if executor is not self._executor:
+            return
+        self.pool_restarts += 1
+        logger.warning(event="Image processing pool is broken, restarting", **asdict(self.stats()))
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_initialize_worker,
+        )
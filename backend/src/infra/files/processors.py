@@ -1,20 +1,24 @@
+import asyncio
 from collections.abc import Mapping
 from dataclasses import dataclass, replace
+from functools import partial
 from io import BytesIO
-from typing import Protocol
+from itertools import chain
+from typing import BinaryIO, Protocol
 from warnings import catch_warnings, simplefilter
 
 from PIL import Image, ImageOps
 
 from core.files.enums import FilePurpose
 from core.files.exceptions import FileImageOptimizationError
-from core.files.processors import FileContentProcessor
-from core.files.schemas import FileUploadParams
+from core.files.processors import FileContentProcessor, FileVariantGenerator
+from core.files.schemas import FileUploadParams, FileVariantRendition, UploadContent
 from core.knowledge.files.clients import KnowledgePhotoProcessor
 from core.knowledge.files.schemas import (
     KnowledgeFileUploadParams,
     ProcessedKnowledgePhoto,
 )
+from infra.files.image_processing_pool import ImageProcessingPool
 
 _MIME_TYPE_BY_IMAGE_FORMAT = {
     "GIF": "image/gif",
@@ -55,6 +59,15 @@ class ImageProcessor(Protocol):
     def encode_lossless_webp(self, *, image: Image.Image, method: int) -> bytes: ...
 
 
+class ImageContentOptimizer(Protocol):
+    def optimize(self, *, params: FileUploadParams) -> FileUploadParams: ...
+
+
+def _in_memory(*, content: UploadContent) -> UploadContent:
+    # Spooled uploads are backed by open temp files, which cannot cross a process boundary.
+    return replace(content, file=BytesIO(content.read()))
+
+
 class ArticleImageProcessingSupport:
     @staticmethod
     def must_preserve_original(*, loaded: LoadedImage) -> bool:
@@ -74,7 +87,7 @@ class ArticleImageProcessingSupport:
         return replace(
             params,
             mime_type="image/webp",
-            content=optimized_content,
+            content=UploadContent.from_bytes(optimized_content),
         )
 
 
@@ -82,18 +95,38 @@ class ArticleImageProcessingSupport:
 class PurposeFileContentProcessor(FileContentProcessor):
     processors: Mapping[FilePurpose, FileContentProcessor]
 
-    def process(self, *, params: FileUploadParams) -> FileUploadParams:
-        return self.processors[params.purpose].process(params=params)
+    async def process(self, *, params: FileUploadParams) -> FileUploadParams:
+        return await self.processors[params.purpose].process(params=params)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class AttachmentContentProcessor(FileContentProcessor):
-    def process(self, *, params: FileUploadParams) -> FileUploadParams:
+    async def process(self, *, params: FileUploadParams) -> FileUploadParams:
         return params
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
-class ArticleCoverImageContentProcessor(FileContentProcessor):
+class PooledImageContentProcessor(FileContentProcessor):
+    pool: ImageProcessingPool
+    optimizer: ImageContentOptimizer
+
+    async def process(self, *, params: FileUploadParams) -> FileUploadParams:
+        optimized = await self.pool.run(
+            partial(
+                self.optimizer.optimize,
+                params=replace(
+                    params,
+                    content=_in_memory(content=params.content),
+                ),
+            ),
+        )
+        if optimized.content.sha256 == params.content.sha256:
+            return params
+        return optimized
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArticleCoverImageContentProcessor:
     image_processor: ImageProcessor
     max_width_px: int
     max_height_px: int
@@ -101,7 +134,7 @@ class ArticleCoverImageContentProcessor(FileContentProcessor):
     webp_method: int
     min_savings_ratio: float
 
-    def process(self, *, params: FileUploadParams) -> FileUploadParams:
+    def optimize(self, *, params: FileUploadParams) -> FileUploadParams:
         loaded = self.image_processor.load(params=params)
         if ArticleImageProcessingSupport.must_preserve_original(loaded=loaded):
             return params
@@ -124,7 +157,7 @@ class ArticleCoverImageContentProcessor(FileContentProcessor):
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
-class ArticleContentImageContentProcessor(FileContentProcessor):
+class ArticleContentImageContentProcessor:
     image_processor: ImageProcessor
     max_width_px: int
     max_height_px: int
@@ -132,7 +165,7 @@ class ArticleContentImageContentProcessor(FileContentProcessor):
     webp_method: int
     min_savings_ratio: float
 
-    def process(self, *, params: FileUploadParams) -> FileUploadParams:
+    def optimize(self, *, params: FileUploadParams) -> FileUploadParams:
         loaded = self.image_processor.load(params=params)
         if ArticleImageProcessingSupport.must_preserve_original(loaded=loaded):
             return params
@@ -169,17 +202,20 @@ class ArticleContentImageContentProcessor(FileContentProcessor):
 @dataclass(frozen=True, slots=True, kw_only=True)
 class PillowImageProcessor:
     def load(self, *, params: FileUploadParams) -> LoadedImage:
+        return self.load_content(content=params.content.rewind(), mime_type=params.mime_type)
+
+    def load_content(self, *, content: BinaryIO, mime_type: str) -> LoadedImage:
         try:
-            with Image.open(BytesIO(params.content)) as source_image:
+            with Image.open(content) as source_image:
                 source_image.load()
                 image_format = source_image.format
-                mime_type = _MIME_TYPE_BY_IMAGE_FORMAT.get(image_format or "")
-                if mime_type != params.mime_type:
+                detected_mime_type = _MIME_TYPE_BY_IMAGE_FORMAT.get(image_format or "")
+                if detected_mime_type is None or detected_mime_type != mime_type:
                     raise FileImageOptimizationError
                 image = ImageOps.exif_transpose(source_image).copy()
                 return LoadedImage(
                     image=image,
-                    mime_type=mime_type,
+                    mime_type=detected_mime_type,
                     is_animated=bool(getattr(source_image, "is_animated", False)),
                 )
         except (OSError, ValueError, Image.DecompressionBombError) as exc:
@@ -215,6 +251,11 @@ class PillowImageProcessor:
         image.save(output, format="WEBP", lossless=True, method=method)
         return output.getvalue()
 
+    def encode_avif(self, *, image: Image.Image, quality: int, speed: int) -> bytes:
+        output = BytesIO()
+        image.save(output, format="AVIF", quality=quality, speed=speed)
+        return output.getvalue()
+
     @staticmethod
     def _normalize_mode(*, image: Image.Image) -> Image.Image:
         if image.mode in {"RGB", "RGBA"}:
@@ -225,17 +266,17 @@ class PillowImageProcessor:
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
-class PersonPhotoContentProcessor(KnowledgePhotoProcessor):
+class PersonPhotoContentProcessor:
     max_width_px: int
     max_height_px: int
     webp_quality: int
     webp_method: int
 
-    def process(self, *, params: KnowledgeFileUploadParams) -> ProcessedKnowledgePhoto:
+    def optimize(self, *, params: KnowledgeFileUploadParams) -> ProcessedKnowledgePhoto:
         try:
             with catch_warnings():
                 simplefilter("error", Image.DecompressionBombWarning)
-                with Image.open(BytesIO(params.content)) as source_image:
+                with Image.open(params.content.rewind()) as source_image:
                     source_image.load()
                     detected_mime_type = Image.MIME.get(source_image.format or "")
                     if detected_mime_type != params.mime_type:
@@ -270,3 +311,100 @@ class PersonPhotoContentProcessor(KnowledgePhotoProcessor):
             Image.DecompressionBombWarning,
         ) as error:
             raise FileImageOptimizationError from error
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PooledKnowledgePhotoProcessor(KnowledgePhotoProcessor):
+    pool: ImageProcessingPool
+    optimizer: PersonPhotoContentProcessor
+
+    async def process(self, *, params: KnowledgeFileUploadParams) -> ProcessedKnowledgePhoto:
+        return await self.pool.run(
+            partial(
+                self.optimizer.optimize,
+                params=replace(
+                    params,
+                    content=_in_memory(content=params.content),
+                ),
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageVariantRenderer:
+    image_processor: PillowImageProcessor
+    webp_quality: int
+    webp_method: int
+    avif_quality: int
+    avif_speed: int
+
+    def render(
+        self,
+        *,
+        content: bytes,
+        mime_type: str,
+        width_px: int,
+    ) -> tuple[FileVariantRendition, ...]:
+        loaded = self.image_processor.load_content(content=BytesIO(content), mime_type=mime_type)
+        if ArticleImageProcessingSupport.must_preserve_original(loaded=loaded):
+            return ()
+        if loaded.image.width <= width_px:
+            return ()
+        image = self.image_processor.resize_for_bounds(
+            image=loaded.image,
+            max_width_px=width_px,
+            max_height_px=loaded.image.height,
+        )
+        return (
+            FileVariantRendition(
+                width_px=image.width,
+                height_px=image.height,
+                mime_type="image/avif",
+                file_extension=".avif",
+                content=self.image_processor.encode_avif(
+                    image=image,
+                    quality=self.avif_quality,
+                    speed=self.avif_speed,
+                ),
+            ),
+            FileVariantRendition(
+                width_px=image.width,
+                height_px=image.height,
+                mime_type="image/webp",
+                file_extension=".webp",
+                content=self.image_processor.encode_webp(
+                    image=image,
+                    quality=self.webp_quality,
+                    method=self.webp_method,
+                ),
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PooledFileVariantGenerator(FileVariantGenerator):
+    pool: ImageProcessingPool
+    renderer: ImageVariantRenderer
+    widths_px: tuple[int, ...]
+
+    async def generate(
+        self,
+        *,
+        content: bytes,
+        mime_type: str,
+    ) -> tuple[FileVariantRendition, ...]:
+        # One job per width keeps every encode inside the per-job CPU budget.
+        renditions = await asyncio.gather(
+            *(
+                self.pool.run(
+                    partial(
+                        self.renderer.render,
+                        content=content,
+                        mime_type=mime_type,
+                        width_px=width_px,
+                    ),
+                )
+                for width_px in self.widths_px
+            ),
+        )
+        return tuple(chain.from_iterable(renditions))
@@ -1,5 +1,9 @@
+import asyncio
+import contextlib
 import ssl
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, TypeVar
 
 import httpx
@@ -20,7 +24,8 @@ from core.competency_matrix.schemas import (
     ExternalResources,
 )
 from infra.config.agent_access import AgentBridgeSettings
-from infra.cryptography.agent_credentials import AgentCredentialPairProvider
+from infra.config.constants import constants
+from infra.cryptography.agent_credentials import AgentCredentialPair, AgentCredentialPairProvider
 from infra.http.agent_api.schemas import (
     AgentApiWireSchema,
     AgentCertificateRotationConfirmResponse,
@@ -39,12 +44,33 @@ from infra.http.agent_api.schemas import (
 
 AgentApiWireSchemaT = TypeVar("AgentApiWireSchemaT", bound=AgentApiWireSchema)
 
+type CredentialFileIdentity = tuple[int, int, int]
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
+class AgentApiClientIdentity:
+    pair: AgentCredentialPair
+    certificate_file: CredentialFileIdentity
+    private_key_file: CredentialFileIdentity
+
+
+@dataclass(slots=True, kw_only=True)
 class AgentApiHttpClient(AgentApiClient):
     settings: AgentBridgeSettings
     credential_provider: AgentCredentialPairProvider
     transport: httpx.AsyncBaseTransport | None
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _client_identity: AgentApiClientIdentity | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _client_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _client_leases: dict[httpx.AsyncClient, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
 
     async def claim_next_matrix_question(self) -> AgentMatrixQuestionClaim:
         response = await self._request(
@@ -156,22 +182,7 @@ class AgentApiHttpClient(AgentApiClient):
     ) -> AgentApiWireSchemaT:
         pair = self.credential_provider.active_pair()
         try:
-            ssl_context = ssl.create_default_context(
-                cafile=str(self.settings.ca_certificate_file),
-            )
-            ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-            ssl_context.load_cert_chain(
-                certfile=str(pair.certificate_file),
-                keyfile=str(pair.private_key_file),
-            )
-            async with httpx.AsyncClient(
-                base_url=f"{self.settings.api_base_url}/",
-                verify=ssl_context,
-                timeout=self.settings.request_timeout_seconds,
-                transport=self.transport,
-                trust_env=False,
-                follow_redirects=False,
-            ) as client:
+            async with self._leased_client(pair=pair) as client:
                 response = await client.request(method, path, params=query, json=json)
             response.raise_for_status()
             return response_schema.model_validate(
@@ -181,3 +192,69 @@ class AgentApiHttpClient(AgentApiClient):
             )
         except httpx.HTTPError, OSError, ValueError:
             raise AgentApiClientError from None
+
+    async def aclose(self) -> None:
+        async with self._client_lock:
+            client, self._client, self._client_identity = self._client, None, None
+            if client is not None and client not in self._client_leases:
+                await client.aclose()
+
+    @contextlib.asynccontextmanager
+    async def _leased_client(
+        self,
+        *,
+        pair: AgentCredentialPair,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        async with self._client_lock:
+            client = await self._client_for(pair=pair)
+            self._client_leases[client] = self._client_leases.get(client, 0) + 1
+        try:
+            yield client
+        finally:
+            self._client_leases[client] -= 1
+            if not self._client_leases[client]:
+                del self._client_leases[client]
+                # A client swapped out mid-request is closed by its last in-flight request.
+                if client is not self._client:
+                    await client.aclose()
+
+    async def _client_for(self, *, pair: AgentCredentialPair) -> httpx.AsyncClient:
+        # External credentials are replaced in place, so the file identity is part of the key.
+        identity = AgentApiClientIdentity(
+            pair=pair,
+            certificate_file=_file_identity(path=pair.certificate_file),
+            private_key_file=_file_identity(path=pair.private_key_file),
+        )
+        if self._client is not None and self._client_identity == identity:
+            return self._client
+        ssl_context = ssl.create_default_context(
+            cafile=str(self.settings.ca_certificate_file),
+        )
+        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        ssl_context.load_cert_chain(
+            certfile=str(pair.certificate_file),
+            keyfile=str(pair.private_key_file),
+        )
+        client = httpx.AsyncClient(
+            base_url=f"{self.settings.api_base_url}/",
+            verify=ssl_context,
+            timeout=self.settings.request_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=constants.agent_access.client_max_connections,
+                max_keepalive_connections=constants.agent_access.client_max_connections,
+                keepalive_expiry=constants.agent_access.client_keepalive_expiry_seconds,
+            ),
+            transport=self.transport,
+            trust_env=False,
+            follow_redirects=False,
+        )
+        stale_client = self._client
+        self._client, self._client_identity = client, identity
+        if stale_client is not None and stale_client not in self._client_leases:
+            await stale_client.aclose()
+        return client
+
+
+def _file_identity(*, path: Path) -> CredentialFileIdentity:
+    stat = path.stat()
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
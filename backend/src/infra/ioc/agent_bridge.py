@@ -31,6 +31,7 @@ class AutomaticAgentCredentialRotationRuntime:
 @dataclass(frozen=True, slots=True, kw_only=True)
 class AgentBridgeRuntime:
     server: AgentBridgeServer
+    client: AgentApiHttpClient
     automatic_rotation: AutomaticAgentCredentialRotationRuntime | None
 
 
@@ -75,5 +76,6 @@ def compose_agent_bridge_runtime(
         )
     return AgentBridgeRuntime(
         server=AgentBridgeServer(use_case=bridge_use_case),
+        client=client,
         automatic_rotation=automatic_rotation,
     )
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.account.storages import ManagedAccountStorage, UserAccountStorage
 from core.account.use_cases import AccountsUseCase
 from core.auth.password_hashers import PasswordHasher
-from core.auth.storages import AuthSessionStorage
+from core.auth.storages import AuthSessionStorage, VerifiedAccessTokenInvalidator
 from infra.postgresql.storages.users import UserAccountDatabaseStorage
 
 
@@ -26,9 +26,11 @@ class UserAccountProvider(Provider):
         storage: ManagedAccountStorage,
         hasher: PasswordHasher,
         auth_session_storage: AuthSessionStorage,
+        verified_token_invalidator: VerifiedAccessTokenInvalidator,
     ) -> AccountsUseCase:
         return AccountsUseCase(
             storage=storage,
             hasher=hasher,
             auth_session_storage=auth_session_storage,
+            verified_token_invalidator=verified_token_invalidator,
         )
@@ -15,7 +15,10 @@ from core.agent_access.use_cases import (
     AgentIdentityUseCase,
     MatrixAgentUseCase,
 )
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.generators import HexUuidIdGenerator
 from infra.config.constants import constants
 from infra.postgresql.storages.agent_access import AgentAccessDatabaseStorage
@@ -60,10 +63,12 @@ class AgentAccessProvider(Provider):
         self,
         storage: MatrixAgentStorage,
         matrix_storage: CompetencyMatrixStorage,
+        workspace_summary_cache: CompetencyMatrixWorkspaceSummaryCache,
         id_generator: HexUuidIdGenerator,
     ) -> MatrixAgentUseCase:
         return MatrixAgentUseCase(
             storage=storage,
             matrix_storage=matrix_storage,
+            workspace_summary_cache=workspace_summary_cache,
             id_generator=id_generator,
         )
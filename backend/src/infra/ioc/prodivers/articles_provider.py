@@ -1,9 +1,16 @@
+from collections.abc import AsyncIterable
+
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
+from valkey.asyncio import Valkey
 
 from core.articles.event_dispatchers import ArticleAnalyticsErrorReporter
 from core.articles.schemas import ArticleAnalyticsConfig
-from core.articles.storages import ArticleAnalyticsStorage, ArticlesStorage
+from core.articles.storages import (
+    ArticleAnalyticsStorage,
+    ArticlesStorage,
+    ArticleViewCounterBuffer,
+)
 from core.articles.use_cases import (
     ArticleAnalyticsUseCase,
     ArticlesUseCase,
@@ -11,11 +18,13 @@ from core.articles.use_cases import (
 from core.files.clients import FileClient
 from core.files.services import FileService
 from infra.articles.event_dispatchers import StructlogArticleAnalyticsErrorReporter
+from infra.config.constants import constants
 from infra.config.settings import settings
 from infra.postgresql.storages.articles import (
     ArticleAnalyticsDatabaseStorage,
     ArticlesDatabaseStorage,
 )
+from infra.valkey.storages import ValkeyArticleViewCounterBuffer
 
 
 class ArticlesProvider(Provider):
@@ -33,6 +42,26 @@ class ArticlesProvider(Provider):
     ) -> ArticleAnalyticsStorage:
         return ArticleAnalyticsDatabaseStorage(session=session)
 
+    @provide(scope=Scope.APP)
+    async def provide_article_view_counter_buffer(
+        self,
+    ) -> AsyncIterable[ArticleViewCounterBuffer]:
+        valkey = Valkey.from_url(
+            settings.valkey.get_url(
+                db=constants.valkey.databases.article_view_counters,
+            ).get_secret_value(),
+        )
+        try:
+            yield ValkeyArticleViewCounterBuffer(
+                valkey=valkey,
+                namespace=constants.valkey.namespaces.article_view_counters,
+                flush_lock_ttl_milliseconds=(
+                    constants.article_analytics.view_counter_flush_lock_ttl_milliseconds
+                ),
+            )
+        finally:
+            await valkey.aclose(close_connection_pool=True)
+
     @provide(scope=Scope.APP)
     async def provide_article_analytics_error_reporter(self) -> ArticleAnalyticsErrorReporter:
         return StructlogArticleAnalyticsErrorReporter()
@@ -62,10 +91,12 @@ class ArticlesProvider(Provider):
         self,
         storage: ArticlesStorage,
         analytics_storage: ArticleAnalyticsStorage,
+        view_counter_buffer: ArticleViewCounterBuffer,
         error_reporter: ArticleAnalyticsErrorReporter,
     ) -> ArticleAnalyticsUseCase:
         return ArticleAnalyticsUseCase(
             articles_storage=storage,
             analytics_storage=analytics_storage,
+            view_counter_buffer=view_counter_buffer,
             error_reporter=error_reporter,
         )
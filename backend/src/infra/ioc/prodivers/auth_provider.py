@@ -1,13 +1,16 @@
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
 from argon2 import PasswordHasher as CryptContext
-from dishka import Provider, Scope, provide
+from dishka import Provider, Scope, alias, provide
 from litestar import Request
 from litestar.stores.valkey import ValkeyStore
 from sqlalchemy.ext.asyncio import AsyncSession
 from ua_parser import parse
+from valkey.asyncio import Valkey
 
 from core.account.storages import UserAccountStorage
+from core.auth.exceptions import PasswordHashingOverloadedError
 from core.auth.generators import AuthSessionSecretGenerator
 from core.auth.password_hashers import PasswordHasher
 from core.auth.schemas import (
@@ -15,20 +18,38 @@ from core.auth.schemas import (
     AuthSessionClientMetadata,
     AuthUseCaseConfig,
 )
-from core.auth.storages import AuthSessionStorage, AuthStorage, TokenRevocationStorage
+from core.auth.storages import (
+    AuthSessionStorage,
+    AuthStorage,
+    TokenRevocationStorage,
+    VerifiedAccessTokenCache,
+    VerifiedAccessTokenInvalidator,
+)
 from core.auth.token_handlers import TokenHandler
 from core.auth.types import RawToken, Token
 from core.auth.use_cases import AuthSessionCleanupUseCase, AuthUseCase
 from infra.auth.event_dispatchers import StructlogAuthEventReporter
 from infra.auth.password_hashers import Argon2PasswordHasher
+from infra.auth.token_caches import (
+    LocalVerifiedAccessTokenCache,
+    PostCommitVerifiedAccessTokenInvalidator,
+    ValkeyVerifiedAccessTokenInvalidationChannel,
+)
 from infra.auth.token_handlers import PasetoTokenHandler
 from infra.config.constants import constants
 from infra.config.settings import settings
+from infra.executors import BoundedThreadPoolExecutor
+from infra.post_commit_actions import PostCommitActions
 from infra.postgresql.storages.auth import AuthDatabaseStorage, AuthSessionDatabaseStorage
 from infra.valkey.storages import ValkeyTokenRevocationStorage
 
 
 class AuthProvider(Provider):
+    verified_access_token_cache = alias(
+        LocalVerifiedAccessTokenCache,
+        provides=VerifiedAccessTokenCache,
+    )
+
     @provide(scope=Scope.REQUEST)
     async def raw_token(self, request: Request) -> RawToken:
         return RawToken(request.headers.get(settings.auth.token_header_name, ""))
@@ -38,8 +59,21 @@ class AuthProvider(Provider):
         return Token(raw_token.split(settings.auth.token_prefix)[-1].strip().encode())
 
     @provide(scope=Scope.APP)
-    async def provide_hasher(self) -> PasswordHasher:
-        return Argon2PasswordHasher(context=CryptContext())
+    async def provide_hasher(self) -> AsyncIterator[PasswordHasher]:
+        # argon2-cffi releases the GIL while hashing, so threads run the work in parallel.
+        executor = BoundedThreadPoolExecutor(
+            max_workers=constants.auth.password_hashing_max_workers,
+            max_queue_depth=constants.auth.password_hashing_max_queue_depth,
+            thread_name_prefix="password-hashing",
+            overloaded_error=PasswordHashingOverloadedError,
+            saturated_log_event="Password hashing queue is saturated",
+            slow_queue_wait_log_event="Slow password hashing queue wait",
+            slow_queue_wait_log_threshold_ms=(
+                constants.auth.password_hashing_slow_queue_wait_log_threshold_ms
+            ),
+        )
+        yield Argon2PasswordHasher(context=CryptContext(), executor=executor)
+        executor.shutdown()
 
     @provide(scope=Scope.APP)
     async def provide_token_handler(self) -> TokenHandler:
@@ -108,6 +142,36 @@ class AuthProvider(Provider):
             ),
         )
 
+    @provide(scope=Scope.APP)
+    async def provide_local_verified_access_token_cache(
+        self,
+    ) -> AsyncIterator[LocalVerifiedAccessTokenCache]:
+        cache = LocalVerifiedAccessTokenCache(
+            max_entries=constants.auth.authentication_cache_max_entries,
+            ttl_seconds=constants.auth.authentication_cache_ttl_seconds,
+            invalidation_channel=ValkeyVerifiedAccessTokenInvalidationChannel(
+                valkey=Valkey.from_url(
+                    settings.valkey.get_url(
+                        db=constants.valkey.databases.auth_revocations,
+                    ).get_secret_value(),
+                ),
+                channel=constants.auth.authentication_invalidation_channel,
+            ),
+        )
+        yield cache
+        await cache.aclose()
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_verified_access_token_invalidator(
+        self,
+        cache: LocalVerifiedAccessTokenCache,
+        post_commit_actions: PostCommitActions,
+    ) -> VerifiedAccessTokenInvalidator:
+        return PostCommitVerifiedAccessTokenInvalidator(
+            cache=cache,
+            post_commit_actions=post_commit_actions,
+        )
+
     @provide(scope=Scope.REQUEST)
     async def provide_auth_use_case(  # noqa: PLR0913
         self,
@@ -118,6 +182,8 @@ class AuthProvider(Provider):
         auth_session_storage: AuthSessionStorage,
         user_storage: UserAccountStorage,
         auth_session_secret_generator: AuthSessionSecretGenerator,
+        verified_token_cache: VerifiedAccessTokenCache,
+        verified_token_invalidator: VerifiedAccessTokenInvalidator,
     ) -> AuthUseCase:
         return AuthUseCase(
             hasher=hasher,
@@ -128,6 +194,8 @@ class AuthProvider(Provider):
             user_storage=user_storage,
             event_reporter=StructlogAuthEventReporter(),
             auth_session_secret_generator=auth_session_secret_generator,
+            verified_token_cache=verified_token_cache,
+            verified_token_invalidator=verified_token_invalidator,
         )
 
     @provide(scope=Scope.REQUEST)
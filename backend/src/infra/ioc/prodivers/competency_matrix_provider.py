@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 from valkey.asyncio import Valkey
@@ -7,13 +9,22 @@ from core.competency_matrix.parsers import QuestionQueueImportParser
 from core.competency_matrix.readers import QuestionQueueImportExcelReader
 from core.competency_matrix.schemas import QuestionSuggestionLimiterConfig
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage, QuestionSuggestionQuotaStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+    QuestionSuggestionQuotaStorage,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
+from infra.competency_matrix_caches import PostCommitCompetencyMatrixWorkspaceSummaryCache
 from infra.config.constants import constants
 from infra.config.settings import settings
 from infra.openpyxl.readers import OpenpyxlQuestionQueueImportExcelReader
+from infra.post_commit_actions import PostCommitActions
 from infra.postgresql.storages.competency_matrix import CompetencyMatrixDatabaseStorage
-from infra.valkey.storages import ValkeyQuestionSuggestionQuotaStorage
+from infra.valkey.storages import (
+    ValkeyCompetencyMatrixWorkspaceSummaryCache,
+    ValkeyQuestionSuggestionQuotaStorage,
+)
 
 
 class CompetencyMatrixProvider(Provider):
@@ -59,6 +70,35 @@ class CompetencyMatrixProvider(Provider):
             namespace=constants.valkey.namespaces.matrix_question_suggestions,
         )
 
+    @provide(scope=Scope.APP)
+    async def provide_valkey_workspace_summary_cache(
+        self,
+    ) -> AsyncIterator[ValkeyCompetencyMatrixWorkspaceSummaryCache]:
+        valkey = Valkey.from_url(
+            settings.valkey.get_url(
+                db=constants.valkey.databases.competency_matrix_workspace_summaries,
+            ).get_secret_value(),
+        )
+        try:
+            yield ValkeyCompetencyMatrixWorkspaceSummaryCache(
+                valkey=valkey,
+                namespace=constants.valkey.namespaces.competency_matrix_workspace_summaries,
+                ttl_seconds=constants.competency_matrix.workspace_summary_cache_ttl_seconds,
+            )
+        finally:
+            await valkey.aclose(close_connection_pool=True)
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_workspace_summary_cache(
+        self,
+        cache: ValkeyCompetencyMatrixWorkspaceSummaryCache,
+        post_commit_actions: PostCommitActions,
+    ) -> CompetencyMatrixWorkspaceSummaryCache:
+        return PostCommitCompetencyMatrixWorkspaceSummaryCache(
+            cache=cache,
+            post_commit_actions=post_commit_actions,
+        )
+
     @provide(scope=Scope.APP)
     async def provide_question_suggestion_limiter(
         self,
@@ -79,8 +119,10 @@ class CompetencyMatrixProvider(Provider):
         self,
         storage: CompetencyMatrixStorage,
         question_suggestion_limiter: QuestionSuggestionLimiter,
+        workspace_summary_cache: CompetencyMatrixWorkspaceSummaryCache,
     ) -> CompetencyMatrixUseCase:
         return CompetencyMatrixUseCase(
             storage=storage,
             question_suggestion_limiter=question_suggestion_limiter,
+            workspace_summary_cache=workspace_summary_cache,
         )
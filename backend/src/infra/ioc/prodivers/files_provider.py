@@ -1,32 +1,53 @@
 import secrets
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator
 from contextlib import AsyncExitStack
 from typing import cast
 
 from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
-from dishka import Provider, Scope, provide
+from dishka import AsyncContainer, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 from types_aiobotocore_s3.client import S3Client
+from valkey.asyncio import Valkey
 
 from core.files.clients import FileClient
 from core.files.enums import FilePurpose
 from core.files.file_name_generators import FileNameGenerator, TimestampFileNameGenerator
-from core.files.processors import FileContentProcessor
-from core.files.schemas import FileOrphanCleanupConfig, FileServiceConfig
-from core.files.services import FileOrphanCleanupService, FileService
-from core.files.storages import FileStorage
+from core.files.processors import FileContentProcessor, FileVariantGenerator
+from core.files.schemas import (
+    DirectUploadConfig,
+    FileOrphanCleanupConfig,
+    FileServiceConfig,
+    FileVariantsConfig,
+)
+from core.files.services import (
+    DirectUploadService,
+    FileDirectUploadService,
+    FileOrphanCleanupService,
+    FileService,
+    FileVariantService,
+)
+from core.files.storages import DirectUploadSessionStorage, FileStorage
+from entrypoints.taskiq.files.scopes import (
+    DishkaFileOrphanCleanupScopes,
+    FileOrphanCleanupScopes,
+)
 from infra.config.constants import constants
 from infra.config.settings import settings
+from infra.files.image_processing_pool import ImageProcessingPool
 from infra.files.processors import (
     ArticleContentImageContentProcessor,
     ArticleCoverImageContentProcessor,
     AttachmentContentProcessor,
+    ImageVariantRenderer,
     PillowImageProcessor,
+    PooledFileVariantGenerator,
+    PooledImageContentProcessor,
     PurposeFileContentProcessor,
 )
 from infra.postgresql.storages.files import FilesDatabaseStorage
-from infra.s3.clients import S3ClientBundle, S3FileClient
+from infra.s3.clients import S3ClientBundle, S3FileClient, S3MultipartUploadClient
+from infra.valkey.storages import ValkeyDirectUploadSessionStorage
 
 
 class FilesProvider(Provider):
@@ -38,30 +59,68 @@ class FilesProvider(Provider):
         )
 
     @provide(scope=Scope.APP)
-    async def provide_file_content_processor(self) -> FileContentProcessor:
+    async def provide_image_processing_pool(self) -> AsyncIterator[ImageProcessingPool]:
+        pool = ImageProcessingPool(
+            max_workers=constants.files.image_processing_max_workers,
+            max_concurrent_jobs=constants.files.image_processing_max_concurrent_jobs,
+            cpu_time_limit_seconds=constants.files.image_processing_cpu_time_limit_seconds,
+        )
+        try:
+            yield pool
+        finally:
+            pool.shutdown()
+
+    @provide(scope=Scope.APP)
+    async def provide_file_content_processor(
+        self,
+        image_processing_pool: ImageProcessingPool,
+    ) -> FileContentProcessor:
         image_processor = PillowImageProcessor()
         return PurposeFileContentProcessor(
             processors={
-                FilePurpose.ARTICLE_COVER_IMAGE: ArticleCoverImageContentProcessor(
-                    image_processor=image_processor,
-                    max_width_px=constants.files.cover_image_max_width_px,
-                    max_height_px=constants.files.cover_image_max_height_px,
-                    webp_quality=constants.files.cover_image_webp_quality,
-                    webp_method=constants.files.cover_image_webp_method,
-                    min_savings_ratio=constants.files.cover_image_min_savings_ratio,
+                FilePurpose.ARTICLE_COVER_IMAGE: PooledImageContentProcessor(
+                    pool=image_processing_pool,
+                    optimizer=ArticleCoverImageContentProcessor(
+                        image_processor=image_processor,
+                        max_width_px=constants.files.cover_image_max_width_px,
+                        max_height_px=constants.files.cover_image_max_height_px,
+                        webp_quality=constants.files.cover_image_webp_quality,
+                        webp_method=constants.files.cover_image_webp_method,
+                        min_savings_ratio=constants.files.cover_image_min_savings_ratio,
+                    ),
                 ),
-                FilePurpose.ARTICLE_CONTENT_IMAGE: ArticleContentImageContentProcessor(
-                    image_processor=image_processor,
-                    max_width_px=constants.files.content_image_max_width_px,
-                    max_height_px=constants.files.content_image_max_height_px,
-                    jpeg_webp_quality=constants.files.content_image_jpeg_webp_quality,
-                    webp_method=constants.files.content_image_webp_method,
-                    min_savings_ratio=constants.files.content_image_min_savings_ratio,
+                FilePurpose.ARTICLE_CONTENT_IMAGE: PooledImageContentProcessor(
+                    pool=image_processing_pool,
+                    optimizer=ArticleContentImageContentProcessor(
+                        image_processor=image_processor,
+                        max_width_px=constants.files.content_image_max_width_px,
+                        max_height_px=constants.files.content_image_max_height_px,
+                        jpeg_webp_quality=constants.files.content_image_jpeg_webp_quality,
+                        webp_method=constants.files.content_image_webp_method,
+                        min_savings_ratio=constants.files.content_image_min_savings_ratio,
+                    ),
                 ),
                 FilePurpose.ATTACHMENT: AttachmentContentProcessor(),
             },
         )
 
+    @provide(scope=Scope.APP)
+    async def provide_file_variant_generator(
+        self,
+        image_processing_pool: ImageProcessingPool,
+    ) -> FileVariantGenerator:
+        return PooledFileVariantGenerator(
+            pool=image_processing_pool,
+            renderer=ImageVariantRenderer(
+                image_processor=PillowImageProcessor(),
+                webp_quality=constants.files.variant_webp_quality,
+                webp_method=constants.files.variant_webp_method,
+                avif_quality=constants.files.variant_avif_quality,
+                avif_speed=constants.files.variant_avif_speed,
+            ),
+            widths_px=constants.files.variant_widths_px,
+        )
+
     @provide(scope=Scope.APP)
     async def provide_s3_clients(self) -> AsyncIterable[S3ClientBundle]:
         session = get_session()
@@ -128,6 +187,61 @@ class FilesProvider(Provider):
             ),
         )
 
+    @provide(scope=Scope.APP)
+    async def provide_direct_upload_session_storage(
+        self,
+    ) -> AsyncIterable[DirectUploadSessionStorage]:
+        valkey = Valkey.from_url(
+            settings.valkey.get_url(
+                db=constants.valkey.databases.direct_upload_sessions,
+            ).get_secret_value(),
+        )
+        try:
+            yield ValkeyDirectUploadSessionStorage(
+                valkey=valkey,
+                namespace=constants.valkey.namespaces.direct_upload_sessions,
+            )
+        finally:
+            await valkey.aclose(close_connection_pool=True)
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_file_direct_upload_service(
+        self,
+        s3_clients: S3ClientBundle,
+        session_storage: DirectUploadSessionStorage,
+        file_service: FileService,
+        file_storage: FileStorage,
+        file_name_generator: FileNameGenerator,
+    ) -> FileDirectUploadService:
+        return FileDirectUploadService(
+            file_service=file_service,
+            file_storage=file_storage,
+            file_name_generator=file_name_generator,
+            direct_uploads=DirectUploadService(
+                client=S3MultipartUploadClient(
+                    clients=s3_clients,
+                    bucket_name=constants.minio_buckets.media,
+                    read_chunk_size_bytes=constants.files.direct_upload_digest_chunk_size_bytes,
+                ),
+                session_storage=session_storage,
+                config=DirectUploadConfig(
+                    part_size_bytes=constants.files.direct_upload_part_size_bytes,
+                    max_size_bytes=constants.files.direct_upload_max_size_bytes,
+                    url_expires_in_seconds=constants.files.direct_upload_url_expires_in_seconds,
+                    session_ttl_seconds=constants.files.direct_upload_session_ttl_seconds,
+                    original_name_max_length=(
+                        constants.files.direct_upload_original_name_max_length
+                    ),
+                    mime_type_max_length=constants.files.direct_upload_mime_type_max_length,
+                ),
+            ),
+            config=FileServiceConfig(
+                namespace=constants.minio_buckets.media,
+                rules=constants.files.rules,
+            ),
+            purposes=constants.files.direct_upload_purposes,
+        )
+
     @provide(scope=Scope.REQUEST)
     async def provide_file_orphan_cleanup_service(
         self,
@@ -142,3 +256,24 @@ class FilesProvider(Provider):
                 batch_size=constants.files.orphan_cleanup_batch_size,
             ),
         )
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_file_variant_service(
+        self,
+        file_client: FileClient,
+        file_storage: FileStorage,
+        file_variant_generator: FileVariantGenerator,
+    ) -> FileVariantService:
+        return FileVariantService(
+            file_client=file_client,
+            file_storage=file_storage,
+            variant_generator=file_variant_generator,
+            config=FileVariantsConfig(purposes=constants.files.variant_purposes),
+        )
+
+    @provide(scope=Scope.APP)
+    async def provide_file_orphan_cleanup_scopes(
+        self,
+        container: AsyncContainer,
+    ) -> FileOrphanCleanupScopes:
+        return DishkaFileOrphanCleanupScopes(container=container)
@@ -4,6 +4,9 @@ from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.files.file_name_generators import FileNameGenerator
+from core.files.schemas import DirectUploadConfig
+from core.files.services import DirectUploadService
+from core.files.storages import DirectUploadSessionStorage
 from core.knowledge.files.clients import (
     KnowledgeFileClient,
     KnowledgeFileObjectCleaner,
@@ -11,27 +14,37 @@ from core.knowledge.files.clients import (
     KnowledgePhotoProcessor,
 )
 from core.knowledge.files.enums import KnowledgeFileKind
-from core.knowledge.files.schemas import KnowledgeFileRule, KnowledgeFileRules
+from core.knowledge.files.schemas import KnowledgeFileRules
 from core.knowledge.files.services import KnowledgeFileCrudService
 from core.knowledge.files.storages import KnowledgeFilesStorage
-from core.knowledge.files.use_cases import KnowledgeFilesUseCase
+from core.knowledge.files.use_cases import (
+    KnowledgeAttachmentDirectUploadUseCase,
+    KnowledgeFilesUseCase,
+)
 from core.knowledge.items.storages import KnowledgeItemsStorage
 from infra.config.constants import constants
-from infra.files.processors import PersonPhotoContentProcessor
+from infra.files.image_processing_pool import ImageProcessingPool
+from infra.files.processors import PersonPhotoContentProcessor, PooledKnowledgePhotoProcessor
 from infra.knowledge_file_actions import RequestKnowledgeFileRollbackRegistrar
 from infra.post_commit_actions import RollbackActions
 from infra.postgresql.storages.knowledge.files import KnowledgeFilesDatabaseStorage
-from infra.s3.clients import S3ClientBundle, S3KnowledgeFileClient
+from infra.s3.clients import S3ClientBundle, S3KnowledgeFileClient, S3MultipartUploadClient
 
 
 class KnowledgeFilesProvider(Provider):
     @provide(scope=Scope.APP)
-    async def provide_knowledge_photo_processor(self) -> KnowledgePhotoProcessor:
-        return PersonPhotoContentProcessor(
-            max_width_px=constants.knowledge_files.photo_max_width_px,
-            max_height_px=constants.knowledge_files.photo_max_height_px,
-            webp_quality=constants.knowledge_files.photo_webp_quality,
-            webp_method=constants.knowledge_files.photo_webp_method,
+    async def provide_knowledge_photo_processor(
+        self,
+        image_processing_pool: ImageProcessingPool,
+    ) -> KnowledgePhotoProcessor:
+        return PooledKnowledgePhotoProcessor(
+            pool=image_processing_pool,
+            optimizer=PersonPhotoContentProcessor(
+                max_width_px=constants.knowledge_files.photo_max_width_px,
+                max_height_px=constants.knowledge_files.photo_max_height_px,
+                webp_quality=constants.knowledge_files.photo_webp_quality,
+                webp_method=constants.knowledge_files.photo_webp_method,
+            ),
         )
 
     @provide(scope=Scope.APP)
@@ -85,24 +98,8 @@ class KnowledgeFilesProvider(Provider):
             file_name_generator=file_name_generator,
             config=KnowledgeFileRules(
                 values={
-                    KnowledgeFileKind.ATTACHMENT: KnowledgeFileRule(
-                        folder=constants.knowledge_files.attachment_folder,
-                        allowed_mime_types=constants.knowledge_files.attachment_mime_types,
-                        max_size_bytes=constants.knowledge_files.attachment_max_size_bytes,
-                        original_name_max_length=(
-                            constants.knowledge_files.original_name_max_length
-                        ),
-                        mime_type_max_length=constants.knowledge_files.mime_type_max_length,
-                    ),
-                    KnowledgeFileKind.PERSON_PHOTO: KnowledgeFileRule(
-                        folder=constants.knowledge_files.person_photo_folder,
-                        allowed_mime_types=constants.knowledge_files.photo_mime_types,
-                        max_size_bytes=constants.knowledge_files.photo_max_size_bytes,
-                        original_name_max_length=(
-                            constants.knowledge_files.original_name_max_length
-                        ),
-                        mime_type_max_length=constants.knowledge_files.mime_type_max_length,
-                    ),
+                    KnowledgeFileKind.ATTACHMENT: constants.knowledge_files.attachment_rule,
+                    KnowledgeFileKind.PERSON_PHOTO: constants.knowledge_files.person_photo_rule,
                 },
             ),
         )
@@ -119,3 +116,35 @@ class KnowledgeFilesProvider(Provider):
             file_storage=file_storage,
             file_service=file_service,
         )
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_knowledge_attachment_direct_upload_use_case(
+        self,
+        s3_clients: S3ClientBundle,
+        session_storage: DirectUploadSessionStorage,
+        item_storage: KnowledgeItemsStorage,
+        file_storage: KnowledgeFilesStorage,
+        file_name_generator: FileNameGenerator,
+    ) -> KnowledgeAttachmentDirectUploadUseCase:
+        return KnowledgeAttachmentDirectUploadUseCase(
+            item_storage=item_storage,
+            file_storage=file_storage,
+            file_name_generator=file_name_generator,
+            direct_uploads=DirectUploadService(
+                client=S3MultipartUploadClient(
+                    clients=s3_clients,
+                    bucket_name=constants.minio_buckets.knowledge_private,
+                    read_chunk_size_bytes=constants.files.direct_upload_digest_chunk_size_bytes,
+                ),
+                session_storage=session_storage,
+                config=DirectUploadConfig(
+                    part_size_bytes=constants.files.direct_upload_part_size_bytes,
+                    max_size_bytes=constants.knowledge_files.attachment_direct_upload_max_size_bytes,
+                    url_expires_in_seconds=constants.files.direct_upload_url_expires_in_seconds,
+                    session_ttl_seconds=constants.files.direct_upload_session_ttl_seconds,
+                    original_name_max_length=constants.knowledge_files.original_name_max_length,
+                    mime_type_max_length=constants.knowledge_files.mime_type_max_length,
+                ),
+            ),
+            rule=constants.knowledge_files.attachment_rule,
+        )
@@ -1,7 +1,6 @@
 from collections.abc import AsyncIterable
-from contextlib import AsyncExitStack
 
-from dishka import Provider, Scope, provide
+from dishka import AsyncContainer, Provider, Scope, provide
 from litestar.stores.valkey import ValkeyStore
 from valkey.asyncio import Valkey
 
@@ -15,6 +14,10 @@ from entrypoints.litestar.response_cache import (
     ResponseCacheDomainStore,
 )
 from entrypoints.taskiq.cache_warm.dispatcher import TaskiqCacheWarmDispatcher
+from entrypoints.taskiq.cache_warm.scopes import (
+    CacheWarmCollectorScopes,
+    DishkaCacheWarmCollectorScopes,
+)
 from entrypoints.taskiq.cache_warm.service import ResponseCacheWarmService
 from entrypoints.taskiq.cache_warm.targets import (
     ArticlesCacheWarmTargetCollector,
@@ -53,18 +56,23 @@ class ResponseCacheWarmProvider(Provider):
             domains=tuple(CacheDomainEnum),
         )
 
-    @provide
+    @provide(scope=Scope.APP)
+    async def provide_cache_warm_collector_scopes(
+        self,
+        container: AsyncContainer,
+    ) -> CacheWarmCollectorScopes:
+        return DishkaCacheWarmCollectorScopes(container=container)
+
+    @provide(scope=Scope.APP)
     async def provide_response_cache_domain_store(
         self,
     ) -> AsyncIterable[ResponseCacheDomainStore]:
         from entrypoints.litestar.initializers.main import (  # noqa: PLC0415
-            create_response_cache_domain_store,
+            get_response_cache_domain_store,
         )
 
-        response_cache_domain_store = create_response_cache_domain_store()
-        async with AsyncExitStack() as exit_stack:
-            for store in response_cache_domain_store.stores.values():
-                await exit_stack.enter_async_context(store)
+        response_cache_domain_store = get_response_cache_domain_store()
+        async with response_cache_domain_store:
             yield response_cache_domain_store
 
     @provide
@@ -72,6 +80,7 @@ class ResponseCacheWarmProvider(Provider):
         self,
         target_collector: ResponseCacheWarmTargetCollector,
         writer: ResponseCacheWarmWriter,
+        collector_scopes: CacheWarmCollectorScopes,
     ) -> ResponseCacheWarmService:
         return ResponseCacheWarmService(
             target_collector=target_collector,
@@ -82,6 +91,7 @@ class ResponseCacheWarmProvider(Provider):
                 ResponseCacheDomain.ARTICLES,
                 ResponseCacheDomain.COMPETENCY_MATRIX,
             ),
+            collector_scopes=collector_scopes,
         )
 
     @provide
@@ -97,11 +107,12 @@ class ResponseCacheWarmProvider(Provider):
         try:
             yield ValkeyResponseCacheStatusStorage(
                 valkey=valkey,
-                namespaces={
-                    domain: f"{constants.valkey.namespaces.framework}_{domain.value}"
+                expiry_index_keys={
+                    domain: (
+                        f"{constants.valkey.namespaces.response_cache_expiry_index}:{domain.value}"
+                    )
                     for domain in CacheDomainEnum
                 },
-                scan_batch_size=constants.response_cache.status_scan_batch_size,
             )
         finally:
             await valkey.aclose(close_connection_pool=True)
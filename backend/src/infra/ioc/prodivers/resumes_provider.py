@@ -1,12 +1,22 @@
+from collections.abc import AsyncIterator
+
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
+from valkey.asyncio import Valkey
 
+from core.resumes.exceptions import ResumeExportOverloadedError
 from core.resumes.exporters import ResumeDocumentExporter
 from core.resumes.storages import ResumesStorage
 from core.resumes.use_cases import ResumesUseCase
 from infra.config.constants import constants
+from infra.config.settings import settings
+from infra.executors import BoundedThreadPoolExecutor
 from infra.postgresql.storages.resumes import ResumesDatabaseStorage
-from infra.resume_export.document_exporter import ResumeDocumentExporterImpl
+from infra.resume_export.document_exporter import (
+    ResumeDocumentExporterImpl,
+    ResumeDocumentRenderer,
+)
+from infra.valkey.storages import ValkeyResumeExportCache
 
 
 class ResumesProvider(Provider):
@@ -15,13 +25,43 @@ class ResumesProvider(Provider):
         return ResumesDatabaseStorage(session=session)
 
     @provide(scope=Scope.APP)
-    async def provide_resume_document_exporter(self) -> ResumeDocumentExporter:
-        return ResumeDocumentExporterImpl(
-            font_regular_path=constants.resume_export.font_regular_path,
-            font_bold_path=constants.resume_export.font_bold_path,
-            font_regular_name=constants.resume_export.font_regular_name,
-            font_bold_name=constants.resume_export.font_bold_name,
+    async def provide_resume_document_exporter(self) -> AsyncIterator[ResumeDocumentExporter]:
+        executor = BoundedThreadPoolExecutor(
+            max_workers=constants.resume_export.render_max_workers,
+            max_queue_depth=constants.resume_export.render_max_queue_depth,
+            thread_name_prefix="resume-export",
+            overloaded_error=ResumeExportOverloadedError,
+            saturated_log_event="Resume export queue is saturated",
+            slow_queue_wait_log_event="Slow resume export queue wait",
+            slow_queue_wait_log_threshold_ms=(
+                constants.resume_export.render_slow_queue_wait_log_threshold_ms
+            ),
+        )
+        valkey = Valkey.from_url(
+            settings.valkey.get_url(
+                db=constants.valkey.databases.resume_exports
+            ).get_secret_value(),
         )
+        try:
+            yield ResumeDocumentExporterImpl(
+                renderer=ResumeDocumentRenderer(
+                    font_regular_path=constants.resume_export.font_regular_path,
+                    font_bold_path=constants.resume_export.font_bold_path,
+                    font_regular_name=constants.resume_export.font_regular_name,
+                    font_bold_name=constants.resume_export.font_bold_name,
+                ),
+                executor=executor,
+                cache=ValkeyResumeExportCache(
+                    valkey=valkey,
+                    namespace=constants.valkey.namespaces.resume_exports,
+                    ttl_seconds=constants.resume_export.cache_ttl_seconds,
+                    max_size_bytes=constants.resume_export.cache_max_size_bytes,
+                ),
+                renderer_version=constants.resume_export.renderer_version,
+            )
+        finally:
+            executor.shutdown()
+            await valkey.aclose(close_connection_pool=True)
 
     @provide(scope=Scope.REQUEST)
     async def provide_resumes_use_case(
@@ -0,0 +1,27 @@
+from collections.abc import AsyncIterable
+
+from dishka import Provider, Scope, provide
+from valkey.asyncio import Valkey
+
+from core.sitemaps.storages import SitemapStorage
+from entrypoints.litestar.public.sitemaps import SitemapPublisher
+from infra.config.constants import constants
+from infra.config.settings import settings
+from infra.valkey.storages import ValkeySitemapStorage
+
+
+class SitemapsProvider(Provider):
+    sitemap_publisher = provide(SitemapPublisher, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.APP)
+    async def provide_sitemap_storage(self) -> AsyncIterable[SitemapStorage]:
+        valkey = Valkey.from_url(
+            settings.valkey.get_url(db=constants.valkey.databases.sitemaps).get_secret_value(),
+        )
+        try:
+            yield ValkeySitemapStorage(
+                valkey=valkey,
+                namespace=constants.valkey.namespaces.sitemaps,
+            )
+        finally:
+            await valkey.aclose(close_connection_pool=True)
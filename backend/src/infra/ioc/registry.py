@@ -24,6 +24,7 @@ from infra.ioc.prodivers.knowledge import (
 )
 from infra.ioc.prodivers.response_cache_warm_provider import ResponseCacheWarmProvider
 from infra.ioc.prodivers.resumes_provider import ResumesProvider
+from infra.ioc.prodivers.sitemaps_provider import SitemapsProvider
 from infra.ioc.prodivers.wiki_links_provider import WikiLinksProvider
 
 
@@ -50,5 +51,6 @@ def get_providers() -> Iterable[Provider]:
         KnowledgePeopleProvider(),
         WikiLinksProvider(),
         ResponseCacheWarmProvider(),
+        SitemapsProvider(),
         HealthcheckProvider(),
     )
@@ -0,0 +1,27 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+FILE_TABLE = "files__file_model"
+
+
+def upgrade() -> None:
+    op.add_column(
+        FILE_TABLE,
+        sa.Column(
+            "variants",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column(FILE_TABLE, "variants")
@@ -0,0 +1,21 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+KNOWLEDGE_FILE_TABLE = "knowledge__knowledge_file_model"
+
+
+def upgrade() -> None:
+    op.add_column(
+        KNOWLEDGE_FILE_TABLE,
+        sa.Column("object_etag", sa.String(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column(KNOWLEDGE_FILE_TABLE, "object_etag")
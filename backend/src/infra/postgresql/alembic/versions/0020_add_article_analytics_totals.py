@@ -0,0 +1,72 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0020"
+down_revision = "0019"
+branch_labels = None
+depends_on = None
+
+TOTALS_TABLE = "articles__article_analytics_totals_model"
+REACTION_COUNT_COLUMNS = {
+    "HEART": "heart_count",
+    "FIRE": "fire_count",
+    "THINKING": "thinking_count",
+    "NEUTRAL": "neutral_count",
+    "POOP": "poop_count",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        TOTALS_TABLE,
+        sa.Column("article_id", sa.String(length=32), nullable=False),
+        sa.Column("view_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("engaged_view_count", sa.BigInteger(), server_default="0", nullable=False),
+        *(
+            sa.Column(column_name, sa.Integer(), server_default="0", nullable=False)
+            for column_name in REACTION_COUNT_COLUMNS.values()
+        ),
+        sa.ForeignKeyConstraint(["article_id"], ["articles__article_model.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+    reaction_count_columns = ", ".join(REACTION_COUNT_COLUMNS.values())
+    reaction_count_aggregates = ", ".join(
+        f"COUNT(*) FILTER (WHERE reaction_kind = '{reaction_kind}') AS {column_name}"
+        for reaction_kind, column_name in REACTION_COUNT_COLUMNS.items()
+    )
+    reaction_count_values = ", ".join(
+        f"COALESCE(reactions.{column_name}, 0)" for column_name in REACTION_COUNT_COLUMNS.values()
+    )
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO {TOTALS_TABLE} (
+                article_id, view_count, engaged_view_count, {reaction_count_columns}
+            )
+            SELECT
+                articles.id,
+                COALESCE(views.view_count, 0),
+                COALESCE(views.engaged_view_count, 0),
+                {reaction_count_values}
+            FROM articles__article_model AS articles
+            LEFT JOIN (
+                SELECT
+                    article_id,
+                    SUM(view_count) AS view_count,
+                    SUM(engaged_view_count) AS engaged_view_count
+                FROM articles__article_daily_analytics_model
+                GROUP BY article_id
+            ) AS views ON views.article_id = articles.id
+            LEFT JOIN (
+                SELECT article_id, {reaction_count_aggregates}
+                FROM articles__article_reaction_model
+                GROUP BY article_id
+            ) AS reactions ON reactions.article_id = articles.id
+            """,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TOTALS_TABLE)
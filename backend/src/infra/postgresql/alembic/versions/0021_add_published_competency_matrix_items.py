@@ -0,0 +1,120 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0021"
+down_revision = "0020"
+branch_labels = None
+depends_on = None
+
+PUBLISHED_ITEM_TABLE = "competency_matrix__competency_matrix_published_item_model"
+ORDERING_COLUMNS = [
+    "sheet_priority",
+    "sheet_id",
+    "section_priority",
+    "section_id",
+    "subsection_priority",
+    "subsection_id",
+    "grade",
+    "item_id",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        PUBLISHED_ITEM_TABLE,
+        sa.Column("item_id", sa.String(length=32), nullable=False),
+        sa.Column("sheet_key_normalized", sa.String(length=255), nullable=False),
+        sa.Column("sheet_id", sa.String(length=32), nullable=False),
+        sa.Column("sheet_key", sa.String(length=255), nullable=False),
+        sa.Column("sheet_name_ru", sa.String(length=255), nullable=False),
+        sa.Column("sheet_name_en", sa.String(length=255), nullable=False),
+        sa.Column("sheet_priority", sa.Integer(), nullable=False),
+        sa.Column("section_id", sa.String(length=32), nullable=False),
+        sa.Column("section_name_ru", sa.String(length=255), nullable=False),
+        sa.Column("section_name_en", sa.String(length=255), nullable=False),
+        sa.Column("section_priority", sa.Integer(), nullable=False),
+        sa.Column("subsection_id", sa.String(length=32), nullable=False),
+        sa.Column("subsection_name_ru", sa.String(length=255), nullable=False),
+        sa.Column("subsection_name_en", sa.String(length=255), nullable=False),
+        sa.Column("subsection_priority", sa.Integer(), nullable=False),
+        sa.Column(
+            "grade",
+            postgresql.ENUM(name="grade_enum", create_type=False),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["item_id"],
+            ["competency_matrix__competency_matrix_item_model.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("item_id"),
+    )
+    op.create_index(
+        "cm_published_item_sheet_key_order_idx",
+        PUBLISHED_ITEM_TABLE,
+        ["sheet_key_normalized", *ORDERING_COLUMNS],
+        unique=False,
+    )
+    op.create_index(
+        "cm_published_item_order_idx",
+        PUBLISHED_ITEM_TABLE,
+        ORDERING_COLUMNS,
+        unique=False,
+    )
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO {PUBLISHED_ITEM_TABLE} (
+                item_id,
+                sheet_key_normalized,
+                sheet_id,
+                sheet_key,
+                sheet_name_ru,
+                sheet_name_en,
+                sheet_priority,
+                section_id,
+                section_name_ru,
+                section_name_en,
+                section_priority,
+                subsection_id,
+                subsection_name_ru,
+                subsection_name_en,
+                subsection_priority,
+                grade
+            )
+            SELECT
+                items.id,
+                lower(sheets.key),
+                sheets.id,
+                sheets.key,
+                sheets.name_ru,
+                sheets.name_en,
+                sheets.priority,
+                sections.id,
+                sections.name_ru,
+                sections.name_en,
+                sections.priority,
+                subsections.id,
+                subsections.name_ru,
+                subsections.name_en,
+                subsections.priority,
+                items.grade
+            FROM competency_matrix__competency_matrix_item_model AS items
+            JOIN competency_matrix__competency_matrix_subsection_model AS subsections
+                ON subsections.id = items.subsection_id
+            JOIN competency_matrix__competency_matrix_section_model AS sections
+                ON sections.id = subsections.section_id
+            JOIN competency_matrix__competency_matrix_sheet_model AS sheets
+                ON sheets.id = sections.sheet_id
+            WHERE items.publish_status = 'PUBLISHED'
+            """,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("cm_published_item_order_idx", table_name=PUBLISHED_ITEM_TABLE)
+    op.drop_index("cm_published_item_sheet_key_order_idx", table_name=PUBLISHED_ITEM_TABLE)
+    op.drop_table(PUBLISHED_ITEM_TABLE)
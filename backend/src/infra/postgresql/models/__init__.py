@@ -6,6 +6,7 @@ from .agent_access import MatrixQuestionClaimModel as MatrixQuestionClaimModel
 from .agent_access import (
     MatrixQuestionDraftCompletionModel as MatrixQuestionDraftCompletionModel,
 )
+from .articles import ArticleAnalyticsTotalsModel as ArticleAnalyticsTotalsModel
 from .articles import ArticleDailyAnalyticsModel as ArticleDailyAnalyticsModel
 from .articles import ArticleFileUsageModel as ArticleFileUsageModel
 from .articles import ArticleFolderModel as ArticleFolderModel
@@ -17,6 +18,9 @@ from .auth import AuthSessionModel as AuthSessionModel
 from .auth import UserModel as UserModel
 from .base import BaseModel as BaseModel
 from .competency_matrix import CompetencyMatrixItemModel as CompetencyMatrixItemModel
+from .competency_matrix import (
+    CompetencyMatrixPublishedItemModel as CompetencyMatrixPublishedItemModel,
+)
 from .competency_matrix import CompetencyMatrixSectionModel as CompetencyMatrixSectionModel
 from .competency_matrix import CompetencyMatrixSheetModel as CompetencyMatrixSheetModel
 from .competency_matrix import CompetencyMatrixSubsectionModel as CompetencyMatrixSubsectionModel
@@ -2,6 +2,7 @@ from datetime import date
 from typing import Self
 
 from sqlalchemy import (
+    BigInteger,
     Computed,
     Date,
     Enum,
@@ -522,6 +523,49 @@ class ArticleDailyAnalyticsModel(HexUuidIDMixin, BaseModel):
         )
 
 
+class ArticleAnalyticsTotalsModel(BaseModel):
+    article_id: Mapped[str] = mapped_column(
+        ForeignKey(ArticleModel.id, ondelete="CASCADE"),
+        primary_key=True,
+        doc="Article identifier",
+    )
+    view_count: Mapped[int] = mapped_column(
+        BigInteger(),
+        server_default="0",
+        doc="All-time number of public article detail views",
+    )
+    engaged_view_count: Mapped[int] = mapped_column(
+        BigInteger(),
+        server_default="0",
+        doc="All-time number of public article detail views with engagement signal",
+    )
+    heart_count: Mapped[int] = mapped_column(
+        Integer(),
+        server_default="0",
+        doc="Current number of heart reactions",
+    )
+    fire_count: Mapped[int] = mapped_column(
+        Integer(),
+        server_default="0",
+        doc="Current number of fire reactions",
+    )
+    thinking_count: Mapped[int] = mapped_column(
+        Integer(),
+        server_default="0",
+        doc="Current number of thinking reactions",
+    )
+    neutral_count: Mapped[int] = mapped_column(
+        Integer(),
+        server_default="0",
+        doc="Current number of neutral reactions",
+    )
+    poop_count: Mapped[int] = mapped_column(
+        Integer(),
+        server_default="0",
+        doc="Current number of poop reactions",
+    )
+
+
 class ArticleReactionModel(HexUuidIDMixin, AuditMixin, BaseModel):
     article_id: Mapped[str] = mapped_column(
         ForeignKey(ArticleModel.id, ondelete="CASCADE"),
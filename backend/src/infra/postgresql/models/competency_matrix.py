@@ -1,8 +1,24 @@
 from datetime import datetime
-from typing import Self
-
-from sqlalchemy import Enum, ForeignKey, Index, LargeBinary, String, UniqueConstraint, func, or_
-from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
+from typing import Any, Self
+
+from sqlalchemy import (
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+    func,
+    or_,
+)
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapped,
+    declared_attr,
+    mapped_column,
+    relationship,
+)
 from sqlalchemy_dev_utils.types.datetime import UTCDateTime
 
 from core.competency_matrix.enums import GradeEnum, InterviewFrequencyEnum
@@ -455,6 +471,17 @@ class CompetencyMatrixItemModel(PublishMixin, HexUuidIDMixin, BaseModel):
         self.interview_frequency = item.interview_frequency
 
     def to_domain_schema(self, *, include_relationships: bool) -> CompetencyMatrixItem:
+        return self.to_domain_schema_with_structure(
+            structure=self.subsection.to_item_structure(),
+            include_relationships=include_relationships,
+        )
+
+    def to_domain_schema_with_structure(
+        self,
+        *,
+        structure: CompetencyMatrixItemStructure,
+        include_relationships: bool,
+    ) -> CompetencyMatrixItem:
         return CompetencyMatrixItem(
             id=self.id,
             slug=self.slug,
@@ -466,7 +493,7 @@ class CompetencyMatrixItemModel(PublishMixin, HexUuidIDMixin, BaseModel):
             published_at=self.published_at,
             interview_answer_explanation_ru=self.interview_answer_explanation_ru,
             interview_answer_explanation_en=self.interview_answer_explanation_en,
-            structure=self.subsection.to_item_structure(),
+            structure=structure,
             grade=self.grade,
             interview_frequency=self.interview_frequency,
             suggested_by_username=self.suggested_by_username,
@@ -480,6 +507,113 @@ class CompetencyMatrixItemModel(PublishMixin, HexUuidIDMixin, BaseModel):
         )
 
 
+class CompetencyMatrixPublishedItemModel(BaseModel):
+    item_id: Mapped[str] = mapped_column(
+        ForeignKey(CompetencyMatrixItemModel.id, ondelete="CASCADE"),
+        primary_key=True,
+        doc="Published competency matrix item identifier",
+    )
+    sheet_key_normalized: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="Lowercased sheet key used for public sheet filtering",
+    )
+    sheet_id: Mapped[str] = mapped_column(
+        String(length=32),
+        doc="Sheet identifier",
+    )
+    sheet_key: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="Sheet key",
+    )
+    sheet_name_ru: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="Russian sheet name",
+    )
+    sheet_name_en: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="English sheet name",
+    )
+    sheet_priority: Mapped[int] = mapped_column(
+        Integer(),
+        doc="Sheet priority",
+    )
+    section_id: Mapped[str] = mapped_column(
+        String(length=32),
+        doc="Section identifier",
+    )
+    section_name_ru: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="Russian section name",
+    )
+    section_name_en: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="English section name",
+    )
+    section_priority: Mapped[int] = mapped_column(
+        Integer(),
+        doc="Section priority within the sheet",
+    )
+    subsection_id: Mapped[str] = mapped_column(
+        String(length=32),
+        doc="Subsection identifier",
+    )
+    subsection_name_ru: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="Russian subsection name",
+    )
+    subsection_name_en: Mapped[str] = mapped_column(
+        String(length=255),
+        doc="English subsection name",
+    )
+    subsection_priority: Mapped[int] = mapped_column(
+        Integer(),
+        doc="Subsection priority within the section",
+    )
+    grade: Mapped[GradeEnum | None] = mapped_column(
+        Enum(GradeEnum, native_enum=True, name="grade_enum"),
+        doc="Competency grade",
+    )
+
+    @declared_attr.directive
+    @classmethod
+    def __table_args__(cls) -> TableArgs:
+        return (
+            Index(
+                "cm_published_item_sheet_key_order_idx",
+                cls.sheet_key_normalized,
+                *cls.ordering(),
+            ),
+            Index("cm_published_item_order_idx", *cls.ordering()),
+        )
+
+    @classmethod
+    def ordering(cls) -> tuple[InstrumentedAttribute[Any], ...]:
+        return (
+            cls.sheet_priority,
+            cls.sheet_id,
+            cls.section_priority,
+            cls.section_id,
+            cls.subsection_priority,
+            cls.subsection_id,
+            cls.grade,
+            cls.item_id,
+        )
+
+    def to_item_structure(self) -> CompetencyMatrixItemStructure:
+        return CompetencyMatrixItemStructure(
+            sheet_id=self.sheet_id,
+            sheet_key=self.sheet_key,
+            sheet_ru=self.sheet_name_ru,
+            sheet_en=self.sheet_name_en,
+            section_id=self.section_id,
+            section_ru=self.section_name_ru,
+            section_en=self.section_name_en,
+            subsection_id=self.subsection_id,
+            subsection_ru=self.subsection_name_ru,
+            subsection_en=self.subsection_name_en,
+        )
+
+
 class QueuedQuestionModel(HexUuidIDMixin, BaseModel):
     question: Mapped[str] = mapped_column(
         String(length=255),
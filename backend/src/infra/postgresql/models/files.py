@@ -1,13 +1,14 @@
 from datetime import datetime
-from typing import Self
+from typing import Any, Self
 
-from sqlalchemy import Enum, Index, String, UniqueConstraint
+from sqlalchemy import Enum, Index, String, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 from sqlalchemy_dev_utils.mixins.audit import AuditMixin
 from sqlalchemy_dev_utils.types.datetime import UTCDateTime
 
 from core.files.enums import FilePurpose
-from core.files.schemas import StoredFile
+from core.files.schemas import FileVariant, StoredFile
 from core.files.types import Namespace
 from infra.postgresql.models.base import BaseModel, TableArgs
 from infra.postgresql.models.mixins.ids import HexUuidIDMixin
@@ -55,6 +56,11 @@ class FileModel(HexUuidIDMixin, AuditMixin, BaseModel):
         nullable=True,
         doc="UTC time when the managed public file lost its last usage",
     )
+    variants: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB,
+        server_default=text("'[]'::jsonb"),
+        doc="Responsive renditions stored next to the original object",
+    )
 
     @declared_attr.directive
     @classmethod
@@ -99,6 +105,7 @@ class FileModel(HexUuidIDMixin, AuditMixin, BaseModel):
             original_name=file.original_name,
             original_sha256=file.original_sha256,
             orphaned_at=file.orphaned_at,
+            variants=cls.variants_to_json(variants=file.variants),
             created_at=file.created_at,
             updated_at=file.updated_at,
         )
@@ -117,4 +124,27 @@ class FileModel(HexUuidIDMixin, AuditMixin, BaseModel):
             orphaned_at=self.orphaned_at,
             created_at=self.created_at,
             updated_at=self.updated_at,
+            variants=tuple(
+                FileVariant(
+                    width_px=variant["width_px"],
+                    height_px=variant["height_px"],
+                    mime_type=variant["mime_type"],
+                    relative_path=variant["relative_path"],
+                    size_bytes=variant["size_bytes"],
+                )
+                for variant in self.variants
+            ),
         )
+
+    @staticmethod
+    def variants_to_json(*, variants: tuple[FileVariant, ...]) -> list[dict[str, Any]]:
+        return [
+            {
+                "width_px": variant.width_px,
+                "height_px": variant.height_px,
+                "mime_type": variant.mime_type,
+                "relative_path": variant.relative_path,
+                "size_bytes": variant.size_bytes,
+            }
+            for variant in variants
+        ]
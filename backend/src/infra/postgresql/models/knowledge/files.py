@@ -36,6 +36,7 @@ class KnowledgeFileModel(HexUuidIDMixin, AuditMixin, BaseModel):
     name: Mapped[str] = mapped_column(String(length=255))
     original_name: Mapped[str] = mapped_column(String(length=255))
     original_sha256: Mapped[str] = mapped_column(String(length=64))
+    object_etag: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
 
     @declared_attr.directive
     @classmethod
@@ -91,6 +92,7 @@ class KnowledgeFileModel(HexUuidIDMixin, AuditMixin, BaseModel):
             name=file.name,
             original_name=file.original_name,
             original_sha256=file.original_sha256,
+            object_etag=file.object_etag,
             created_at=file.created_at,
             updated_at=file.updated_at,
         )
@@ -107,6 +109,7 @@ class KnowledgeFileModel(HexUuidIDMixin, AuditMixin, BaseModel):
             name=self.name,
             original_name=self.original_name,
             original_sha256=self.original_sha256,
+            object_etag=self.object_etag,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
@@ -1,17 +1,22 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 from sqlalchemy import (
+    ColumnElement,
+    Insert,
     Select,
     String,
     and_,
     bindparam,
     case,
     delete,
+    false,
     func,
     or_,
     select,
+    text,
     true,
     update,
 )
@@ -28,9 +33,12 @@ from core.articles.exceptions import (
 from core.articles.schemas import (
     Article,
     ArticleAnalyticsDailyStats,
+    ArticleCursor,
+    ArticleDailyCounterIncrement,
     ArticleFilters,
     ArticleFolder,
     ArticleFolders,
+    ArticleListPage,
     ArticlePublicStats,
     ArticlePublicStatsCollection,
     ArticleReactionCounts,
@@ -43,6 +51,7 @@ from core.enums import PublishStatusEnum
 from core.i18n.enums import LanguageEnum
 from infra.config.constants import constants
 from infra.postgresql.models import (
+    ArticleAnalyticsTotalsModel,
     ArticleDailyAnalyticsModel,
     ArticleFileUsageModel,
     ArticleFolderModel,
@@ -54,6 +63,107 @@ from infra.postgresql.models import (
 
 _SelectT = TypeVar("_SelectT")
 
+REACTION_TOTAL_COLUMNS: dict[ArticleReactionKind, InstrumentedAttribute[int]] = {
+    ArticleReactionKind.HEART: ArticleAnalyticsTotalsModel.heart_count,
+    ArticleReactionKind.FIRE: ArticleAnalyticsTotalsModel.fire_count,
+    ArticleReactionKind.THINKING: ArticleAnalyticsTotalsModel.thinking_count,
+    ArticleReactionKind.NEUTRAL: ArticleAnalyticsTotalsModel.neutral_count,
+    ArticleReactionKind.POOP: ArticleAnalyticsTotalsModel.poop_count,
+}
+TOTAL_COUNTER_COLUMNS: tuple[InstrumentedAttribute[int], ...] = (
+    ArticleAnalyticsTotalsModel.view_count,
+    ArticleAnalyticsTotalsModel.engaged_view_count,
+    *REACTION_TOTAL_COLUMNS.values(),
+)
+
+
+def build_article_analytics_totals_rebuild() -> Insert:
+    views = (
+        select(
+            ArticleDailyAnalyticsModel.article_id,
+            func.sum(ArticleDailyAnalyticsModel.view_count).label("view_count"),
+            func.sum(ArticleDailyAnalyticsModel.engaged_view_count).label("engaged_view_count"),
+        )
+        .group_by(ArticleDailyAnalyticsModel.article_id)
+        .subquery("views")
+    )
+    reactions = (
+        select(
+            ArticleReactionModel.article_id,
+            *(
+                func.count()
+                .filter(ArticleReactionModel.reaction_kind == reaction_kind)
+                .label(column.key)
+                for reaction_kind, column in REACTION_TOTAL_COLUMNS.items()
+            ),
+        )
+        .group_by(ArticleReactionModel.article_id)
+        .subquery("reactions")
+    )
+    insert_statement = postgresql_insert(ArticleAnalyticsTotalsModel).from_select(
+        [ArticleAnalyticsTotalsModel.article_id, *TOTAL_COUNTER_COLUMNS],
+        select(
+            ArticleModel.id,
+            func.coalesce(views.c.view_count, 0),
+            func.coalesce(views.c.engaged_view_count, 0),
+            *(
+                func.coalesce(reactions.c[column.key], 0)
+                for column in REACTION_TOTAL_COLUMNS.values()
+            ),
+        )
+        .outerjoin(views, views.c.article_id == ArticleModel.id)
+        .outerjoin(reactions, reactions.c.article_id == ArticleModel.id),
+    )
+    return insert_statement.on_conflict_do_update(
+        index_elements=[ArticleAnalyticsTotalsModel.article_id],
+        set_={
+            column.key: insert_statement.excluded[column.key] for column in TOTAL_COUNTER_COLUMNS
+        },
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArticleSortKey:
+    expression: ColumnElement[Any] | InstrumentedAttribute[Any]
+    cursor_value: Callable[[ArticleCursor], object]
+    descending: bool = False
+    nullable: bool = False
+
+    @property
+    def ordering(self) -> ColumnElement[Any]:
+        if not self.descending:
+            return self.expression.asc()
+        if self.nullable:
+            return self.expression.desc().nullslast()
+        return self.expression.desc()
+
+    def after(self, value: object) -> ColumnElement[bool]:
+        if value is None:
+            return false()
+        after_value = self.expression < value if self.descending else self.expression > value
+        if self.nullable:
+            return or_(after_value, self.expression.is_(None))
+        return after_value
+
+    def equals(self, value: object) -> ColumnElement[bool]:
+        if value is None:
+            return self.expression.is_(None)
+        return self.expression == value
+
+
+def build_keyset_condition(
+    *,
+    sort_keys: tuple[ArticleSortKey, ...],
+    cursor: ArticleCursor,
+) -> ColumnElement[bool]:
+    conditions: list[ColumnElement[bool]] = []
+    equal_prefix: list[ColumnElement[bool]] = []
+    for sort_key in sort_keys:
+        value = sort_key.cursor_value(cursor)
+        conditions.append(and_(*equal_prefix, sort_key.after(value)))
+        equal_prefix.append(sort_key.equals(value))
+    return or_(*conditions)
+
 
 @dataclass(kw_only=True)
 class ArticlesDatabaseStorage(ArticlesStorage):
@@ -86,8 +196,8 @@ class ArticlesDatabaseStorage(ArticlesStorage):
             include_files=True,
         )
 
-    async def list_articles(self, *, filters: ArticleFilters) -> tuple[list[Article], int]:
-        query = select(ArticleModel).options(joinedload(ArticleModel.folder))
+    async def list_articles(self, *, filters: ArticleFilters) -> ArticleListPage:
+        query: Select[Any] = select(ArticleModel).options(joinedload(ArticleModel.folder))
         if filters.include_files:
             query = query.options(
                 joinedload(ArticleModel.cover_image_file),
@@ -98,28 +208,83 @@ class ArticlesDatabaseStorage(ArticlesStorage):
                 selectinload(ArticleModel.tag_links).selectinload(ArticleToTagSecondaryModel.tag),
             )
         query = self._apply_article_filters(query, filters=filters)
-        query = query.order_by(*self._article_ordering(filters=filters))
+        if filters.search_query is not None:
+            query = query.add_columns(self._search_rank(filters=filters))
+        sort_keys = self._article_sort_keys(filters=filters)
+        if filters.cursor is not None:
+            query = query.where(build_keyset_condition(sort_keys=sort_keys, cursor=filters.cursor))
+        query = query.order_by(*(sort_key.ordering for sort_key in sort_keys))
         is_paginated = filters.page is not None and filters.page_size is not None
         if is_paginated:
-            query = query.offset(filters.offset).limit(filters.limit)
-            count_query = self._apply_article_filters(
-                select(func.count(func.distinct(ArticleModel.id))),
-                filters=filters,
-            )
-            total_count = (await self.session.scalar(count_query)) or 0
-        elif filters.page is not None or filters.page_size is not None:
+            if filters.cursor is None:
+                query = query.offset(filters.offset)
+            # One extra row tells whether a next page exists without counting.
+            query = query.limit(filters.limit + 1)
+        elif filters.page is not None or filters.page_size is not None or filters.cursor:
             raise ValueError
 
-        article_models = await self.session.scalars(query)
+        rows = (await self.session.execute(query)).unique().all()
+        has_next_page = is_paginated and len(rows) > filters.limit
+        if has_next_page:
+            rows = rows[: filters.limit]
         articles = [
-            article_model.to_domain_schema(
+            row[0].to_domain_schema(
                 include_tags=filters.include_tags,
                 include_files=filters.include_files,
             )
-            for article_model in article_models.unique()
+            for row in rows
         ]
+        next_cursor = (
+            ArticleCursor.from_article(
+                article=articles[-1],
+                language=filters.language,
+                search_rank=rows[-1][1] if filters.search_query is not None else None,
+            )
+            if has_next_page
+            else None
+        )
+        return ArticleListPage(
+            articles=articles,
+            total_count=await self._count_articles(filters=filters)
+            if is_paginated
+            else len(articles),
+            next_cursor=next_cursor,
+        )
 
-        return articles, total_count if is_paginated else len(articles)
+    async def _count_articles(self, *, filters: ArticleFilters) -> int | None:
+        if not filters.include_count:
+            return None
+        count_query = self._apply_article_filters(
+            select(func.count(func.distinct(ArticleModel.id))),
+            filters=filters,
+        )
+        return (await self.session.scalar(count_query)) or 0
+
+    async def list_published_articles_after(
+        self,
+        *,
+        after_slug: str | None,
+        limit: int,
+    ) -> list[Article]:
+        query = (
+            select(ArticleModel)
+            .where(ArticleModel.publish_status == PublishStatusEnum.PUBLISHED)
+            .options(
+                joinedload(ArticleModel.folder),
+                joinedload(ArticleModel.cover_image_file),
+                selectinload(ArticleModel.file_usage_links),
+                selectinload(ArticleModel.tag_links).selectinload(ArticleToTagSecondaryModel.tag),
+            )
+            .order_by(ArticleModel.slug)
+            .limit(limit)
+        )
+        if after_slug is not None:
+            query = query.where(ArticleModel.slug > after_slug)
+        article_models = await self.session.scalars(query)
+        return [
+            article_model.to_domain_schema(include_tags=True, include_files=True)
+            for article_model in article_models.unique()
+        ]
 
     def _apply_article_filters(
         self,
@@ -159,20 +324,58 @@ class ArticlesDatabaseStorage(ArticlesStorage):
                 ArticleModel.published_at.desc().nullslast(),
                 ArticleModel.updated_at.desc(),
             )
-        default_ordering = (
-            case((ArticleModel.publish_status == PublishStatusEnum.PUBLISHED, 0), else_=1),
-            ArticleModel.published_at.desc().nullslast(),
-            ArticleModel.updated_at.desc(),
-            self._title_column(language=filters.language),
+        return tuple(sort_key.ordering for sort_key in self._article_sort_keys(filters=filters))
+
+    def _article_sort_keys(self, *, filters: ArticleFilters) -> tuple[ArticleSortKey, ...]:
+        sort_keys: tuple[ArticleSortKey, ...] = (
+            ArticleSortKey(
+                expression=ArticleModel.published_at,
+                descending=True,
+                nullable=True,
+                cursor_value=lambda cursor: cursor.published_at,
+            ),
+            ArticleSortKey(
+                expression=ArticleModel.updated_at,
+                descending=True,
+                cursor_value=lambda cursor: cursor.updated_at,
+            ),
+            ArticleSortKey(
+                expression=self._title_column(language=filters.language),
+                cursor_value=lambda cursor: cursor.title,
+            ),
+            ArticleSortKey(
+                expression=ArticleModel.id,
+                cursor_value=lambda cursor: cursor.article_id,
+            ),
         )
+        # A fixed publish status makes the published-first bucket constant, so it is left out
+        # to keep the (publish_status, published_at, updated_at) index usable.
+        if not filters.only_published and filters.publish_status is None:
+            sort_keys = (
+                ArticleSortKey(
+                    expression=case(
+                        (ArticleModel.publish_status == PublishStatusEnum.PUBLISHED, 0),
+                        else_=1,
+                    ),
+                    cursor_value=lambda cursor: 0 if cursor.is_published else 1,
+                ),
+                *sort_keys,
+            )
         if filters.search_query is None:
-            return default_ordering
+            return sort_keys
         return (
-            func.ts_rank_cd(
-                self._search_vector(language=filters.language),
-                func.websearch_to_tsquery("simple", filters.search_query),
-            ).desc(),
-            *default_ordering,
+            ArticleSortKey(
+                expression=self._search_rank(filters=filters),
+                descending=True,
+                cursor_value=lambda cursor: cursor.search_rank,
+            ),
+            *sort_keys,
+        )
+
+    def _search_rank(self, *, filters: ArticleFilters) -> ColumnElement[float]:
+        return func.ts_rank_cd(
+            self._search_vector(language=filters.language),
+            func.websearch_to_tsquery("simple", filters.search_query),
         )
 
     def _search_vector(self, *, language: LanguageEnum) -> InstrumentedAttribute[str]:
@@ -602,99 +805,85 @@ class ArticlesDatabaseStorage(ArticlesStorage):
 class ArticleAnalyticsDatabaseStorage(ArticleAnalyticsStorage):
     session: AsyncSession
 
-    async def increment_view(
-        self,
-        *,
-        article_id: str,
-        source_category: ArticleViewSourceCategory,
-        viewed_on: date | None,
-    ) -> None:
-        await self._increment_daily_counter(
-            article_id=article_id,
-            source_category=source_category,
-            viewed_on=viewed_on,
-            view_count_increment=1,
-            engaged_view_count_increment=0,
-        )
-
-    async def increment_engaged_view(
-        self,
-        *,
-        article_id: str,
-        source_category: ArticleViewSourceCategory,
-        viewed_on: date | None,
-    ) -> None:
-        await self._increment_daily_counter(
-            article_id=article_id,
-            source_category=source_category,
-            viewed_on=viewed_on,
-            view_count_increment=0,
-            engaged_view_count_increment=1,
-        )
-
-    async def _increment_daily_counter(
-        self,
-        *,
-        article_id: str,
-        source_category: ArticleViewSourceCategory,
-        viewed_on: date | None,
-        view_count_increment: int,
-        engaged_view_count_increment: int,
-    ) -> None:
-        recorded_on = viewed_on if viewed_on is not None else datetime.now(tz=UTC).date()
-        insert_statement = postgresql_insert(ArticleDailyAnalyticsModel).values(
-            article_id=article_id,
-            date=recorded_on,
-            source_category=source_category,
-            view_count=view_count_increment,
-            engaged_view_count=engaged_view_count_increment,
-        )
-        await self.session.execute(
-            insert_statement.on_conflict_do_update(
-                index_elements=[
-                    ArticleDailyAnalyticsModel.article_id,
-                    ArticleDailyAnalyticsModel.date,
-                    ArticleDailyAnalyticsModel.source_category,
-                ],
-                set_={
-                    ArticleDailyAnalyticsModel.view_count.key: (
-                        ArticleDailyAnalyticsModel.view_count + view_count_increment
-                    ),
-                    ArticleDailyAnalyticsModel.engaged_view_count.key: (
-                        ArticleDailyAnalyticsModel.engaged_view_count + engaged_view_count_increment
-                    ),
-                },
+    async def add_daily_counters(self, *, increments: list[ArticleDailyCounterIncrement]) -> None:
+        if not increments:
+            return
+        # Counters are buffered outside the database, so their article may be gone by now.
+        existing_article_ids = set(
+            await self.session.scalars(
+                select(ArticleModel.id).where(
+                    ArticleModel.id.in_({increment.article_id for increment in increments}),
+                ),
             ),
         )
+        rows = [
+            {
+                "article_id": increment.article_id,
+                "date": increment.date,
+                "source_category": increment.source_category,
+                "view_count": increment.view_count,
+                "engaged_view_count": increment.engaged_view_count,
+            }
+            for increment in increments
+            if increment.article_id in existing_article_ids
+        ]
+        batch_size = constants.article_analytics.daily_counter_upsert_batch_size
+        for offset in range(0, len(rows), batch_size):
+            insert_statement = postgresql_insert(ArticleDailyAnalyticsModel).values(
+                rows[offset : offset + batch_size],
+            )
+            await self.session.execute(
+                insert_statement.on_conflict_do_update(
+                    index_elements=[
+                        ArticleDailyAnalyticsModel.article_id,
+                        ArticleDailyAnalyticsModel.date,
+                        ArticleDailyAnalyticsModel.source_category,
+                    ],
+                    set_={
+                        ArticleDailyAnalyticsModel.view_count.key: (
+                            ArticleDailyAnalyticsModel.view_count
+                            + insert_statement.excluded.view_count
+                        ),
+                        ArticleDailyAnalyticsModel.engaged_view_count.key: (
+                            ArticleDailyAnalyticsModel.engaged_view_count
+                            + insert_statement.excluded.engaged_view_count
+                        ),
+                    },
+                ),
+            )
+        totals: dict[str, dict[str, int]] = {}
+        for increment in increments:
+            if increment.article_id not in existing_article_ids:
+                continue
+            article_totals = totals.setdefault(
+                increment.article_id,
+                {"view_count": 0, "engaged_view_count": 0},
+            )
+            article_totals["view_count"] += increment.view_count
+            article_totals["engaged_view_count"] += increment.engaged_view_count
+        # Sorted article ids keep concurrent flushes locking totals rows in the same order.
+        await self._add_totals(
+            rows=[
+                {"article_id": article_id, **totals[article_id]} for article_id in sorted(totals)
+            ],
+        )
         await self.session.flush()
 
     async def get_public_stats(self, *, article_ids: list[str]) -> ArticlePublicStatsCollection:
         if not article_ids:
             return ArticlePublicStatsCollection(values=[])
-        view_counts = await self._get_view_counts(article_ids=article_ids)
-        reaction_counts = await self.get_reaction_counts(article_ids=article_ids)
+        totals = await self._get_totals(article_ids=article_ids)
         return ArticlePublicStatsCollection(
             values=[
                 ArticlePublicStats(
-                    article_id=article_id,
-                    view_count=view_counts.get(article_id, 0),
-                    reaction_counts=reaction_counts.get(article_id, ArticleReactionCounts.zero()),
+                    article_id=model.article_id,
+                    view_count=model.view_count,
+                    reaction_counts=self._to_reaction_counts(model=model),
                 )
-                for article_id in article_ids
+                for model in totals
             ],
         )
 
-    async def _get_view_counts(self, *, article_ids: list[str]) -> dict[str, int]:
-        result = await self.session.execute(
-            select(
-                ArticleDailyAnalyticsModel.article_id,
-                func.coalesce(func.sum(ArticleDailyAnalyticsModel.view_count), 0),
-            )
-            .where(ArticleDailyAnalyticsModel.article_id.in_(article_ids))
-            .group_by(ArticleDailyAnalyticsModel.article_id),
-        )
-        return {row[0]: row[1] for row in result}
-
     async def get_reaction_counts(
         self,
         *,
@@ -702,22 +891,60 @@ class ArticleAnalyticsDatabaseStorage(ArticleAnalyticsStorage):
     ) -> dict[str, ArticleReactionCounts]:
         if not article_ids:
             return {}
-        result = await self.session.execute(
-            select(
-                ArticleReactionModel.article_id,
-                ArticleReactionModel.reaction_kind,
-                func.count(ArticleReactionModel.id),
-            )
-            .where(ArticleReactionModel.article_id.in_(article_ids))
-            .group_by(ArticleReactionModel.article_id, ArticleReactionModel.reaction_kind),
-        )
-        raw_counts: dict[str, dict[ArticleReactionKind, int]] = {}
-        for article_id, reaction_kind, count in result:
-            raw_counts.setdefault(article_id, {})[self._to_reaction_kind(reaction_kind)] = count
-        return {
-            article_id: ArticleReactionCounts.from_counts(counts=counts)
-            for article_id, counts in raw_counts.items()
-        }
+        totals = await self._get_totals(article_ids=article_ids)
+        return {model.article_id: self._to_reaction_counts(model=model) for model in totals}
+
+    async def rebuild_totals(self) -> int:
+        # Counter writers upsert totals in their own transactions; holding this lock until commit
+        # makes the rebuild see every committed counter and makes later writers apply on top of it.
+        await self.session.execute(
+            text(
+                f"LOCK TABLE {ArticleAnalyticsTotalsModel.__tablename__} "
+                "IN SHARE ROW EXCLUSIVE MODE",
+            ),
+        )
+        result = await self.session.execute(build_article_analytics_totals_rebuild())
+        await self.session.flush()
+        rowcount = cast("int | None", getattr(result, "rowcount", None))
+        if rowcount is None:
+            return 0
+        return rowcount
+
+    async def _get_totals(self, *, article_ids: list[str]) -> list[ArticleAnalyticsTotalsModel]:
+        return list(
+            await self.session.scalars(
+                select(ArticleAnalyticsTotalsModel)
+                .where(ArticleAnalyticsTotalsModel.article_id.in_(article_ids))
+                # Totals are changed by bulk upserts that bypass the identity map.
+                .execution_options(populate_existing=True),
+            ),
+        )
+
+    async def _add_totals(self, *, rows: list[dict[str, Any]]) -> None:
+        batch_size = constants.article_analytics.daily_counter_upsert_batch_size
+        for offset in range(0, len(rows), batch_size):
+            insert_statement = postgresql_insert(ArticleAnalyticsTotalsModel).values(
+                rows[offset : offset + batch_size],
+            )
+            await self.session.execute(
+                insert_statement.on_conflict_do_update(
+                    index_elements=[ArticleAnalyticsTotalsModel.article_id],
+                    set_={
+                        column.key: column + insert_statement.excluded[column.key]
+                        for column in TOTAL_COUNTER_COLUMNS
+                        if column.key in rows[offset]
+                    },
+                ),
+            )
+
+    def _to_reaction_counts(self, *, model: ArticleAnalyticsTotalsModel) -> ArticleReactionCounts:
+        return ArticleReactionCounts(
+            heart=model.heart_count,
+            fire=model.fire_count,
+            thinking=model.thinking_count,
+            neutral=model.neutral_count,
+            poop=model.poop_count,
+        )
 
     async def set_reaction(
         self,
@@ -734,12 +961,13 @@ class ArticleAnalyticsDatabaseStorage(ArticleAnalyticsStorage):
             )
             .with_for_update(),
         )
+        previous_reaction_kind = (
+            None if model is None else self._to_reaction_kind(model.reaction_kind)
+        )
         if reaction_kind is None:
             if model is not None:
                 await self.session.delete(model)
-            await self.session.flush()
-            return
-        if model is None:
+        elif model is None:
             self.session.add(
                 ArticleReactionModel(
                     article_id=article_id,
@@ -749,6 +977,13 @@ class ArticleAnalyticsDatabaseStorage(ArticleAnalyticsStorage):
             )
         else:
             model.reaction_kind = reaction_kind
+        if previous_reaction_kind != reaction_kind:
+            deltas: dict[str, Any] = {"article_id": article_id}
+            if previous_reaction_kind is not None:
+                deltas[REACTION_TOTAL_COLUMNS[previous_reaction_kind].key] = -1
+            if reaction_kind is not None:
+                deltas[REACTION_TOTAL_COLUMNS[reaction_kind].key] = 1
+            await self._add_totals(rows=[deltas])
         await self.session.flush()
 
     async def get_daily_stats(
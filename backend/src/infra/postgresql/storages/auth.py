@@ -153,7 +153,7 @@ class AuthSessionDatabaseStorage(AuthSessionStorage):
             expiring_soon_count=row.expiring_soon_count,
         )
 
-    async def revoke_session_by_secret_hash(self, *, secret_hash: SessionSecretHash) -> None:
+    async def revoke_session_by_secret_hash(self, *, secret_hash: SessionSecretHash) -> str:
         statement = (
             update(AuthSessionModel)
             .values(is_revoked=True)
@@ -163,6 +163,7 @@ class AuthSessionDatabaseStorage(AuthSessionStorage):
         session_id = await self.session.scalar(statement)
         if session_id is None:
             raise AuthSessionNotFoundError
+        return session_id
 
     async def revoke_user_session(self, *, username: str, session_id: str) -> None:
         statement = (
@@ -4,6 +4,8 @@ from typing import Any, cast
 
 from sqlalchemy import (
     ARRAY,
+    Insert,
+    Row,
     Select,
     String,
     and_,
@@ -16,10 +18,12 @@ from sqlalchemy import (
     union,
     update,
 )
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute, defer, selectinload
+from sqlalchemy.orm import InstrumentedAttribute, contains_eager, defer, selectinload
 from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
 
 from core.competency_matrix.enums import (
     CompetencyMatrixWorkspaceSortEnum,
@@ -70,6 +74,7 @@ from infra.config.constants import constants
 from infra.postgresql.models import (
     AgentClientModel,
     CompetencyMatrixItemModel,
+    CompetencyMatrixPublishedItemModel,
     CompetencyMatrixSectionModel,
     CompetencyMatrixSheetModel,
     CompetencyMatrixSubsectionModel,
@@ -85,6 +90,81 @@ type PriorityStructureModel = type[
     CompetencyMatrixSheetModel | CompetencyMatrixSectionModel | CompetencyMatrixSubsectionModel
 ]
 
+PUBLISHED_ITEM_SOURCE_COLUMNS: tuple[
+    tuple[InstrumentedAttribute[Any], ColumnElement[Any] | InstrumentedAttribute[Any]],
+    ...,
+] = (
+    (CompetencyMatrixPublishedItemModel.item_id, CompetencyMatrixItemModel.id),
+    (
+        CompetencyMatrixPublishedItemModel.sheet_key_normalized,
+        func.lower(CompetencyMatrixSheetModel.key),
+    ),
+    (CompetencyMatrixPublishedItemModel.sheet_id, CompetencyMatrixSheetModel.id),
+    (CompetencyMatrixPublishedItemModel.sheet_key, CompetencyMatrixSheetModel.key),
+    (CompetencyMatrixPublishedItemModel.sheet_name_ru, CompetencyMatrixSheetModel.name_ru),
+    (CompetencyMatrixPublishedItemModel.sheet_name_en, CompetencyMatrixSheetModel.name_en),
+    (CompetencyMatrixPublishedItemModel.sheet_priority, CompetencyMatrixSheetModel.priority),
+    (CompetencyMatrixPublishedItemModel.section_id, CompetencyMatrixSectionModel.id),
+    (CompetencyMatrixPublishedItemModel.section_name_ru, CompetencyMatrixSectionModel.name_ru),
+    (CompetencyMatrixPublishedItemModel.section_name_en, CompetencyMatrixSectionModel.name_en),
+    (CompetencyMatrixPublishedItemModel.section_priority, CompetencyMatrixSectionModel.priority),
+    (CompetencyMatrixPublishedItemModel.subsection_id, CompetencyMatrixSubsectionModel.id),
+    (
+        CompetencyMatrixPublishedItemModel.subsection_name_ru,
+        CompetencyMatrixSubsectionModel.name_ru,
+    ),
+    (
+        CompetencyMatrixPublishedItemModel.subsection_name_en,
+        CompetencyMatrixSubsectionModel.name_en,
+    ),
+    (
+        CompetencyMatrixPublishedItemModel.subsection_priority,
+        CompetencyMatrixSubsectionModel.priority,
+    ),
+    (CompetencyMatrixPublishedItemModel.grade, CompetencyMatrixItemModel.grade),
+)
+PUBLISHED_ITEM_PRIORITY_COLUMNS: dict[
+    PriorityStructureModel,
+    tuple[InstrumentedAttribute[str], InstrumentedAttribute[int]],
+] = {
+    CompetencyMatrixSheetModel: (
+        CompetencyMatrixPublishedItemModel.sheet_id,
+        CompetencyMatrixPublishedItemModel.sheet_priority,
+    ),
+    CompetencyMatrixSectionModel: (
+        CompetencyMatrixPublishedItemModel.section_id,
+        CompetencyMatrixPublishedItemModel.section_priority,
+    ),
+    CompetencyMatrixSubsectionModel: (
+        CompetencyMatrixPublishedItemModel.subsection_id,
+        CompetencyMatrixPublishedItemModel.subsection_priority,
+    ),
+}
+
+
+def build_published_competency_matrix_items_refresh(
+    *conditions: ColumnElement[bool],
+) -> Insert:
+    insert_statement = postgresql_insert(CompetencyMatrixPublishedItemModel).from_select(
+        [target for target, _ in PUBLISHED_ITEM_SOURCE_COLUMNS],
+        select(*(source for _, source in PUBLISHED_ITEM_SOURCE_COLUMNS))
+        .select_from(CompetencyMatrixItemModel)
+        .join(CompetencyMatrixItemModel.subsection)
+        .join(CompetencyMatrixSubsectionModel.section)
+        .join(CompetencyMatrixSectionModel.sheet)
+        .where(
+            CompetencyMatrixItemModel.publish_status == PublishStatusEnum.PUBLISHED,
+            *conditions,
+        ),
+    )
+    return insert_statement.on_conflict_do_update(
+        index_elements=[CompetencyMatrixPublishedItemModel.item_id],
+        set_={
+            target.key: insert_statement.excluded[target.key]
+            for target, _ in PUBLISHED_ITEM_SOURCE_COLUMNS[1:]
+        },
+    )
+
 
 @dataclass(kw_only=True)
 class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
@@ -92,18 +172,24 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
 
     async def list_sheets(self) -> Sheets:
         stmt = (
-            select(CompetencyMatrixSheetModel)
-            .join(CompetencyMatrixSheetModel.sections)
-            .join(CompetencyMatrixSectionModel.subsections)
-            .join(CompetencyMatrixSubsectionModel.items)
-            .where(CompetencyMatrixItemModel.publish_status == PublishStatusEnum.PUBLISHED)
-            .distinct()
-            .order_by(CompetencyMatrixSheetModel.priority, CompetencyMatrixSheetModel.id)
+            select(
+                CompetencyMatrixPublishedItemModel.sheet_key,
+                CompetencyMatrixPublishedItemModel.sheet_name_ru,
+                CompetencyMatrixPublishedItemModel.sheet_name_en,
+            )
+            .distinct(
+                CompetencyMatrixPublishedItemModel.sheet_priority,
+                CompetencyMatrixPublishedItemModel.sheet_id,
+            )
+            .order_by(
+                CompetencyMatrixPublishedItemModel.sheet_priority,
+                CompetencyMatrixPublishedItemModel.sheet_id,
+            )
         )
-        sheets = await self.session.scalars(stmt)
+        sheets = await self.session.execute(stmt)
         return Sheets(
             values=[
-                Sheet(key=sheet.key, name_ru=sheet.name_ru, name_en=sheet.name_en)
+                Sheet(key=sheet.sheet_key, name_ru=sheet.sheet_name_ru, name_en=sheet.sheet_name_en)
                 for sheet in sheets
             ],
         )
@@ -237,6 +323,10 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
         *,
         filters: CompetencyMatrixItemFilters,
     ) -> list[CompetencyMatrixItem]:
+        if filters.only_published is True:
+            return await self._list_published_competency_matrix_items(
+                sheet_key=filters.sheet_key,
+            )
         stmt = self._select_items_with_structure().order_by(
             CompetencyMatrixSheetModel.priority,
             CompetencyMatrixSheetModel.id,
@@ -251,13 +341,37 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
             stmt = stmt.where(
                 func.lower(CompetencyMatrixSheetModel.key) == filters.sheet_key.lower(),
             )
-        if filters.only_published is True:
-            stmt = stmt.where(
-                CompetencyMatrixItemModel.publish_status == PublishStatusEnum.PUBLISHED,
-            )
         items = await self.session.scalars(stmt)
         return [item.to_domain_schema(include_relationships=False) for item in items]
 
+    async def _list_published_competency_matrix_items(
+        self,
+        *,
+        sheet_key: str | None,
+    ) -> list[CompetencyMatrixItem]:
+        stmt = (
+            select(CompetencyMatrixItemModel, CompetencyMatrixPublishedItemModel)
+            .select_from(CompetencyMatrixPublishedItemModel)
+            .join(
+                CompetencyMatrixItemModel,
+                CompetencyMatrixItemModel.id == CompetencyMatrixPublishedItemModel.item_id,
+            )
+            .options(*self._item_domain_load_options())
+            .order_by(*CompetencyMatrixPublishedItemModel.ordering())
+        )
+        if sheet_key is not None:
+            stmt = stmt.where(
+                CompetencyMatrixPublishedItemModel.sheet_key_normalized == sheet_key.lower(),
+            )
+        rows = await self.session.execute(stmt)
+        return [
+            item.to_domain_schema_with_structure(
+                structure=published_item.to_item_structure(),
+                include_relationships=False,
+            )
+            for item, published_item in rows.tuples()
+        ]
+
     async def list_competency_matrix_workspace_items(
         self,
         *,
@@ -267,23 +381,61 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
         int,
         CompetencyMatrixWorkspaceSummary,
     ]:
-        stmt = self._apply_workspace_filters(
-            self._select_items_with_structure(),
-            filters=filters,
-        ).order_by(*self._workspace_ordering(filters=filters))
-        items = await self.session.scalars(stmt.offset(filters.offset).limit(filters.limit))
-        count_stmt = self._apply_workspace_filters(
-            self._join_structure(select(func.count(CompetencyMatrixItemModel.id))),
-            filters=filters,
+        # Window aggregates are evaluated before LIMIT, so every page row carries the summary
+        # of the whole filtered set and the page, total and facets share one statement.
+        stmt = self._workspace_page_statement(filters=filters).add_columns(
+            *(
+                aggregate.over().label(name)
+                for name, aggregate in self._workspace_summary_aggregates().items()
+            ),
         )
-        total_count = (await self.session.scalar(count_stmt)) or 0
-        summary = await self._workspace_summary(filters=filters)
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            summary = self._to_workspace_summary(row=rows[0])
+        elif filters.offset > 0:
+            summary = await self._workspace_summary(filters=filters)
+        else:
+            summary = CompetencyMatrixWorkspaceSummary(
+                total=0,
+                draft=0,
+                missing_draft=0,
+                dangerous_published=0,
+                ready_published=0,
+            )
         return (
-            [self._to_workspace_item(item=item, language=filters.language) for item in items],
-            total_count,
+            [self._to_workspace_item(item=row[0], language=filters.language) for row in rows],
+            summary.total,
             summary,
         )
 
+    async def list_competency_matrix_workspace_page(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+    ) -> list[CompetencyMatrixWorkspaceItem]:
+        items = await self.session.scalars(self._workspace_page_statement(filters=filters))
+        return [self._to_workspace_item(item=item, language=filters.language) for item in items]
+
+    def _workspace_page_statement(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+    ) -> Select[tuple[CompetencyMatrixItemModel]]:
+        return (
+            self._apply_workspace_filters(
+                self._join_structure(select(CompetencyMatrixItemModel)).options(
+                    *self._item_domain_load_options(),
+                    contains_eager(CompetencyMatrixItemModel.subsection)
+                    .contains_eager(CompetencyMatrixSubsectionModel.section)
+                    .contains_eager(CompetencyMatrixSectionModel.sheet),
+                ),
+                filters=filters,
+            )
+            .order_by(*self._workspace_ordering(filters=filters))
+            .offset(filters.offset)
+            .limit(filters.limit)
+        )
+
     async def list_competency_matrix_workspace_filter_options(
         self,
         *,
@@ -459,6 +611,7 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
             ):
                 raise CompetencyMatrixItemNotFoundError from error
             raise
+        await self._refresh_published_item(item_id=item.id)
         return await self.get_competency_matrix_item(item_id=item.id)
 
     async def update_competency_matrix_item(
@@ -476,6 +629,7 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
             existing_links=item_model.resource_links,
         )
         await self.session.flush()
+        await self._refresh_published_item(item_id=item.id)
         return await self.get_competency_matrix_item(item_id=item.id)
 
     async def update_competency_matrix_item_publish_status(
@@ -490,6 +644,19 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
         item_model.publish_status = publish_status
         self._ensure_first_published_at(item_model=item_model)
         await self.session.flush()
+        await self._refresh_published_item(item_id=item_id)
+
+    async def _refresh_published_item(self, *, item_id: str) -> None:
+        await self.session.execute(
+            delete(CompetencyMatrixPublishedItemModel).where(
+                CompetencyMatrixPublishedItemModel.item_id == item_id,
+            ),
+        )
+        await self.session.execute(
+            build_published_competency_matrix_items_refresh(
+                CompetencyMatrixItemModel.id == item_id,
+            ),
+        )
 
     async def _get_competency_matrix_item_model(
         self,
@@ -620,6 +787,22 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
                 ),
             ),
         )
+        published_id_column, published_priority_column = PUBLISHED_ITEM_PRIORITY_COLUMNS[model]
+        await self.session.execute(
+            update(CompetencyMatrixPublishedItemModel)
+            .where(published_id_column.in_(priority_by_id.keys()))
+            .values(
+                {
+                    published_priority_column: case(
+                        *(
+                            (published_id_column == ordered_id, priority)
+                            for ordered_id, priority in priority_by_id.items()
+                        ),
+                        else_=published_priority_column,
+                    ),
+                },
+            ),
+        )
 
     async def _get_sheet_model(self, *, sheet_id: str) -> CompetencyMatrixSheetModel:
         sheet = await self.session.get(CompetencyMatrixSheetModel, sheet_id)
@@ -784,30 +967,40 @@ class CompetencyMatrixDatabaseStorage(CompetencyMatrixStorage):
         *,
         filters: CompetencyMatrixWorkspaceFilters,
     ) -> CompetencyMatrixWorkspaceSummary:
-        missing_condition = self._workspace_missing_condition()
-        draft_condition = CompetencyMatrixItemModel.publish_status == PublishStatusEnum.DRAFT
-        published_condition = (
-            CompetencyMatrixItemModel.publish_status == PublishStatusEnum.PUBLISHED
-        )
         stmt = self._apply_workspace_filters(
             self._join_structure(
                 select(
-                    func.count(CompetencyMatrixItemModel.id).label("total"),
-                    func.sum(case((draft_condition, 1), else_=0)).label("draft"),
-                    func.sum(case((and_(draft_condition, missing_condition), 1), else_=0)).label(
-                        "missing_draft",
+                    *(
+                        aggregate.label(name)
+                        for name, aggregate in self._workspace_summary_aggregates().items()
                     ),
-                    func.sum(
-                        case((and_(published_condition, missing_condition), 1), else_=0),
-                    ).label("dangerous_published"),
-                    func.sum(
-                        case((and_(published_condition, ~missing_condition), 1), else_=0),
-                    ).label("ready_published"),
                 ),
             ),
             filters=filters,
         )
-        row = (await self.session.execute(stmt)).one()
+        return self._to_workspace_summary(row=(await self.session.execute(stmt)).one())
+
+    def _workspace_summary_aggregates(self) -> dict[str, FunctionElement[Any]]:
+        missing_condition = self._workspace_missing_condition()
+        draft_condition = CompetencyMatrixItemModel.publish_status == PublishStatusEnum.DRAFT
+        published_condition = (
+            CompetencyMatrixItemModel.publish_status == PublishStatusEnum.PUBLISHED
+        )
+        return {
+            "total": func.count(CompetencyMatrixItemModel.id),
+            "draft": func.sum(case((draft_condition, 1), else_=0)),
+            "missing_draft": func.sum(
+                case((and_(draft_condition, missing_condition), 1), else_=0),
+            ),
+            "dangerous_published": func.sum(
+                case((and_(published_condition, missing_condition), 1), else_=0),
+            ),
+            "ready_published": func.sum(
+                case((and_(published_condition, ~missing_condition), 1), else_=0),
+            ),
+        }
+
+    def _to_workspace_summary(self, *, row: Row[Any]) -> CompetencyMatrixWorkspaceSummary:
         return CompetencyMatrixWorkspaceSummary(
             total=row.total or 0,
             draft=row.draft or 0,
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import delete, exists, select, update
+from sqlalchemy import String, any_, bindparam, delete, exists, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.exceptions import EntryNotFoundError
 from core.files.enums import FilePurpose
-from core.files.schemas import StoredFile, StoredFiles
+from core.files.schemas import FileVariant, StoredFile, StoredFiles
 from core.files.storages import FileStorage
 from core.files.types import Namespace
 from infra.postgresql.models import ArticleFileUsageModel, ArticleModel, FileModel
@@ -97,6 +98,22 @@ class FilesDatabaseStorage(FileStorage):
             raise EntryNotFoundError
         return file_model.to_domain_schema()
 
+    async def set_file_variants(
+        self,
+        file_id: str,
+        variants: tuple[FileVariant, ...],
+    ) -> StoredFile:
+        query = (
+            update(FileModel)
+            .where(FileModel.id == file_id)
+            .values(variants=FileModel.variants_to_json(variants=variants))
+            .returning(FileModel)
+        )
+        file_model = await self.session.scalar(query)
+        if file_model is None:
+            raise EntryNotFoundError
+        return file_model.to_domain_schema()
+
     async def file_has_usages(self, file_id: str) -> bool:
         query = select(
             exists().where(ArticleModel.cover_image_file_id == file_id)
@@ -104,6 +121,19 @@ class FilesDatabaseStorage(FileStorage):
         )
         return bool(await self.session.scalar(query))
 
+    async def list_file_ids_with_usages(self, file_ids: frozenset[str]) -> frozenset[str]:
+        if not file_ids:
+            return frozenset()
+        ids = bindparam("file_ids", value=sorted(file_ids), type_=ARRAY(String))
+        cover_usages = select(ArticleModel.cover_image_file_id).where(
+            ArticleModel.cover_image_file_id == any_(ids),
+        )
+        content_usages = select(ArticleFileUsageModel.file_id).where(
+            ArticleFileUsageModel.file_id == any_(ids),
+        )
+        file_ids_with_usages = await self.session.scalars(cover_usages.union(content_usages))
+        return frozenset(file_id for file_id in file_ids_with_usages if file_id is not None)
+
     async def lock_files(self, file_ids: frozenset[str]) -> None:
         if not file_ids:
             return
@@ -180,3 +210,9 @@ class FilesDatabaseStorage(FileStorage):
 
     async def delete_file(self, file_id: str) -> None:
         await self.session.execute(delete(FileModel).where(FileModel.id == file_id))
+
+    async def delete_files(self, file_ids: frozenset[str]) -> None:
+        if not file_ids:
+            return
+        ids = bindparam("file_ids", value=sorted(file_ids), type_=ARRAY(String))
+        await self.session.execute(delete(FileModel).where(FileModel.id == any_(ids)))
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
 from datetime import date
 from io import BytesIO
 from pathlib import Path
@@ -19,7 +21,7 @@ from reportlab.platypus.flowables import Flowable
 
 from core.i18n.enums import LanguageEnum
 from core.resumes.enums import ResumeCurrentStatusEnum, ResumeExportFormatEnum
-from core.resumes.exporters import ResumeDocumentExporter
+from core.resumes.exporters import ResumeDocumentExporter, ResumeExportCache
 from core.resumes.schemas import (
     ResumeAdditionalSection,
     ResumeCertificationItem,
@@ -31,6 +33,7 @@ from core.resumes.schemas import (
     ResumeProjectItem,
 )
 from infra.config.constants import constants
+from infra.executors import BoundedThreadPoolExecutor
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -68,13 +71,20 @@ class ResumeWordStyleDefinition:
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
-class ResumeDocumentExporterImpl(ResumeDocumentExporter):
+class ResumeDocumentRenderer:
     font_regular_path: Path
     font_bold_path: Path
     font_regular_name: str
     font_bold_name: str
+    _pdf_styles: ResumePdfStyles = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Parsing the TTF files and building the style sheet dominate small exports,
+        # so both happen once per renderer instead of once per document.
+        self._register_pdf_fonts()
+        object.__setattr__(self, "_pdf_styles", self._build_pdf_styles())
 
-    def export_resume(self, *, params: ResumeExportParams) -> ResumeExport:
+    def render(self, *, params: ResumeExportParams) -> ResumeExport:
         if params.format == ResumeExportFormatEnum.PDF:
             return ResumeExport(
                 format=params.format,
@@ -89,8 +99,7 @@ class ResumeDocumentExporterImpl(ResumeDocumentExporter):
         raise ValueError(message)
 
     def _export_pdf(self, *, params: ResumeExportParams) -> bytes:
-        self._register_pdf_fonts()
-        styles = self._build_pdf_styles()
+        styles = self._pdf_styles
         labels = self._labels_for_language(language=params.language)
         output = BytesIO()
         document = SimpleDocTemplate(
@@ -960,3 +969,29 @@ class ResumeDocumentExporterImpl(ResumeDocumentExporter):
             "Dec",
         )
         return f"{month_names[value.month - 1]} {value.year}"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ResumeDocumentExporterImpl(ResumeDocumentExporter):
+    renderer: ResumeDocumentRenderer
+    executor: BoundedThreadPoolExecutor
+    cache: ResumeExportCache
+    renderer_version: int
+
+    async def export_resume(self, *, params: ResumeExportParams) -> ResumeExport:
+        cache_key = self.cache_key(params=params)
+        content = await self.cache.get_content(key=cache_key)
+        if content is not None:
+            return ResumeExport(format=params.format, content=content)
+        document = await self.executor.run(lambda: self.renderer.render(params=params))
+        await self.cache.save_content(key=cache_key, content=document.content)
+        return document
+
+    def cache_key(self, *, params: ResumeExportParams) -> str:
+        payload = json.dumps(
+            {"renderer_version": self.renderer_version, "params": asdict(params)},
+            default=str,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
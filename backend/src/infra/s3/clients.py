@@ -1,23 +1,42 @@
+import hashlib
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from http import HTTPStatus
-from io import BytesIO
-from typing import Any
+from io import SEEK_END
+from itertools import batched
+from typing import Any, BinaryIO
 
 from botocore.exceptions import BotoCoreError, ClientError
 from types_aiobotocore_s3.client import S3Client
-from types_aiobotocore_s3.type_defs import CORSConfigurationTypeDef
+from types_aiobotocore_s3.type_defs import (
+    CORSConfigurationTypeDef,
+    GetObjectRequestTypeDef,
+    PutObjectOutputTypeDef,
+    PutObjectRequestTypeDef,
+)
 
-from core.files.clients import FileClient
-from core.files.exceptions import FileClientInternalError, NamespaceNotAllowedError
-from core.files.schemas import FileUploadResult
+from core.files.clients import FileClient, MultipartUploadClient
+from core.files.exceptions import (
+    DirectUploadVerificationError,
+    FileClientInternalError,
+    NamespaceNotAllowedError,
+)
+from core.files.schemas import (
+    CompletedUploadPart,
+    FileUploadResult,
+    ObjectDigest,
+    UploadPartUrl,
+)
 from core.files.types import Namespace
 from core.knowledge.files.clients import (
     KnowledgeFileClient,
     KnowledgeFileObjectCleaner,
 )
+from core.knowledge.files.schemas import ByteRange
+from infra.config.constants import constants
 from infra.config.loggers import logger
 from infra.config.settings import settings
 
@@ -28,6 +47,64 @@ class S3ClientBundle:
     public: S3Client
 
 
+async def delete_s3_objects(
+    *,
+    client: S3Client,
+    bucket_name: str,
+    object_names: tuple[str, ...],
+) -> frozenset[str]:
+    failed_object_names: set[str] = set()
+    for chunk in batched(object_names, constants.minio.delete_objects_max_keys, strict=False):
+        try:
+            response = await client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": object_name} for object_name in chunk], "Quiet": True},
+            )
+        except BotoCoreError, ClientError:
+            logger.exception(
+                "S3 batch delete failed",
+                bucket_name=bucket_name,
+                object_count=len(chunk),
+            )
+            failed_object_names.update(chunk)
+            continue
+        for error in response.get("Errors", []):
+            logger.error(
+                "S3 object delete failed",
+                bucket_name=bucket_name,
+                object_name=error.get("Key"),
+                error_code=error.get("Code"),
+            )
+            failed_object_names.add(error.get("Key", ""))
+    return frozenset(failed_object_names)
+
+
+async def _put_object(
+    *,
+    client: S3Client,
+    content: BinaryIO,
+    request: PutObjectRequestTypeDef,
+    ensure_bucket_exists: Callable[[], Awaitable[None]],
+) -> PutObjectOutputTypeDef:
+    # Buckets are provisioned at deploy, so a missing one is recreated once instead of per upload.
+    try:
+        content.seek(0)
+        return await client.put_object(**request)
+    except ClientError as error:
+        if not _is_no_such_bucket(error=error):
+            raise
+    logger.warning("Bucket is missing, provisioning it again", bucket_name=request["Bucket"])
+    await ensure_bucket_exists()
+    content.seek(0)
+    return await client.put_object(**request)
+
+
+def _is_no_such_bucket(*, error: ClientError) -> bool:
+    with suppress(KeyError):
+        return str(error.response["Error"]["Code"]) == "NoSuchBucket"
+    return False
+
+
 @dataclass(kw_only=True)
 class S3FileClient(FileClient):
     clients: S3ClientBundle
@@ -58,7 +135,7 @@ class S3FileClient(FileClient):
             "CORSRules": [
                 {
                     "AllowedHeaders": ["*"],
-                    "AllowedMethods": ["GET"],
+                    "AllowedMethods": ["GET", "PUT"],
                     "AllowedOrigins": [allowed_origin],
                     "ExposeHeaders": ["ETag"],
                     "MaxAgeSeconds": max_age_seconds,
@@ -101,27 +178,33 @@ class S3FileClient(FileClient):
 
     async def upload_file(
         self,
-        file_data: BytesIO,
+        file_data: BinaryIO,
         object_name: str,
         namespace: str,
         content_type: str,
     ) -> FileUploadResult:
         _namespace = self._ensure_valid_namespace(namespace)
         logger.info("Uploading file", bucket_name=_namespace, object_name=object_name)
-        object_bytes = file_data.getvalue()
+        size = file_data.seek(0, SEEK_END)
+        file_data.seek(0)
         try:
-            await self.ensure_namespace_exists(namespace=_namespace)
-            await self.clients.internal.put_object(
-                Bucket=_namespace,
-                Key=object_name,
-                Body=object_bytes,
-                ContentType=content_type,
+            await _put_object(
+                client=self.clients.internal,
+                content=file_data,
+                request={
+                    "Bucket": _namespace,
+                    "Key": object_name,
+                    "Body": file_data,
+                    "ContentLength": size,
+                    "ContentType": content_type,
+                },
+                ensure_bucket_exists=partial(self.ensure_namespace_exists, namespace=_namespace),
             )
             upload_result = FileUploadResult(
                 url=self.get_access_url(object_name=object_name, namespace=_namespace),
                 bucket=_namespace,
                 object_name=object_name,
-                size=len(object_bytes),
+                size=size,
             )
         except ClientError as e:
             logger.exception(
@@ -137,6 +220,24 @@ class S3FileClient(FileClient):
             )
             return upload_result
 
+    async def download_file(self, object_name: str, namespace: str) -> bytes:
+        _namespace = self._ensure_valid_namespace(namespace)
+        try:
+            response = await self.clients.internal.get_object(Bucket=_namespace, Key=object_name)
+            body = response["Body"]
+            try:
+                content: bytes = await body.read()
+            finally:
+                body.close()
+        except (BotoCoreError, ClientError) as e:
+            logger.exception(
+                "S3 download failed",
+                bucket_name=_namespace,
+                object_name=object_name,
+            )
+            raise FileClientInternalError(message="File download failed") from e
+        return content
+
     async def delete_file(self, object_name: str, namespace: str) -> None:
         _namespace = self._ensure_valid_namespace(namespace)
         logger.info("Deleting file", bucket_name=_namespace, object_name=object_name)
@@ -150,6 +251,15 @@ class S3FileClient(FileClient):
             )
             raise FileClientInternalError(message="File delete failed") from e
 
+    async def delete_files(self, object_names: tuple[str, ...], namespace: str) -> frozenset[str]:
+        _namespace = self._ensure_valid_namespace(namespace)
+        logger.info("Deleting files", bucket_name=_namespace, object_count=len(object_names))
+        return await delete_s3_objects(
+            client=self.clients.internal,
+            bucket_name=_namespace,
+            object_names=object_names,
+        )
+
     async def init_storage(self) -> None:
         logger.info("Initializing storage")
         await self.ensure_namespace_exists(namespace="media")
@@ -218,17 +328,21 @@ class S3KnowledgeFileClient(KnowledgeFileClient, KnowledgeFileObjectCleaner):
     async def upload_file(
         self,
         *,
-        content: bytes,
+        content: BinaryIO,
         object_name: str,
         content_type: str,
-    ) -> None:
+    ) -> str:
         try:
-            await self.ensure_namespace_exists()
-            await self.internal_client.put_object(
-                Bucket=self.bucket_name,
-                Key=object_name,
-                Body=content,
-                ContentType=content_type,
+            response = await _put_object(
+                client=self.internal_client,
+                content=content,
+                request={
+                    "Bucket": self.bucket_name,
+                    "Key": object_name,
+                    "Body": content,
+                    "ContentType": content_type,
+                },
+                ensure_bucket_exists=self.ensure_namespace_exists,
             )
         except ClientError as error:
             logger.exception(
@@ -236,13 +350,23 @@ class S3KnowledgeFileClient(KnowledgeFileClient, KnowledgeFileObjectCleaner):
                 bucket_name=self.bucket_name,
             )
             raise FileClientInternalError(message="Private file upload failed") from error
+        return response["ETag"]
 
-    async def stream_file(self, *, object_name: str) -> AsyncIterator[bytes]:
+    async def stream_file(
+        self,
+        *,
+        object_name: str,
+        byte_range: ByteRange | None = None,
+        object_etag: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        request: GetObjectRequestTypeDef = {"Bucket": self.bucket_name, "Key": object_name}
+        if byte_range is not None:
+            request["Range"] = f"bytes={byte_range.start}-{byte_range.end}"
+        if object_etag is not None:
+            # A replaced object must fail loudly instead of mixing bytes from two versions.
+            request["IfMatch"] = object_etag
         try:
-            response = await self.internal_client.get_object(
-                Bucket=self.bucket_name,
-                Key=object_name,
-            )
+            response = await self.internal_client.get_object(**request)
         except ClientError as error:
             logger.exception(
                 "Private knowledge file read failed",
@@ -266,20 +390,19 @@ class S3KnowledgeFileClient(KnowledgeFileClient, KnowledgeFileObjectCleaner):
         await self.ensure_namespace_exists()
 
     async def cleanup_objects(self, *, object_names: tuple[str, ...]) -> None:
-        failed_count = 0
-        for object_name in object_names:
-            try:
-                await self.internal_client.delete_object(
-                    Bucket=self.bucket_name,
-                    Key=object_name,
-                )
-            except Exception:  # noqa: BLE001
-                failed_count += 1
-        if failed_count:
+        try:
+            failed_object_names = await delete_s3_objects(
+                client=self.internal_client,
+                bucket_name=self.bucket_name,
+                object_names=object_names,
+            )
+        except Exception:  # noqa: BLE001
+            failed_object_names = frozenset(object_names)
+        if failed_object_names:
             logger.error(
                 "Private knowledge object cleanup incomplete",
                 bucket_name=self.bucket_name,
-                failed_count=failed_count,
+                failed_count=len(failed_object_names),
                 total_count=len(object_names),
             )
 
@@ -319,3 +442,127 @@ class S3KnowledgeFileClient(KnowledgeFileClient, KnowledgeFileObjectCleaner):
                 "NotImplemented",
             }
         return False
+
+
+@dataclass(kw_only=True)
+class S3MultipartUploadClient(MultipartUploadClient):
+    clients: S3ClientBundle
+    bucket_name: str
+    read_chunk_size_bytes: int
+
+    async def create_upload(self, *, object_name: str, content_type: str) -> str:
+        try:
+            response = await self.clients.internal.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                ContentType=content_type,
+            )
+        except (BotoCoreError, ClientError) as error:
+            logger.exception("S3 multipart upload start failed", bucket_name=self.bucket_name)
+            raise FileClientInternalError(message="File upload start failed") from error
+        return response["UploadId"]
+
+    async def presign_part_urls(
+        self,
+        *,
+        object_name: str,
+        upload_id: str,
+        part_count: int,
+        expires_in_seconds: int,
+    ) -> tuple[UploadPartUrl, ...]:
+        # Parts are signed for the public endpoint, so the browser sends them straight to storage.
+        return tuple(
+            [
+                UploadPartUrl(
+                    part_number=part_number,
+                    url=await self.clients.public.generate_presigned_url(
+                        "upload_part",
+                        Params={
+                            "Bucket": self.bucket_name,
+                            "Key": object_name,
+                            "UploadId": upload_id,
+                            "PartNumber": part_number,
+                        },
+                        ExpiresIn=expires_in_seconds,
+                    ),
+                )
+                for part_number in range(1, part_count + 1)
+            ],
+        )
+
+    async def complete_upload(
+        self,
+        *,
+        object_name: str,
+        upload_id: str,
+        parts: tuple[CompletedUploadPart, ...],
+    ) -> str:
+        try:
+            response = await self.clients.internal.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": part.part_number, "ETag": part.etag} for part in parts
+                    ],
+                },
+            )
+        except ClientError as error:
+            if self.upload_is_rejected(error=error):
+                raise DirectUploadVerificationError from error
+            logger.exception("S3 multipart upload completion failed", bucket_name=self.bucket_name)
+            raise FileClientInternalError(message="File upload completion failed") from error
+        except BotoCoreError as error:
+            logger.exception("S3 multipart upload completion failed", bucket_name=self.bucket_name)
+            raise FileClientInternalError(message="File upload completion failed") from error
+        return response["ETag"]
+
+    async def abort_upload(self, *, object_name: str, upload_id: str) -> None:
+        try:
+            await self.clients.internal.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+            )
+        except (BotoCoreError, ClientError) as error:
+            logger.exception("S3 multipart upload abort failed", bucket_name=self.bucket_name)
+            raise FileClientInternalError(message="File upload abort failed") from error
+
+    async def read_digest(self, *, object_name: str) -> ObjectDigest:
+        digest = hashlib.sha256()
+        size_bytes = 0
+        try:
+            response = await self.clients.internal.get_object(
+                Bucket=self.bucket_name,
+                Key=object_name,
+            )
+            body = response["Body"]
+            try:
+                while chunk := await body.read(self.read_chunk_size_bytes):
+                    digest.update(chunk)
+                    size_bytes += len(chunk)
+            finally:
+                body.close()
+        except (BotoCoreError, ClientError) as error:
+            logger.exception("S3 uploaded object read failed", bucket_name=self.bucket_name)
+            raise FileClientInternalError(message="Uploaded file read failed") from error
+        return ObjectDigest(size_bytes=size_bytes, sha256=digest.hexdigest())
+
+    async def delete_object(self, *, object_name: str) -> None:
+        try:
+            await self.clients.internal.delete_object(Bucket=self.bucket_name, Key=object_name)
+        except (BotoCoreError, ClientError) as error:
+            logger.exception("S3 uploaded object delete failed", bucket_name=self.bucket_name)
+            raise FileClientInternalError(message="Uploaded file delete failed") from error
+
+    @staticmethod
+    def upload_is_rejected(*, error: ClientError) -> bool:
+        with suppress(KeyError):
+            return str(error.response["Error"]["Code"]) in {
+                "EntityTooSmall",
+                "InvalidPart",
+                "InvalidPartOrder",
+                "NoSuchUpload",
+            }
+        return False
@@ -0,0 +1,105 @@
+from time import perf_counter_ns
+from typing import cast
+
+from valkey.asyncio import Valkey
+from valkey.asyncio.connection import AbstractConnection, BlockingConnectionPool, Connection
+
+from infra.config.loggers import logger
+
+type ConnectionCheckoutPayload = dict[str, bool | float | int | str]
+
+
+class MonitoredBlockingConnectionPool(BlockingConnectionPool):
+    def __init__(
+        self,
+        *,
+        name: str,
+        slow_checkout_log_threshold_ms: int,
+        max_connections: int,
+        timeout: int | None,
+        connection_class: type[AbstractConnection] = Connection,
+        **connection_kwargs: object,
+    ) -> None:
+        super().__init__(
+            max_connections=max_connections,
+            timeout=timeout,
+            connection_class=connection_class,
+            **connection_kwargs,  # type: ignore[arg-type]
+        )
+        self.name = name
+        self.slow_checkout_log_threshold_ms = slow_checkout_log_threshold_ms
+
+    @property
+    def in_use_connections(self) -> int:
+        return len(self._in_use_connections)
+
+    async def get_connection(
+        self,
+        command_name: str,
+        *keys: object,
+        **options: object,
+    ) -> AbstractConnection:
+        saturated = not self.can_get_connection()
+        started_at_ns = perf_counter_ns()
+        connection = cast(
+            "AbstractConnection",
+            await super().get_connection(  # type: ignore[no-untyped-call]
+                command_name,
+                *keys,
+                **options,
+            ),
+        )
+        wait_ms = (perf_counter_ns() - started_at_ns) / 1_000_000
+        if wait_ms >= self.slow_checkout_log_threshold_ms:
+            logger.warning(
+                "Slow Valkey connection checkout",
+                **build_connection_checkout_log_payload(
+                    pool_name=self.name,
+                    wait_ms=wait_ms,
+                    threshold_ms=self.slow_checkout_log_threshold_ms,
+                    saturated=saturated,
+                    in_use_connections=self.in_use_connections,
+                    max_connections=self.max_connections,
+                ),
+            )
+        return connection
+
+
+def create_monitored_valkey_client(
+    *,
+    url: str,
+    name: str,
+    max_connections: int,
+    checkout_timeout_seconds: int,
+    slow_checkout_log_threshold_ms: int,
+) -> Valkey:
+    return Valkey(
+        connection_pool=MonitoredBlockingConnectionPool.from_url(
+            url,
+            name=name,
+            max_connections=max_connections,
+            timeout=checkout_timeout_seconds,
+            slow_checkout_log_threshold_ms=slow_checkout_log_threshold_ms,
+            decode_responses=False,
+        ),
+    )
+
+
+def build_connection_checkout_log_payload(  # noqa: PLR0913
+    *,
+    pool_name: str,
+    wait_ms: float,
+    threshold_ms: int,
+    saturated: bool,
+    in_use_connections: int,
+    max_connections: int,
+) -> ConnectionCheckoutPayload:
+    return {
+        "pool": pool_name,
+        "wait_ms": round(wait_ms, 2),
+        "threshold_ms": threshold_ms,
+        "saturated": saturated,
+        "in_use_connections": in_use_connections,
+        "max_connections": max_connections,
+        "utilization": round(in_use_connections / max_connections, 2),
+    }
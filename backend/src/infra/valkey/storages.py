@@ -1,29 +1,61 @@
 import hashlib
 import json
+import math
+import secrets
+import time
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import TypedDict, cast
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, date, datetime
+from typing import NotRequired, TypedDict, cast
 
 from litestar.stores.base import Store
 from valkey.asyncio import Valkey
+from valkey.exceptions import ValkeyError
 
+from core.articles.enums import ArticleViewSourceCategory
+from core.articles.schemas import ArticleDailyCounterIncrement
+from core.articles.storages import ArticleViewCounterBuffer
 from core.auth.storages import TokenRevocationStorage
 from core.auth.types import Token
 from core.cache_tools.enums import CacheDomainEnum, CacheWarmOperationStatusEnum
 from core.cache_tools.schemas import CacheDomainStatus, CacheWarmOperation, CacheWarmSummary
 from core.cache_tools.storages import CacheWarmOperationStorage, ResponseCacheStatusStorage
-from core.competency_matrix.schemas import QuestionSuggestionQuota
-from core.competency_matrix.storages import QuestionSuggestionQuotaStorage
+from core.competency_matrix.schemas import (
+    CompetencyMatrixWorkspaceFilters,
+    CompetencyMatrixWorkspaceSummary,
+    QuestionSuggestionQuota,
+)
+from core.competency_matrix.storages import (
+    CompetencyMatrixWorkspaceSummaryCache,
+    QuestionSuggestionQuotaStorage,
+)
+from core.files.schemas import DirectUploadParams, DirectUploadSession
+from core.files.storages import DirectUploadSessionStorage
+from core.resumes.exporters import ResumeExportCache
+from core.sitemaps.schemas import SitemapDocument
+from core.sitemaps.storages import SitemapStorage
 from infra.config.constants import constants
+from infra.config.loggers import logger
 
 QuotaScript = Callable[..., Awaitable[int]]
+ViewCounterClaimScript = Callable[..., Awaitable[list[bytes]]]
+ViewCounterAcknowledgeScript = Callable[..., Awaitable[int]]
 
 
 class CacheWarmSummaryPayload(TypedDict):
     attempted: int
     written: int
     skipped: int
+    collect_ms: NotRequired[int]
+    write_ms: NotRequired[int]
+
+
+class CompetencyMatrixWorkspaceSummaryPayload(TypedDict):
+    total: int
+    draft: int
+    missing_draft: int
+    dangerous_published: int
+    ready_published: int
 
 
 class CacheWarmOperationPayload(TypedDict):
@@ -33,6 +65,20 @@ class CacheWarmOperationPayload(TypedDict):
     summary: CacheWarmSummaryPayload | None
 
 
+class DirectUploadSessionPayload(TypedDict):
+    id: str
+    owner_username: str
+    scope: str
+    upload_id: str
+    object_name: str
+    name: str
+    original_name: str
+    mime_type: str
+    size_bytes: int
+    sha256: str
+    expires_at: str
+
+
 @dataclass(kw_only=True, slots=True, frozen=True)
 class ValkeyTokenRevocationStorage(TokenRevocationStorage):
     store: Store
@@ -88,48 +134,112 @@ class ValkeyQuestionSuggestionQuotaStorage(QuestionSuggestionQuotaStorage):
         return f"{self.namespace}:{actor_key}"
 
 
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ValkeyCompetencyMatrixWorkspaceSummaryCache(CompetencyMatrixWorkspaceSummaryCache):
+    valkey: Valkey
+    namespace: str
+    ttl_seconds: int
+
+    async def get_summary(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+    ) -> CompetencyMatrixWorkspaceSummary | None:
+        try:
+            value = await cast(
+                "Awaitable[bytes | None]",
+                self.valkey.hget(
+                    self.summaries_key,
+                    self.filters_field(filters=filters),
+                ),
+            )
+        except ValkeyError:
+            # The cache only saves aggregate work, so an outage falls back to counting.
+            logger.warning("Competency matrix workspace summary cache read failed", exc_info=True)
+            return None
+        if value is None:
+            return None
+        payload = cast("CompetencyMatrixWorkspaceSummaryPayload", json.loads(value))
+        return CompetencyMatrixWorkspaceSummary(
+            total=payload["total"],
+            draft=payload["draft"],
+            missing_draft=payload["missing_draft"],
+            dangerous_published=payload["dangerous_published"],
+            ready_published=payload["ready_published"],
+        )
+
+    async def save_summary(
+        self,
+        *,
+        filters: CompetencyMatrixWorkspaceFilters,
+        summary: CompetencyMatrixWorkspaceSummary,
+    ) -> None:
+        payload = CompetencyMatrixWorkspaceSummaryPayload(
+            total=summary.total,
+            draft=summary.draft,
+            missing_draft=summary.missing_draft,
+            dangerous_published=summary.dangerous_published,
+            ready_published=summary.ready_published,
+        )
+        try:
+            async with self.valkey.pipeline(transaction=True) as pipeline:
+                pipeline.hset(
+                    self.summaries_key,
+                    self.filters_field(filters=filters),
+                    json.dumps(payload, separators=(",", ":")),
+                )
+                # The first write starts the clock, so every summary is gone within one TTL.
+                pipeline.expire(self.summaries_key, self.ttl_seconds, nx=True)
+                await pipeline.execute()
+        except ValkeyError:
+            logger.warning("Competency matrix workspace summary cache write failed", exc_info=True)
+
+    async def invalidate(self) -> None:
+        try:
+            await self.valkey.unlink(self.summaries_key)
+        except ValkeyError:
+            logger.warning(
+                "Competency matrix workspace summary cache invalidation failed",
+                exc_info=True,
+            )
+
+    @property
+    def summaries_key(self) -> str:
+        return f"{self.namespace}:summaries"
+
+    def filters_field(self, *, filters: CompetencyMatrixWorkspaceFilters) -> str:
+        payload = asdict(filters)
+        for page_field in ("page", "page_size", "sort"):
+            payload.pop(page_field)
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode(),
+        ).hexdigest()
+
+
 @dataclass(kw_only=True, slots=True, frozen=True)
 class ValkeyResponseCacheStatusStorage(ResponseCacheStatusStorage):
     valkey: Valkey
-    namespaces: dict[CacheDomainEnum, str]
-    scan_batch_size: int
+    expiry_index_keys: dict[CacheDomainEnum, str]
+    clock: Callable[[], float] = time.time
 
     async def get_domain_status(self, *, domain: CacheDomainEnum) -> CacheDomainStatus:
-        cursor = 0
-        seen_keys: set[bytes] = set()
-        key_count = 0
-        minimum_remaining_ttl_seconds: int | None = None
-        non_expiring_key_count = 0
-        while True:
-            cursor, keys = await self.valkey.scan(
-                cursor=cursor,
-                match=f"{self.namespaces[domain]}:*",
-                count=self.scan_batch_size,
-            )
-            new_keys = [key for key in keys if key not in seen_keys]
-            seen_keys.update(new_keys)
-            if new_keys:
-                pipeline = self.valkey.pipeline(transaction=False)
-                for key in new_keys:
-                    pipeline.ttl(key)
-                ttl_values = cast("list[int]", await pipeline.execute())
-                for ttl_seconds in ttl_values:
-                    if ttl_seconds == constants.valkey.missing_ttl_seconds:
-                        continue
-                    key_count += 1
-                    if ttl_seconds == constants.valkey.non_expiring_ttl_seconds:
-                        non_expiring_key_count += 1
-                    elif (
-                        minimum_remaining_ttl_seconds is None
-                        or ttl_seconds < minimum_remaining_ttl_seconds
-                    ):
-                        minimum_remaining_ttl_seconds = ttl_seconds
-            if cursor == 0:
-                break
+        index_key = self.expiry_index_keys[domain]
+        now = self.clock()
+        pipeline = self.valkey.pipeline(transaction=False)
+        pipeline.zremrangebyscore(index_key, "-inf", now)
+        pipeline.zcard(index_key)
+        pipeline.zcount(index_key, "+inf", "+inf")
+        pipeline.zrange(index_key, 0, 0, withscores=True)
+        _, key_count, non_expiring_key_count, earliest = await pipeline.execute()
+        earliest_expiry = (
+            cast("list[tuple[bytes, float]]", earliest)[0][1] if earliest else math.inf
+        )
         return CacheDomainStatus(
             domain=domain,
             key_count=key_count,
-            minimum_remaining_ttl_seconds=minimum_remaining_ttl_seconds,
+            minimum_remaining_ttl_seconds=(
+                math.ceil(earliest_expiry - now) if math.isfinite(earliest_expiry) else None
+            ),
             non_expiring_key_count=non_expiring_key_count,
         )
 
@@ -189,6 +299,8 @@ class ValkeyCacheWarmOperationStorage(CacheWarmOperationStorage):
                     attempted=operation.summary.attempted,
                     written=operation.summary.written,
                     skipped=operation.summary.skipped,
+                    collect_ms=operation.summary.collect_ms,
+                    write_ms=operation.summary.write_ms,
                 )
                 if operation.summary is not None
                 else None
@@ -208,8 +320,286 @@ class ValkeyCacheWarmOperationStorage(CacheWarmOperationStorage):
                     attempted=summary_payload["attempted"],
                     written=summary_payload["written"],
                     skipped=summary_payload["skipped"],
+                    collect_ms=summary_payload.get("collect_ms", 0),
+                    write_ms=summary_payload.get("write_ms", 0),
                 )
                 if summary_payload is not None
                 else None
             ),
         )
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ValkeyDirectUploadSessionStorage(DirectUploadSessionStorage):
+    valkey: Valkey
+    namespace: str
+
+    async def save_session(self, *, session: DirectUploadSession, ttl_seconds: int) -> None:
+        await self.valkey.set(
+            self.session_key(session_id=session.id),
+            self.serialize(session=session),
+            ex=ttl_seconds,
+        )
+
+    async def take_session(self, *, session_id: str) -> DirectUploadSession | None:
+        value = await self.valkey.getdel(self.session_key(session_id=session_id))
+        if value is None:
+            return None
+        return self.deserialize(value=value)
+
+    def session_key(self, *, session_id: str) -> str:
+        return f"{self.namespace}:{session_id}"
+
+    def serialize(self, *, session: DirectUploadSession) -> bytes:
+        payload = DirectUploadSessionPayload(
+            id=session.id,
+            owner_username=session.owner_username,
+            scope=session.scope,
+            upload_id=session.upload_id,
+            object_name=session.object_name,
+            name=session.params.name,
+            original_name=session.params.original_name,
+            mime_type=session.params.mime_type,
+            size_bytes=session.params.size_bytes,
+            sha256=session.params.sha256,
+            expires_at=session.expires_at.isoformat(),
+        )
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def deserialize(self, *, value: bytes) -> DirectUploadSession:
+        payload = cast("DirectUploadSessionPayload", json.loads(value))
+        return DirectUploadSession(
+            id=payload["id"],
+            owner_username=payload["owner_username"],
+            scope=payload["scope"],
+            upload_id=payload["upload_id"],
+            object_name=payload["object_name"],
+            params=DirectUploadParams(
+                name=payload["name"],
+                original_name=payload["original_name"],
+                mime_type=payload["mime_type"],
+                size_bytes=payload["size_bytes"],
+                sha256=payload["sha256"],
+            ),
+            expires_at=datetime.fromisoformat(payload["expires_at"]),
+        )
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ValkeyResumeExportCache(ResumeExportCache):
+    valkey: Valkey
+    namespace: str
+    ttl_seconds: int
+    max_size_bytes: int
+
+    async def get_content(self, *, key: str) -> bytes | None:
+        try:
+            return cast("bytes | None", await self.valkey.get(self.content_key(key=key)))
+        except ValkeyError:
+            # The cache only saves rendering time, so an outage falls back to rendering.
+            logger.warning("Resume export cache read failed", exc_info=True)
+            return None
+
+    async def save_content(self, *, key: str, content: bytes) -> None:
+        if len(content) > self.max_size_bytes:
+            return
+        try:
+            await self.valkey.set(self.content_key(key=key), content, ex=self.ttl_seconds)
+        except ValkeyError:
+            logger.warning("Resume export cache write failed", exc_info=True)
+
+    def content_key(self, *, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+
+@dataclass(kw_only=True, slots=True)
+class ValkeyArticleViewCounterBuffer(ArticleViewCounterBuffer):
+    valkey: Valkey
+    namespace: str
+    flush_lock_ttl_milliseconds: int
+    flush_lock_token: str | None = None
+    _claim_script: ViewCounterClaimScript = field(init=False, repr=False)
+    _acknowledge_script: ViewCounterAcknowledgeScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # A batch left behind by a failed flush is retried before new increments are claimed.
+        self._claim_script = self.valkey.register_script(
+            b"""
+            if redis.call('EXISTS', KEYS[2]) == 0 then
+                if redis.call('EXISTS', KEYS[1]) == 0 then
+                    return {}
+                end
+                redis.call('RENAME', KEYS[1], KEYS[2])
+            end
+            return redis.call('HGETALL', KEYS[2])
+            """,
+        )
+        self._acknowledge_script = self.valkey.register_script(
+            b"""
+            if redis.call('GET', KEYS[1]) == ARGV[1] then
+                redis.call('DEL', KEYS[2])
+                return redis.call('DEL', KEYS[1])
+            end
+            return 0
+            """,
+        )
+
+    async def increment_view(
+        self,
+        *,
+        article_id: str,
+        source_category: ArticleViewSourceCategory,
+        viewed_on: date | None,
+    ) -> None:
+        await cast(
+            "Awaitable[int]",
+            self.valkey.hincrby(
+                self.active_key,
+                self.counter_field(
+                    article_id=article_id,
+                    source_category=source_category,
+                    viewed_on=viewed_on,
+                    counter="views",
+                ),
+                1,
+            ),
+        )
+
+    async def increment_engaged_view(
+        self,
+        *,
+        article_id: str,
+        source_category: ArticleViewSourceCategory,
+        viewed_on: date | None,
+    ) -> None:
+        await cast(
+            "Awaitable[int]",
+            self.valkey.hincrby(
+                self.active_key,
+                self.counter_field(
+                    article_id=article_id,
+                    source_category=source_category,
+                    viewed_on=viewed_on,
+                    counter="engaged_views",
+                ),
+                1,
+            ),
+        )
+
+    async def claim_pending(self) -> list[ArticleDailyCounterIncrement]:
+        # The lock outlives a failed flush, so its batch is retried once the lock expires.
+        token = secrets.token_hex(16)
+        if not await self.valkey.set(
+            self.flush_lock_key,
+            token,
+            nx=True,
+            px=self.flush_lock_ttl_milliseconds,
+        ):
+            return []
+        self.flush_lock_token = token
+        values = await self._claim_script(keys=[self.active_key, self.pending_key], args=[])
+        if not values:
+            await self.acknowledge_pending()
+            return []
+        counters: dict[tuple[str, date, ArticleViewSourceCategory], dict[str, int]] = {}
+        for field_name, value in zip(values[::2], values[1::2], strict=True):
+            article_id, recorded_on, source_category, counter = field_name.decode().split(":")
+            key = (
+                article_id,
+                date.fromisoformat(recorded_on),
+                ArticleViewSourceCategory.from_value(source_category),
+            )
+            counters.setdefault(key, {})[counter] = int(value)
+        return [
+            ArticleDailyCounterIncrement(
+                article_id=article_id,
+                date=recorded_on,
+                source_category=source_category,
+                view_count=counts.get("views", 0),
+                engaged_view_count=counts.get("engaged_views", 0),
+            )
+            for (article_id, recorded_on, source_category), counts in counters.items()
+        ]
+
+    async def acknowledge_pending(self) -> None:
+        token, self.flush_lock_token = self.flush_lock_token, None
+        if token is None:
+            return
+        await self._acknowledge_script(keys=[self.flush_lock_key, self.pending_key], args=[token])
+
+    @property
+    def active_key(self) -> str:
+        return f"{self.namespace}:active"
+
+    @property
+    def pending_key(self) -> str:
+        return f"{self.namespace}:pending"
+
+    @property
+    def flush_lock_key(self) -> str:
+        return f"{self.namespace}:flush_lock"
+
+    def counter_field(
+        self,
+        *,
+        article_id: str,
+        source_category: ArticleViewSourceCategory,
+        viewed_on: date | None,
+        counter: str,
+    ) -> str:
+        recorded_on = viewed_on if viewed_on is not None else datetime.now(tz=UTC).date()
+        return f"{article_id}:{recorded_on.isoformat()}:{source_category.value}:{counter}"
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ValkeySitemapStorage(SitemapStorage):
+    valkey: Valkey
+    namespace: str
+
+    async def get_document(self, *, name: str) -> SitemapDocument | None:
+        values = await cast(
+            "Awaitable[dict[bytes, bytes]]",
+            self.valkey.hgetall(self.document_key(name=name)),
+        )
+        if not values:
+            return None
+        return SitemapDocument(
+            name=name,
+            content=values[b"content"],
+            entity_tag=values[b"entity_tag"].decode(),
+            last_modified=datetime.fromisoformat(values[b"last_modified"].decode()),
+        )
+
+    async def replace_documents(self, *, documents: list[SitemapDocument]) -> None:
+        previous_names = {
+            name.decode()
+            for name in await cast(
+                "Awaitable[set[bytes]]",
+                self.valkey.smembers(self.names_key),
+            )
+        }
+        names = [document.name for document in documents]
+        # Readers see either the previous or the new set of documents, never a mix of both.
+        pipeline = self.valkey.pipeline(transaction=True)
+        for document in documents:
+            pipeline.hset(
+                self.document_key(name=document.name),
+                mapping={
+                    "content": document.content,
+                    "entity_tag": document.entity_tag,
+                    "last_modified": document.last_modified.isoformat(),
+                },
+            )
+        for name in previous_names.difference(names):
+            pipeline.delete(self.document_key(name=name))
+        pipeline.delete(self.names_key)
+        if names:
+            pipeline.sadd(self.names_key, *names)
+        await pipeline.execute()
+
+    @property
+    def names_key(self) -> str:
+        return f"{self.namespace}:names"
+
+    def document_key(self, *, name: str) -> str:
+        return f"{self.namespace}:document:{name}"
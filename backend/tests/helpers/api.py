@@ -240,8 +240,14 @@ class APIHelper:
             params=params,
         )
 
-    def get_sitemap_xml(self) -> Response:
-        return self.client.get("/sitemap.xml")
+    def get_sitemap_xml(
+        self,
+        *,
+        page: int | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        params = {} if page is None else {"page": page}
+        return self.client.get("/sitemap.xml", params=params, headers=headers)
 
     def get_robots_txt(self) -> Response:
         return self.client.get("/robots.txt")
@@ -544,6 +550,8 @@ class APIHelper:
         published_from: str | None = None,
         published_to: str | None = None,
         search_query: str | None = None,
+        cursor: str | None = None,
+        include_count: bool | None = None,
     ) -> Response:
         params: dict[str, str | int] = {}
         if language is not None:
@@ -560,6 +568,10 @@ class APIHelper:
             params["publishedTo"] = published_to
         if search_query is not None:
             params["searchQuery"] = search_query
+        if cursor is not None:
+            params["cursor"] = cursor
+        if include_count is not None:
+            params["includeCount"] = str(include_count).lower()
         return self.client.get("/api/articles", params=params)
 
     def get_admin_articles(
@@ -861,6 +873,23 @@ class APIHelper:
             files={"file": (filename, content, content_type)},
         )
 
+    def post_admin_file_upload(self, *, data: dict[str, Any]) -> Response:
+        return self.client.post("/api/admin/files/uploads", json=data)
+
+    def post_admin_file_upload_complete(
+        self,
+        *,
+        session_id: str,
+        data: dict[str, Any],
+    ) -> Response:
+        return self.client.post(f"/api/admin/files/uploads/{session_id}/complete", json=data)
+
+    def delete_admin_file_upload(self, *, session_id: str, purpose: str) -> Response:
+        return self.client.delete(
+            f"/api/admin/files/uploads/{session_id}",
+            params={"purpose": purpose},
+        )
+
     def get_admin_files(self, *, purpose: str) -> Response:
         return self.client.get(
             "/api/admin/files",
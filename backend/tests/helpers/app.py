@@ -21,20 +21,24 @@ from core.competency_matrix.generators import ItemIdGenerator, ResourceIdGenerat
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.contacts.use_cases import ContactsUseCase
 from core.files.file_name_generators import FileNameGenerator
-from core.files.services import FileService
+from core.files.services import FileDirectUploadService, FileService
 from core.generators import HexUuidIdGenerator
 from core.knowledge.dates.use_cases import KnowledgeDatesUseCase
 from core.knowledge.files.clients import (
     KnowledgeFileObjectCleaner,
     KnowledgeFileRollbackRegistrar,
 )
-from core.knowledge.files.use_cases import KnowledgeFilesUseCase
+from core.knowledge.files.use_cases import (
+    KnowledgeAttachmentDirectUploadUseCase,
+    KnowledgeFilesUseCase,
+)
 from core.knowledge.items.use_cases import KnowledgeTagsUseCase
 from core.knowledge.people.use_cases import (
     PeopleUseCase,
     PersonRelationshipTypesUseCase,
 )
 from core.resumes.use_cases import ResumesUseCase
+from core.sitemaps.storages import SitemapStorage
 from core.types import IntId
 from core.wiki_links.use_cases import WikiLinksUseCase
 from infra.healthcheck import ReadinessChecker
@@ -140,10 +144,18 @@ class IocContainerHelper:
         service = await self.container.get(FileService)
         return cast("Mock", service)
 
+    async def get_file_direct_upload_service(self) -> Mock:
+        service = await self.container.get(FileDirectUploadService)
+        return cast("Mock", service)
+
     async def get_resumes_use_case(self) -> Mock:
         use_case = await self.container.get(ResumesUseCase)
         return cast("Mock", use_case)
 
+    async def get_sitemap_storage(self) -> Mock:
+        storage = await self.container.get(SitemapStorage)
+        return cast("Mock", storage)
+
     async def get_people_use_case(self) -> Mock:
         use_case = await self.container.get(PeopleUseCase)
         return cast("Mock", use_case)
@@ -160,6 +172,10 @@ class IocContainerHelper:
         use_case = await self.container.get(KnowledgeFilesUseCase)
         return cast("Mock", use_case)
 
+    async def get_knowledge_attachment_direct_upload_use_case(self) -> Mock:
+        use_case = await self.container.get(KnowledgeAttachmentDirectUploadUseCase)
+        return cast("Mock", use_case)
+
     async def get_knowledge_file_object_cleaner(self) -> Mock:
         cleaner = await self.container.get(KnowledgeFileObjectCleaner)
         return cast("Mock", cleaner)
@@ -6,6 +6,7 @@ from typing import Any
 from core.account.schemas import ManagedAccount, ManagedAccounts
 from core.articles.schemas import (
     Article,
+    ArticleCursor,
     ArticleFolder,
     ArticleFolders,
     ArticleMetadata,
@@ -42,6 +43,8 @@ from core.enums import PublishStatusEnum
 from core.files.enums import FilePurpose
 from core.files.schemas import (
     FileRead,
+    FileVariant,
+    FileVariantRead,
     StoredFile,
 )
 from core.files.types import Namespace
@@ -640,10 +643,16 @@ class CoreFactoryHelper:
     def article_list(
         cls,
         articles: list[Article] | None = None,
-        total_count: int = 0,
-        total_pages: int = 0,
+        total_count: int | None = 0,
+        total_pages: int | None = 0,
+        next_cursor: ArticleCursor | None = None,
     ) -> Articles:
-        return Articles(values=articles or [], total_count=total_count, total_pages=total_pages)
+        return Articles(
+            values=articles or [],
+            total_count=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        )
 
     @classmethod
     def tag(
@@ -892,6 +901,7 @@ class CoreFactoryHelper:
         orphaned_at: datetime | None = None,
         created_at: datetime | None = None,
         updated_at: datetime | None = None,
+        variants: tuple[FileVariant, ...] = (),
     ) -> StoredFile:
         now = datetime(2026, 7, 3, 10, 0, tzinfo=UTC)
         return StoredFile(
@@ -907,6 +917,24 @@ class CoreFactoryHelper:
             orphaned_at=orphaned_at,
             created_at=created_at or now,
             updated_at=updated_at or now,
+            variants=variants,
+        )
+
+    @classmethod
+    def file_variant(
+        cls,
+        width_px: int = 640,
+        height_px: int = 360,
+        mime_type: str = "image/webp",
+        relative_path: str = "article-content-images/file-640w.webp",
+        size_bytes: int = 3,
+    ) -> FileVariant:
+        return FileVariant(
+            width_px=width_px,
+            height_px=height_px,
+            mime_type=mime_type,
+            relative_path=relative_path,
+            size_bytes=size_bytes,
         )
 
     @classmethod
@@ -915,11 +943,13 @@ class CoreFactoryHelper:
         file: StoredFile | None = None,
         access_url: str = "https://cdn.example.test/media/article-content-images/file.png",
         markdown_url: str = "https://cdn.example.test/media/article-content-images/file.png#fileId=00000000000000000000000000000001",
+        variants: tuple[FileVariantRead, ...] = (),
     ) -> FileRead:
         return FileRead(
             file=file or cls.stored_file(),
             access_url=access_url,
             markdown_url=markdown_url,
+            variants=variants,
         )
 
     @classmethod
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.articles.schemas import Article, ArticleFolder, Tag
@@ -19,6 +19,7 @@ from infra.postgresql.models import (
     ArticleModel,
     ArticleToTagSecondaryModel,
     CompetencyMatrixItemModel,
+    CompetencyMatrixPublishedItemModel,
     CompetencyMatrixSectionModel,
     CompetencyMatrixSheetModel,
     CompetencyMatrixSubsectionModel,
@@ -29,6 +30,9 @@ from infra.postgresql.models import (
     TagModel,
     UserModel,
 )
+from infra.postgresql.storages.competency_matrix import (
+    build_published_competency_matrix_items_refresh,
+)
 
 
 @dataclass(kw_only=True)
@@ -50,6 +54,7 @@ class StorageHelper:
         model = CompetencyMatrixItemModel.from_domain_schema(item=item, include_relationships=True)
         await self.session.merge(model)
         await self.session.flush()
+        await self._refresh_published_competency_matrix_items(item_ids=[item.id])
         return model
 
     async def create_competency_matrix_items(
@@ -64,8 +69,23 @@ class StorageHelper:
         ]
         self.session.add_all(db_items)
         await self.session.flush()
+        await self._refresh_published_competency_matrix_items(
+            item_ids=[item.id for item in items],
+        )
         return db_items
 
+    async def _refresh_published_competency_matrix_items(self, *, item_ids: list[str]) -> None:
+        await self.session.execute(
+            delete(CompetencyMatrixPublishedItemModel).where(
+                CompetencyMatrixPublishedItemModel.item_id.in_(item_ids),
+            ),
+        )
+        await self.session.execute(
+            build_published_competency_matrix_items_refresh(
+                CompetencyMatrixItemModel.id.in_(item_ids),
+            ),
+        )
+
     async def create_competency_matrix_structure(
         self,
         structure: CompetencyMatrixItemStructure,
@@ -1,6 +1,7 @@
 import asyncio
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
@@ -44,6 +45,7 @@ from core.competency_matrix.exceptions import (
     CompetencyMatrixStructureNotFoundError,
 )
 from core.competency_matrix.schemas import QueuedCompetencyMatrixQuestion
+from core.competency_matrix.storages import CompetencyMatrixWorkspaceSummaryCache
 from core.enums import PublishStatusEnum
 from core.generators import HexUuidIdGenerator
 from infra.postgresql.models import (
@@ -862,6 +864,7 @@ class TestAgentAccessDatabaseStorage(StorageTestCase):
             or CompetencyMatrixDatabaseStorage(
                 session=storage.session,
             ),
+            workspace_summary_cache=AsyncMock(spec=CompetencyMatrixWorkspaceSummaryCache),
             id_generator=HexUuidIdGenerator(generator=lambda: next(ids)),
         )
 
@@ -3,6 +3,7 @@ from datetime import date
 import pytest_asyncio
 
 from core.articles.enums import ArticleReactionKind, ArticleViewSourceCategory
+from core.articles.schemas import ArticleDailyCounterIncrement
 from core.i18n.enums import LanguageEnum
 from infra.postgresql.storages.articles import ArticleAnalyticsDatabaseStorage
 from tests.test_cases import StorageTestCase
@@ -19,20 +20,25 @@ class TestArticleAnalyticsDatabaseStorage(StorageTestCase):
         )
         await self.storage_helper.create_article(article=article)
 
-        await self.storage.increment_view(
+        increment = ArticleDailyCounterIncrement(
             article_id=article.id,
+            date=date(2026, 1, 2),
             source_category=ArticleViewSourceCategory.SEARCH,
-            viewed_on=None,
-        )
-        await self.storage.increment_view(
-            article_id=article.id,
-            source_category=ArticleViewSourceCategory.SEARCH,
-            viewed_on=None,
-        )
-        await self.storage.increment_engaged_view(
-            article_id=article.id,
-            source_category=ArticleViewSourceCategory.SEARCH,
-            viewed_on=None,
+            view_count=1,
+            engaged_view_count=1,
+        )
+        await self.storage.add_daily_counters(increments=[increment])
+        await self.storage.add_daily_counters(
+            increments=[
+                increment,
+                ArticleDailyCounterIncrement(
+                    article_id=self.factory.core.hex_id(9),
+                    date=date(2026, 1, 2),
+                    source_category=ArticleViewSourceCategory.SEARCH,
+                    view_count=5,
+                    engaged_view_count=0,
+                ),
+            ],
         )
         await self.storage.set_reaction(
             article_id=article.id,
@@ -73,6 +79,40 @@ class TestArticleAnalyticsDatabaseStorage(StorageTestCase):
         assert replaced.by_article_id(article.id).reaction_counts.poop == 1
         assert removed.by_article_id(article.id).reaction_counts.poop == 0
 
+    async def test_rebuild_totals_recomputes_counters_for_every_article(self) -> None:
+        article = self.factory.core.article(
+            article_id=self.factory.core.hex_id(1), slug="rebuilt-article"
+        )
+        quiet_article = self.factory.core.article(
+            article_id=self.factory.core.hex_id(2), slug="quiet-article"
+        )
+        await self.storage_helper.create_articles(articles=[article, quiet_article])
+        await self.storage.add_daily_counters(
+            increments=[
+                ArticleDailyCounterIncrement(
+                    article_id=article.id,
+                    date=date(2026, 1, 2),
+                    source_category=ArticleViewSourceCategory.DIRECT,
+                    view_count=3,
+                    engaged_view_count=1,
+                ),
+            ],
+        )
+        await self.storage.set_reaction(
+            article_id=article.id,
+            article_scoped_voter_hash="voter-hash",
+            reaction_kind=ArticleReactionKind.HEART,
+        )
+
+        rebuilt_count = await self.storage.rebuild_totals()
+        result = await self.storage.get_public_stats(article_ids=[article.id, quiet_article.id])
+
+        assert rebuilt_count == 2
+        assert result.by_article_id(article.id).view_count == 3
+        assert result.by_article_id(article.id).reaction_counts.heart == 1
+        assert result.by_article_id(quiet_article.id).view_count == 0
+        assert result.by_article_id(quiet_article.id).reaction_counts.total == 0
+
     async def test_stats_are_filtered_by_date_range(self) -> None:
         first_article = self.factory.core.article(
             article_id=self.factory.core.hex_id(1), slug="first"
@@ -81,20 +121,23 @@ class TestArticleAnalyticsDatabaseStorage(StorageTestCase):
             article_id=self.factory.core.hex_id(2), slug="second"
         )
         await self.storage_helper.create_articles(articles=[first_article, second_article])
-        await self.storage.increment_view(
-            article_id=first_article.id,
-            source_category=ArticleViewSourceCategory.EXTERNAL,
-            viewed_on=date(2026, 1, 2),
-        )
-        await self.storage.increment_engaged_view(
-            article_id=first_article.id,
-            source_category=ArticleViewSourceCategory.EXTERNAL,
-            viewed_on=date(2026, 1, 2),
-        )
-        await self.storage.increment_view(
-            article_id=second_article.id,
-            source_category=ArticleViewSourceCategory.DIRECT,
-            viewed_on=date(2026, 2, 2),
+        await self.storage.add_daily_counters(
+            increments=[
+                ArticleDailyCounterIncrement(
+                    article_id=first_article.id,
+                    date=date(2026, 1, 2),
+                    source_category=ArticleViewSourceCategory.EXTERNAL,
+                    view_count=1,
+                    engaged_view_count=1,
+                ),
+                ArticleDailyCounterIncrement(
+                    article_id=second_article.id,
+                    date=date(2026, 2, 2),
+                    source_category=ArticleViewSourceCategory.DIRECT,
+                    view_count=1,
+                    engaged_view_count=0,
+                ),
+            ],
         )
         await self.storage.set_reaction(
             article_id=first_article.id,
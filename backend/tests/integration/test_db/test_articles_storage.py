@@ -1,4 +1,5 @@
 import asyncio
+from dataclasses import replace
 from datetime import date
 
 import pytest
@@ -316,7 +317,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        articles, total_count = await self.storage.list_articles(
+        page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -328,11 +329,13 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query=None,
             ),
         )
+        articles = page.articles
+        total_count = page.total_count
 
         assert self.collections.slugs(articles) == ["published-python"]
         assert total_count == 1
 
-        draft_articles, draft_total_count = await self.storage.list_articles(
+        draft_page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -345,6 +348,8 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query=None,
             ),
         )
+        draft_articles = draft_page.articles
+        draft_total_count = draft_page.total_count
 
         assert self.collections.slugs(draft_articles) == ["draft-python"]
         assert draft_total_count == 1
@@ -379,7 +384,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        articles, total_count = await self.storage.list_articles(
+        page = await self.storage.list_articles(
             filters=ArticleFilters(
                 only_published=True,
                 include_tags=False,
@@ -387,11 +392,39 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 order_for_seo=True,
             ),
         )
+        articles = page.articles
+        total_count = page.total_count
 
         assert self.collections.slugs(articles) == ["newer-published", "older-published"]
         assert [list(article.tags) for article in articles] == [[], []]
         assert total_count == 2
 
+    async def test_list_published_articles_after_pages_by_slug(self) -> None:
+        await self.storage_helper.create_articles(
+            articles=[
+                self.factory.core.article(
+                    title=slug,
+                    slug=slug,
+                    publish_status=publish_status,
+                )
+                for slug, publish_status in (
+                    ("c-article", PublishStatusEnum.PUBLISHED),
+                    ("a-article", PublishStatusEnum.PUBLISHED),
+                    ("b-draft", PublishStatusEnum.DRAFT),
+                    ("d-article", PublishStatusEnum.PUBLISHED),
+                )
+            ],
+        )
+
+        first_chunk = await self.storage.list_published_articles_after(after_slug=None, limit=2)
+        second_chunk = await self.storage.list_published_articles_after(
+            after_slug=first_chunk[-1].slug,
+            limit=2,
+        )
+
+        assert [article.slug for article in first_chunk] == ["a-article", "c-article"]
+        assert [article.slug for article in second_chunk] == ["d-article"]
+
     async def test_list_articles_sorts_published_before_drafts_for_admin(self) -> None:
         await self.storage_helper.create_articles(
             articles=[
@@ -421,7 +454,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        articles, _total_count = await self.storage.list_articles(
+        page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -433,6 +466,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query=None,
             ),
         )
+        articles = page.articles
 
         assert self.collections.slugs(articles) == [
             "newer-published",
@@ -440,6 +474,39 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             "draft",
         ]
 
+    async def test_list_articles_walks_keyset_cursor_without_count(self) -> None:
+        await self.storage_helper.create_articles(
+            articles=[
+                self.factory.core.article(
+                    title=f"Published {index}",
+                    slug=f"published-{index}",
+                    publish_status=PublishStatusEnum.PUBLISHED,
+                    published_at=f"2024-0{index}-01T00:00:00",
+                    created_at=f"2024-0{index}-01T00:00:00",
+                    updated_at=f"2024-0{index}-01T00:00:00",
+                )
+                for index in range(1, 4)
+            ],
+        )
+        filters = ArticleFilters(
+            page=1,
+            page_size=2,
+            include_count=False,
+            language=LanguageEnum.RU,
+            only_published=True,
+        )
+
+        first_page = await self.storage.list_articles(filters=filters)
+        assert first_page.next_cursor is not None
+        second_page = await self.storage.list_articles(
+            filters=replace(filters, cursor=first_page.next_cursor),
+        )
+
+        assert self.collections.slugs(first_page.articles) == ["published-3", "published-2"]
+        assert first_page.total_count is None
+        assert self.collections.slugs(second_page.articles) == ["published-1"]
+        assert second_page.next_cursor is None
+
     async def test_list_articles_filters_by_inclusive_publish_date_range(self) -> None:
         await self.storage_helper.create_articles(
             articles=[
@@ -485,7 +552,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        articles, total_count = await self.storage.list_articles(
+        page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -497,6 +564,8 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query=None,
             ),
         )
+        articles = page.articles
+        total_count = page.total_count
 
         assert self.collections.slugs(articles) == ["range-end", "range-start"]
         assert total_count == 2
@@ -528,7 +597,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        title_articles, _title_total_count = await self.storage.list_articles(
+        title_page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -540,7 +609,8 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query="full text",
             ),
         )
-        content_articles, _content_total_count = await self.storage.list_articles(
+        title_articles = title_page.articles
+        content_page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -552,6 +622,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query="dishka providers",
             ),
         )
+        content_articles = content_page.articles
 
         assert self.collections.slugs(title_articles) == ["title-match"]
         assert self.collections.slugs(content_articles) == ["content-match"]
@@ -580,7 +651,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        ru_articles, _ru_total_count = await self.storage.list_articles(
+        ru_page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -592,7 +663,8 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query="документам",
             ),
         )
-        en_articles, _en_total_count = await self.storage.list_articles(
+        ru_articles = ru_page.articles
+        en_page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -604,6 +676,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query="background",
             ),
         )
+        en_articles = en_page.articles
 
         assert self.collections.slugs(ru_articles) == ["database-indexes"]
         assert self.collections.slugs(en_articles) == ["task-queues"]
@@ -641,7 +714,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
             ],
         )
 
-        articles, _total_count = await self.storage.list_articles(
+        page = await self.storage.list_articles(
             filters=ArticleFilters(
                 page=1,
                 page_size=10,
@@ -653,6 +726,7 @@ class TestArticlesDatabaseStorage(StorageTestCase):
                 search_query="search vectors",
             ),
         )
+        articles = page.articles
 
         assert self.collections.slugs(articles) == ["match"]
 
@@ -206,8 +206,11 @@ class TestAuthSessionStorage(StorageTestCase):
         )
         created = await self.storage.create_session(session=session)
 
-        await self.storage.revoke_session_by_secret_hash(secret_hash=session.secret_hash)
+        revoked_session_id = await self.storage.revoke_session_by_secret_hash(
+            secret_hash=session.secret_hash,
+        )
 
+        assert revoked_session_id == created.id
         stored = await self.storage.get_session_by_id(session_id=created.id)
         assert stored == AuthSession(
             id=created.id,
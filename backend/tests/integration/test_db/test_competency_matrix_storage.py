@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import UTC, datetime
 
 import pytest
@@ -237,6 +238,42 @@ class TestCompetencyMatrixStorage(StorageTestCase):
 
         assert self.collections.slugs(items) == ["advanced-question", "1"]
 
+    async def test_published_items_follow_publish_switches_and_priorities(self) -> None:
+        await self.storage.update_competency_matrix_item_publish_status(
+            item_id=self.factory.core.hex_id(2),
+            publish_status=PublishStatusEnum.DRAFT,
+        )
+
+        assert await self.storage.list_sheets() == self.factory.core.sheets(values=["Python"])
+        assert (
+            self.collections.slugs(
+                await self.storage.list_competency_matrix_items(
+                    filters=CompetencyMatrixItemFilters(sheet_key="SQL", only_published=True),
+                ),
+            )
+            == []
+        )
+
+        await self.storage.update_competency_matrix_item_publish_status(
+            item_id=self.factory.core.hex_id(2),
+            publish_status=PublishStatusEnum.PUBLISHED,
+        )
+        await self.storage.update_sheet_priorities(
+            params=CompetencyMatrixSheetPriorityUpdateParams(
+                ordered_ids=(self.factory.core.hex_id(2), self.factory.core.hex_id(1)),
+            ),
+        )
+
+        items = await self.storage.list_competency_matrix_items(
+            filters=CompetencyMatrixItemFilters(sheet_key=None, only_published=True),
+        )
+        assert await self.storage.list_sheets() == self.factory.core.sheets(
+            values=["SQL", "Python"],
+        )
+        assert self.collections.slugs(items) == ["2", "1"]
+        assert items[0].structure.sheet_key == "sql"
+        assert items[0].structure.subsection_en == "Async"
+
     async def test_get_item_structure_by_subsection_id(self) -> None:
         structure = await self.storage.get_item_structure_by_subsection_id(
             subsection_id=self.factory.core.hex_id(1),
@@ -488,6 +525,30 @@ class TestCompetencyMatrixStorage(StorageTestCase):
         assert items[0].subsection == "Async"
         assert items[0].missing_fields == (CompetencyMatrixMissingFieldEnum.ANSWER_EN,)
 
+        second_page_filters = CompetencyMatrixWorkspaceFilters(
+            page=2,
+            page_size=2,
+            language=LanguageEnum.EN,
+            sort=CompetencyMatrixWorkspaceSortEnum.DANGEROUS_PUBLISHED,
+            search_query="Python",
+            sheet_keys=("python",),
+            sections=("Basics",),
+        )
+        second_page = await self.storage.list_competency_matrix_workspace_page(
+            filters=second_page_filters,
+        )
+        (
+            _items,
+            past_end_total,
+            past_end_summary,
+        ) = await self.storage.list_competency_matrix_workspace_items(
+            filters=replace(second_page_filters, page=3),
+        )
+
+        assert self.collections.slugs(second_page) == ["missing-draft-python"]
+        assert past_end_total == 3
+        assert past_end_summary == summary
+
     async def test_list_workspace_items_supports_filters_and_all_sorts(self) -> None:
         await self.storage_helper.create_competency_matrix_items(
             items=[
@@ -110,6 +110,26 @@ class TestFilesDatabaseStorage(StorageTestCase):
         assert await self.storage.file_has_usages(file_id=cover.id)
         assert await self.storage.file_has_usages(file_id=content.id)
         assert not await self.storage.file_has_usages(file_id=unused.id)
+        assert await self.storage.list_file_ids_with_usages(
+            file_ids=frozenset({cover.id, content.id, unused.id}),
+        ) == frozenset({cover.id, content.id})
+        assert await self.storage.list_file_ids_with_usages(file_ids=frozenset()) == frozenset()
+
+    async def test_delete_files_removes_only_requested_rows(self) -> None:
+        files = [
+            self.factory.core.stored_file(file_id=20 + number, relative_path=f"bulk/{number}")
+            for number in range(3)
+        ]
+        for file in files:
+            await self.storage.create_file(file=file)
+
+        await self.storage.delete_files(file_ids=frozenset({files[0].id, files[2].id}))
+        await self.storage.delete_files(file_ids=frozenset())
+
+        assert await self.storage.get_file(file_id=files[1].id) == files[1]
+        for file in (files[0], files[2]):
+            with pytest.raises(EntryNotFoundError):
+                await self.storage.get_file(file_id=file.id)
 
     async def test_find_file_by_original_sha256_is_scoped_by_namespace_and_purpose(self) -> None:
         original_sha256 = "a" * 64
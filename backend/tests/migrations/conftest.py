@@ -111,6 +111,20 @@ def migrated_to_0016() -> Generator[None]:
     downgrade(revision="base")
 
 
+@pytest.fixture
+def migrated_to_0017() -> Generator[None]:
+    migrate(revision="0017")
+    yield
+    downgrade(revision="base")
+
+
+@pytest.fixture
+def migrated_to_0019() -> Generator[None]:
+    migrate(revision="0019")
+    yield
+    downgrade(revision="base")
+
+
 @pytest.fixture
 def migration_asserts() -> AssertsHelper:
     return AssertsHelper()
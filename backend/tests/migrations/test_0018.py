@@ -0,0 +1,82 @@
+from typing import Any, cast
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infra.postgresql.utils import downgrade, migrate
+
+FILE_TABLE = "files__file_model"
+
+file_purpose_enum = postgresql.ENUM(
+    "ARTICLE_CONTENT_IMAGE",
+    "ARTICLE_COVER_IMAGE",
+    "ATTACHMENT",
+    name="file_purpose_enum",
+    create_type=False,
+)
+files = sa.table(
+    FILE_TABLE,
+    sa.column("id", sa.String()),
+    sa.column("purpose", file_purpose_enum),
+    sa.column("namespace", sa.String()),
+    sa.column("relative_path", sa.String()),
+    sa.column("mime_type", sa.String()),
+    sa.column("size_bytes", sa.Integer()),
+    sa.column("name", sa.String()),
+    sa.column("original_name", sa.String()),
+)
+
+
+async def file_columns(engine: AsyncEngine) -> set[str]:
+    async with engine.connect() as connection:
+        return await connection.run_sync(
+            lambda sync_connection: {
+                column["name"] for column in sa.inspect(sync_connection).get_columns(FILE_TABLE)
+            },
+        )
+
+
+class TestMigration0018:
+    async def test_upgrade_adds_empty_variants_to_existing_files(
+        self,
+        engine: AsyncEngine,
+        migrated_to_0017: None,
+    ) -> None:
+        _ = migrated_to_0017
+        file_id = "18000000000000000000000000000001"
+        async with engine.begin() as connection:
+            await connection.execute(
+                files.insert().values(
+                    id=file_id,
+                    purpose="ARTICLE_COVER_IMAGE",
+                    namespace="media",
+                    relative_path="covers/existing.webp",
+                    mime_type="image/webp",
+                    size_bytes=1,
+                    name="Existing cover",
+                    original_name="existing.png",
+                ),
+            )
+
+        migrate(revision="0018")
+
+        async with engine.connect() as connection:
+            variants = await connection.scalar(
+                sa.select(sa.column("variants", postgresql.JSONB()))
+                .select_from(sa.table(FILE_TABLE))
+                .where(sa.column("id") == file_id),
+            )
+        assert cast("list[Any]", variants) == []
+
+    async def test_downgrade_removes_variants_column(
+        self,
+        engine: AsyncEngine,
+        migrated_to_0017: None,
+    ) -> None:
+        _ = migrated_to_0017
+        migrate(revision="0018")
+
+        downgrade(revision="0017")
+
+        assert "variants" not in await file_columns(engine)
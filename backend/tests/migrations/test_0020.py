@@ -0,0 +1,194 @@
+from datetime import date
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infra.postgresql.utils import downgrade, migrate
+
+ARTICLE_TABLE = "articles__article_model"
+ARTICLE_FOLDER_TABLE = "articles__article_folder_model"
+DAILY_ANALYTICS_TABLE = "articles__article_daily_analytics_model"
+REACTION_TABLE = "articles__article_reaction_model"
+TOTALS_TABLE = "articles__article_analytics_totals_model"
+
+publish_status_enum = postgresql.ENUM(
+    "DRAFT",
+    "PUBLISHED",
+    name="publish_status_enum",
+    create_type=False,
+)
+source_category_enum = postgresql.ENUM(
+    "DIRECT",
+    "INTERNAL",
+    "SEARCH",
+    "SOCIAL",
+    "EXTERNAL",
+    "UNKNOWN",
+    name="article_view_source_category_enum",
+    create_type=False,
+)
+reaction_kind_enum = postgresql.ENUM(
+    "HEART",
+    "FIRE",
+    "THINKING",
+    "NEUTRAL",
+    "POOP",
+    name="article_reaction_kind_enum",
+    create_type=False,
+)
+article_folders = sa.table(
+    ARTICLE_FOLDER_TABLE,
+    sa.column("id", sa.String()),
+    sa.column("key", sa.String()),
+    sa.column("name_ru", sa.String()),
+    sa.column("name_en", sa.String()),
+    sa.column("priority", sa.Integer()),
+)
+articles = sa.table(
+    ARTICLE_TABLE,
+    sa.column("id", sa.String()),
+    sa.column("title_ru", sa.String()),
+    sa.column("title_en", sa.String()),
+    sa.column("content_ru", sa.String()),
+    sa.column("content_en", sa.String()),
+    sa.column("slug", sa.String()),
+    sa.column("folder_id", sa.String()),
+    sa.column("author_username", sa.String()),
+    sa.column("publish_status", publish_status_enum),
+)
+daily_analytics = sa.table(
+    DAILY_ANALYTICS_TABLE,
+    sa.column("article_id", sa.String()),
+    sa.column("date", sa.Date()),
+    sa.column("source_category", source_category_enum),
+    sa.column("view_count", sa.Integer()),
+    sa.column("engaged_view_count", sa.Integer()),
+)
+reactions = sa.table(
+    REACTION_TABLE,
+    sa.column("article_id", sa.String()),
+    sa.column("article_scoped_voter_hash", sa.String()),
+    sa.column("reaction_kind", reaction_kind_enum),
+)
+totals = sa.table(
+    TOTALS_TABLE,
+    sa.column("article_id", sa.String()),
+    sa.column("view_count", sa.BigInteger()),
+    sa.column("engaged_view_count", sa.BigInteger()),
+    sa.column("heart_count", sa.Integer()),
+    sa.column("fire_count", sa.Integer()),
+    sa.column("thinking_count", sa.Integer()),
+    sa.column("neutral_count", sa.Integer()),
+    sa.column("poop_count", sa.Integer()),
+)
+
+
+class TestMigration0020:
+    async def test_upgrade_backfills_totals_for_every_article(
+        self,
+        engine: AsyncEngine,
+        migrated_to_0019: None,
+    ) -> None:
+        _ = migrated_to_0019
+        folder_id = "20000000000000000000000000000001"
+        article_id = "20000000000000000000000000000002"
+        quiet_article_id = "20000000000000000000000000000003"
+        async with engine.begin() as connection:
+            await connection.execute(
+                article_folders.insert().values(
+                    id=folder_id,
+                    key="migration-0020",
+                    name_ru="Миграция",
+                    name_en="Migration",
+                    priority=20,
+                ),
+            )
+            await connection.execute(
+                articles.insert(),
+                [
+                    {
+                        "id": current_article_id,
+                        "title_ru": "Статья",
+                        "title_en": "Article",
+                        "content_ru": "Содержимое",
+                        "content_en": "Content",
+                        "slug": slug,
+                        "folder_id": folder_id,
+                        "author_username": "owner",
+                        "publish_status": "PUBLISHED",
+                    }
+                    for current_article_id, slug in (
+                        (article_id, "migration-0020"),
+                        (quiet_article_id, "migration-0020-quiet"),
+                    )
+                ],
+            )
+            await connection.execute(
+                daily_analytics.insert(),
+                [
+                    {
+                        "article_id": article_id,
+                        "date": date(2026, 1, 2),
+                        "source_category": "DIRECT",
+                        "view_count": 3,
+                        "engaged_view_count": 1,
+                    },
+                    {
+                        "article_id": article_id,
+                        "date": date(2026, 1, 3),
+                        "source_category": "SEARCH",
+                        "view_count": 4,
+                        "engaged_view_count": 2,
+                    },
+                ],
+            )
+            await connection.execute(
+                reactions.insert(),
+                [
+                    {
+                        "article_id": article_id,
+                        "article_scoped_voter_hash": f"voter-{index}",
+                        "reaction_kind": reaction_kind,
+                    }
+                    for index, reaction_kind in enumerate(("HEART", "HEART", "POOP"))
+                ],
+            )
+
+        migrate(revision="0020")
+
+        async with engine.connect() as connection:
+            result = await connection.execute(sa.select(totals))
+            rows: dict[str, dict[str, Any]] = {
+                row["article_id"]: dict(row) for row in result.mappings()
+            }
+
+        assert rows[article_id] == {
+            "article_id": article_id,
+            "view_count": 7,
+            "engaged_view_count": 3,
+            "heart_count": 2,
+            "fire_count": 0,
+            "thinking_count": 0,
+            "neutral_count": 0,
+            "poop_count": 1,
+        }
+        assert rows[quiet_article_id]["view_count"] == 0
+        assert rows[quiet_article_id]["heart_count"] == 0
+
+    async def test_downgrade_removes_totals_table(
+        self,
+        engine: AsyncEngine,
+        migrated_to_0019: None,
+    ) -> None:
+        _ = migrated_to_0019
+        migrate(revision="0020")
+
+        downgrade(revision="0019")
+
+        async with engine.connect() as connection:
+            table_names = await connection.run_sync(
+                lambda sync_connection: sa.inspect(sync_connection).get_table_names(),
+            )
+        assert TOTALS_TABLE not in table_names
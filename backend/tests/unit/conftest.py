@@ -27,6 +27,7 @@ from tests.unit.mocks.providers.general import MockGeneralProvider
 from tests.unit.mocks.providers.healthcheck import MockHealthcheckProvider
 from tests.unit.mocks.providers.knowledge import MockKnowledgeProvider
 from tests.unit.mocks.providers.resumes import MockResumesProvider
+from tests.unit.mocks.providers.sitemaps import MockSitemapsProvider
 from tests.unit.mocks.providers.wiki_links import MockWikiLinksProvider
 
 
@@ -76,6 +77,7 @@ async def container(  # noqa: PLR0913
         MockCacheToolsProvider(),
         MockWikiLinksProvider(),
         MockHealthcheckProvider(),
+        MockSitemapsProvider(),
     )
     yield container
     await container.close()
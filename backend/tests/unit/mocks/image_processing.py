@@ -0,0 +1,20 @@
+import pickle
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import cast
+
+from infra.files.image_processing_pool import ImageProcessingPool
+
+
+@dataclass
+class InlineImageProcessingPool:
+    jobs: list[Callable[[], object]] = field(default_factory=list)
+
+    async def run[ResultT](self, job: Callable[[], ResultT]) -> ResultT:
+        # Jobs and results travel through pickle just like they do across the process boundary.
+        worker_job = cast("Callable[[], ResultT]", pickle.loads(pickle.dumps(job)))  # noqa: S301
+        self.jobs.append(worker_job)
+        return cast("ResultT", pickle.loads(pickle.dumps(worker_job())))  # noqa: S301
+
+    def as_pool(self) -> ImageProcessingPool:
+        return cast("ImageProcessingPool", self)
@@ -5,7 +5,7 @@ from dishka import Provider, Scope, provide
 
 from core.files.clients import FileClient
 from core.files.file_name_generators import FileNameGenerator
-from core.files.services import FileService
+from core.files.services import FileDirectUploadService, FileService, FileVariantService
 from core.files.storages import FileStorage
 from infra.s3.clients import S3ClientBundle
 
@@ -44,3 +44,11 @@ class MockFilesProvider(Provider):
     @provide(scope=Scope.APP)
     async def provide_file_service(self) -> FileService:
         return Mock(spec=FileService)
+
+    @provide(scope=Scope.APP)
+    async def provide_file_variant_service(self) -> FileVariantService:
+        return Mock(spec=FileVariantService)
+
+    @provide(scope=Scope.APP)
+    async def provide_file_direct_upload_service(self) -> FileDirectUploadService:
+        return Mock(spec=FileDirectUploadService)
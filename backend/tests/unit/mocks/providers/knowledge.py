@@ -7,7 +7,10 @@ from core.knowledge.files.clients import (
     KnowledgeFileObjectCleaner,
     KnowledgeFileRollbackRegistrar,
 )
-from core.knowledge.files.use_cases import KnowledgeFilesUseCase
+from core.knowledge.files.use_cases import (
+    KnowledgeAttachmentDirectUploadUseCase,
+    KnowledgeFilesUseCase,
+)
 from core.knowledge.items.use_cases import KnowledgeTagsUseCase
 from core.knowledge.people.use_cases import (
     PeopleUseCase,
@@ -20,6 +23,12 @@ class MockKnowledgeProvider(Provider):
     async def provide_knowledge_files_use_case(self) -> KnowledgeFilesUseCase:
         return Mock(spec=KnowledgeFilesUseCase)
 
+    @provide(scope=Scope.APP)
+    async def provide_knowledge_attachment_direct_upload_use_case(
+        self,
+    ) -> KnowledgeAttachmentDirectUploadUseCase:
+        return Mock(spec=KnowledgeAttachmentDirectUploadUseCase)
+
     @provide(scope=Scope.APP)
     async def provide_knowledge_file_object_cleaner(self) -> KnowledgeFileObjectCleaner:
         return Mock(spec=KnowledgeFileObjectCleaner)
@@ -0,0 +1,16 @@
+from unittest.mock import Mock
+
+from dishka import Provider, Scope, provide
+
+from core.sitemaps.storages import SitemapStorage
+from entrypoints.litestar.public.sitemaps import SitemapPublisher
+
+
+class MockSitemapsProvider(Provider):
+    sitemap_publisher = provide(SitemapPublisher, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.APP)
+    async def provide_sitemap_storage(self) -> SitemapStorage:
+        mock = Mock(spec=SitemapStorage)
+        mock.get_document.return_value = None
+        return mock
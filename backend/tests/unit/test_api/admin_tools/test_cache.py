@@ -94,7 +94,13 @@ class TestAdminToolsCacheAPI(ApiTestCase):
                 "operationId": "previous-operation",
                 "status": "succeeded",
                 "queuedAt": "2026-07-16T12:00:00Z",
-                "summary": {"attempted": 8, "written": 8, "skipped": 0},
+                "summary": {
+                    "attempted": 8,
+                    "written": 8,
+                    "skipped": 0,
+                    "collectMs": 0,
+                    "writeMs": 0,
+                },
             },
         }
         self.use_case.get_status.assert_awaited_once_with(policy=self.policy)
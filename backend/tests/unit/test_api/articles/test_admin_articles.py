@@ -12,7 +12,11 @@ from core.articles.schemas import (
 )
 from core.enums import PublishStatusEnum
 from core.i18n.enums import LanguageEnum
-from entrypoints.litestar.response_cache import ResponseCacheDomain
+from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
+    ResponseCacheDomain,
+)
 from tests.test_cases import ApiTestCase
 from tests.unit.mocks.providers.auth import test_current_datetime
 
@@ -342,15 +346,18 @@ class TestAdminArticlesAPI(ApiTestCase):
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         invalidated_domains: list[ResponseCacheDomain] = []
+        invalidated_dependencies: list[ResponseCacheDependencies | None] = []
 
         async def fake_invalidate_response_cache_domain_for_mutation(
             *,
             request: object,
             domain: ResponseCacheDomain,
             post_commit_actions: object,
+            dependencies: ResponseCacheDependencies | None = None,
         ) -> None:
             _ = request, post_commit_actions
             invalidated_domains.append(domain)
+            invalidated_dependencies.append(dependencies)
 
         monkeypatch.setattr(
             "entrypoints.litestar.api.articles.endpoints.invalidate_response_cache_domain_for_mutation",
@@ -405,15 +412,18 @@ class TestAdminArticlesAPI(ApiTestCase):
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         invalidated_domains: list[ResponseCacheDomain] = []
+        invalidated_dependencies: list[ResponseCacheDependencies | None] = []
 
         async def fake_invalidate_response_cache_domain_for_mutation(
             *,
             request: object,
             domain: ResponseCacheDomain,
             post_commit_actions: object,
+            dependencies: ResponseCacheDependencies | None = None,
         ) -> None:
             _ = request, post_commit_actions
             invalidated_domains.append(domain)
+            invalidated_dependencies.append(dependencies)
 
         monkeypatch.setattr(
             "entrypoints.litestar.api.articles.endpoints.invalidate_response_cache_domain_for_mutation",
@@ -463,3 +473,18 @@ class TestAdminArticlesAPI(ApiTestCase):
             codes.NO_CONTENT,
         ]
         assert invalidated_domains == [ResponseCacheDomain.ARTICLES] * 5
+        assert [
+            dependencies.article_slugs if dependencies is not None else None
+            for dependencies in invalidated_dependencies
+        ] == [
+            frozenset({"new-article"}),
+            frozenset({"old-article", "updated-article"}),
+            frozenset({"updated-article"}),
+            frozenset({"draft-article"}),
+            frozenset({"published-article"}),
+        ]
+        assert all(
+            dependencies is not None
+            and ResponseCacheCollection.ARTICLE_LIST in dependencies.collections
+            for dependencies in invalidated_dependencies
+        )
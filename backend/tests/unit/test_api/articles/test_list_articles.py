@@ -1,9 +1,11 @@
-from datetime import date
+from dataclasses import replace
+from datetime import UTC, date, datetime
 
 import pytest_asyncio
 from httpx import codes
 
-from core.articles.schemas import ArticleFilters, ArticlePublicStatsCollection
+from core.articles.exceptions import ArticleCursorInvalidError
+from core.articles.schemas import ArticleCursor, ArticleFilters, ArticlePublicStatsCollection
 from core.auth.enums import RoleEnum
 from core.auth.exceptions import UnauthorizedError
 from core.auth.schemas import JwtUser
@@ -116,6 +118,7 @@ class TestListArticlesAPI(ApiTestCase):
         assert response.json() == {
             "totalCount": 1,
             "totalPages": 1,
+            "nextCursor": None,
             "articles": [
                 {
                     "id": str(article.id),
@@ -225,6 +228,58 @@ class TestListArticlesAPI(ApiTestCase):
             ),
         )
 
+    def test_list_articles_forwards_cursor_and_returns_next_cursor(self) -> None:
+        cursor = ArticleCursor(
+            search_rank=None,
+            is_published=True,
+            published_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+            updated_at=datetime(2026, 1, 3, 3, 4, 5, tzinfo=UTC),
+            title="Typed articles",
+            article_id=self.factory.core.hex_id(1),
+        )
+        next_cursor = replace(
+            cursor, title="Untyped articles", article_id=self.factory.core.hex_id(2)
+        )
+        self.use_case.list_articles.return_value = self.factory.core.article_list(
+            articles=[],
+            total_count=None,
+            total_pages=None,
+            next_cursor=next_cursor,
+        )
+
+        response = self.api.get_articles(
+            page=1,
+            page_size=10,
+            cursor=cursor.encode(),
+            include_count=False,
+        )
+
+        assert response.status_code == codes.OK, response.content
+        assert response.json() == {
+            "totalCount": None,
+            "totalPages": None,
+            "nextCursor": next_cursor.encode(),
+            "articles": [],
+        }
+        self.use_case.list_articles.assert_called_once_with(
+            filters=ArticleFilters(
+                page=1,
+                page_size=10,
+                cursor=cursor,
+                include_count=False,
+                language=LanguageEnum.RU,
+                only_published=True,
+                include_tags=True,
+            ),
+        )
+
+    def test_list_articles_rejects_malformed_cursor(self) -> None:
+        response = self.api.get_articles(page=1, page_size=10, cursor="not-a-cursor")
+
+        assert response.status_code == codes.BAD_REQUEST
+        assert response.json()["message"] == ArticleCursorInvalidError.message
+        self.use_case.list_articles.assert_not_called()
+
     def test_list_articles_requires_explicit_page(self) -> None:
         response = self.api.get_articles(page=None, page_size=10)
 
@@ -5,7 +5,11 @@ from httpx import codes
 from core.articles.schemas import TagCreateParams, TagUpdateParams
 from core.auth.exceptions import UnauthorizedError
 from core.i18n.enums import LanguageEnum
-from entrypoints.litestar.response_cache import ResponseCacheDomain
+from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
+    ResponseCacheDomain,
+)
 from tests.test_cases import ApiTestCase
 
 
@@ -210,15 +214,18 @@ class TestTagsAPI(ApiTestCase):
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         invalidated_domains: list[ResponseCacheDomain] = []
+        invalidated_dependencies: list[ResponseCacheDependencies | None] = []
 
         async def fake_invalidate_response_cache_domain_for_mutation(
             *,
             request: object,
             domain: ResponseCacheDomain,
             post_commit_actions: object,
+            dependencies: ResponseCacheDependencies | None = None,
         ) -> None:
             _ = request, post_commit_actions
             invalidated_domains.append(domain)
+            invalidated_dependencies.append(dependencies)
 
         monkeypatch.setattr(
             "entrypoints.litestar.api.articles.endpoints.invalidate_response_cache_domain_for_mutation",
@@ -245,3 +252,16 @@ class TestTagsAPI(ApiTestCase):
             codes.NO_CONTENT,
         ]
         assert invalidated_domains == [ResponseCacheDomain.ARTICLES] * 3
+        assert invalidated_dependencies == [
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+                tag_ids=frozenset({"00000000000040008000000000000003"}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_TAGS}),
+                tag_ids=frozenset({"00000000000040008000000000000003"}),
+            ),
+        ]
@@ -4,7 +4,11 @@ from httpx import codes
 
 from core.competency_matrix.exceptions import CompetencyMatrixStructurePriorityInvalidError
 from core.enums import PublishStatusEnum
-from entrypoints.litestar.response_cache import ResponseCacheDomain
+from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
+    ResponseCacheDomain,
+)
 from tests.test_cases import ApiTestCase
 
 
@@ -18,15 +22,18 @@ class TestCompetencyMatrixResponseCacheInvalidation(ApiTestCase):
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         invalidated_domains: list[ResponseCacheDomain] = []
+        invalidated_dependencies: list[ResponseCacheDependencies | None] = []
 
         async def fake_invalidate_response_cache_domain_for_mutation(
             *,
             request: object,
             domain: ResponseCacheDomain,
             post_commit_actions: object,
+            dependencies: ResponseCacheDependencies | None = None,
         ) -> None:
             _ = request, post_commit_actions
             invalidated_domains.append(domain)
+            invalidated_dependencies.append(dependencies)
 
         monkeypatch.setattr(
             "entrypoints.litestar.api.competency_matrix.endpoints.invalidate_response_cache_domain_for_mutation",
@@ -36,6 +43,7 @@ class TestCompetencyMatrixResponseCacheInvalidation(ApiTestCase):
         self.use_case.create_item.return_value = self.factory.core.competency_matrix_item(
             item_id=1,
             publish_status=PublishStatusEnum.DRAFT,
+            sheet_key="Python",
         )
         self.use_case.update_item.return_value = self.factory.core.competency_matrix_item(
             item_id=1,
@@ -75,21 +83,68 @@ class TestCompetencyMatrixResponseCacheInvalidation(ApiTestCase):
             codes.NO_CONTENT,
         ]
         assert invalidated_domains == [ResponseCacheDomain.COMPETENCY_MATRIX] * 9
+        created_item = self.use_case.create_item.return_value
+        queued_item = self.use_case.create_item_from_queue.return_value
+        updated_item = self.use_case.update_item.return_value
+        item_id = self.factory.core.hex_id(1)
+        assert invalidated_dependencies == [
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({created_item.id}),
+                matrix_sheet_keys=frozenset({"python"}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({queued_item.id}),
+                matrix_sheet_keys=frozenset({queued_item.sheet_key.lower()}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({updated_item.id}),
+                matrix_sheet_keys=frozenset({updated_item.sheet_key.lower()}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({item_id}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset(
+                    {ResponseCacheCollection.MATRIX_ITEMS, ResponseCacheCollection.MATRIX_SHEETS},
+                ),
+                matrix_item_ids=frozenset({item_id}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+                matrix_item_ids=frozenset({item_id}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_SHEETS}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_ITEMS}),
+            ),
+            ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.MATRIX_ITEMS}),
+            ),
+        ]
 
     def test_item_validation_error_does_not_schedule_matrix_cache_invalidation(
         self,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         invalidated_domains: list[ResponseCacheDomain] = []
+        invalidated_dependencies: list[ResponseCacheDependencies | None] = []
 
         async def fake_invalidate_response_cache_domain_for_mutation(
             *,
             request: object,
             domain: ResponseCacheDomain,
             post_commit_actions: object,
+            dependencies: ResponseCacheDependencies | None = None,
         ) -> None:
             _ = request, post_commit_actions
             invalidated_domains.append(domain)
+            invalidated_dependencies.append(dependencies)
 
         monkeypatch.setattr(
             "entrypoints.litestar.api.competency_matrix.endpoints.invalidate_response_cache_domain_for_mutation",
@@ -110,15 +165,18 @@ class TestCompetencyMatrixResponseCacheInvalidation(ApiTestCase):
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         invalidated_domains: list[ResponseCacheDomain] = []
+        invalidated_dependencies: list[ResponseCacheDependencies | None] = []
 
         async def fake_invalidate_response_cache_domain_for_mutation(
             *,
             request: object,
             domain: ResponseCacheDomain,
             post_commit_actions: object,
+            dependencies: ResponseCacheDependencies | None = None,
         ) -> None:
             _ = request, post_commit_actions
             invalidated_domains.append(domain)
+            invalidated_dependencies.append(dependencies)
 
         monkeypatch.setattr(
             "entrypoints.litestar.api.competency_matrix.endpoints.invalidate_response_cache_domain_for_mutation",
@@ -1,23 +1,46 @@
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
 import pytest_asyncio
 from httpx import codes
 
 from core.auth.enums import RoleEnum
 from core.auth.schemas import JwtUser
 from core.files.enums import FilePurpose
-from core.files.schemas import FileUpdateParams, FileUploadParams
+from core.files.exceptions import DirectUploadVerificationError
+from core.files.schemas import (
+    CompletedUploadPart,
+    DirectUploadParams,
+    DirectUploadStart,
+    FileUpdateParams,
+    FileUploadParams,
+    FileVariantRead,
+    UploadContent,
+    UploadPartUrl,
+)
+from entrypoints.litestar.api.files.endpoints import enqueue_file_variants
 from entrypoints.litestar.api.files.schemas import FileUploadRequestSchema
 from entrypoints.litestar.api.schemas import CamelCaseSchema
+from infra.post_commit_actions import PostCommitActions
 from tests.test_cases import ApiTestCase
 from tests.unit.mocks.providers.auth import test_current_datetime
 
 
 class TestAdminFilesAPI(ApiTestCase):
+    @pytest.fixture(autouse=True)
+    def post_commit_actions_add(self) -> Iterator[Mock]:
+        with patch.object(PostCommitActions, "add") as post_commit_actions_add:
+            self.post_commit_actions_add = post_commit_actions_add
+            yield post_commit_actions_add
+
     @pytest_asyncio.fixture(autouse=True)
     async def setup(self, jwt_user: JwtUser, jwt_admin: JwtUser) -> None:
         self.user = jwt_user
         self.admin = jwt_admin
         self.authentication_use_case = await self.container.get_auth_use_case()
         self.use_case = await self.container.get_file_service()
+        self.direct_upload_service = await self.container.get_file_direct_upload_service()
         self.id_generator = await self.container.get_hex_uuid_id_generator()
         self.file_id = self.id_generator.get_next()
         self.file = self.factory.core.stored_file(
@@ -97,9 +120,14 @@ class TestAdminFilesAPI(ApiTestCase):
                 "https://cdn.example.test/media/article-cover-images/file.png"
                 f"#fileId={self.file_id}"
             ),
+            "variants": [],
             "createdAt": "2026-07-03T10:00:00Z",
             "updatedAt": "2026-07-03T10:00:00Z",
         }
+        self.post_commit_actions_add.assert_called_once()
+        action = self.post_commit_actions_add.call_args.kwargs["action"]
+        assert action.func is enqueue_file_variants
+        assert action.keywords == {"file_id": self.file_id}
         self.use_case.upload_file.assert_called_once_with(
             params=FileUploadParams(
                 id=self.file_id,
@@ -107,11 +135,61 @@ class TestAdminFilesAPI(ApiTestCase):
                 name="Cover",
                 original_name="cover.png",
                 mime_type="image/png",
-                content=b"data",
+                content=UploadContent.from_bytes(b"data"),
             ),
             current_datetime=test_current_datetime,
         )
 
+    def test_upload_file_does_not_enqueue_variants_for_attachments(self) -> None:
+        self.authentication_use_case.authenticate.return_value = self.admin
+        self.use_case.upload_file.return_value = self.factory.core.file_read(
+            file=self.factory.core.stored_file(
+                file_id=self.file_id,
+                purpose=FilePurpose.ATTACHMENT,
+                relative_path="attachments/file.pdf",
+                mime_type="application/pdf",
+            ),
+        )
+
+        response = self.api.post_admin_file(
+            purpose=FilePurpose.ATTACHMENT.value,
+            name="Attachment",
+            filename="file.pdf",
+            content=b"data",
+            content_type="application/pdf",
+        )
+
+        assert response.status_code == codes.CREATED, response.content
+        self.post_commit_actions_add.assert_not_called()
+
+    def test_get_file_exposes_responsive_variants(self) -> None:
+        self.authentication_use_case.authenticate.return_value = self.admin
+        variant = self.factory.core.file_variant(
+            relative_path="article-cover-images/file-640w.webp",
+        )
+        self.use_case.get_file.return_value = self.factory.core.file_read(
+            file=self.factory.core.stored_file(file_id=self.file_id, variants=(variant,)),
+            variants=(
+                FileVariantRead(
+                    variant=variant,
+                    access_url="https://cdn.example.test/media/article-cover-images/file-640w.webp",
+                ),
+            ),
+        )
+
+        response = self.api.get_admin_file(file_id=self.file_id)
+
+        assert response.status_code == codes.OK, response.content
+        assert response.json()["variants"] == [
+            {
+                "widthPx": 640,
+                "heightPx": 360,
+                "mimeType": "image/webp",
+                "sizeBytes": 3,
+                "accessUrl": "https://cdn.example.test/media/article-cover-images/file-640w.webp",
+            },
+        ]
+
     def test_list_files_maps_purpose_filter(self) -> None:
         self.authentication_use_case.authenticate.return_value = self.admin
         self.use_case.list_files.return_value = [self.file_read]
@@ -154,3 +232,104 @@ class TestAdminFilesAPI(ApiTestCase):
 
         assert response.status_code == codes.NO_CONTENT, response.content
         self.use_case.delete_file.assert_called_once_with(file_id=self.file_id)
+
+    def test_start_direct_upload_returns_presigned_parts(self) -> None:
+        self.authentication_use_case.authenticate.return_value = self.admin
+        direct_upload_service = self.direct_upload_service
+        direct_upload_service.start_upload.return_value = DirectUploadStart(
+            session_id=self.file_id,
+            part_size_bytes=16,
+            parts=(UploadPartUrl(part_number=1, url="https://files.example.test/part-1"),),
+            expires_at=test_current_datetime,
+        )
+
+        response = self.api.post_admin_file_upload(
+            data={
+                "purpose": "attachment",
+                "name": "Dataset",
+                "originalName": "dataset.zip",
+                "mimeType": "application/zip",
+                "sizeBytes": 10,
+                "sha256": "A" * 64,
+            },
+        )
+
+        assert response.status_code == codes.CREATED, response.content
+        assert response.json() == {
+            "sessionId": self.file_id,
+            "partSizeBytes": 16,
+            "parts": [{"partNumber": 1, "url": "https://files.example.test/part-1"}],
+            "expiresAt": "2026-07-08T11:30:00Z",
+        }
+        direct_upload_service.start_upload.assert_called_once_with(
+            session_id=self.file_id,
+            owner_username=self.admin.username,
+            purpose=FilePurpose.ATTACHMENT,
+            params=DirectUploadParams(
+                name="Dataset",
+                original_name="dataset.zip",
+                mime_type="application/zip",
+                size_bytes=10,
+                sha256="a" * 64,
+            ),
+            current_datetime=test_current_datetime,
+        )
+
+    def test_complete_direct_upload_orders_parts_and_returns_file(self) -> None:
+        self.authentication_use_case.authenticate.return_value = self.admin
+        direct_upload_service = self.direct_upload_service
+        direct_upload_service.complete_upload.return_value = self.file_read
+
+        response = self.api.post_admin_file_upload_complete(
+            session_id="session-id",
+            data={
+                "purpose": "attachment",
+                "parts": [
+                    {"partNumber": 2, "etag": '"second"'},
+                    {"partNumber": 1, "etag": '"first"'},
+                ],
+            },
+        )
+
+        assert response.status_code == codes.CREATED, response.content
+        assert response.json()["id"] == self.file_id
+        direct_upload_service.complete_upload.assert_called_once_with(
+            file_id=self.file_id,
+            session_id="session-id",
+            owner_username=self.admin.username,
+            purpose=FilePurpose.ATTACHMENT,
+            parts=(
+                CompletedUploadPart(part_number=1, etag='"first"'),
+                CompletedUploadPart(part_number=2, etag='"second"'),
+            ),
+            current_datetime=test_current_datetime,
+        )
+
+    def test_complete_direct_upload_reports_checksum_mismatch(self) -> None:
+        self.authentication_use_case.authenticate.return_value = self.admin
+        direct_upload_service = self.direct_upload_service
+        direct_upload_service.complete_upload.side_effect = DirectUploadVerificationError
+
+        response = self.api.post_admin_file_upload_complete(
+            session_id="session-id",
+            data={"purpose": "attachment", "parts": [{"partNumber": 1, "etag": '"first"'}]},
+        )
+
+        assert response.status_code == codes.BAD_REQUEST, response.content
+
+    def test_cancel_direct_upload_maps_session_and_purpose(self) -> None:
+        self.authentication_use_case.authenticate.return_value = self.admin
+        direct_upload_service = self.direct_upload_service
+
+        response = self.api.delete_admin_file_upload(
+            session_id="session-id",
+            purpose=FilePurpose.ATTACHMENT.value,
+        )
+
+        assert response.status_code == codes.NO_CONTENT, response.content
+        direct_upload_service.cancel_upload.assert_called_once_with(
+            session_id="session-id",
+            owner_username=self.admin.username,
+            purpose=FilePurpose.ATTACHMENT,
+            current_datetime=test_current_datetime,
+        )
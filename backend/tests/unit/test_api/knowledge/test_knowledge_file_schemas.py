@@ -2,6 +2,7 @@ import pytest
 from litestar.datastructures import UploadFile
 from pydantic import ValidationError
 
+from core.files.schemas import UploadContent
 from core.knowledge.files.enums import KnowledgeFileKind
 from core.knowledge.files.schemas import KnowledgeFileUploadParams
 from entrypoints.litestar.api.knowledge.files.schemas import (
@@ -68,9 +69,10 @@ async def test_attachment_schema_builds_bounded_domain_upload_params() -> None:
             name="Notes",
             original_name="private.txt",
             mime_type="text/plain",
-            content=b"private",
+            content=UploadContent.from_bytes(b"private"),
         )
-        assert upload_file.read_size == constants.knowledge_files.attachment_max_size_bytes + 1
+        assert upload_file.read_size == constants.files.upload_read_chunk_size_bytes
+        assert result.content.read() == b"private"
     finally:
         upload_file.file.close()
 
@@ -94,6 +96,6 @@ async def test_photo_schema_builds_domain_upload_params_with_filename_as_name()
         assert result.name == "portrait.png"
         assert result.original_name == "portrait.png"
         assert result.mime_type == "image/png"
-        assert result.content == b"png"
+        assert result.content.read() == b"png"
     finally:
         upload_file.file.close()
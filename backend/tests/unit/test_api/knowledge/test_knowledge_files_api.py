@@ -1,4 +1,5 @@
 from collections.abc import AsyncIterator
+from dataclasses import replace
 from datetime import UTC, datetime
 from functools import partial
 from unittest.mock import patch
@@ -7,9 +8,12 @@ import pytest
 import pytest_asyncio
 from httpx import codes
 
+from core.files.exceptions import DirectUploadSessionNotFoundError
+from core.files.schemas import CompletedUploadPart, DirectUploadStart, UploadPartUrl
 from core.knowledge.exceptions import KnowledgeFileNotFoundError
 from core.knowledge.files.enums import KnowledgeFileKind
 from core.knowledge.files.schemas import (
+    ByteRange,
     KnowledgeFile,
     KnowledgeFileContent,
     KnowledgeFileMutationResult,
@@ -31,6 +35,9 @@ class TestKnowledgeFilesApi(ApiTestCase):
         self.use_case = await self.container.get_knowledge_files_use_case()
         self.cleaner = await self.container.get_knowledge_file_object_cleaner()
         self.rollback_registrar = await self.container.get_knowledge_file_rollback_registrar()
+        self.direct_upload_use_case = (
+            await self.container.get_knowledge_attachment_direct_upload_use_case()
+        )
 
     def file(self, *, kind: KnowledgeFileKind) -> KnowledgeFile:
         return KnowledgeFile(
@@ -48,11 +55,21 @@ class TestKnowledgeFilesApi(ApiTestCase):
             updated_at=NOW,
         )
 
-    def test_attachment_content_is_author_checked_and_forced_to_download(self) -> None:
-        self.use_case.get_file_content.return_value = KnowledgeFileContent(
-            file=self.file(kind=KnowledgeFileKind.ATTACHMENT),
-            content=content_chunks(),
+    def serve(
+        self,
+        *,
+        kind: KnowledgeFileKind,
+        object_etag: str | None = '"object-etag"',
+    ) -> KnowledgeFile:
+        file = replace(self.file(kind=kind), object_etag=object_etag)
+        self.use_case.get_file.return_value = file
+        self.use_case.get_file_content.side_effect = lambda *, file, byte_range: (
+            KnowledgeFileContent(file=file, content=content_chunks(), byte_range=byte_range)
         )
+        return file
+
+    def test_attachment_content_is_author_checked_and_forced_to_download(self) -> None:
+        file = self.serve(kind=KnowledgeFileKind.ATTACHMENT)
 
         response = self.api.client.get(
             "/api/admin/knowledge/files/11111111111111111111111111111111/content",
@@ -64,16 +81,17 @@ class TestKnowledgeFilesApi(ApiTestCase):
         assert response.headers["content-disposition"].startswith("attachment;")
         assert response.headers["x-content-type-options"] == "nosniff"
         assert response.headers["cache-control"] == "no-store"
-        self.use_case.get_file_content.assert_awaited_once_with(
+        assert response.headers["etag"] == '"object-etag"'
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-length"] == "15"
+        self.use_case.get_file.assert_awaited_once_with(
             file_id="1" * 32,
             author_username="test",
         )
+        self.use_case.get_file_content.assert_called_once_with(file=file, byte_range=None)
 
-    def test_photo_content_is_inline_normalized_webp(self) -> None:
-        self.use_case.get_file_content.return_value = KnowledgeFileContent(
-            file=self.file(kind=KnowledgeFileKind.PERSON_PHOTO),
-            content=content_chunks(),
-        )
+    def test_photo_content_is_inline_normalized_webp_and_privately_cacheable(self) -> None:
+        self.serve(kind=KnowledgeFileKind.PERSON_PHOTO)
 
         response = self.api.client.get(
             "/api/admin/knowledge/files/11111111111111111111111111111111/content",
@@ -82,9 +100,118 @@ class TestKnowledgeFilesApi(ApiTestCase):
         self.asserts.status(response=response, expected_status=codes.OK)
         assert response.headers["content-type"] == "image/webp"
         assert response.headers["content-disposition"] == 'inline; filename="photo.webp"'
+        assert response.headers["cache-control"] == "private, max-age=31536000, immutable"
+
+    @pytest.mark.parametrize(
+        ("range_header", "expected_range", "expected_content_range"),
+        [
+            ("bytes=0-7", ByteRange(start=0, end=7), "bytes 0-7/15"),
+            ("bytes=8-", ByteRange(start=8, end=14), "bytes 8-14/15"),
+            ("bytes=-7", ByteRange(start=8, end=14), "bytes 8-14/15"),
+            ("bytes=10-99", ByteRange(start=10, end=14), "bytes 10-14/15"),
+        ],
+    )
+    def test_range_request_returns_partial_content(
+        self,
+        range_header: str,
+        expected_range: ByteRange,
+        expected_content_range: str,
+    ) -> None:
+        file = self.serve(kind=KnowledgeFileKind.ATTACHMENT)
+
+        response = self.api.client.get(
+            "/api/admin/knowledge/files/11111111111111111111111111111111/content",
+            headers={"Range": range_header},
+        )
+
+        self.asserts.status(response=response, expected_status=codes.PARTIAL_CONTENT)
+        assert response.headers["content-range"] == expected_content_range
+        assert response.headers["content-length"] == str(expected_range.length)
+        assert response.headers["etag"] == '"object-etag"'
+        self.use_case.get_file_content.assert_called_once_with(
+            file=file,
+            byte_range=expected_range,
+        )
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Range": "bytes=0-1,4-5"},
+            {"Range": "items=0-1"},
+            {"Range": "bytes=5-1"},
+            {"Range": "bytes=0-1", "If-Range": '"stale-etag"'},
+            {"Range": "bytes=0-1", "If-Range": "Wed, 21 Oct 2026 07:28:00 GMT"},
+        ],
+    )
+    def test_unusable_or_stale_range_falls_back_to_full_content(
+        self,
+        headers: dict[str, str],
+    ) -> None:
+        file = self.serve(kind=KnowledgeFileKind.ATTACHMENT)
+
+        response = self.api.client.get(
+            "/api/admin/knowledge/files/11111111111111111111111111111111/content",
+            headers=headers,
+        )
+
+        self.asserts.status(response=response, expected_status=codes.OK)
+        assert response.content == b"private-content"
+        self.use_case.get_file_content.assert_called_once_with(file=file, byte_range=None)
+
+    def test_matching_if_range_keeps_partial_content(self) -> None:
+        self.serve(kind=KnowledgeFileKind.ATTACHMENT)
+
+        response = self.api.client.get(
+            "/api/admin/knowledge/files/11111111111111111111111111111111/content",
+            headers={"Range": "bytes=0-1", "If-Range": '"object-etag"'},
+        )
+
+        self.asserts.status(response=response, expected_status=codes.PARTIAL_CONTENT)
+        assert response.headers["content-range"] == "bytes 0-1/15"
+
+    def test_range_beyond_end_is_not_satisfiable(self) -> None:
+        self.serve(kind=KnowledgeFileKind.ATTACHMENT)
+
+        response = self.api.client.get(
+            "/api/admin/knowledge/files/11111111111111111111111111111111/content",
+            headers={"Range": "bytes=15-"},
+        )
+
+        self.asserts.status(
+            response=response,
+            expected_status=codes.REQUESTED_RANGE_NOT_SATISFIABLE,
+        )
+        assert response.headers["content-range"] == "bytes */15"
+        self.use_case.get_file_content.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("object_etag", "if_none_match"),
+        [
+            ('"object-etag"', '"other", W/"object-etag"'),
+            (None, f'"{"1" * 32}"'),
+            ('"object-etag"', "*"),
+        ],
+    )
+    def test_matching_if_none_match_returns_not_modified_without_reading_object(
+        self,
+        object_etag: str | None,
+        if_none_match: str,
+    ) -> None:
+        self.serve(kind=KnowledgeFileKind.PERSON_PHOTO, object_etag=object_etag)
+
+        response = self.api.client.get(
+            "/api/admin/knowledge/files/11111111111111111111111111111111/content",
+            headers={"If-None-Match": if_none_match},
+        )
+
+        self.asserts.status(response=response, expected_status=codes.NOT_MODIFIED)
+        assert response.content == b""
+        assert response.headers["etag"] == (object_etag or f'"{"1" * 32}"')
+        assert response.headers["cache-control"] == "private, max-age=31536000, immutable"
+        self.use_case.get_file_content.assert_not_called()
 
     def test_foreign_file_is_indistinguishable_from_missing_file(self) -> None:
-        self.use_case.get_file_content.side_effect = KnowledgeFileNotFoundError
+        self.use_case.get_file.side_effect = KnowledgeFileNotFoundError
 
         response = self.api.client.get(
             "/api/admin/knowledge/files/11111111111111111111111111111111/content",
@@ -187,3 +314,55 @@ class TestKnowledgeFilesApi(ApiTestCase):
         action = add_action.call_args.kwargs["action"]
         assert isinstance(action, partial)
         assert action.keywords == {"object_names": (file.relative_path,)}
+
+    def test_attachment_direct_upload_start_returns_presigned_parts(self) -> None:
+        self.direct_upload_use_case.start_upload.return_value = DirectUploadStart(
+            session_id="3" * 32,
+            part_size_bytes=16,
+            parts=(UploadPartUrl(part_number=1, url="https://files.example.test/part-1"),),
+            expires_at=NOW,
+        )
+
+        response = self.api.client.post(
+            f"/api/admin/knowledge/items/{'2' * 32}/attachments/uploads",
+            json={
+                "name": "Recording",
+                "originalName": "recording.mp4",
+                "mimeType": "video/mp4",
+                "sizeBytes": 10,
+                "sha256": "a" * 64,
+            },
+        )
+
+        self.asserts.status(response=response, expected_status=codes.CREATED)
+        assert response.json()["sessionId"] == "3" * 32
+        assert response.headers["cache-control"] == "no-store"
+        kwargs = self.direct_upload_use_case.start_upload.await_args.kwargs
+        assert kwargs["item_id"] == "2" * 32
+        assert kwargs["author_username"] == "test"
+        assert kwargs["params"].size_bytes == 10
+
+    def test_attachment_direct_upload_complete_passes_rollback_registrar(self) -> None:
+        file = self.file(kind=KnowledgeFileKind.ATTACHMENT)
+        self.direct_upload_use_case.complete_upload.return_value = file
+
+        response = self.api.client.post(
+            f"/api/admin/knowledge/items/{file.item_id}/attachments/uploads/{'3' * 32}/complete",
+            json={"parts": [{"partNumber": 1, "etag": '"etag"'}]},
+        )
+
+        self.asserts.status(response=response, expected_status=codes.CREATED)
+        assert response.json()["contentPath"] == f"/api/admin/knowledge/files/{file.id}/content"
+        kwargs = self.direct_upload_use_case.complete_upload.await_args.kwargs
+        assert kwargs["session_id"] == "3" * 32
+        assert kwargs["parts"] == (CompletedUploadPart(part_number=1, etag='"etag"'),)
+        assert kwargs["rollback_registrar"] is self.rollback_registrar
+
+    def test_attachment_direct_upload_cancel_hides_foreign_sessions(self) -> None:
+        self.direct_upload_use_case.cancel_upload.side_effect = DirectUploadSessionNotFoundError
+
+        response = self.api.client.delete(
+            f"/api/admin/knowledge/items/{'2' * 32}/attachments/uploads/{'3' * 32}",
+        )
+
+        self.asserts.status(response=response, expected_status=codes.NOT_FOUND)
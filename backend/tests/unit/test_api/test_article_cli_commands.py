@@ -0,0 +1,36 @@
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from core.articles.use_cases import ArticleAnalyticsUseCase
+from entrypoints.litestar.cli.commands.articles import rebuild_article_stats_command
+
+
+class TestArticleCliCommands:
+    async def test_rebuild_article_stats_command_rebuilds_totals_in_request_scope(self) -> None:
+        providers = (Mock(),)
+        use_case = Mock(spec=ArticleAnalyticsUseCase)
+        use_case.rebuild_totals = AsyncMock(return_value=3)
+        request_container = Mock()
+        request_container.get = AsyncMock(return_value=use_case)
+        request_scope = MagicMock()
+        request_scope.__aenter__ = AsyncMock(return_value=request_container)
+        request_scope.__aexit__ = AsyncMock(return_value=None)
+        command_container = Mock(return_value=request_scope)
+        command_container.close = AsyncMock()
+
+        with (
+            patch(
+                "entrypoints.litestar.cli.commands.articles.get_providers",
+                return_value=providers,
+            ),
+            patch(
+                "entrypoints.litestar.cli.commands.articles.make_async_container",
+                return_value=command_container,
+            ) as make_async_container,
+        ):
+            await rebuild_article_stats_command()
+
+        make_async_container.assert_called_once_with(*providers)
+        request_container.get.assert_awaited_once_with(ArticleAnalyticsUseCase)
+        use_case.rebuild_totals.assert_awaited_once_with()
+        request_scope.__aexit__.assert_awaited_once()
+        command_container.close.assert_awaited_once_with()
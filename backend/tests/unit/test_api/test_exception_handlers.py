@@ -10,6 +10,7 @@ from verbose_http_exceptions import (
     ForbiddenHTTPException,
     InternalServerErrorHTTPException,
     NotFoundHTTPException,
+    ServiceUnavailableHTTPException,
     TooManyRequestsHTTPException,
     UnauthorizedHTTPException,
 )
@@ -30,10 +31,11 @@ from core.agent_access.exceptions import (
     MatrixQuestionDraftValidationError,
 )
 from core.articles.exceptions import (
+    ArticleCursorInvalidError,
     ArticleFolderAlreadyExistsError,
     ArticleFolderPriorityInvalidError,
 )
-from core.auth.exceptions import ForbiddenError, UnauthorizedError
+from core.auth.exceptions import ForbiddenError, PasswordHashingOverloadedError, UnauthorizedError
 from core.competency_matrix.exceptions import (
     CompetencyMatrixItemNotPublicReadyError,
     CompetencyMatrixStructureAlreadyExistsError,
@@ -48,6 +50,7 @@ from core.competency_matrix.exceptions import (
 from core.exceptions import DomainError, EntryNotFoundError
 from core.files.exceptions import FileClientInternalError, FileInUseError, InvalidFileDataError
 from core.knowledge.exceptions import InvalidKnowledgeDataError, KnowledgeConflictError
+from core.resumes.exceptions import ResumeExportOverloadedError
 from entrypoints.litestar import exception_handlers
 from entrypoints.litestar.exception_handlers import get_litestar_exception_handlers
 from infra.healthcheck import ReadinessCheckError
@@ -203,6 +206,8 @@ def test_domain_error_verbose_exception_mapping() -> None:
         EntryNotFoundError: NotFoundHTTPException,
         UnauthorizedError: UnauthorizedHTTPException,
         ForbiddenError: ForbiddenHTTPException,
+        PasswordHashingOverloadedError: ServiceUnavailableHTTPException,
+        ResumeExportOverloadedError: ServiceUnavailableHTTPException,
         AgentAuthenticationError: UnauthorizedHTTPException,
         AgentScopeDeniedError: ForbiddenHTTPException,
         AgentCertificateRequestError: BadRequestHTTPException,
@@ -225,6 +230,7 @@ def test_domain_error_verbose_exception_mapping() -> None:
         InvalidManagedAccountRoleError: BadRequestHTTPException,
         SelfAccountActionForbiddenError: ForbiddenHTTPException,
         ManagedAccountActionForbiddenError: ForbiddenHTTPException,
+        ArticleCursorInvalidError: BadRequestHTTPException,
         ArticleFolderAlreadyExistsError: BadRequestHTTPException,
         ArticleFolderPriorityInvalidError: BadRequestHTTPException,
         InvalidKnowledgeDataError: BadRequestHTTPException,
@@ -1,14 +1,25 @@
+import asyncio
+import gzip
+import hashlib
+import math
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import Mock, patch
 
 import click
+import msgspec
 import pytest
-from litestar.exceptions import ImproperlyConfiguredException
+from litestar import Litestar, get
+from litestar.config.response_cache import ResponseCacheConfig
+from litestar.exceptions import ImproperlyConfiguredException, NotFoundException
+from litestar.status_codes import HTTP_404_NOT_FOUND
 from litestar.stores.base import Store
+from litestar.testing import AsyncTestClient
 
 from core.cache_tools.enums import CacheDomainEnum
+from core.competency_matrix.schemas import CompetencyMatrixItems
 from entrypoints.litestar import response_cache as response_cache_module
 from entrypoints.litestar.api.articles.endpoints import (
     AdminArticlesApiController,
@@ -24,13 +35,30 @@ from entrypoints.litestar.api.resumes.endpoints import AdminResumesApiController
 from entrypoints.litestar.cli.commands.cache import invalidate_cache_command
 from entrypoints.litestar.cli.plugins import CLIPlugin
 from entrypoints.litestar.initializers import main as litestar_initializers
+from entrypoints.litestar.lifespan.main import listen_for_response_cache_invalidations
+from entrypoints.litestar.middlewares.response_cache import ResponseCacheRevalidationMiddleware
 from entrypoints.litestar.response_cache import (
+    ResponseCacheBatchWriter,
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
+    ResponseCacheDependencyIndex,
     ResponseCacheDomain,
     ResponseCacheDomainStore,
+    ResponseCacheEntry,
+    ResponseCacheExpiryIndex,
+    ResponseCacheInvalidation,
+    ResponseCacheInvalidationChannel,
+    ResponseCacheLocalTier,
+    ResponseCacheRevalidation,
+    ResponseCacheRevalidationLock,
+    ResponseCacheSingleFlight,
+    ResponseCacheValue,
     invalidate_response_cache_domain_for_mutation,
+    record_response_cache_dependencies,
 )
 from infra.config.constants import constants
 from infra.config.settings import settings
+from infra.ioc.prodivers.response_cache_warm_provider import ResponseCacheWarmProvider
 from infra.post_commit_actions import PostCommitActions
 
 
@@ -67,6 +95,152 @@ class FakeStore:
     async def expires_in(self, key: str) -> int | None:
         return 60 if key in self.values else None
 
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+@dataclass
+class BarrierStore(FakeStore):
+    barrier: asyncio.Barrier = field(default_factory=lambda: asyncio.Barrier(1))
+
+    async def delete_all(self) -> None:
+        async with asyncio.timeout(1):
+            await self.barrier.wait()
+        await super().delete_all()
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class FakeInvalidationChannel:
+    published: list[ResponseCacheInvalidation] = field(default_factory=list)
+    incoming: list[ResponseCacheInvalidation] = field(default_factory=list)
+
+    async def publish(self, *, invalidations: tuple[ResponseCacheInvalidation, ...]) -> None:
+        self.published.extend(invalidations)
+
+    async def listen(self) -> AsyncIterator[ResponseCacheInvalidation]:
+        for invalidation in self.incoming:
+            yield invalidation
+        self.incoming = []
+        msg = "subscription closed"
+        raise ConnectionError(msg)
+
+
+@dataclass
+class FakeRevalidationLock:
+    held_keys: set[str] = field(default_factory=set)
+    released_keys: list[str] = field(default_factory=list)
+
+    async def acquire(self, *, key: str) -> bool:
+        if key in self.held_keys:
+            return False
+        self.held_keys.add(key)
+        return True
+
+    async def release(self, *, key: str) -> None:
+        self.released_keys.append(key)
+        self.held_keys.discard(key)
+
+
+@dataclass
+class FakeDependencyPipeline:
+    valkey: FakeDependencyValkey
+    commands: list[tuple[str, tuple[Any, ...]]] = field(default_factory=list)
+
+    def mset(self, mapping: dict[str, bytes]) -> None:
+        self.commands.append(("mset", (mapping,)))
+
+    def sadd(self, key: str, *members: str) -> None:
+        self.commands.append(("sadd", (key, *members)))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.commands.append(("expire", (key, seconds)))
+
+    def sunion(self, keys: list[str]) -> None:
+        self.commands.append(("sunion", tuple(keys)))
+
+    def delete(self, *keys: str) -> None:
+        self.commands.append(("delete", keys))
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.commands.append(("zadd", (key, mapping)))
+
+    def zremrangebyscore(self, key: str, minimum: str, maximum: float) -> None:
+        self.commands.append(("zremrangebyscore", (key, minimum, maximum)))
+
+    async def execute(self) -> list[Any]:
+        self.valkey.executed_pipelines += 1
+        return [getattr(self.valkey, name)(*args) for name, args in self.commands]
+
+
+@dataclass
+class FakeDependencyValkey:
+    sets: dict[str, set[bytes]] = field(default_factory=dict)
+    expirations: dict[str, int] = field(default_factory=dict)
+    values: dict[str, bytes] = field(default_factory=dict)
+    sorted_sets: dict[str, dict[str, float]] = field(default_factory=dict)
+    executed_pipelines: int = 0
+
+    def pipeline(self, *, transaction: bool) -> FakeDependencyPipeline:
+        _ = transaction
+        return FakeDependencyPipeline(valkey=self)
+
+    def mset(self, mapping: dict[str, bytes]) -> bool:
+        self.values.update(mapping)
+        return True
+
+    def sadd(self, key: str, *members: str) -> int:
+        self.sets.setdefault(key, set()).update(member.encode() for member in members)
+        return len(members)
+
+    def expire(self, key: str, seconds: int) -> bool:
+        self.expirations[key] = seconds
+        return True
+
+    def sunion(self, *keys: str) -> set[bytes]:
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    def delete(self, *keys: str) -> int:
+        return sum(
+            self.sets.pop(key, None) is not None or self.sorted_sets.pop(key, None) is not None
+            for key in keys
+        )
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zremrangebyscore(self, key: str, minimum: str, maximum: float) -> int:
+        _ = minimum
+        members = self.sorted_sets.get(key, {})
+        expired = [member for member, score in members.items() if score <= maximum]
+        for member in expired:
+            del members[member]
+        return len(expired)
+
+    async def zrem(self, key: str, *members: str) -> int:
+        sorted_set = self.sorted_sets.get(key, {})
+        return sum(sorted_set.pop(member, None) is not None for member in members)
+
+    async def scan_iter(self, *, match: str, count: int) -> AsyncIterator[str]:
+        _ = count
+        for key in list(self.sets):
+            if key.startswith(match.removesuffix("*")):
+                yield key
+
+    async def unlink(self, *keys: str) -> int:
+        return self.delete(*keys)
+
 
 class FakeQueryParams:
     def __init__(self, values: dict[str, Any]) -> None:
@@ -85,6 +259,9 @@ class FakeRequest:
     url = FakeUrl()
     query_params = FakeQueryParams({"language": "ru", "page": "1"})
 
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        self.headers = headers or {}
+
 
 class FakeStores:
     def __init__(self, store: Store) -> None:
@@ -153,6 +330,865 @@ class TestResponseCacheDomainStore:
         assert i18n_store.values == {}
         assert articles_store.values == {}
 
+    async def test_clear_domains_deletes_domains_concurrently(self) -> None:
+        barrier = asyncio.Barrier(2)
+        i18n_store = BarrierStore(values={"GET/api/i18n/languages": b"i18n"}, barrier=barrier)
+        articles_store = BarrierStore(values={"GET/api/articles": b"articles"}, barrier=barrier)
+        channel = FakeInvalidationChannel()
+        store = ResponseCacheDomainStore(
+            stores={
+                ResponseCacheDomain.I18N: cast("Store", i18n_store),
+                ResponseCacheDomain.ARTICLES: cast("Store", articles_store),
+            },
+            invalidation_channel=cast("ResponseCacheInvalidationChannel", channel),
+        )
+
+        await store.clear_domains(
+            domains=(CacheDomainEnum.I18N, CacheDomainEnum.ARTICLES),
+        )
+
+        assert i18n_store.values == {}
+        assert articles_store.values == {}
+        assert channel.published == [
+            ResponseCacheInvalidation(domain=ResponseCacheDomain.I18N),
+            ResponseCacheInvalidation(domain=ResponseCacheDomain.ARTICLES),
+        ]
+
+
+class TestResponseCacheLocalTier:
+    def test_expires_entries_after_ttl(self) -> None:
+        clock = FakeClock()
+        tier = ResponseCacheLocalTier(max_entries=10, ttl_seconds=30, clock=clock)
+
+        tier.set(key="GET/api/articles", value=b"articles", expires_in=None)
+        clock.now = 29
+        assert tier.get(key="GET/api/articles") == b"articles"
+        clock.now = 30
+        assert tier.get(key="GET/api/articles") is None
+        assert tier.entries == {}
+
+    def test_uses_shorter_store_expiration(self) -> None:
+        clock = FakeClock()
+        tier = ResponseCacheLocalTier(max_entries=10, ttl_seconds=30, clock=clock)
+
+        tier.set(key="GET/api/health", value=b"ok", expires_in=timedelta(seconds=1))
+        clock.now = 1
+
+        assert tier.get(key="GET/api/health") is None
+
+    def test_does_not_keep_non_positive_expiration(self) -> None:
+        tier = ResponseCacheLocalTier(max_entries=10, ttl_seconds=30)
+
+        tier.set(key="GET/api/articles", value=b"articles", expires_in=0)
+
+        assert tier.get(key="GET/api/articles") is None
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        tier = ResponseCacheLocalTier(max_entries=2, ttl_seconds=30)
+
+        tier.set(key="first", value=b"1", expires_in=None)
+        tier.set(key="second", value=b"2", expires_in=None)
+        assert tier.get(key="first") == b"1"
+        tier.set(key="third", value=b"3", expires_in=None)
+
+        assert list(tier.entries) == ["first", "third"]
+
+
+class TestResponseCacheInvalidation:
+    def test_round_trips_domain_and_key_invalidations(self) -> None:
+        domain_invalidation = ResponseCacheInvalidation(domain=ResponseCacheDomain.ARTICLES)
+        key_invalidation = ResponseCacheInvalidation(
+            domain=ResponseCacheDomain.ARTICLES,
+            store_key="GET/api/articleslanguage=ru",
+        )
+
+        assert domain_invalidation.encode() == "articles"
+        assert key_invalidation.encode() == "articles:GET/api/articleslanguage=ru"
+        assert ResponseCacheInvalidation.decode("articles") == domain_invalidation
+        assert (
+            ResponseCacheInvalidation.decode("articles:GET/api/articleslanguage=ru")
+            == key_invalidation
+        )
+        assert ResponseCacheInvalidation.decode("unknown") is None
+
+
+class TestTwoTierResponseCacheDomainStore:
+    def create_store(
+        self,
+        *,
+        articles_store: FakeStore,
+        channel: FakeInvalidationChannel | None = None,
+    ) -> ResponseCacheDomainStore:
+        return ResponseCacheDomainStore(
+            stores={ResponseCacheDomain.ARTICLES: cast("Store", articles_store)},
+            local_tiers={
+                ResponseCacheDomain.ARTICLES: ResponseCacheLocalTier(
+                    max_entries=10,
+                    ttl_seconds=30,
+                ),
+            },
+            invalidation_channel=cast("ResponseCacheInvalidationChannel | None", channel),
+        )
+
+    async def test_serves_repeated_reads_from_local_tier(self) -> None:
+        articles_store = FakeStore(values={"GET/api/articles": b"articles"})
+        store = self.create_store(articles_store=articles_store)
+
+        assert await store.get("articles:GET/api/articles") == b"articles"
+        articles_store.values.clear()
+
+        assert await store.get("articles:GET/api/articles") == b"articles"
+
+    async def test_writes_through_to_local_tier(self) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+
+        await store.set("articles:GET/api/articles", "articles", expires_in=60)
+        articles_store.values.clear()
+
+        assert await store.get("articles:GET/api/articles") == b"articles"
+        assert articles_store.set_calls == [("GET/api/articles", "articles", 60)]
+
+    async def test_renewing_reads_bypass_local_tier(self) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+        await store.set("articles:GET/api/articles", b"articles")
+        articles_store.values.clear()
+
+        assert await store.get("articles:GET/api/articles", renew_for=60) is None
+
+    async def test_domain_invalidation_clears_local_tier_and_broadcasts(self) -> None:
+        articles_store = FakeStore()
+        channel = FakeInvalidationChannel()
+        store = self.create_store(articles_store=articles_store, channel=channel)
+        await store.set("articles:GET/api/articles", b"articles")
+
+        await store.delete_domain(ResponseCacheDomain.ARTICLES)
+
+        assert await store.get("articles:GET/api/articles") is None
+        assert channel.published == [
+            ResponseCacheInvalidation(domain=ResponseCacheDomain.ARTICLES),
+        ]
+
+    async def test_key_delete_broadcasts_key_invalidation(self) -> None:
+        channel = FakeInvalidationChannel()
+        store = self.create_store(articles_store=FakeStore(), channel=channel)
+
+        await store.delete("articles:GET/api/articles")
+
+        assert channel.published == [
+            ResponseCacheInvalidation(
+                domain=ResponseCacheDomain.ARTICLES,
+                store_key="GET/api/articles",
+            ),
+        ]
+
+    async def test_listener_applies_remote_invalidations(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        articles_store = FakeStore()
+        channel = FakeInvalidationChannel(
+            incoming=[
+                ResponseCacheInvalidation(
+                    domain=ResponseCacheDomain.ARTICLES,
+                    store_key="GET/api/articles",
+                ),
+            ],
+        )
+        store = self.create_store(articles_store=articles_store, channel=channel)
+        await store.set("articles:GET/api/articles", b"list")
+        await store.set("articles:GET/api/articles/tree", b"tree")
+        sleep_calls: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleep_calls.append(delay)
+            raise asyncio.CancelledError
+
+        monkeypatch.setattr("entrypoints.litestar.lifespan.main.asyncio.sleep", fake_sleep)
+
+        with pytest.raises(asyncio.CancelledError):
+            await listen_for_response_cache_invalidations(store)
+
+        assert store.local_tiers[ResponseCacheDomain.ARTICLES].entries == {}
+        assert sleep_calls == [constants.response_cache.invalidation_listener_retry_delay_seconds]
+
+
+class TestStaleWhileRevalidateResponseCacheDomainStore:
+    def create_store(
+        self,
+        *,
+        articles_store: FakeStore,
+        stale_store: FakeStore,
+        lock: FakeRevalidationLock | None = None,
+    ) -> ResponseCacheDomainStore:
+        return ResponseCacheDomainStore(
+            stores={ResponseCacheDomain.ARTICLES: cast("Store", articles_store)},
+            revalidation=ResponseCacheRevalidation(
+                stale_stores={ResponseCacheDomain.ARTICLES: cast("Store", stale_store)},
+                single_flight=ResponseCacheSingleFlight(claim_ttl_seconds=10),
+                lock=cast("ResponseCacheRevalidationLock | None", lock),
+                stale_ttl_seconds=3_600,
+                wait_timeout_seconds=1,
+                poll_interval_seconds=0.01,
+            ),
+        )
+
+    async def test_keeps_last_good_payload_for_stale_reads(self) -> None:
+        articles_store = FakeStore()
+        stale_store = FakeStore()
+        store = self.create_store(articles_store=articles_store, stale_store=stale_store)
+
+        await store.set("articles:GET/api/articles", b"articles", expires_in=60)
+
+        assert stale_store.set_calls == [("GET/api/articles", b"articles", 3_600)]
+
+    async def test_single_request_recomputes_while_others_get_stale_payload(self) -> None:
+        articles_store = FakeStore()
+        stale_store = FakeStore(values={"GET/api/articles": b"stale"})
+        lock = FakeRevalidationLock()
+        store = self.create_store(
+            articles_store=articles_store,
+            stale_store=stale_store,
+            lock=lock,
+        )
+
+        async with store.revalidating():
+            assert await store.get("articles:GET/api/articles") is None
+            assert await store.get("articles:GET/api/articles") == b"stale"
+            assert lock.held_keys == {"articles:GET/api/articles"}
+
+            await store.set("articles:GET/api/articles", b"fresh", expires_in=60)
+
+        assert lock.released_keys == ["articles:GET/api/articles"]
+        assert await store.get("articles:GET/api/articles") == b"fresh"
+
+    async def test_other_worker_lock_serves_stale_payload(self) -> None:
+        lock = FakeRevalidationLock(held_keys={"articles:GET/api/articles"})
+        store = self.create_store(
+            articles_store=FakeStore(),
+            stale_store=FakeStore(values={"GET/api/articles": b"stale"}),
+            lock=lock,
+        )
+
+        assert await store.get("articles:GET/api/articles") == b"stale"
+        assert await store.get("articles:GET/api/articles") == b"stale"
+
+    async def test_cold_key_waiters_coalesce_on_in_flight_recomputation(self) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store, stale_store=FakeStore())
+
+        async with store.revalidating():
+            assert await store.get("articles:GET/api/articles") is None
+            waiter = asyncio.create_task(store.get("articles:GET/api/articles"))
+            await asyncio.sleep(0)
+            await store.set("articles:GET/api/articles", b"fresh", expires_in=60)
+
+        assert await waiter == b"fresh"
+
+    async def test_error_response_finishes_revalidation(self) -> None:
+        lock = FakeRevalidationLock()
+        stale_store = FakeStore(values={"GET/api/articles": b"stale"})
+        store = self.create_store(articles_store=FakeStore(), stale_store=stale_store, lock=lock)
+
+        @get(
+            "/api/articles",
+            cache=60,
+            cache_key_builder=ResponseCacheDomain.ARTICLES.cache_key_builder,
+        )
+        async def missing_articles() -> None:
+            raise NotFoundException
+
+        app = Litestar(
+            route_handlers=[missing_articles],
+            stores={constants.response_cache.store_name: store},
+            response_cache_config=ResponseCacheConfig(store=constants.response_cache.store_name),
+            middleware=[ResponseCacheRevalidationMiddleware()],
+        )
+        async with AsyncTestClient(app=app) as client:
+            response = await client.get("/api/articles")
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+        assert lock.released_keys == ["articles:GET/api/articles"]
+        assert lock.held_keys == set()
+        assert await store.get("articles:GET/api/articles") is None
+        assert lock.held_keys == {"articles:GET/api/articles"}
+
+    async def test_revalidation_finished_by_set_is_not_finished_again(self) -> None:
+        lock = FakeRevalidationLock()
+        store = self.create_store(articles_store=FakeStore(), stale_store=FakeStore(), lock=lock)
+
+        async with store.revalidating():
+            assert await store.get("articles:GET/api/articles") is None
+            await store.set("articles:GET/api/articles", b"fresh", expires_in=60)
+
+        assert lock.released_keys == ["articles:GET/api/articles"]
+
+    async def test_non_claimant_set_keeps_claim_and_lock_of_revalidating_request(self) -> None:
+        lock = FakeRevalidationLock()
+        store = self.create_store(articles_store=FakeStore(), stale_store=FakeStore(), lock=lock)
+        revalidation = cast("ResponseCacheRevalidation", store.revalidation)
+
+        async def recompute_after_wait_timeout() -> None:
+            async with store.revalidating():
+                await store.set("articles:GET/api/articles", b"waiter", expires_in=60)
+
+        async with store.revalidating():
+            assert await store.get("articles:GET/api/articles") is None
+            await asyncio.create_task(recompute_after_wait_timeout())
+
+            assert lock.held_keys == {"articles:GET/api/articles"}
+            assert lock.released_keys == []
+            assert set(revalidation.single_flight.claims) == {"articles:GET/api/articles"}
+
+        assert lock.released_keys == ["articles:GET/api/articles"]
+        assert revalidation.single_flight.claims == {}
+
+    async def test_dependency_invalidation_purges_stale_payloads(self) -> None:
+        articles_store = FakeStore()
+        stale_store = FakeStore()
+        store = ResponseCacheDomainStore(
+            stores={ResponseCacheDomain.ARTICLES: cast("Store", articles_store)},
+            revalidation=ResponseCacheRevalidation(
+                stale_stores={ResponseCacheDomain.ARTICLES: cast("Store", stale_store)},
+                single_flight=ResponseCacheSingleFlight(claim_ttl_seconds=10),
+                lock=None,
+                stale_ttl_seconds=3_600,
+                wait_timeout_seconds=0.05,
+                poll_interval_seconds=0.01,
+            ),
+            dependency_index=ResponseCacheDependencyIndex(
+                valkey=cast("Any", FakeDependencyValkey()),
+                namespace="LITESTAR_DEPENDENCIES",
+                ttl_seconds=60,
+                domains=frozenset({ResponseCacheDomain.ARTICLES}),
+            ),
+        )
+        await store.set_with_dependencies(
+            key="articles:GET/api/articles/detail/first-article",
+            value=b"first",
+            expires_in=60,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+
+        await store.delete_dependencies(
+            domain=ResponseCacheDomain.ARTICLES,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+
+        assert stale_store.values == {}
+        assert await store.get("articles:GET/api/articles/detail/first-article") is None
+        assert await store.get("articles:GET/api/articles/detail/first-article") is None
+
+    async def test_domain_invalidation_purges_stale_payloads(self) -> None:
+        stale_store = FakeStore(values={"GET/api/articles": b"stale"})
+        store = self.create_store(articles_store=FakeStore(), stale_store=stale_store)
+
+        await store.delete_domain(ResponseCacheDomain.ARTICLES)
+
+        assert stale_store.values == {}
+
+    async def test_dependency_invalidation_without_index_purges_stale_payloads(self) -> None:
+        stale_store = FakeStore(values={"GET/api/articles/detail/first-article": b"stale"})
+        store = self.create_store(articles_store=FakeStore(), stale_store=stale_store)
+
+        await store.delete_dependencies(
+            domain=ResponseCacheDomain.ARTICLES,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+
+        assert stale_store.values == {}
+
+    async def test_clear_domains_purges_stale_payloads(self) -> None:
+        stale_store = FakeStore(values={"GET/api/articles": b"stale"})
+        store = self.create_store(articles_store=FakeStore(), stale_store=stale_store)
+
+        await store.clear_domains(domains=(CacheDomainEnum.ARTICLES,))
+
+        assert stale_store.values == {}
+
+
+class TestResponseCacheDependencies:
+    def test_round_trips_task_payload(self) -> None:
+        dependencies = ResponseCacheDependencies(
+            collections=frozenset({ResponseCacheCollection.ARTICLE_LIST}),
+            article_slugs=frozenset({"first-article"}),
+            tag_ids=frozenset({"tag-1"}),
+        )
+
+        assert ResponseCacheDependencies.from_payload(dependencies.to_payload()) == dependencies
+
+    def test_article_mutation_covers_detail_and_article_collections(self) -> None:
+        dependencies = ResponseCacheDependencies.for_article_mutation(
+            slugs=("old-article", "new-article"),
+        )
+
+        assert dependencies.to_tags() == {
+            "article:old-article",
+            "article:new-article",
+            "collection:article-list",
+            "collection:article-tree",
+            "collection:article-tags",
+        }
+
+    def test_matrix_items_tag_lowered_sheet_key(self) -> None:
+        dependencies = ResponseCacheDependencies.for_matrix_items(
+            sheet_key="Python",
+            items=CompetencyMatrixItems(values=[]),
+        )
+
+        assert "matrix-sheet:python" in dependencies.to_tags()
+
+
+class TestDependencyTrackedResponseCacheDomainStore:
+    def create_store(
+        self,
+        *,
+        articles_store: FakeStore,
+        valkey: FakeDependencyValkey,
+        channel: FakeInvalidationChannel | None = None,
+    ) -> ResponseCacheDomainStore:
+        return ResponseCacheDomainStore(
+            stores={ResponseCacheDomain.ARTICLES: cast("Store", articles_store)},
+            local_tiers={
+                ResponseCacheDomain.ARTICLES: ResponseCacheLocalTier(
+                    max_entries=10,
+                    ttl_seconds=30,
+                ),
+            },
+            invalidation_channel=cast("ResponseCacheInvalidationChannel | None", channel),
+            dependency_index=ResponseCacheDependencyIndex(
+                valkey=cast("Any", valkey),
+                namespace="LITESTAR_DEPENDENCIES",
+                ttl_seconds=60,
+                domains=frozenset({ResponseCacheDomain.ARTICLES}),
+            ),
+        )
+
+    async def test_indexes_dependencies_recorded_by_the_handler(self) -> None:
+        valkey = FakeDependencyValkey()
+        store = self.create_store(articles_store=FakeStore(), valkey=valkey)
+
+        record_response_cache_dependencies(
+            ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+        await store.set("articles:GET/api/articles/detail/first-article", b"first")
+        await store.set("articles:GET/api/articles/detail/second-article", b"second")
+
+        assert valkey.sets == {
+            "LITESTAR_DEPENDENCIES_articles:article:first-article": {
+                b"GET/api/articles/detail/first-article",
+            },
+            "LITESTAR_DEPENDENCIES_articles:untracked": {
+                b"GET/api/articles/detail/second-article",
+            },
+        }
+        assert set(valkey.expirations.values()) == {60}
+
+    async def test_invalidates_only_keys_built_from_changed_dependencies(self) -> None:
+        articles_store = FakeStore()
+        valkey = FakeDependencyValkey()
+        channel = FakeInvalidationChannel()
+        store = self.create_store(articles_store=articles_store, valkey=valkey, channel=channel)
+        await store.set_with_dependencies(
+            key="articles:GET/api/articles/detail/first-article",
+            value=b"first",
+            expires_in=60,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+        await store.set_with_dependencies(
+            key="articles:GET/api/articles/detail/second-article",
+            value=b"second",
+            expires_in=60,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"second-article"})),
+        )
+        await store.set_with_dependencies(
+            key="articles:GET/api/articles",
+            value=b"list",
+            expires_in=60,
+            dependencies=ResponseCacheDependencies(
+                collections=frozenset({ResponseCacheCollection.ARTICLE_LIST}),
+                article_slugs=frozenset({"first-article", "second-article"}),
+            ),
+        )
+
+        deleted_count = await store.delete_dependencies(
+            domain=ResponseCacheDomain.ARTICLES,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+
+        assert deleted_count == 2
+        assert articles_store.values == {"GET/api/articles/detail/second-article": b"second"}
+        assert await store.get("articles:GET/api/articles") is None
+        assert await store.get("articles:GET/api/articles/detail/second-article") == b"second"
+        assert channel.published == [
+            ResponseCacheInvalidation(
+                domain=ResponseCacheDomain.ARTICLES,
+                store_key="GET/api/articles",
+            ),
+            ResponseCacheInvalidation(
+                domain=ResponseCacheDomain.ARTICLES,
+                store_key="GET/api/articles/detail/first-article",
+            ),
+        ]
+
+    async def test_domain_invalidation_drops_dependency_index(self) -> None:
+        valkey = FakeDependencyValkey()
+        store = self.create_store(articles_store=FakeStore(), valkey=valkey)
+        await store.set_with_dependencies(
+            key="articles:GET/api/articles/detail/first-article",
+            value=b"first",
+            expires_in=60,
+            dependencies=ResponseCacheDependencies(article_slugs=frozenset({"first-article"})),
+        )
+
+        await store.delete_domain(ResponseCacheDomain.ARTICLES)
+
+        assert valkey.sets == {}
+
+    async def test_set_many_writes_fresh_stale_and_index_in_one_pipeline(self) -> None:
+        articles_store = FakeStore()
+        valkey = FakeDependencyValkey()
+        store = ResponseCacheDomainStore(
+            stores={ResponseCacheDomain.ARTICLES: cast("Store", articles_store)},
+            local_tiers={
+                ResponseCacheDomain.ARTICLES: ResponseCacheLocalTier(
+                    max_entries=10,
+                    ttl_seconds=30,
+                ),
+            },
+            dependency_index=ResponseCacheDependencyIndex(
+                valkey=cast("Any", valkey),
+                namespace="LITESTAR_DEPENDENCIES",
+                ttl_seconds=60,
+                domains=frozenset({ResponseCacheDomain.ARTICLES}),
+            ),
+            batch_writer=ResponseCacheBatchWriter(
+                valkey=cast("Any", valkey),
+                namespaces={ResponseCacheDomain.ARTICLES: "LITESTAR_articles"},
+                stale_namespaces={ResponseCacheDomain.ARTICLES: "LITESTAR_STALE_articles"},
+                stale_ttl_seconds=600,
+            ),
+        )
+
+        await store.set_many(
+            entries=[
+                ResponseCacheEntry(
+                    key="articles:GET/api/articles/detail/first-article",
+                    value=b"first",
+                    dependencies=ResponseCacheDependencies(
+                        article_slugs=frozenset({"first-article"}),
+                    ),
+                ),
+                ResponseCacheEntry(key="articles:GET/api/articles", value=b"list"),
+            ],
+            expires_in=60,
+        )
+
+        assert valkey.executed_pipelines == 1
+        assert articles_store.set_calls == []
+        assert valkey.values == {
+            "LITESTAR_articles:GET/api/articles/detail/first-article": b"first",
+            "LITESTAR_articles:GET/api/articles": b"list",
+            "LITESTAR_STALE_articles:GET/api/articles/detail/first-article": b"first",
+            "LITESTAR_STALE_articles:GET/api/articles": b"list",
+        }
+        assert valkey.expirations == {
+            "LITESTAR_articles:GET/api/articles/detail/first-article": 60,
+            "LITESTAR_articles:GET/api/articles": 60,
+            "LITESTAR_STALE_articles:GET/api/articles/detail/first-article": 600,
+            "LITESTAR_STALE_articles:GET/api/articles": 600,
+            "LITESTAR_DEPENDENCIES_articles:article:first-article": 60,
+            "LITESTAR_DEPENDENCIES_articles:untracked": 60,
+        }
+        assert valkey.sets == {
+            "LITESTAR_DEPENDENCIES_articles:article:first-article": {
+                b"GET/api/articles/detail/first-article",
+            },
+            "LITESTAR_DEPENDENCIES_articles:untracked": {b"GET/api/articles"},
+        }
+        assert await store.get("articles:GET/api/articles") == b"list"
+
+
+class TestResponseCacheExpiryIndex:
+    def create_store(
+        self,
+        *,
+        valkey: FakeDependencyValkey,
+        clock: FakeClock,
+    ) -> ResponseCacheDomainStore:
+        return ResponseCacheDomainStore(
+            stores={
+                ResponseCacheDomain.ARTICLES: cast("Store", FakeStore()),
+                ResponseCacheDomain.I18N: cast("Store", FakeStore()),
+            },
+            expiry_index=ResponseCacheExpiryIndex(
+                valkey=cast("Any", valkey),
+                namespace="LITESTAR_EXPIRY_INDEX",
+                domains=frozenset({ResponseCacheDomain.ARTICLES}),
+                clock=clock,
+            ),
+            batch_writer=ResponseCacheBatchWriter(
+                valkey=cast("Any", valkey),
+                namespaces={ResponseCacheDomain.ARTICLES: "LITESTAR_articles"},
+            ),
+        )
+
+    async def test_writes_record_expiry_and_trim_expired_members(self) -> None:
+        valkey = FakeDependencyValkey()
+        clock = FakeClock(now=1_000.0)
+        store = self.create_store(valkey=valkey, clock=clock)
+
+        await store.set("articles:GET/api/articles", b"list", expires_in=60)
+        await store.set("articles:GET/api/articles/tags", b"tags")
+        await store.set("i18n:GET/api/i18n/languages", b"languages", expires_in=60)
+        clock.now = 1_061.0
+        await store.set(
+            "articles:GET/api/articles/detail/first-article",
+            b"first",
+            expires_in=timedelta(minutes=1),
+        )
+
+        assert valkey.sorted_sets == {
+            "LITESTAR_EXPIRY_INDEX:articles": {
+                "GET/api/articles/tags": math.inf,
+                "GET/api/articles/detail/first-article": 1_121.0,
+            },
+        }
+
+    async def test_deletes_drop_members_and_domain_clear_drops_index(self) -> None:
+        valkey = FakeDependencyValkey()
+        store = self.create_store(valkey=valkey, clock=FakeClock(now=1_000.0))
+        await store.set("articles:GET/api/articles", b"list", expires_in=60)
+        await store.set("articles:GET/api/articles/tags", b"tags", expires_in=60)
+
+        await store.delete("articles:GET/api/articles")
+
+        assert valkey.sorted_sets == {
+            "LITESTAR_EXPIRY_INDEX:articles": {"GET/api/articles/tags": 1_060.0},
+        }
+
+        await store.delete_domain(ResponseCacheDomain.ARTICLES)
+
+        assert valkey.sorted_sets == {}
+
+    async def test_set_many_indexes_expiry_in_the_write_pipeline(self) -> None:
+        valkey = FakeDependencyValkey()
+        store = self.create_store(valkey=valkey, clock=FakeClock(now=1_000.0))
+
+        await store.set_many(
+            entries=[
+                ResponseCacheEntry(key="articles:GET/api/articles", value=b"list"),
+                ResponseCacheEntry(key="articles:GET/api/articles/tags", value=b"tags"),
+            ],
+            expires_in=60,
+        )
+
+        assert valkey.executed_pipelines == 1
+        assert valkey.sorted_sets == {
+            "LITESTAR_EXPIRY_INDEX:articles": {
+                "GET/api/articles": 1_060.0,
+                "GET/api/articles/tags": 1_060.0,
+            },
+        }
+
+
+def encode_response_messages(*, body: bytes) -> bytes:
+    return msgspec.msgpack.encode(
+        [
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            },
+            {"type": "http.response.body", "body": body},
+        ],
+    )
+
+
+class TestEntityTaggedResponseCacheDomainStore:
+    key = "articles:GET/api/articleslanguage=ru&page=1"
+    entity_tag = '"eef46741adfc3a9f76294d3b78f37a45f113092ac9d44ee77c7a038a88ff09a1"'
+
+    def create_store(self, *, articles_store: FakeStore) -> ResponseCacheDomainStore:
+        return ResponseCacheDomainStore(
+            stores={ResponseCacheDomain.ARTICLES: cast("Store", articles_store)},
+            local_tiers={
+                ResponseCacheDomain.ARTICLES: ResponseCacheLocalTier(
+                    max_entries=10,
+                    ttl_seconds=30,
+                ),
+            },
+        )
+
+    def request_cache_key(self, *, headers: dict[str, str] | None = None) -> str:
+        return ResponseCacheDomain.ARTICLES.cache_key_builder(cast("Any", FakeRequest(headers)))
+
+    async def test_stores_content_hash_next_to_payload_and_emits_it_as_etag(self) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+
+        await store.set(self.key, encode_response_messages(body=b'{"items":[]}'))
+        value = await store.get(self.request_cache_key())
+
+        stored_value = articles_store.values["GET/api/articleslanguage=ru&page=1"]
+        assert stored_value.startswith(b"etag:" + self.entity_tag.encode() + b"\n\n")
+        assert value is not None
+        assert msgspec.msgpack.decode(value) == [
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    [b"content-type", b"application/json"],
+                    [b"content-length", b"12"],
+                    [b"etag", self.entity_tag.encode()],
+                ],
+            },
+            {"type": "http.response.body", "body": b'{"items":[]}'},
+        ]
+
+    async def test_matching_if_none_match_gets_not_modified_without_decoding_payload(
+        self,
+    ) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+        await store.set(self.key, encode_response_messages(body=b'{"items":[]}'))
+        key = self.request_cache_key(headers={"if-none-match": f'"other", W/{self.entity_tag}'})
+
+        with patch.object(response_cache_module, "_response_cache_messages_decoder") as decoder:
+            value = await store.get(key)
+
+        decoder.decode.assert_not_called()
+        assert value is not None
+        assert msgspec.msgpack.decode(value) == [
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [[b"etag", self.entity_tag.encode()]],
+            },
+            {"type": "http.response.body", "body": b""},
+        ]
+
+    async def test_stale_if_none_match_gets_full_payload(self) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+        await store.set(self.key, encode_response_messages(body=b'{"items":[]}'))
+
+        value = await store.get(self.request_cache_key(headers={"if-none-match": '"stale"'}))
+
+        assert value is not None
+        assert msgspec.msgpack.decode(value)[0]["status"] == 200
+
+    async def test_set_many_tags_untagged_entries_once(self) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+        tagged_value = ResponseCacheValue.from_messages(
+            messages=msgspec.msgpack.decode(encode_response_messages(body=b"{}")),
+        ).to_stored()
+
+        await store.set_many(
+            entries=[
+                ResponseCacheEntry(key=self.key, value=tagged_value),
+                ResponseCacheEntry(
+                    key="articles:GET/api/articles/tags",
+                    value=encode_response_messages(body=b'{"items":[]}'),
+                ),
+            ],
+            expires_in=60,
+        )
+
+        assert articles_store.values["GET/api/articleslanguage=ru&page=1"] == tagged_value
+        assert (
+            ResponseCacheValue.from_stored(
+                articles_store.values["GET/api/articles/tags"],
+            ).entity_tag
+            == self.entity_tag
+        )
+
+    async def test_large_payloads_are_stored_gzip_only_and_served_by_accept_encoding(
+        self,
+    ) -> None:
+        articles_store = FakeStore()
+        store = self.create_store(articles_store=articles_store)
+        body = b'{"items":[' + b",".join([b'{"slug":"typed-articles"}'] * 100) + b"]}"
+        entity_tag = f'"{hashlib.sha256(body).hexdigest()}"'
+        await store.set(self.key, encode_response_messages(body=body))
+
+        compressed = await store.get(
+            self.request_cache_key(headers={"accept-encoding": "br, gzip"})
+        )
+        identity = await store.get(self.request_cache_key(headers={"accept-encoding": "gzip;q=0"}))
+
+        stored_value = articles_store.values["GET/api/articleslanguage=ru&page=1"]
+        assert stored_value.startswith(b"etag:" + entity_tag.encode() + b"\ngzip\n")
+        assert len(stored_value) < len(body)
+        assert compressed is not None
+        compressed_start, compressed_body = msgspec.msgpack.decode(compressed)
+        assert compressed_start["headers"] == [
+            [b"content-type", b"application/json"],
+            [b"content-encoding", b"gzip"],
+            [b"vary", b"accept-encoding"],
+            [b"content-length", str(len(compressed_body["body"])).encode()],
+            [b"etag", f'{entity_tag[:-1]}-gzip"'.encode()],
+        ]
+        assert gzip.decompress(compressed_body["body"]) == body
+        assert identity is not None
+        identity_start, identity_body = msgspec.msgpack.decode(identity)
+        assert identity_start["headers"] == [
+            [b"content-type", b"application/json"],
+            [b"vary", b"accept-encoding"],
+            [b"content-length", str(len(body)).encode()],
+            [b"etag", entity_tag.encode()],
+        ]
+        assert identity_body["body"] == body
+
+    async def test_any_encoding_entity_tag_gets_not_modified(self) -> None:
+        store = self.create_store(articles_store=FakeStore())
+        body = b"[" + b",".join([b'"typed-articles"'] * 100) + b"]"
+        entity_tag = f'"{hashlib.sha256(body).hexdigest()}"'
+        await store.set(self.key, encode_response_messages(body=body))
+
+        value = await store.get(
+            self.request_cache_key(
+                headers={"if-none-match": f'{entity_tag[:-1]}-gzip"', "accept-encoding": "gzip"},
+            ),
+        )
+
+        assert value is not None
+        assert msgspec.msgpack.decode(value)[0] == {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [
+                [b"etag", f'{entity_tag[:-1]}-gzip"'.encode()],
+                [b"vary", b"accept-encoding"],
+            ],
+        }
+
+    async def test_untagged_values_are_served_unchanged(self) -> None:
+        legacy_value = encode_response_messages(body=b"{}")
+        store = self.create_store(
+            articles_store=FakeStore(values={"GET/api/articleslanguage=ru&page=1": legacy_value}),
+        )
+
+        value = await store.get(self.request_cache_key(headers={"if-none-match": "*"}))
+
+        assert value == legacy_value
+
+
+class TestResponseCacheSingleFlight:
+    def test_expired_claim_can_be_taken_over(self) -> None:
+        clock = FakeClock()
+        single_flight = ResponseCacheSingleFlight(claim_ttl_seconds=10, clock=clock)
+
+        assert single_flight.claim(key="articles:GET/api/articles") is True
+        assert single_flight.claim(key="articles:GET/api/articles") is False
+        clock.now = 10
+
+        assert single_flight.claim(key="articles:GET/api/articles") is True
+
 
 class TestInvalidateAllResponseCacheDomains:
     async def test_deletes_all_domain_stores_when_cache_is_enabled(
@@ -205,6 +1241,33 @@ class TestResponseCacheModuleBoundaries:
         assert callable(invalidate_cache_command)
 
 
+class TestSharedResponseCacheDomainStore:
+    async def test_cache_tools_provider_reuses_app_response_cache_store(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings.app, "use_cache", True)
+        monkeypatch.setattr(
+            litestar_initializers,
+            "create_response_cache_domain_store",
+            Mock(
+                side_effect=lambda: ResponseCacheDomainStore(
+                    stores={ResponseCacheDomain.ARTICLES: cast("Store", FakeStore())},
+                ),
+            ),
+        )
+        litestar_initializers.get_response_cache_domain_store.cache_clear()
+        try:
+            app_store = litestar_initializers.create_stores()[constants.response_cache.store_name]
+            provided_stores = ResponseCacheWarmProvider().provide_response_cache_domain_store()
+            provided_store = await anext(provided_stores)
+            await provided_stores.aclose()
+        finally:
+            litestar_initializers.get_response_cache_domain_store.cache_clear()
+
+        assert provided_store is app_store
+
+
 class TestInvalidateResponseCacheDomainForMutation:
     async def test_invalidates_and_enqueues_warm_only_after_commit_action_runs(
         self,
@@ -251,6 +1314,53 @@ class TestInvalidateResponseCacheDomainForMutation:
         assert events == ["invalidate:articles", "enqueue:articles"]
         assert cached_values == {}
 
+    async def test_dependency_invalidation_enqueues_targeted_warm_after_commit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        events: list[object] = []
+        monkeypatch.setattr(settings.app, "use_cache", True)
+        dependencies = ResponseCacheDependencies.for_article_mutation(slugs=("first-article",))
+
+        async def fake_invalidate_response_cache_dependencies(
+            *,
+            request: object,
+            domain: ResponseCacheDomain,
+            dependencies: ResponseCacheDependencies,
+        ) -> None:
+            _ = request
+            events.append(("invalidate", domain, dependencies))
+
+        async def fake_cache_warm_dependencies_kiq(
+            domain_value: str,
+            dependencies_payload: dict[str, list[str]],
+        ) -> None:
+            events.append(("enqueue", domain_value, dependencies_payload))
+
+        monkeypatch.setattr(
+            "entrypoints.litestar.response_cache.invalidate_response_cache_dependencies",
+            fake_invalidate_response_cache_dependencies,
+        )
+        monkeypatch.setattr(
+            "entrypoints.taskiq.cache_warm.tasks.cache_warm_dependencies.kiq",
+            fake_cache_warm_dependencies_kiq,
+            raising=False,
+        )
+        post_commit_actions = PostCommitActions(actions=[])
+
+        await invalidate_response_cache_domain_for_mutation(
+            request=cast("Any", object()),
+            domain=ResponseCacheDomain.ARTICLES,
+            post_commit_actions=post_commit_actions,
+            dependencies=dependencies,
+        )
+        await post_commit_actions.run()
+
+        assert events == [
+            ("invalidate", ResponseCacheDomain.ARTICLES, dependencies),
+            ("enqueue", "articles", dependencies.to_payload()),
+        ]
+
     async def test_does_not_schedule_post_commit_action_when_cache_is_disabled(
         self,
         monkeypatch: pytest.MonkeyPatch,
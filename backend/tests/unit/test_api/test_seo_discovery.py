@@ -1,3 +1,4 @@
+import gzip
 from datetime import UTC, datetime
 
 import pytest_asyncio
@@ -9,6 +10,7 @@ from core.competency_matrix.schemas import (
     PublishedCompetencyMatrixItemsForSeo,
 )
 from core.enums import PublishStatusEnum
+from core.sitemaps.schemas import SitemapDocument
 from tests.test_cases import ApiTestCase
 
 
@@ -17,6 +19,17 @@ class TestSeoDiscoveryAPI(ApiTestCase):
     async def setup(self) -> None:
         self.articles_use_case = await self.container.get_articles_use_case()
         self.matrix_use_case = await self.container.get_competency_matrix_use_case()
+        self.sitemap_storage = await self.container.get_sitemap_storage()
+
+    def stored_sitemap(self, *, name: str, content: str) -> SitemapDocument:
+        document = SitemapDocument(
+            name=name,
+            content=gzip.compress(content.encode(), mtime=0),
+            entity_tag='W/"stored"',
+            last_modified=datetime(2026, 2, 4, 4, 5, 6, tzinfo=UTC),
+        )
+        self.sitemap_storage.get_document.return_value = document
+        return document
 
     def test_sitemap_contains_language_prefixed_public_pages_and_published_articles(self) -> None:
         article = PublishedArticleForSeo(
@@ -105,6 +118,80 @@ class TestSeoDiscoveryAPI(ApiTestCase):
         assert "/articles/draft-article" not in response.text
         assert "/competency-matrix/questions/draft-question" not in response.text
 
+    def test_sitemap_is_generated_and_stored_when_the_store_is_empty(self) -> None:
+        self.articles_use_case.list_published_articles_for_seo.return_value = (
+            PublishedArticlesForSeo(values=[])
+        )
+        self.matrix_use_case.list_published_items_for_seo.return_value = (
+            PublishedCompetencyMatrixItemsForSeo(values=[])
+        )
+
+        response = self.no_auth_api.get_sitemap_xml()
+
+        assert response.status_code == codes.OK, response.content
+        self.sitemap_storage.get_document.assert_any_await(name="sitemap.xml")
+        [document] = self.sitemap_storage.replace_documents.await_args.kwargs["documents"]
+        assert response.headers["etag"] == document.entity_tag
+        assert gzip.decompress(document.content) == response.content
+
+    def test_stored_sitemap_is_served_precompressed_with_validators(self) -> None:
+        document = self.stored_sitemap(name="sitemap.xml", content="<urlset></urlset>")
+
+        response = self.no_auth_api.get_sitemap_xml(headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == codes.OK, response.content
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == document.entity_tag
+        assert response.headers["last-modified"] == "Wed, 04 Feb 2026 04:05:06 GMT"
+        assert response.headers["cache-control"] == "public, max-age=300"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == "<urlset></urlset>"
+        self.articles_use_case.list_published_articles_for_seo.assert_not_called()
+        self.sitemap_storage.replace_documents.assert_not_called()
+
+    def test_stored_sitemap_is_decompressed_for_clients_without_gzip(self) -> None:
+        self.stored_sitemap(name="sitemap.xml", content="<urlset></urlset>")
+
+        response = self.no_auth_api.get_sitemap_xml(headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == codes.OK, response.content
+        assert "content-encoding" not in response.headers
+        assert response.text == "<urlset></urlset>"
+
+    def test_sitemap_returns_not_modified_for_matching_validators(self) -> None:
+        document = self.stored_sitemap(name="sitemap.xml", content="<urlset></urlset>")
+
+        by_entity_tag = self.no_auth_api.get_sitemap_xml(
+            headers={"If-None-Match": '"other", "stored"'},
+        )
+        by_date = self.no_auth_api.get_sitemap_xml(
+            headers={"If-Modified-Since": "Wed, 04 Feb 2026 04:05:06 GMT"},
+        )
+        stale_date = self.no_auth_api.get_sitemap_xml(
+            headers={"If-Modified-Since": "Wed, 04 Feb 2026 04:05:05 GMT"},
+        )
+
+        assert by_entity_tag.status_code == codes.NOT_MODIFIED
+        assert by_entity_tag.content == b""
+        assert by_entity_tag.headers["etag"] == document.entity_tag
+        assert by_date.status_code == codes.NOT_MODIFIED
+        assert stale_date.status_code == codes.OK
+
+    def test_sitemap_page_is_read_from_the_store(self) -> None:
+        self.stored_sitemap(name="sitemap-2.xml", content="<urlset>page</urlset>")
+
+        response = self.no_auth_api.get_sitemap_xml(page=2)
+
+        assert response.status_code == codes.OK, response.content
+        assert response.text == "<urlset>page</urlset>"
+        self.sitemap_storage.get_document.assert_awaited_once_with(name="sitemap-2.xml")
+
+    def test_missing_sitemap_page_returns_not_found_without_regenerating(self) -> None:
+        response = self.no_auth_api.get_sitemap_xml(page=3)
+
+        assert response.status_code == codes.NOT_FOUND, response.content
+        self.sitemap_storage.replace_documents.assert_not_called()
+
     def test_robots_allows_public_language_routes_and_blocks_duplicate_spa_routes(self) -> None:
         response = self.no_auth_api.get_robots_txt()
 
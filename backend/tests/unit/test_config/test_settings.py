@@ -91,6 +91,8 @@ class TestSettings:
                 auth_session_prune_interval_seconds=86_400,
                 cache_warm_interval_seconds=3_600,
                 file_orphan_prune_interval_seconds=86_400,
+                article_view_counter_flush_interval_seconds=60,
+                sitemap_refresh_interval_seconds=3_600,
                 result_expire_seconds=3_600,
             )
 
@@ -106,6 +108,8 @@ class TestSettings:
                 auth_session_prune_interval_seconds=86_400,
                 agent_audit_prune_interval_seconds=86_400,
                 cache_warm_interval_seconds=3_600,
+                article_view_counter_flush_interval_seconds=60,
+                sitemap_refresh_interval_seconds=3_600,
                 result_expire_seconds=3_600,
             )
 
@@ -33,8 +33,12 @@ from core.account.use_cases import AccountsUseCase
 from core.auth.enums import AuthSessionAuthMethodEnum, AuthSessionDeviceTypeEnum, RoleEnum
 from core.auth.exceptions import UserNotFoundError
 from core.auth.password_hashers import PasswordHasher
-from core.auth.schemas import AuthSession, AuthSessionClientMetadata
-from core.auth.storages import AuthSessionStorage
+from core.auth.schemas import (
+    AuthSession,
+    AuthSessionClientMetadata,
+    VerifiedAccessTokenInvalidation,
+)
+from core.auth.storages import AuthSessionStorage, VerifiedAccessTokenInvalidator
 from core.auth.types import SessionSecretHash
 from core.schemas import Secret
 from tests.test_cases import TestCase
@@ -114,10 +118,12 @@ class TestAccountsUseCase(TestCase):
         self.auth_session_storage = Mock(spec=AuthSessionStorage)
         self.hasher = Mock(spec=PasswordHasher)
         self.hasher.hash_password.return_value = "hashed-password"
+        self.verified_token_invalidator = Mock(spec=VerifiedAccessTokenInvalidator)
         self.use_case = AccountsUseCase(
             storage=self.storage,
             hasher=self.hasher,
             auth_session_storage=self.auth_session_storage,
+            verified_token_invalidator=self.verified_token_invalidator,
         )
 
     async def test_list_accounts_builds_page(self) -> None:
@@ -198,6 +204,9 @@ class TestAccountsUseCase(TestCase):
             username="Admin",
             session_id="session-current",
         )
+        self.verified_token_invalidator.invalidate.assert_called_once_with(
+            invalidation=VerifiedAccessTokenInvalidation.for_session(session_id="session-current"),
+        )
 
     async def test_revoke_all_account_sessions_reports_current_session_for_self(self) -> None:
         self.storage.get_managed_account.side_effect = [
@@ -216,6 +225,9 @@ class TestAccountsUseCase(TestCase):
 
         assert result.current_session_revoked is True
         self.auth_session_storage.revoke_user_sessions.assert_called_once_with(username="Owner")
+        self.verified_token_invalidator.invalidate.assert_called_once_with(
+            invalidation=VerifiedAccessTokenInvalidation.for_username(username="Owner"),
+        )
 
     async def test_revoke_other_account_sessions_is_self_only(self) -> None:
         self.storage.get_managed_account.side_effect = [
@@ -588,6 +600,7 @@ class TestAccountsUseCase(TestCase):
             )
 
         self.auth_session_storage.revoke_user_sessions.assert_not_called()
+        self.verified_token_invalidator.invalidate.assert_not_called()
 
     async def test_deactivate_rejects_self_action(self) -> None:
         self.storage.get_managed_account.side_effect = [
@@ -644,6 +657,9 @@ class TestAccountsUseCase(TestCase):
         self.auth_session_storage.revoke_user_sessions.assert_called_once_with(
             username="Moderator",
         )
+        self.verified_token_invalidator.invalidate.assert_called_once_with(
+            invalidation=VerifiedAccessTokenInvalidation.for_username(username="Moderator"),
+        )
 
     async def test_activate_delegates_to_storage(self) -> None:
         activated_account = ManagedAccount(
@@ -55,7 +55,10 @@ from core.agent_access.use_cases import (
 )
 from core.competency_matrix.enums import GradeEnum, InterviewFrequencyEnum
 from core.competency_matrix.schemas import CompetencyMatrixItemStructure
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.enums import PublishStatusEnum
 from core.generators import HexUuidIdGenerator
 from tests.test_cases import TestCase
@@ -69,6 +72,7 @@ class TestMatrixQuestionDraftCompletionPolicy(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=MatrixAgentStorage)
         self.matrix_storage = Mock(spec=CompetencyMatrixStorage)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.id_generator = Mock(spec=HexUuidIdGenerator)
         self.item_id = self.factory.core.hex_id(20)
         self.resource_id = self.factory.core.hex_id(21)
@@ -81,6 +85,7 @@ class TestMatrixQuestionDraftCompletionPolicy(TestCase):
         self.use_case = MatrixAgentUseCase(
             storage=self.storage,
             matrix_storage=self.matrix_storage,
+            workspace_summary_cache=self.workspace_summary_cache,
             id_generator=self.id_generator,
         )
         self.identity = AgentIdentity(
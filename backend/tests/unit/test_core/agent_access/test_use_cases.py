@@ -58,7 +58,10 @@ from core.competency_matrix.schemas import (
     CompetencyMatrixResourceSearchParams,
     CompetencyMatrixStructure,
 )
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.generators import HexUuidIdGenerator
 from core.i18n.enums import LanguageEnum
 from core.types import SearchName
@@ -418,6 +421,7 @@ class TestMatrixAgentUseCase(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=MatrixAgentStorage)
         self.matrix_storage = Mock(spec=CompetencyMatrixStorage)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.id_generator = Mock(spec=HexUuidIdGenerator)
         self.id_generator.get_next.side_effect = [
             self.factory.core.hex_id(6),
@@ -431,6 +435,7 @@ class TestMatrixAgentUseCase(TestCase):
         self.use_case = MatrixAgentUseCase(
             storage=self.storage,
             matrix_storage=self.matrix_storage,
+            workspace_summary_cache=self.workspace_summary_cache,
             id_generator=self.id_generator,
         )
         self.identity = AgentIdentity(
@@ -651,6 +656,7 @@ class TestMatrixAgentUseCase(TestCase):
             claim_id=self.claim.id,
             queue_item_id=self.question.id,
         )
+        self.workspace_summary_cache.invalidate.assert_awaited_once_with()
 
     async def test_save_returns_storage_idempotency_replay(self) -> None:
         completion = MatrixQuestionDraftCompletion(
@@ -676,6 +682,7 @@ class TestMatrixAgentUseCase(TestCase):
             replayed=True,
         )
         self.storage.lock_matrix_question_claim.assert_not_awaited()
+        self.workspace_summary_cache.invalidate.assert_not_awaited()
 
     @pytest.mark.parametrize(
         "resources",
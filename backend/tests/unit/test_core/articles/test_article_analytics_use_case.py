@@ -8,10 +8,15 @@ from core.articles.exceptions import ArticleNotFoundError
 from core.articles.schemas import (
     ArticleAnalyticsConfig,
     ArticleAnalyticsDailyStats,
+    ArticleDailyCounterIncrement,
     ArticlePublicStatsCollection,
     ArticleReactionCounts,
 )
-from core.articles.storages import ArticleAnalyticsStorage, ArticlesStorage
+from core.articles.storages import (
+    ArticleAnalyticsStorage,
+    ArticlesStorage,
+    ArticleViewCounterBuffer,
+)
 from core.articles.use_cases import ArticleAnalyticsUseCase
 from core.enums import PublishStatusEnum
 from core.i18n.enums import LanguageEnum
@@ -23,10 +28,12 @@ class TestArticleAnalyticsUseCase(TestCase):
     def setup_method(self) -> None:
         self.articles_storage = Mock(spec=ArticlesStorage)
         self.analytics_storage = Mock(spec=ArticleAnalyticsStorage)
+        self.view_counter_buffer = Mock(spec=ArticleViewCounterBuffer)
         self.error_reporter = Mock()
         self.use_case = ArticleAnalyticsUseCase(
             articles_storage=self.articles_storage,
             analytics_storage=self.analytics_storage,
+            view_counter_buffer=self.view_counter_buffer,
             error_reporter=self.error_reporter,
         )
         self.config = ArticleAnalyticsConfig(
@@ -45,7 +52,7 @@ class TestArticleAnalyticsUseCase(TestCase):
             source_category=ArticleViewSourceCategory.SEARCH,
         )
 
-        self.analytics_storage.increment_view.assert_called_once_with(
+        self.view_counter_buffer.increment_view.assert_called_once_with(
             article_id=article.id,
             source_category=ArticleViewSourceCategory.SEARCH,
             viewed_on=None,
@@ -62,7 +69,7 @@ class TestArticleAnalyticsUseCase(TestCase):
             source_category=ArticleViewSourceCategory.SEARCH,
         )
 
-        self.analytics_storage.increment_view.assert_not_called()
+        self.view_counter_buffer.increment_view.assert_not_called()
 
     async def test_track_public_view_classifies_referrer(self) -> None:
         article = self.factory.core.article(
@@ -76,7 +83,7 @@ class TestArticleAnalyticsUseCase(TestCase):
             config=self.config,
         )
 
-        self.analytics_storage.increment_view.assert_called_once_with(
+        self.view_counter_buffer.increment_view.assert_called_once_with(
             article_id=article.id,
             source_category=ArticleViewSourceCategory.SEARCH,
             viewed_on=None,
@@ -88,7 +95,7 @@ class TestArticleAnalyticsUseCase(TestCase):
             publish_status=PublishStatusEnum.PUBLISHED,
         )
         error = RuntimeError("db is down")
-        self.analytics_storage.increment_view.side_effect = error
+        self.view_counter_buffer.increment_view.side_effect = error
 
         await self.use_case.track_public_view(
             article=article,
@@ -112,7 +119,40 @@ class TestArticleAnalyticsUseCase(TestCase):
                 source_category=ArticleViewSourceCategory.UNKNOWN,
             )
 
-        self.analytics_storage.increment_engaged_view.assert_not_called()
+        self.view_counter_buffer.increment_engaged_view.assert_not_called()
+
+    async def test_flush_view_counters_upserts_claimed_increments(self) -> None:
+        increments = [
+            ArticleDailyCounterIncrement(
+                article_id=self.factory.core.hex_id(1),
+                date=date(2026, 1, 2),
+                source_category=ArticleViewSourceCategory.SEARCH,
+                view_count=12,
+                engaged_view_count=3,
+            ),
+        ]
+        self.view_counter_buffer.claim_pending.return_value = increments
+
+        flushed_count = await self.use_case.flush_view_counters()
+
+        assert flushed_count == 1
+        self.analytics_storage.add_daily_counters.assert_awaited_once_with(increments=increments)
+
+    async def test_flush_view_counters_skips_database_when_nothing_was_buffered(self) -> None:
+        self.view_counter_buffer.claim_pending.return_value = []
+
+        flushed_count = await self.use_case.flush_view_counters()
+
+        assert flushed_count == 0
+        self.analytics_storage.add_daily_counters.assert_not_called()
+
+    async def test_rebuild_totals_delegates_to_storage(self) -> None:
+        self.analytics_storage.rebuild_totals.return_value = 7
+
+        rebuilt_count = await self.use_case.rebuild_totals()
+
+        assert rebuilt_count == 7
+        self.analytics_storage.rebuild_totals.assert_awaited_once_with()
 
     async def test_same_token_is_article_scoped_for_reactions(self) -> None:
         first_article = self.factory.core.article(
@@ -1,9 +1,11 @@
+from dataclasses import replace
 from datetime import UTC, datetime
 from unittest.mock import Mock, call
 
 import pytest
 
 from core.articles.exceptions import (
+    ArticleCursorInvalidError,
     ArticleFolderAlreadyExistsError,
     ArticleFolderNotFoundError,
     ArticleFolderPriorityInvalidError,
@@ -12,9 +14,11 @@ from core.articles.exceptions import (
 )
 from core.articles.schemas import (
     ArticleCreateParams,
+    ArticleCursor,
     ArticleFilters,
     ArticleFolderCreateParams,
     ArticleFolderPriorityUpdateParams,
+    ArticleListPage,
     ArticleMetadata,
     ArticleTreeItemData,
     ArticleUpdateParams,
@@ -59,7 +63,11 @@ class TestArticlesUseCase(TestCase):
             include_tags=True,
         )
         article = self.factory.core.article(title="Published article", slug="published-article")
-        self.storage.list_articles.return_value = ([article], 11)
+        self.storage.list_articles.return_value = ArticleListPage(
+            articles=[article],
+            total_count=11,
+            next_cursor=None,
+        )
 
         result = await self.use_case.list_articles(filters=filters)
 
@@ -68,12 +76,104 @@ class TestArticlesUseCase(TestCase):
         assert result.total_pages == 2
         self.storage.list_articles.assert_called_once_with(filters=filters)
 
+    async def test_list_articles_forwards_cursor_page_without_count(self) -> None:
+        cursor = ArticleCursor(
+            search_rank=None,
+            is_published=True,
+            published_at=datetime(2026, 1, 2, tzinfo=UTC),
+            updated_at=datetime(2026, 1, 3, tzinfo=UTC),
+            title="Published article",
+            article_id=self.factory.core.hex_id(1),
+        )
+        filters = ArticleFilters(page=1, page_size=10, cursor=cursor, include_count=False)
+        article = self.factory.core.article(title="Next article", slug="next-article")
+        next_cursor = replace(cursor, title="Next article")
+        self.storage.list_articles.return_value = ArticleListPage(
+            articles=[article],
+            total_count=None,
+            next_cursor=next_cursor,
+        )
+
+        result = await self.use_case.list_articles(filters=filters)
+
+        assert result.values == [article]
+        assert result.total_count is None
+        assert result.total_pages is None
+        assert result.next_cursor == next_cursor
+
+    @pytest.mark.parametrize(
+        ("search_rank", "search_query"),
+        [(None, "typed articles"), (0.5, None)],
+    )
+    async def test_list_articles_rejects_cursor_from_other_search_mode(
+        self,
+        search_rank: float | None,
+        search_query: str | None,
+    ) -> None:
+        cursor = ArticleCursor(
+            search_rank=search_rank,
+            is_published=True,
+            published_at=None,
+            updated_at=datetime(2026, 1, 3, tzinfo=UTC),
+            title="Published article",
+            article_id=self.factory.core.hex_id(1),
+        )
+
+        with pytest.raises(ArticleCursorInvalidError):
+            await self.use_case.list_articles(
+                filters=ArticleFilters(
+                    page=1,
+                    page_size=10,
+                    cursor=cursor,
+                    search_query=search_query,
+                ),
+            )
+
+        self.storage.list_articles.assert_not_called()
+
+    def test_article_cursor_round_trips_through_encoded_value(self) -> None:
+        cursor = ArticleCursor(
+            search_rank=0.25,
+            is_published=False,
+            published_at=None,
+            updated_at=datetime(2026, 1, 3, 4, 5, 6, tzinfo=UTC),
+            title="Черновик",
+            article_id=self.factory.core.hex_id(2),
+        )
+
+        encoded = cursor.encode()
+
+        assert "=" not in encoded
+        assert ArticleCursor.decode(encoded) == cursor
+
+    @pytest.mark.parametrize("value", ["not-a-cursor", "WzFd", "bnVsbA"])
+    def test_article_cursor_rejects_malformed_value(self, value: str) -> None:
+        with pytest.raises(ArticleCursorInvalidError):
+            ArticleCursor.decode(value)
+
     async def test_list_articles_requires_pagination_before_storage_call(self) -> None:
         with pytest.raises(ValueError, match="pagination required"):
             await self.use_case.list_articles(filters=ArticleFilters())
 
         self.storage.list_articles.assert_not_called()
 
+    async def test_iter_published_articles_walks_keyset_chunks(self) -> None:
+        first = self.factory.core.article(slug="a-article")
+        second = self.factory.core.article(slug="b-article")
+        third = self.factory.core.article(slug="c-article")
+        self.storage.list_published_articles_after.side_effect = [[first, second], [third]]
+
+        chunks = [chunk async for chunk in self.use_case.iter_published_articles(chunk_size=2)]
+
+        assert [[article.slug for article in chunk] for chunk in chunks] == [
+            ["a-article", "b-article"],
+            ["c-article"],
+        ]
+        assert self.storage.list_published_articles_after.call_args_list == [
+            call(after_slug=None, limit=2),
+            call(after_slug="b-article", limit=2),
+        ]
+
     @pytest.mark.parametrize("only_with_published_articles", [False, True])
     async def test_list_tags_forwards_published_article_filter(
         self,
@@ -109,7 +209,11 @@ class TestArticlesUseCase(TestCase):
             publish_status=PublishStatusEnum.DRAFT,
             updated_at="2026-01-02T00:00:00",
         )
-        self.storage.list_articles.return_value = ([first_article, draft_article], 2)
+        self.storage.list_articles.return_value = ArticleListPage(
+            articles=[first_article, draft_article],
+            total_count=2,
+            next_cursor=None,
+        )
 
         result = await self.use_case.list_published_articles_for_seo()
 
@@ -265,7 +369,11 @@ class TestArticlesUseCase(TestCase):
             published_to=None,
             search_query=None,
         )
-        self.storage.list_articles.return_value = ([article], 1)
+        self.storage.list_articles.return_value = ArticleListPage(
+            articles=[article],
+            total_count=1,
+            next_cursor=None,
+        )
         self.file_client.get_access_url.return_value = "https://cdn.test/list-cover.png"
 
         result = await self.use_case.list_articles(filters=filters)
@@ -14,8 +14,14 @@ from core.auth.schemas import (
     AuthAuthenticateParams,
     AuthSession,
     AuthSessionClientMetadata,
+    VerifiedAccessToken,
+)
+from core.auth.storages import (
+    AuthSessionStorage,
+    TokenRevocationStorage,
+    VerifiedAccessTokenCache,
+    VerifiedAccessTokenInvalidator,
 )
-from core.auth.storages import AuthSessionStorage, TokenRevocationStorage
 from core.auth.types import SessionSecretHash, Token
 from core.auth.use_cases import AuthUseCase
 from tests.test_cases import ContainerTestCase
@@ -31,6 +37,9 @@ class TestLoginUseCase(ContainerTestCase):
         self.auth_session_storage = Mock(spec=AuthSessionStorage)
         self.auth_event_reporter = Mock(spec=AuthEventReporter)
         self.now = datetime(2026, 7, 8, 11, 30, tzinfo=UTC)
+        self.verified_token_cache = Mock(spec=VerifiedAccessTokenCache)
+        self.verified_token_cache.get.return_value = None
+        self.verified_token_invalidator = Mock(spec=VerifiedAccessTokenInvalidator)
         self.use_case = AuthUseCase(
             hasher=await self.container.get_hasher(),
             auth_storage=await self.container.get_auth_storage(),
@@ -40,6 +49,8 @@ class TestLoginUseCase(ContainerTestCase):
             user_storage=self.user_storage,
             event_reporter=self.auth_event_reporter,
             auth_session_secret_generator=AuthSessionSecretGenerator(byte_count=32),
+            verified_token_cache=self.verified_token_cache,
+            verified_token_invalidator=self.verified_token_invalidator,
         )
 
     def _set_active_session(self, *, username: str = "test") -> None:
@@ -184,6 +195,76 @@ class TestLoginUseCase(ContainerTestCase):
             role=RoleEnum.ADMIN,
         )
 
+    async def test_authenticate_caches_verification_until_earliest_expiry(self) -> None:
+        user = self.factory.core.user(username="test", password_hash="test", role=RoleEnum.ADMIN)
+        self.user_storage.get_user_by_username.return_value = user
+        self.token_handler.decode_token.return_value = AccessTokenPayload(
+            username="test",
+            session_id="session-id",
+            expires_at=self.now + timedelta(minutes=15),
+        )
+        self._set_active_session()
+
+        await self.use_case.authenticate(
+            params=AuthAuthenticateParams(
+                token=Token(b"valid_token"),
+                required_role=RoleEnum.ADMIN,
+                current_datetime=self.now,
+            ),
+        )
+
+        self.verified_token_cache.set.assert_called_once_with(
+            token=Token(b"valid_token"),
+            verified_token=VerifiedAccessToken(
+                user=user,
+                session_id="session-id",
+                expires_at=self.now + timedelta(minutes=15),
+            ),
+        )
+
+    async def test_authenticate_cached_verification_skips_lookups(self) -> None:
+        user = self.factory.core.user(username="test", password_hash="test", role=RoleEnum.ADMIN)
+        self.verified_token_cache.get.return_value = VerifiedAccessToken(
+            user=user,
+            session_id="session-id",
+            expires_at=self.now + timedelta(minutes=15),
+        )
+
+        authenticated_user = await self.use_case.authenticate(
+            params=AuthAuthenticateParams(
+                token=Token(b"valid_token"),
+                required_role=RoleEnum.ADMIN,
+                current_datetime=self.now,
+            ),
+        )
+
+        assert authenticated_user == user
+        self.verified_token_cache.get.assert_called_once_with(
+            token=Token(b"valid_token"),
+            now=self.now,
+        )
+        self.token_revocation_storage.is_token_revoked.assert_not_called()
+        self.token_handler.decode_token.assert_not_called()
+        self.auth_session_storage.get_session_by_id.assert_not_called()
+        self.user_storage.get_user_by_username.assert_not_called()
+        self.verified_token_cache.set.assert_not_called()
+
+    async def test_authenticate_cached_verification_still_checks_role(self) -> None:
+        self.verified_token_cache.get.return_value = VerifiedAccessToken(
+            user=self.factory.core.user(username="test", password_hash="test", role=RoleEnum.USER),
+            session_id="session-id",
+            expires_at=self.now + timedelta(minutes=15),
+        )
+
+        with pytest.raises(ForbiddenError):
+            await self.use_case.authenticate(
+                params=AuthAuthenticateParams(
+                    token=Token(b"valid_token"),
+                    required_role=RoleEnum.ADMIN,
+                    current_datetime=self.now,
+                ),
+            )
+
 
 def auth_session_client() -> AuthSessionClientMetadata:
     return AuthSessionClientMetadata(
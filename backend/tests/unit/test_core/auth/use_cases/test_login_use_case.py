@@ -20,7 +20,12 @@ from core.auth.schemas import (
     AuthSessionCredentials,
     AuthUseCaseConfig,
 )
-from core.auth.storages import AuthSessionStorage, TokenRevocationStorage
+from core.auth.storages import (
+    AuthSessionStorage,
+    TokenRevocationStorage,
+    VerifiedAccessTokenCache,
+    VerifiedAccessTokenInvalidator,
+)
 from core.auth.types import SessionSecret, SessionSecretHash
 from core.auth.use_cases import AuthUseCase
 from tests.test_cases import ContainerTestCase
@@ -61,6 +66,9 @@ class TestAuthUseCase(ContainerTestCase):
             auth_method=AuthSessionAuthMethodEnum.PASSWORD,
             client_metadata=auth_session_client(),
         )
+        self.verified_token_cache = Mock(spec=VerifiedAccessTokenCache)
+        self.verified_token_cache.get.return_value = None
+        self.verified_token_invalidator = Mock(spec=VerifiedAccessTokenInvalidator)
         self.use_case = AuthUseCase(
             hasher=self.hasher,
             token_handler=self.token_handler,
@@ -70,6 +78,8 @@ class TestAuthUseCase(ContainerTestCase):
             user_storage=self.user_storage,
             event_reporter=self.auth_event_reporter,
             auth_session_secret_generator=self.auth_session_secret_generator,
+            verified_token_cache=self.verified_token_cache,
+            verified_token_invalidator=self.verified_token_invalidator,
         )
 
     async def test_login_user_not_found(self) -> None:
@@ -1,13 +1,18 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest_asyncio
 
 from core.auth.event_dispatchers import AuthEventReporter
-from core.auth.exceptions import UnauthorizedError
+from core.auth.exceptions import AuthSessionNotFoundError, UnauthorizedError
 from core.auth.generators import AuthSessionSecretGenerator
-from core.auth.schemas import AuthLogoutParams
-from core.auth.storages import AuthSessionStorage, TokenRevocationStorage
-from core.auth.types import Token
+from core.auth.schemas import AuthLogoutParams, VerifiedAccessTokenInvalidation
+from core.auth.storages import (
+    AuthSessionStorage,
+    TokenRevocationStorage,
+    VerifiedAccessTokenCache,
+    VerifiedAccessTokenInvalidator,
+)
+from core.auth.types import SessionSecret, Token
 from core.auth.use_cases import AuthUseCase
 from tests.test_cases import ContainerTestCase
 
@@ -19,6 +24,9 @@ class TestLogoutUseCase(ContainerTestCase):
         self.token_revocation_storage = Mock(spec=TokenRevocationStorage)
         self.auth_session_storage = Mock(spec=AuthSessionStorage)
         self.auth_event_reporter = Mock(spec=AuthEventReporter)
+        self.verified_token_cache = Mock(spec=VerifiedAccessTokenCache)
+        self.verified_token_cache.get.return_value = None
+        self.verified_token_invalidator = Mock(spec=VerifiedAccessTokenInvalidator)
         self.use_case = AuthUseCase(
             hasher=await self.container.get_hasher(),
             auth_storage=await self.container.get_auth_storage(),
@@ -28,6 +36,8 @@ class TestLogoutUseCase(ContainerTestCase):
             user_storage=await self.container.get_user_storage(),
             event_reporter=self.auth_event_reporter,
             auth_session_secret_generator=AuthSessionSecretGenerator(byte_count=32),
+            verified_token_cache=self.verified_token_cache,
+            verified_token_invalidator=self.verified_token_invalidator,
         )
 
     async def test_logout_revokes_valid_token_until_it_expires(self) -> None:
@@ -41,6 +51,38 @@ class TestLogoutUseCase(ContainerTestCase):
             token=token,
             expires_in_seconds=42,
         )
+        self.verified_token_invalidator.invalidate.assert_called_once_with(
+            invalidation=VerifiedAccessTokenInvalidation.for_token(token=token),
+        )
+
+    async def test_logout_invalidates_verified_tokens_of_revoked_session(self) -> None:
+        token = Token(b"valid_token")
+        self.token_handler.get_token_remaining_seconds.return_value = 42
+        self.auth_session_storage.revoke_session_by_secret_hash.return_value = "1" * 32
+
+        await self.use_case.logout(
+            params=AuthLogoutParams(token=token, session_secret=SessionSecret("session-secret")),
+        )
+
+        assert self.verified_token_invalidator.invalidate.call_args_list == [
+            call(invalidation=VerifiedAccessTokenInvalidation.for_token(token=token)),
+            call(invalidation=VerifiedAccessTokenInvalidation.for_session(session_id="1" * 32)),
+        ]
+
+    async def test_logout_skips_session_invalidation_for_unknown_session(self) -> None:
+        token = Token(b"valid_token")
+        self.token_handler.get_token_remaining_seconds.return_value = 42
+        self.auth_session_storage.revoke_session_by_secret_hash.side_effect = (
+            AuthSessionNotFoundError
+        )
+
+        await self.use_case.logout(
+            params=AuthLogoutParams(token=token, session_secret=SessionSecret("session-secret")),
+        )
+
+        self.verified_token_invalidator.invalidate.assert_called_once_with(
+            invalidation=VerifiedAccessTokenInvalidation.for_token(token=token),
+        )
 
     async def test_logout_ignores_invalid_token(self) -> None:
         token = Token(b"invalid_token")
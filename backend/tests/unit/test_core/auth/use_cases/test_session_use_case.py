@@ -13,6 +13,7 @@ from core.auth.exceptions import (
     UserNotFoundError,
 )
 from core.auth.generators import AuthSessionSecretGenerator
+from core.auth.password_hashers import PasswordHasher
 from core.auth.schemas import (
     AccessTokenPayload,
     AccessTokenResult,
@@ -28,7 +29,13 @@ from core.auth.schemas import (
     AuthSessionCredentials,
     AuthUseCaseConfig,
 )
-from core.auth.storages import AuthSessionStorage, AuthStorage, TokenRevocationStorage
+from core.auth.storages import (
+    AuthSessionStorage,
+    AuthStorage,
+    TokenRevocationStorage,
+    VerifiedAccessTokenCache,
+    VerifiedAccessTokenInvalidator,
+)
 from core.auth.types import SessionSecret, SessionSecretHash, Token
 from core.auth.use_cases import AuthUseCase
 from tests.test_cases import TestCase
@@ -37,7 +44,7 @@ from tests.test_cases import TestCase
 class TestAuthSessionUseCase(TestCase):
     def setup_method(self) -> None:
         self.now = datetime(2026, 7, 8, 11, 30, tzinfo=UTC)
-        self.hasher = Mock()
+        self.hasher = Mock(spec=PasswordHasher)
         self.token_handler = Mock()
         self.auth_storage = Mock(spec=AuthStorage)
         self.token_revocation_storage = Mock(spec=TokenRevocationStorage)
@@ -69,6 +76,9 @@ class TestAuthSessionUseCase(TestCase):
             session_expires_in_seconds=2_592_000,
             session_absolute_expires_in_seconds=2_592_000,
         )
+        self.verified_token_cache = Mock(spec=VerifiedAccessTokenCache)
+        self.verified_token_cache.get.return_value = None
+        self.verified_token_invalidator = Mock(spec=VerifiedAccessTokenInvalidator)
         self.use_case = AuthUseCase(
             hasher=self.hasher,
             token_handler=self.token_handler,
@@ -78,6 +88,8 @@ class TestAuthSessionUseCase(TestCase):
             user_storage=self.user_storage,
             event_reporter=self.event_reporter,
             auth_session_secret_generator=self.session_secret_generator,
+            verified_token_cache=self.verified_token_cache,
+            verified_token_invalidator=self.verified_token_invalidator,
         )
 
     async def test_login_uses_shorter_absolute_lifetime_when_it_is_less_than_idle_lifetime(
@@ -97,6 +109,8 @@ class TestAuthSessionUseCase(TestCase):
             user_storage=self.user_storage,
             event_reporter=self.event_reporter,
             auth_session_secret_generator=self.session_secret_generator,
+            verified_token_cache=self.verified_token_cache,
+            verified_token_invalidator=self.verified_token_invalidator,
         )
         self.hasher.verify_password.return_value = (True, False)
         self.token_handler.encode_token.return_value = Token(b"ACCESS")
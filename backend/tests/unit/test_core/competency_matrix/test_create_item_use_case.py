@@ -7,7 +7,10 @@ from core.competency_matrix.exceptions import (
     CompetencyMatrixItemNotPublicReadyError,
 )
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.enums import PublishStatusEnum
 from tests.test_cases import TestCase
@@ -21,9 +24,11 @@ class TestCompetencyMatrixUseCase(TestCase):
             self.factory.core.competency_matrix_item_structure()
         )
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     async def test_create_item_with_new_resources(self) -> None:
@@ -3,7 +3,10 @@ from unittest.mock import Mock
 import pytest
 
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from tests.test_cases import TestCase
 
@@ -13,12 +16,15 @@ class TestCompetencyMatrixUseCase(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=CompetencyMatrixStorage)
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     async def test_delete(self) -> None:
         item_id = self.factory.core.hex_id(1)
         await self.use_case.delete_item(item_id=item_id)
         self.storage.delete_competency_matrix_item.assert_called_once_with(item_id=item_id)
+        self.workspace_summary_cache.invalidate.assert_awaited_once_with()
@@ -4,7 +4,10 @@ import pytest
 
 from core.competency_matrix.schemas import CompetencyMatrixResourceSearchParams
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.i18n.enums import LanguageEnum
 from tests.test_cases import TestCase
@@ -15,9 +18,11 @@ class TestFindResourcesItemUseCase(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=CompetencyMatrixStorage)
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     async def test_search_resources(self) -> None:
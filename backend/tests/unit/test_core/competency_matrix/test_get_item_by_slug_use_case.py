@@ -6,7 +6,10 @@ from core.competency_matrix.enums import GradeEnum
 from core.competency_matrix.exceptions import CompetencyMatrixItemNotFoundError
 from core.competency_matrix.schemas import CompetencyMatrixItemBySlugGetParams
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.enums import PublishStatusEnum
 from tests.test_cases import TestCase
@@ -17,9 +20,11 @@ class TestCompetencyMatrixUseCase(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=CompetencyMatrixStorage)
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     async def test_get_item_by_slug_rejects_unavailable_public_item(self) -> None:
@@ -5,7 +5,10 @@ import pytest
 from core.competency_matrix.exceptions import CompetencyMatrixItemNotPublicReadyError
 from core.competency_matrix.schemas import CompetencyMatrixItemPublishStatusSwitchParams
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.enums import PublishStatusEnum
 from tests.test_cases import TestCase
@@ -16,9 +19,11 @@ class TestCompetencyMatrixUseCase(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=CompetencyMatrixStorage)
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     async def test_set_draft(self) -> None:
@@ -55,6 +60,7 @@ class TestCompetencyMatrixUseCase(TestCase):
             item_id=self.factory.core.hex_id(1),
             publish_status=PublishStatusEnum.PUBLISHED,
         )
+        self.workspace_summary_cache.invalidate.assert_awaited_once_with()
 
     async def test_set_published_rejects_item_with_missing_public_fields(self) -> None:
         self.storage.get_competency_matrix_item.return_value = (
@@ -74,3 +80,4 @@ class TestCompetencyMatrixUseCase(TestCase):
             )
 
         self.storage.update_competency_matrix_item_publish_status.assert_not_called()
+        self.workspace_summary_cache.invalidate.assert_not_called()
@@ -24,7 +24,10 @@ from core.competency_matrix.schemas import (
     QueuedCompetencyMatrixQuestionsCreateParams,
 )
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from tests.test_cases import TestCase
 
@@ -37,11 +40,13 @@ class TestQuestionSuggestionsUseCase(TestCase):
             self.factory.core.competency_matrix_item_structure()
         )
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.storage.list_sheets.return_value = self.factory.core.sheets(values=["Python"])
         self.storage.question_suggestion_exists.return_value = False
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     def test_question_fingerprint_normalizes_whitespace_and_unicode_case(self) -> None:
@@ -14,7 +14,10 @@ from core.competency_matrix.schemas import (
     CompetencyMatrixWorkspaceSummary,
 )
 from core.competency_matrix.services import QuestionSuggestionLimiter
-from core.competency_matrix.storages import CompetencyMatrixStorage
+from core.competency_matrix.storages import (
+    CompetencyMatrixStorage,
+    CompetencyMatrixWorkspaceSummaryCache,
+)
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.enums import PublishStatusEnum
 from core.i18n.enums import LanguageEnum
@@ -26,9 +29,11 @@ class TestCompetencyMatrixWorkspaceUseCase(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=CompetencyMatrixStorage)
         self.question_suggestion_limiter = Mock(spec=QuestionSuggestionLimiter)
+        self.workspace_summary_cache = Mock(spec=CompetencyMatrixWorkspaceSummaryCache)
         self.use_case = CompetencyMatrixUseCase(
             storage=self.storage,
             question_suggestion_limiter=self.question_suggestion_limiter,
+            workspace_summary_cache=self.workspace_summary_cache,
         )
 
     async def test_list_workspace_items_builds_paginated_workspace(self) -> None:
@@ -60,6 +65,7 @@ class TestCompetencyMatrixWorkspaceUseCase(TestCase):
             dangerous_published=0,
             ready_published=1,
         )
+        self.workspace_summary_cache.get_summary.return_value = None
         self.storage.list_competency_matrix_workspace_items.return_value = ([item], 2, summary)
 
         workspace = await self.use_case.list_workspace_items(filters=filters)
@@ -71,3 +77,36 @@ class TestCompetencyMatrixWorkspaceUseCase(TestCase):
         self.storage.list_competency_matrix_workspace_items.assert_called_once_with(
             filters=filters,
         )
+        self.storage.list_competency_matrix_workspace_page.assert_not_called()
+        self.workspace_summary_cache.save_summary.assert_awaited_once_with(
+            filters=filters,
+            summary=summary,
+        )
+
+    async def test_list_workspace_items_reuses_cached_summary(self) -> None:
+        filters = CompetencyMatrixWorkspaceFilters(
+            page=3,
+            page_size=10,
+            language=LanguageEnum.EN,
+            sort=CompetencyMatrixWorkspaceSortEnum.GRADE,
+        )
+        summary = CompetencyMatrixWorkspaceSummary(
+            total=21,
+            draft=4,
+            missing_draft=2,
+            dangerous_published=1,
+            ready_published=16,
+        )
+        self.workspace_summary_cache.get_summary.return_value = summary
+        self.storage.list_competency_matrix_workspace_page.return_value = []
+
+        workspace = await self.use_case.list_workspace_items(filters=filters)
+
+        assert workspace.total_count == 21
+        assert workspace.total_pages == 3
+        assert workspace.summary == summary
+        self.storage.list_competency_matrix_workspace_page.assert_awaited_once_with(
+            filters=filters,
+        )
+        self.storage.list_competency_matrix_workspace_items.assert_not_called()
+        self.workspace_summary_cache.save_summary.assert_not_called()
@@ -0,0 +1,400 @@
+import hashlib
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+
+from core.files.clients import MultipartUploadClient
+from core.files.enums import FilePurpose
+from core.files.exceptions import (
+    DirectUploadSessionNotFoundError,
+    DirectUploadVerificationError,
+    FileClientInternalError,
+    FilePurposeNotAllowedError,
+    FileSizeTooLargeError,
+    InvalidFileDataError,
+)
+from core.files.file_name_generators import FileNameGenerator
+from core.files.schemas import (
+    CompletedDirectUpload,
+    CompletedUploadPart,
+    DirectUploadConfig,
+    DirectUploadParams,
+    DirectUploadSession,
+    FileRead,
+    FileRule,
+    FileRules,
+    FileServiceConfig,
+    ObjectDigest,
+    StoredFile,
+    UploadPartUrl,
+)
+from core.files.services import DirectUploadService, FileDirectUploadService, FileService
+from core.files.storages import DirectUploadSessionStorage, FileStorage
+from tests.test_cases import TestCase
+
+NOW = datetime(2026, 7, 3, 10, 0, tzinfo=UTC)
+CONTENT = b"large attachment"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+PARTS = (CompletedUploadPart(part_number=1, etag='"etag-1"'),)
+
+
+@dataclass
+class InMemoryDirectUploadSessionStorage(DirectUploadSessionStorage):
+    sessions: dict[str, tuple[DirectUploadSession, int]] = field(default_factory=dict)
+
+    async def save_session(self, *, session: DirectUploadSession, ttl_seconds: int) -> None:
+        self.sessions[session.id] = (session, ttl_seconds)
+
+    async def take_session(self, *, session_id: str) -> DirectUploadSession | None:
+        entry = self.sessions.pop(session_id, None)
+        return None if entry is None else entry[0]
+
+
+def upload_params(**overrides: object) -> DirectUploadParams:
+    params = DirectUploadParams(
+        name="Dataset",
+        original_name="dataset.zip",
+        mime_type="application/zip",
+        size_bytes=len(CONTENT),
+        sha256=SHA256,
+    )
+    return replace(params, **overrides)  # type: ignore[arg-type]
+
+
+class TestDirectUploadService(TestCase):
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.client = Mock(spec=MultipartUploadClient)
+        self.client.create_upload.return_value = "upload-id"
+        self.client.complete_upload.return_value = '"object-etag-1"'
+        self.client.presign_part_urls.side_effect = lambda *, object_name, part_count, **_: tuple(
+            UploadPartUrl(part_number=number, url=f"https://s3/{object_name}?part={number}")
+            for number in range(1, part_count + 1)
+        )
+        self.client.read_digest.return_value = ObjectDigest(
+            size_bytes=len(CONTENT),
+            sha256=SHA256,
+        )
+        self.session_storage = InMemoryDirectUploadSessionStorage()
+        self.service = DirectUploadService(
+            client=self.client,
+            session_storage=self.session_storage,
+            config=DirectUploadConfig(
+                part_size_bytes=5,
+                max_size_bytes=64,
+                url_expires_in_seconds=600,
+                session_ttl_seconds=1_800,
+                original_name_max_length=32,
+                mime_type_max_length=32,
+            ),
+        )
+
+    async def start(self, **overrides: object) -> None:
+        await self.service.start(
+            session_id="session-id",
+            owner_username="admin",
+            scope="files:attachment",
+            object_name="attachments/dataset.zip",
+            params=upload_params(**overrides),
+            allowed_mime_types=frozenset({"*/*"}),
+            current_datetime=NOW,
+        )
+
+    async def test_start_presigns_one_url_per_part_and_stores_session(self) -> None:
+        result = await self.service.start(
+            session_id="session-id",
+            owner_username="admin",
+            scope="files:attachment",
+            object_name="attachments/dataset.zip",
+            params=upload_params(),
+            allowed_mime_types=frozenset({"*/*"}),
+            current_datetime=NOW,
+        )
+
+        assert result.session_id == "session-id"
+        assert result.part_size_bytes == 5
+        assert [part.part_number for part in result.parts] == [1, 2, 3, 4]
+        assert result.expires_at == NOW + timedelta(seconds=1_800)
+        self.client.create_upload.assert_awaited_once_with(
+            object_name="attachments/dataset.zip",
+            content_type="application/zip",
+        )
+        session, ttl_seconds = self.session_storage.sessions["session-id"]
+        assert session.upload_id == "upload-id"
+        assert ttl_seconds == 1_800
+
+    @pytest.mark.parametrize(
+        ("overrides", "error"),
+        [
+            ({"size_bytes": 0}, InvalidFileDataError),
+            ({"size_bytes": 65}, FileSizeTooLargeError),
+            ({"sha256": "A" * 64}, InvalidFileDataError),
+            ({"mime_type": "text/plain\r\nX-Evil: 1"}, InvalidFileDataError),
+        ],
+    )
+    async def test_start_rejects_invalid_declarations_before_touching_storage(
+        self,
+        overrides: dict[str, object],
+        error: type[Exception],
+    ) -> None:
+        with pytest.raises(error):
+            await self.start(**overrides)
+
+        self.client.create_upload.assert_not_awaited()
+        assert self.session_storage.sessions == {}
+
+    async def test_complete_returns_session_and_object_etag_once_digest_matches(self) -> None:
+        await self.start()
+
+        completed = await self.service.complete(
+            session_id="session-id",
+            owner_username="admin",
+            scope="files:attachment",
+            parts=PARTS,
+            current_datetime=NOW,
+        )
+
+        assert completed.session.object_name == "attachments/dataset.zip"
+        assert completed.object_etag == '"object-etag-1"'
+        self.client.complete_upload.assert_awaited_once_with(
+            object_name="attachments/dataset.zip",
+            upload_id="upload-id",
+            parts=PARTS,
+        )
+        assert self.session_storage.sessions == {}
+        self.client.delete_object.assert_not_awaited()
+
+    async def test_complete_deletes_object_when_digest_differs(self) -> None:
+        await self.start()
+        self.client.read_digest.return_value = ObjectDigest(
+            size_bytes=len(CONTENT),
+            sha256="0" * 64,
+        )
+
+        with pytest.raises(DirectUploadVerificationError):
+            await self.service.complete(
+                session_id="session-id",
+                owner_username="admin",
+                scope="files:attachment",
+                parts=PARTS,
+                current_datetime=NOW,
+            )
+
+        self.client.delete_object.assert_awaited_once_with(object_name="attachments/dataset.zip")
+        assert self.session_storage.sessions == {}
+
+    async def test_complete_aborts_upload_when_parts_are_rejected(self) -> None:
+        await self.start()
+        self.client.complete_upload.side_effect = DirectUploadVerificationError
+
+        with pytest.raises(DirectUploadVerificationError):
+            await self.service.complete(
+                session_id="session-id",
+                owner_username="admin",
+                scope="files:attachment",
+                parts=PARTS,
+                current_datetime=NOW,
+            )
+
+        self.client.abort_upload.assert_awaited_once_with(
+            object_name="attachments/dataset.zip",
+            upload_id="upload-id",
+        )
+        self.client.read_digest.assert_not_awaited()
+
+    async def test_complete_keeps_session_for_retry_after_storage_error(self) -> None:
+        await self.start()
+        self.client.complete_upload.side_effect = FileClientInternalError(message="boom")
+
+        with pytest.raises(FileClientInternalError):
+            await self.service.complete(
+                session_id="session-id",
+                owner_username="admin",
+                scope="files:attachment",
+                parts=PARTS,
+                current_datetime=NOW + timedelta(seconds=300),
+            )
+
+        _, ttl_seconds = self.session_storage.sessions["session-id"]
+        assert ttl_seconds == 1_500
+        self.client.abort_upload.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        ("owner_username", "scope"),
+        [("moderator", "files:attachment"), ("admin", "knowledge:item-id")],
+    )
+    async def test_complete_hides_sessions_of_other_owners_and_scopes(
+        self,
+        owner_username: str,
+        scope: str,
+    ) -> None:
+        await self.start()
+
+        with pytest.raises(DirectUploadSessionNotFoundError):
+            await self.service.complete(
+                session_id="session-id",
+                owner_username=owner_username,
+                scope=scope,
+                parts=PARTS,
+                current_datetime=NOW,
+            )
+
+        assert "session-id" in self.session_storage.sessions
+        self.client.complete_upload.assert_not_awaited()
+
+    async def test_complete_rejects_unknown_session(self) -> None:
+        with pytest.raises(DirectUploadSessionNotFoundError):
+            await self.service.complete(
+                session_id="missing",
+                owner_username="admin",
+                scope="files:attachment",
+                parts=PARTS,
+                current_datetime=NOW,
+            )
+
+    async def test_cancel_aborts_upload_and_forgets_session(self) -> None:
+        await self.start()
+
+        await self.service.cancel(
+            session_id="session-id",
+            owner_username="admin",
+            scope="files:attachment",
+            current_datetime=NOW,
+        )
+
+        self.client.abort_upload.assert_awaited_once_with(
+            object_name="attachments/dataset.zip",
+            upload_id="upload-id",
+        )
+        assert self.session_storage.sessions == {}
+
+
+class TestFileDirectUploadService(TestCase):
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.direct_uploads = Mock(spec=DirectUploadService)
+        self.direct_uploads.complete.return_value = CompletedDirectUpload(
+            session=DirectUploadSession(
+                id="session-id",
+                owner_username="admin",
+                scope="files:attachment",
+                upload_id="upload-id",
+                object_name="attachments/dataset.zip",
+                params=upload_params(),
+                expires_at=NOW + timedelta(hours=1),
+            ),
+            object_etag='"object-etag-1"',
+        )
+        self.file_service = Mock(spec=FileService)
+        self.file_service.find_duplicate.return_value = None
+        self.file_service.to_read.side_effect = lambda *, file: FileRead(
+            file=file,
+            access_url=f"https://cdn/{file.relative_path}",
+            markdown_url=f"https://cdn/{file.relative_path}#fileId={file.id}",
+        )
+        self.file_storage = Mock(spec=FileStorage)
+        self.file_storage.create_file.side_effect = lambda *, file: file
+        self.file_name_generator = Mock(spec=FileNameGenerator)
+        self.file_name_generator.return_value = "attachments/dataset.zip"
+        self.service = FileDirectUploadService(
+            file_service=self.file_service,
+            file_storage=self.file_storage,
+            file_name_generator=self.file_name_generator,
+            direct_uploads=self.direct_uploads,
+            config=FileServiceConfig(
+                namespace="media",
+                rules=FileRules(
+                    values={
+                        FilePurpose.ATTACHMENT: FileRule(
+                            folder="attachments",
+                            allowed_mime_types=frozenset({"*/*"}),
+                            max_size_bytes=16,
+                        ),
+                    },
+                ),
+            ),
+            purposes=frozenset({FilePurpose.ATTACHMENT}),
+        )
+
+    async def test_start_upload_targets_purpose_folder(self) -> None:
+        await self.service.start_upload(
+            session_id="session-id",
+            owner_username="admin",
+            purpose=FilePurpose.ATTACHMENT,
+            params=upload_params(),
+            current_datetime=NOW,
+        )
+
+        self.file_name_generator.assert_called_once_with(
+            folder="attachments",
+            file_extension=".zip",
+        )
+        self.direct_uploads.start.assert_awaited_once_with(
+            session_id="session-id",
+            owner_username="admin",
+            scope="files:attachment",
+            object_name="attachments/dataset.zip",
+            params=upload_params(),
+            allowed_mime_types=frozenset({"*/*"}),
+            current_datetime=NOW,
+        )
+
+    async def test_start_upload_rejects_purposes_that_need_server_processing(self) -> None:
+        with pytest.raises(FilePurposeNotAllowedError):
+            await self.service.start_upload(
+                session_id="session-id",
+                owner_username="admin",
+                purpose=FilePurpose.ARTICLE_COVER_IMAGE,
+                params=upload_params(),
+                current_datetime=NOW,
+            )
+
+        self.direct_uploads.start.assert_not_awaited()
+
+    async def test_complete_upload_creates_orphaned_file_row(self) -> None:
+        result = await self.service.complete_upload(
+            file_id="file-id",
+            session_id="session-id",
+            owner_username="admin",
+            purpose=FilePurpose.ATTACHMENT,
+            parts=PARTS,
+            current_datetime=NOW,
+        )
+
+        assert result.file == StoredFile(
+            id="file-id",
+            purpose=FilePurpose.ATTACHMENT,
+            namespace="media",
+            relative_path="attachments/dataset.zip",
+            mime_type="application/zip",
+            size_bytes=len(CONTENT),
+            name="Dataset",
+            original_name="dataset.zip",
+            original_sha256=SHA256,
+            orphaned_at=NOW,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        self.direct_uploads.discard_object.assert_not_awaited()
+
+    async def test_complete_upload_reuses_duplicate_and_discards_new_object(self) -> None:
+        duplicate = Mock(spec=FileRead)
+        self.file_service.find_duplicate.return_value = duplicate
+
+        result = await self.service.complete_upload(
+            file_id="file-id",
+            session_id="session-id",
+            owner_username="admin",
+            purpose=FilePurpose.ATTACHMENT,
+            parts=PARTS,
+            current_datetime=NOW,
+        )
+
+        assert result is duplicate
+        self.direct_uploads.discard_object.assert_awaited_once_with(
+            session=self.direct_uploads.complete.return_value.session,
+        )
+        self.file_storage.create_file.assert_not_awaited()
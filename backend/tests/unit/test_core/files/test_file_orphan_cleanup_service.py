@@ -1,10 +1,10 @@
 from datetime import UTC, datetime
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
+import pytest_asyncio
 
 from core.files.clients import FileClient
-from core.files.exceptions import FileClientInternalError
 from core.files.schemas import FileOrphanCleanupConfig, FileOrphanCleanupResult, StoredFiles
 from core.files.services import FileOrphanCleanupService
 from core.files.storages import FileStorage
@@ -12,85 +12,98 @@ from tests.test_cases import TestCase
 
 
 class TestFileOrphanCleanupService(TestCase):
-    async def test_prune_deletes_objects_before_metadata_and_returns_counts(self) -> None:
-        cutoff = datetime(2026, 7, 1, tzinfo=UTC)
-        first = self.factory.core.stored_file(file_id=1, orphaned_at=cutoff)
-        second = self.factory.core.stored_file(file_id=2, orphaned_at=cutoff)
-        client = Mock(spec=FileClient)
-        storage = Mock(spec=FileStorage)
-        storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(
-            values=[first, second],
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.cutoff = datetime(2026, 7, 1, tzinfo=UTC)
+        self.client = Mock(spec=FileClient)
+        self.client.delete_files.return_value = frozenset()
+        self.storage = Mock(spec=FileStorage)
+        self.storage.list_file_ids_with_usages.return_value = frozenset()
+        self.service = FileOrphanCleanupService(
+            file_client=self.client,
+            file_storage=self.storage,
+            config=FileOrphanCleanupConfig(namespace="media", batch_size=2),
+        )
+
+    async def test_prune_deletes_objects_before_metadata_in_bulk(self) -> None:
+        first = self.factory.core.stored_file(file_id=1, orphaned_at=self.cutoff)
+        second = self.factory.core.stored_file(
+            file_id=2,
+            relative_path="article-content-images/second.png",
+            orphaned_at=self.cutoff,
+            variants=(
+                self.factory.core.file_variant(
+                    relative_path="article-content-images/second-640w.webp",
+                ),
+            ),
         )
-        storage.file_has_usages.return_value = False
-        service = FileOrphanCleanupService(
-            file_client=client,
-            file_storage=storage,
-            config=FileOrphanCleanupConfig(namespace="media", batch_size=100),
+        self.storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(
+            values=[first, second],
         )
+        order = Mock()
+        order.attach_mock(self.client.delete_files, "delete_objects")
+        order.attach_mock(self.storage.delete_files, "delete_rows")
 
-        result = await service.prune(cutoff=cutoff)
+        result = await self.service.prune(cutoff=self.cutoff)
 
         assert result == FileOrphanCleanupResult(
             scanned_count=2,
             deleted_count=2,
             failed_count=0,
             skipped_in_use_count=0,
+            has_more=True,
         )
-        storage.list_orphaned_files_for_cleanup.assert_awaited_once_with(
+        self.storage.list_orphaned_files_for_cleanup.assert_awaited_once_with(
             namespace="media",
-            cutoff=cutoff,
-            limit=100,
+            cutoff=self.cutoff,
+            limit=2,
         )
-        client.delete_file.assert_has_awaits(
-            [
-                call(object_name=first.relative_path, namespace="media"),
-                call(object_name=second.relative_path, namespace="media"),
-            ],
+        self.storage.list_file_ids_with_usages.assert_awaited_once_with(
+            file_ids=frozenset({first.id, second.id}),
+        )
+        assert [name for name, _, _ in order.mock_calls] == ["delete_objects", "delete_rows"]
+        self.client.delete_files.assert_awaited_once_with(
+            object_names=(
+                first.relative_path,
+                "article-content-images/second.png",
+                "article-content-images/second-640w.webp",
+            ),
+            namespace="media",
         )
-        storage.delete_file.assert_has_awaits(
-            [call(file_id=first.id), call(file_id=second.id)],
+        self.storage.delete_files.assert_awaited_once_with(
+            file_ids=frozenset({first.id, second.id}),
         )
+        self.client.delete_file.assert_not_called()
+        self.storage.delete_file.assert_not_called()
 
-    async def test_prune_keeps_metadata_after_client_error_and_continues(self) -> None:
-        cutoff = datetime(2026, 7, 1, tzinfo=UTC)
-        failed = self.factory.core.stored_file(file_id=1, orphaned_at=cutoff)
-        deleted = self.factory.core.stored_file(file_id=2, orphaned_at=cutoff)
-        client = Mock(spec=FileClient)
-        client.delete_file.side_effect = [
-            FileClientInternalError(message="MinIO failed"),
-            None,
-        ]
-        storage = Mock(spec=FileStorage)
-        storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(
-            values=[failed, deleted],
+    async def test_prune_keeps_rows_whose_objects_failed_to_delete(self) -> None:
+        failed = self.factory.core.stored_file(
+            file_id=1,
+            relative_path="article-content-images/failed.png",
+            orphaned_at=self.cutoff,
         )
-        storage.file_has_usages.return_value = False
-        service = FileOrphanCleanupService(
-            file_client=client,
-            file_storage=storage,
-            config=FileOrphanCleanupConfig(namespace="media", batch_size=100),
+        deleted = self.factory.core.stored_file(
+            file_id=2,
+            relative_path="article-content-images/deleted.png",
+            orphaned_at=self.cutoff,
         )
+        self.storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(
+            values=[failed, deleted],
+        )
+        self.client.delete_files.return_value = frozenset({"article-content-images/failed.png"})
 
-        result = await service.prune(cutoff=cutoff)
+        result = await self.service.prune(cutoff=self.cutoff)
 
         assert result.failed_count == 1
         assert result.deleted_count == 1
-        storage.delete_file.assert_awaited_once_with(file_id=deleted.id)
+        self.storage.delete_files.assert_awaited_once_with(file_ids=frozenset({deleted.id}))
 
     async def test_prune_clears_orphan_marker_when_usage_reappeared(self) -> None:
-        cutoff = datetime(2026, 7, 1, tzinfo=UTC)
-        file = self.factory.core.stored_file(file_id=1, orphaned_at=cutoff)
-        client = Mock(spec=FileClient)
-        storage = Mock(spec=FileStorage)
-        storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(values=[file])
-        storage.file_has_usages.return_value = True
-        service = FileOrphanCleanupService(
-            file_client=client,
-            file_storage=storage,
-            config=FileOrphanCleanupConfig(namespace="media", batch_size=100),
-        )
+        in_use = self.factory.core.stored_file(file_id=1, orphaned_at=self.cutoff)
+        self.storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(values=[in_use])
+        self.storage.list_file_ids_with_usages.return_value = frozenset({in_use.id})
 
-        result = await service.prune(cutoff=cutoff)
+        result = await self.service.prune(cutoff=self.cutoff)
 
         assert result == FileOrphanCleanupResult(
             scanned_count=1,
@@ -98,25 +111,32 @@ class TestFileOrphanCleanupService(TestCase):
             failed_count=0,
             skipped_in_use_count=1,
         )
-        storage.set_files_attached.assert_awaited_once_with(file_ids=frozenset({file.id}))
-        client.delete_file.assert_not_called()
-        storage.delete_file.assert_not_called()
+        self.storage.set_files_attached.assert_awaited_once_with(file_ids=frozenset({in_use.id}))
+        self.client.delete_files.assert_awaited_once_with(object_names=(), namespace="media")
+        self.storage.delete_files.assert_not_called()
+
+    async def test_prune_reports_no_more_work_when_a_full_batch_makes_no_progress(self) -> None:
+        self.storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(
+            values=[
+                self.factory.core.stored_file(file_id=1, relative_path="one.png"),
+                self.factory.core.stored_file(file_id=2, relative_path="two.png"),
+            ],
+        )
+        self.client.delete_files.return_value = frozenset({"one.png", "two.png"})
+
+        result = await self.service.prune(cutoff=self.cutoff)
+
+        assert result.failed_count == 2
+        assert result.has_more is False
+        self.storage.delete_files.assert_not_called()
 
     async def test_prune_propagates_unexpected_errors(self) -> None:
-        cutoff = datetime(2026, 7, 1, tzinfo=UTC)
-        file = self.factory.core.stored_file(file_id=1, orphaned_at=cutoff)
-        client = Mock(spec=FileClient)
-        client.delete_file.side_effect = RuntimeError("unexpected")
-        storage = Mock(spec=FileStorage)
-        storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(values=[file])
-        storage.file_has_usages.return_value = False
-        service = FileOrphanCleanupService(
-            file_client=client,
-            file_storage=storage,
-            config=FileOrphanCleanupConfig(namespace="media", batch_size=100),
+        self.storage.list_orphaned_files_for_cleanup.return_value = StoredFiles(
+            values=[self.factory.core.stored_file(file_id=1, orphaned_at=self.cutoff)],
         )
+        self.client.delete_files.side_effect = RuntimeError("unexpected")
 
         with pytest.raises(RuntimeError, match="unexpected"):
-            await service.prune(cutoff=cutoff)
+            await self.service.prune(cutoff=self.cutoff)
 
-        storage.delete_file.assert_not_called()
+        self.storage.delete_files.assert_not_called()
@@ -6,17 +6,19 @@ from unittest.mock import Mock, call
 import pytest
 import pytest_asyncio
 
+from core.exceptions import EntryNotFoundError
 from core.files.clients import FileClient
 from core.files.enums import FilePurpose
 from core.files.exceptions import (
     ContentTypeNotAllowedError,
+    FileClientInternalError,
     FileInUseError,
     FileNameInvalidError,
     FilePurposeNotAllowedError,
     FileSizeTooLargeError,
 )
 from core.files.file_name_generators import FileNameGenerator
-from core.files.processors import FileContentProcessor
+from core.files.processors import FileContentProcessor, FileVariantGenerator
 from core.files.schemas import (
     FileRead,
     FileRule,
@@ -25,9 +27,14 @@ from core.files.schemas import (
     FileUpdateParams,
     FileUploadParams,
     FileUploadResult,
+    FileVariant,
+    FileVariantRead,
+    FileVariantRendition,
+    FileVariantsConfig,
     StoredFile,
+    UploadContent,
 )
-from core.files.services import FileService
+from core.files.services import FileService, FileVariantService
 from core.files.storages import FileStorage
 from tests.test_cases import TestCase
 
@@ -106,7 +113,7 @@ class TestFileService(TestCase):
                 name="Inline image",
                 original_name="original.png",
                 mime_type="image/png",
-                content=b"data",
+                content=UploadContent.from_bytes(b"data"),
             ),
         )
 
@@ -119,11 +126,11 @@ class TestFileService(TestCase):
             folder="article-content-images",
             file_extension=".png",
         )
-        self.file_content_processor.process.assert_called_once()
+        self.file_content_processor.process.assert_awaited_once()
         self.file_client.upload_file.assert_awaited_once()
         upload_call = self.file_client.upload_file.await_args.kwargs
         assert isinstance(upload_call["file_data"], BytesIO)
-        assert upload_call["file_data"].getvalue() == b"data"
+        assert upload_call["file_data"].read() == b"data"
         assert upload_call["object_name"] == "article-content-images/file-id.png"
         assert upload_call["namespace"] == "media"
         assert upload_call["content_type"] == "image/png"
@@ -137,7 +144,7 @@ class TestFileService(TestCase):
             name="Cover",
             original_name="cover.png",
             mime_type="image/webp",
-            content=b"webp",
+            content=UploadContent.from_bytes(b"webp"),
         )
         self.file_content_processor.process.side_effect = None
         self.file_content_processor.process.return_value = optimized_params
@@ -174,7 +181,7 @@ class TestFileService(TestCase):
                 name="Cover",
                 original_name="cover.png",
                 mime_type="image/png",
-                content=b"png-data",
+                content=UploadContent.from_bytes(b"png-data"),
             ),
         )
 
@@ -218,7 +225,7 @@ class TestFileService(TestCase):
                 name="New requested name",
                 original_name="duplicate.png",
                 mime_type="image/png",
-                content=b"same",
+                content=UploadContent.from_bytes(b"same"),
             ),
         )
 
@@ -262,7 +269,7 @@ class TestFileService(TestCase):
                 name="Duplicate",
                 original_name="duplicate.png",
                 mime_type="image/png",
-                content=b"same",
+                content=UploadContent.from_bytes(b"same"),
             ),
         )
 
@@ -302,7 +309,7 @@ class TestFileService(TestCase):
                 name="Cover",
                 original_name="cover.png",
                 mime_type="image/png",
-                content=b"data",
+                content=UploadContent.from_bytes(b"data"),
             ),
         )
 
@@ -327,7 +334,7 @@ class TestFileService(TestCase):
                     name="Inline image",
                     original_name="original.png",
                     mime_type="image/png",
-                    content=b"data",
+                    content=UploadContent.from_bytes(b"data"),
                 ),
             )
 
@@ -343,7 +350,7 @@ class TestFileService(TestCase):
                     name="Inline image",
                     original_name="original.txt",
                     mime_type="text/plain",
-                    content=b"data",
+                    content=UploadContent.from_bytes(b"data"),
                 ),
             )
 
@@ -360,7 +367,7 @@ class TestFileService(TestCase):
                     name="Cover",
                     original_name="cover.pdf",
                     mime_type="application/pdf",
-                    content=b"%PDF",
+                    content=UploadContent.from_bytes(b"%PDF"),
                 ),
             )
 
@@ -398,7 +405,7 @@ class TestFileService(TestCase):
                 name="Document",
                 original_name="document.pdf",
                 mime_type="application/pdf",
-                content=b"%PDF-1.7",
+                content=UploadContent.from_bytes(b"%PDF-1.7"),
             ),
         )
 
@@ -421,7 +428,7 @@ class TestFileService(TestCase):
                     name="Inline image",
                     original_name="original.png",
                     mime_type="image/png",
-                    content=b"large",
+                    content=UploadContent.from_bytes(b"large"),
                 ),
             )
 
@@ -438,7 +445,7 @@ class TestFileService(TestCase):
                     name="   ",
                     original_name="original.png",
                     mime_type="image/png",
-                    content=b"data",
+                    content=UploadContent.from_bytes(b"data"),
                 ),
             )
 
@@ -540,6 +547,23 @@ class TestFileService(TestCase):
                 purpose=FilePurpose.ARTICLE_COVER_IMAGE,
             )
 
+    async def test_get_file_exposes_variant_access_urls(self) -> None:
+        variant = self.factory.core.file_variant()
+        stored_file = self.factory.core.stored_file(file_id="file-id", variants=(variant,))
+        self.file_storage.get_file.return_value = stored_file
+        self.file_client.get_access_url.side_effect = lambda *, object_name, namespace: (
+            f"https://cdn.example.test/{namespace}/{object_name}"
+        )
+
+        result = await self.service.get_file(file_id="file-id")
+
+        assert result.variants == (
+            FileVariantRead(
+                variant=variant,
+                access_url="https://cdn.example.test/media/article-content-images/file-640w.webp",
+            ),
+        )
+
     async def test_delete_file_rejects_file_with_usages_before_external_io(self) -> None:
         self.file_storage.file_has_usages.return_value = True
 
@@ -611,5 +635,125 @@ class TestFileService(TestCase):
         )
 
 
+class TestFileVariantService(TestCase):
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.file_client = Mock(spec=FileClient)
+        self.file_client.download_file.return_value = b"original"
+        self.file_storage = Mock(spec=FileStorage)
+        self.file_storage.get_file.return_value = self.factory.core.stored_file(
+            file_id="file-id",
+            purpose=FilePurpose.ARTICLE_COVER_IMAGE,
+            relative_path="article-cover-images/file-id.png",
+        )
+        self.variant_generator = Mock(spec=FileVariantGenerator)
+        self.variant_generator.generate.return_value = (
+            FileVariantRendition(
+                width_px=320,
+                height_px=180,
+                mime_type="image/avif",
+                file_extension=".avif",
+                content=b"avif",
+            ),
+            FileVariantRendition(
+                width_px=320,
+                height_px=180,
+                mime_type="image/webp",
+                file_extension=".webp",
+                content=b"webp!",
+            ),
+        )
+        self.service = FileVariantService(
+            file_client=self.file_client,
+            file_storage=self.file_storage,
+            variant_generator=self.variant_generator,
+            config=FileVariantsConfig(purposes=frozenset({FilePurpose.ARTICLE_COVER_IMAGE})),
+        )
+        self.expected_variants = (
+            FileVariant(
+                width_px=320,
+                height_px=180,
+                mime_type="image/avif",
+                relative_path="article-cover-images/file-id-320w.avif",
+                size_bytes=4,
+            ),
+            FileVariant(
+                width_px=320,
+                height_px=180,
+                mime_type="image/webp",
+                relative_path="article-cover-images/file-id-320w.webp",
+                size_bytes=5,
+            ),
+        )
+
+    async def test_generate_variants_stores_renditions_next_to_original(self) -> None:
+        variants = await self.service.generate_variants(file_id="file-id")
+
+        assert variants == self.expected_variants
+        self.file_client.download_file.assert_awaited_once_with(
+            object_name="article-cover-images/file-id.png",
+            namespace="media",
+        )
+        self.variant_generator.generate.assert_awaited_once_with(
+            content=b"original",
+            mime_type="image/png",
+        )
+        uploads = self.file_client.upload_file.await_args_list
+        assert [upload.kwargs["object_name"] for upload in uploads] == [
+            "article-cover-images/file-id-320w.avif",
+            "article-cover-images/file-id-320w.webp",
+        ]
+        assert [upload.kwargs["content_type"] for upload in uploads] == [
+            "image/avif",
+            "image/webp",
+        ]
+        assert uploads[1].kwargs["file_data"].read() == b"webp!"
+        self.file_storage.set_file_variants.assert_awaited_once_with(
+            file_id="file-id",
+            variants=self.expected_variants,
+        )
+
+    async def test_generate_variants_skips_files_with_variants_or_other_purposes(self) -> None:
+        self.file_storage.get_file.side_effect = [
+            self.factory.core.stored_file(
+                purpose=FilePurpose.ARTICLE_COVER_IMAGE,
+                variants=self.expected_variants,
+            ),
+            self.factory.core.stored_file(purpose=FilePurpose.ATTACHMENT),
+            EntryNotFoundError,
+        ]
+
+        assert await self.service.generate_variants(file_id="file-id") == self.expected_variants
+        assert await self.service.generate_variants(file_id="file-id") == ()
+        assert await self.service.generate_variants(file_id="file-id") == ()
+        self.file_client.download_file.assert_not_called()
+        self.file_storage.set_file_variants.assert_not_called()
+
+    async def test_generate_variants_removes_uploaded_objects_when_upload_fails(self) -> None:
+        self.file_client.upload_file.side_effect = [
+            None,
+            FileClientInternalError(message="File upload failed"),
+        ]
+
+        with pytest.raises(FileClientInternalError):
+            await self.service.generate_variants(file_id="file-id")
+
+        self.file_client.delete_file.assert_awaited_once_with(
+            object_name="article-cover-images/file-id-320w.avif",
+            namespace="media",
+        )
+        self.file_storage.set_file_variants.assert_not_called()
+
+    async def test_generate_variants_removes_objects_when_file_was_deleted(self) -> None:
+        self.file_storage.set_file_variants.side_effect = EntryNotFoundError
+
+        assert await self.service.generate_variants(file_id="file-id") == ()
+
+        assert self.file_client.delete_file.await_args_list == [
+            call(object_name="article-cover-images/file-id-320w.avif", namespace="media"),
+            call(object_name="article-cover-images/file-id-320w.webp", namespace="media"),
+        ]
+
+
 def sha256_hex(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
@@ -1,5 +1,5 @@
 from dataclasses import replace
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -10,6 +10,15 @@ from core.files.exceptions import (
     FileSizeTooLargeError,
     InvalidFileDataError,
 )
+from core.files.file_name_generators import FileNameGenerator
+from core.files.schemas import (
+    CompletedDirectUpload,
+    CompletedUploadPart,
+    DirectUploadParams,
+    DirectUploadSession,
+    UploadContent,
+)
+from core.files.services import DirectUploadService
 from core.knowledge.exceptions import KnowledgeFileNotFoundError
 from core.knowledge.files.clients import (
     KnowledgeFileClient,
@@ -18,6 +27,7 @@ from core.knowledge.files.clients import (
 )
 from core.knowledge.files.enums import KnowledgeFileKind
 from core.knowledge.files.schemas import (
+    ByteRange,
     KnowledgeFile,
     KnowledgeFileMutationResult,
     KnowledgeFileRule,
@@ -28,7 +38,10 @@ from core.knowledge.files.schemas import (
 )
 from core.knowledge.files.services import KnowledgeFileCrudService
 from core.knowledge.files.storages import KnowledgeFilesStorage
-from core.knowledge.files.use_cases import KnowledgeFilesUseCase
+from core.knowledge.files.use_cases import (
+    KnowledgeAttachmentDirectUploadUseCase,
+    KnowledgeFilesUseCase,
+)
 from core.knowledge.items.enums import KnowledgeItemKind
 from core.knowledge.items.schemas import KnowledgeItem
 from core.knowledge.items.storages import KnowledgeItemsStorage
@@ -42,6 +55,7 @@ class TestKnowledgeFileCrudService(TestCase):
     def setup(self) -> None:
         self.storage = Mock(spec=KnowledgeFilesStorage)
         self.client = Mock(spec=KnowledgeFileClient)
+        self.client.upload_file.return_value = '"object-etag"'
         self.photo_processor = Mock(spec=KnowledgePhotoProcessor)
         self.rollback_registrar = Mock(spec=KnowledgeFileRollbackRegistrar)
         self.file_name_generator = Mock(return_value="attachments/object.bin")
@@ -82,7 +96,7 @@ class TestKnowledgeFileCrudService(TestCase):
             name=" Notes ",
             original_name="notes.txt",
             mime_type="text/plain",
-            content=b"private",
+            content=UploadContent.from_bytes(b"private"),
         )
         self.storage.create_file.side_effect = lambda *, file: file
 
@@ -95,12 +109,41 @@ class TestKnowledgeFileCrudService(TestCase):
         assert result.name == "Notes"
         assert result.original_sha256
         assert result.relative_path == "attachments/object.bin"
+        assert result.object_etag == '"object-etag"'
         self.photo_processor.process.assert_not_called()
         self.client.upload_file.assert_awaited_once()
         self.rollback_registrar.register_new_object.assert_called_once_with(
             object_name="attachments/object.bin",
         )
 
+    def test_read_file_streams_requested_range_pinned_to_recorded_etag(self) -> None:
+        file = KnowledgeFile(
+            id="1" * 32,
+            item_id="2" * 32,
+            author_username="owner",
+            kind=KnowledgeFileKind.ATTACHMENT,
+            relative_path="attachments/object.bin",
+            mime_type="text/plain",
+            size_bytes=7,
+            name="Notes",
+            original_name="notes.txt",
+            original_sha256="a" * 64,
+            created_at=NOW,
+            updated_at=NOW,
+            object_etag='"object-etag"',
+        )
+        byte_range = ByteRange(start=2, end=4)
+
+        result = self.service.read_file(file=file, byte_range=byte_range)
+
+        assert result.file is file
+        assert result.byte_range == byte_range
+        self.client.stream_file.assert_called_once_with(
+            object_name="attachments/object.bin",
+            byte_range=byte_range,
+            object_etag='"object-etag"',
+        )
+
     async def test_photo_upload_always_uses_processed_webp(self) -> None:
         params = KnowledgeFileUploadParams(
             id="1" * 32,
@@ -110,7 +153,7 @@ class TestKnowledgeFileCrudService(TestCase):
             name="Photo",
             original_name="photo.png",
             mime_type="image/png",
-            content=b"png",
+            content=UploadContent.from_bytes(b"png"),
         )
         self.photo_processor.process.return_value = ProcessedKnowledgePhoto(
             content=b"webp",
@@ -125,7 +168,9 @@ class TestKnowledgeFileCrudService(TestCase):
         )
 
         assert result.mime_type == "image/webp"
+        assert result.original_sha256 == params.content.sha256
         self.client.upload_file.assert_awaited_once()
+        assert self.client.upload_file.await_args.kwargs["content"].read() == b"webp"
         self.rollback_registrar.register_new_object.assert_called_once_with(
             object_name="attachments/object.bin",
         )
@@ -142,7 +187,7 @@ class TestKnowledgeFileCrudService(TestCase):
                     name=" ",
                     original_name="file.txt",
                     mime_type="text/plain",
-                    content=b"x",
+                    content=UploadContent.from_bytes(b"x"),
                 ),
                 FileNameInvalidError,
             ),
@@ -155,7 +200,7 @@ class TestKnowledgeFileCrudService(TestCase):
                     name="Photo",
                     original_name="file.gif",
                     mime_type="image/gif",
-                    content=b"x",
+                    content=UploadContent.from_bytes(b"x"),
                 ),
                 ContentTypeNotAllowedError,
             ),
@@ -168,7 +213,7 @@ class TestKnowledgeFileCrudService(TestCase):
                     name="Photo",
                     original_name="file.png",
                     mime_type="image/png",
-                    content=b"123456",
+                    content=UploadContent.from_bytes(b"123456"),
                 ),
                 FileSizeTooLargeError,
             ),
@@ -181,7 +226,7 @@ class TestKnowledgeFileCrudService(TestCase):
                     name="File",
                     original_name="x" * 256,
                     mime_type="text/plain",
-                    content=b"x",
+                    content=UploadContent.from_bytes(b"x"),
                 ),
                 FileNameInvalidError,
             ),
@@ -194,7 +239,7 @@ class TestKnowledgeFileCrudService(TestCase):
                     name="File",
                     original_name="file.txt",
                     mime_type="x" * 256,
-                    content=b"x",
+                    content=UploadContent.from_bytes(b"x"),
                 ),
                 InvalidFileDataError,
             ),
@@ -291,7 +336,7 @@ class TestKnowledgeFilesUseCase(TestCase):
             name="Private",
             original_name="private.bin",
             mime_type="application/octet-stream",
-            content=b"private",
+            content=UploadContent.from_bytes(b"private"),
         )
         self.file_service.create_file.return_value = self.file
         rollback_registrar = Mock(spec=KnowledgeFileRollbackRegistrar)
@@ -305,3 +350,102 @@ class TestKnowledgeFilesUseCase(TestCase):
         assert result == self.file
         assert self.file_service.create_file.await_args.kwargs["now"] == NOW
         assert self.item_storage.touch_items.await_args.kwargs["updated_at"] == NOW
+
+
+class TestKnowledgeAttachmentDirectUploadUseCase(TestCase):
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.item_storage = Mock(spec=KnowledgeItemsStorage)
+        self.item_storage.get_item_for_author.return_value = KnowledgeItem(
+            id="1" * 32,
+            kind=KnowledgeItemKind.DATE,
+            author_username="owner",
+            display_name="Date",
+            description="",
+            tags=[],
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        self.file_storage = Mock(spec=KnowledgeFilesStorage)
+        self.file_storage.create_file.side_effect = lambda *, file: file
+        self.file_name_generator = Mock(spec=FileNameGenerator)
+        self.file_name_generator.return_value = "attachments/recording.mp4"
+        self.direct_uploads = Mock(spec=DirectUploadService)
+        self.params = DirectUploadParams(
+            name=" Recording ",
+            original_name="recording.mp4",
+            mime_type="video/mp4",
+            size_bytes=104_857_600,
+            sha256="a" * 64,
+        )
+        self.direct_uploads.complete.return_value = CompletedDirectUpload(
+            session=DirectUploadSession(
+                id="session-id",
+                owner_username="owner",
+                scope=f"knowledge:{'1' * 32}",
+                upload_id="upload-id",
+                object_name="attachments/recording.mp4",
+                params=self.params,
+                expires_at=NOW + timedelta(hours=1),
+            ),
+            object_etag='"object-etag-3"',
+        )
+        self.use_case = KnowledgeAttachmentDirectUploadUseCase(
+            item_storage=self.item_storage,
+            file_storage=self.file_storage,
+            file_name_generator=self.file_name_generator,
+            direct_uploads=self.direct_uploads,
+            rule=KnowledgeFileRule(
+                folder="attachments",
+                allowed_mime_types=frozenset({"*/*"}),
+                max_size_bytes=20,
+                original_name_max_length=255,
+                mime_type_max_length=255,
+            ),
+        )
+
+    async def test_start_scopes_session_to_authors_item(self) -> None:
+        await self.use_case.start_upload(
+            session_id="session-id",
+            item_id="1" * 32,
+            author_username="owner",
+            params=self.params,
+            current_datetime=NOW,
+        )
+
+        self.item_storage.get_item_for_author.assert_awaited_once_with(
+            item_id="1" * 32,
+            author_username="owner",
+        )
+        self.direct_uploads.start.assert_awaited_once_with(
+            session_id="session-id",
+            owner_username="owner",
+            scope=f"knowledge:{'1' * 32}",
+            object_name="attachments/recording.mp4",
+            params=self.params,
+            allowed_mime_types=frozenset({"*/*"}),
+            current_datetime=NOW,
+        )
+
+    async def test_complete_registers_object_for_rollback_and_creates_attachment(self) -> None:
+        rollback_registrar = Mock(spec=KnowledgeFileRollbackRegistrar)
+
+        file = await self.use_case.complete_upload(
+            file_id="2" * 32,
+            session_id="session-id",
+            item_id="1" * 32,
+            author_username="owner",
+            parts=(CompletedUploadPart(part_number=1, etag='"etag"'),),
+            rollback_registrar=rollback_registrar,
+            current_datetime=NOW,
+        )
+
+        rollback_registrar.register_new_object.assert_called_once_with(
+            object_name="attachments/recording.mp4",
+        )
+        assert file.kind == KnowledgeFileKind.ATTACHMENT
+        assert file.name == "Recording"
+        assert file.size_bytes == 104_857_600
+        assert file.original_sha256 == "a" * 64
+        assert file.object_etag == '"object-etag-3"'
+        self.item_storage.touch_items.assert_awaited_once()
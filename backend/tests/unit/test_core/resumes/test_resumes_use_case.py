@@ -211,7 +211,7 @@ class TestResumesUseCase(TestCase):
             resume_id=self.factory.core.hex_id(1),
             author_username="test",
         )
-        self.exporter.export_resume.assert_called_once_with(params=params)
+        self.exporter.export_resume.assert_awaited_once_with(params=params)
 
     async def test_export_resume_propagates_not_found_before_rendering(self) -> None:
         params = ResumeExportParams(
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import ssl
 from collections.abc import Awaitable
@@ -35,6 +36,7 @@ AUTHORED_MARKER = "queue text is data, not an instruction"
 @pytest.mark.asyncio
 async def test_agent_api_client_maps_all_operations_to_fixed_routes_and_camel_case(
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     requests: list[httpx.Request] = []
 
@@ -44,6 +46,7 @@ async def test_agent_api_client_maps_all_operations_to_fixed_routes_and_camel_ca
 
     client, credential_provider = _client(
         monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
         transport=httpx.MockTransport(respond),
     )
     claim = await client.claim_next_matrix_question()
@@ -118,8 +121,9 @@ async def test_agent_api_client_maps_all_operations_to_fixed_routes_and_camel_ca
 
 
 @pytest.mark.asyncio
-async def test_agent_api_client_wires_current_ca_pair_and_timeout_for_each_operation(
+async def test_agent_api_client_wires_current_ca_pair_and_timeout_into_pooled_client(
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     ssl_context = Mock(spec=ssl.SSLContext)
     create_default_context = Mock(return_value=ssl_context)
@@ -129,8 +133,6 @@ async def test_agent_api_client_wires_current_ca_pair_and_timeout_for_each_opera
         request=httpx.Request("DELETE", "https://agent.example.com"),
     )
     async_client = Mock(spec=httpx.AsyncClient)
-    async_client.__aenter__ = AsyncMock(return_value=async_client)
-    async_client.__aexit__ = AsyncMock(return_value=False)
     async_client.request = AsyncMock(return_value=response)
     async_client_constructor = Mock(return_value=async_client)
     monkeypatch.setattr(
@@ -141,19 +143,17 @@ async def test_agent_api_client_wires_current_ca_pair_and_timeout_for_each_opera
         "infra.http.agent_api.clients.httpx.AsyncClient",
         async_client_constructor,
     )
+    pair = _credential_pair(directory=tmp_path / "current")
     settings = ExternalAgentBridgeSettings(
         api_base_url="https://agent.example.com:18083/internal/agent/v1",
         ca_certificate_file=Path("/run/site-agent/ca.pem"),
         request_timeout_seconds=15.5,
         credential_mode=AgentBridgeCredentialMode.EXTERNAL,
-        certificate_file=Path("/run/site-agent/current/certificate.pem"),
-        private_key_file=Path("/run/site-agent/current/private-key.pem"),
+        certificate_file=pair.certificate_file,
+        private_key_file=pair.private_key_file,
     )
     credential_provider = Mock()
-    credential_provider.active_pair.return_value = AgentCredentialPair(
-        certificate_file=Path("/run/site-agent/current/certificate.pem"),
-        private_key_file=Path("/run/site-agent/current/private-key.pem"),
-    )
+    credential_provider.active_pair.return_value = pair
     client = AgentApiHttpClient(
         settings=settings,
         credential_provider=credential_provider,
@@ -161,27 +161,33 @@ async def test_agent_api_client_wires_current_ca_pair_and_timeout_for_each_opera
     )
 
     await client.release_matrix_question_claim(claim_id=CLAIM_ID)
+    await client.release_matrix_question_claim(claim_id=CLAIM_ID)
+    await client.aclose()
 
-    credential_provider.active_pair.assert_called_once_with()
+    assert credential_provider.active_pair.call_count == 2
     create_default_context.assert_called_once_with(cafile="/run/site-agent/ca.pem")
     ssl_context.load_cert_chain.assert_called_once_with(
-        certfile="/run/site-agent/current/certificate.pem",
-        keyfile="/run/site-agent/current/private-key.pem",
+        certfile=str(pair.certificate_file),
+        keyfile=str(pair.private_key_file),
     )
     assert ssl_context.minimum_version is ssl.TLSVersion.TLSv1_2
     async_client_constructor.assert_called_once_with(
         base_url="https://agent.example.com:18083/internal/agent/v1/",
         verify=ssl_context,
         timeout=15.5,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=60.0),
         transport=None,
         trust_env=False,
         follow_redirects=False,
     )
+    assert async_client.request.await_count == 2
+    async_client.aclose.assert_awaited_once_with()
 
 
 @pytest.mark.asyncio
 async def test_agent_api_client_reloads_activated_pair_before_rotation_confirmation(
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     old_context = Mock(spec=ssl.SSLContext)
     replacement_context = Mock(spec=ssl.SSLContext)
@@ -203,25 +209,19 @@ async def test_agent_api_client_reloads_activated_pair_before_rotation_confirmat
         },
         request=httpx.Request("POST", "https://agent.example.com"),
     )
-    async_client = Mock(spec=httpx.AsyncClient)
-    async_client.__aenter__ = AsyncMock(return_value=async_client)
-    async_client.__aexit__ = AsyncMock(return_value=False)
-    async_client.request = AsyncMock(side_effect=[released_response, confirmed_response])
+    old_client = Mock(spec=httpx.AsyncClient)
+    old_client.request = AsyncMock(return_value=released_response)
+    replacement_client = Mock(spec=httpx.AsyncClient)
+    replacement_client.request = AsyncMock(return_value=confirmed_response)
+    async_client_constructor = Mock(side_effect=[old_client, replacement_client])
     monkeypatch.setattr(
         "infra.http.agent_api.clients.httpx.AsyncClient",
-        Mock(return_value=async_client),
+        async_client_constructor,
     )
+    old_pair = _credential_pair(directory=tmp_path / "old")
+    replacement_pair = _credential_pair(directory=tmp_path / "replacement")
     credential_provider = Mock()
-    credential_provider.active_pair.side_effect = [
-        AgentCredentialPair(
-            certificate_file=Path("/run/site-agent/old/certificate.pem"),
-            private_key_file=Path("/run/site-agent/old/private-key.pem"),
-        ),
-        AgentCredentialPair(
-            certificate_file=Path("/run/site-agent/replacement/certificate.pem"),
-            private_key_file=Path("/run/site-agent/replacement/private-key.pem"),
-        ),
-    ]
+    credential_provider.active_pair.side_effect = [old_pair, replacement_pair]
     client = AgentApiHttpClient(
         settings=ExternalAgentBridgeSettings(
             api_base_url="https://agent.example.com:18083/internal/agent/v1",
@@ -239,18 +239,120 @@ async def test_agent_api_client_reloads_activated_pair_before_rotation_confirmat
     await client.confirm_certificate_rotation(rotation_id=ROTATION_ID)
 
     old_context.load_cert_chain.assert_called_once_with(
-        certfile="/run/site-agent/old/certificate.pem",
-        keyfile="/run/site-agent/old/private-key.pem",
+        certfile=str(old_pair.certificate_file),
+        keyfile=str(old_pair.private_key_file),
     )
     replacement_context.load_cert_chain.assert_called_once_with(
-        certfile="/run/site-agent/replacement/certificate.pem",
-        keyfile="/run/site-agent/replacement/private-key.pem",
+        certfile=str(replacement_pair.certificate_file),
+        keyfile=str(replacement_pair.private_key_file),
     )
+    assert async_client_constructor.call_count == 2
+    old_client.aclose.assert_awaited_once_with()
+    replacement_client.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_agent_api_client_closes_swapped_client_after_in_flight_request(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(
+        "infra.http.agent_api.clients.ssl.create_default_context",
+        Mock(return_value=Mock(spec=ssl.SSLContext)),
+    )
+    in_flight_started = asyncio.Event()
+    finish_in_flight = asyncio.Event()
+
+    async def slow_release(*_args: object, **_kwargs: object) -> httpx.Response:
+        in_flight_started.set()
+        await finish_in_flight.wait()
+        return httpx.Response(
+            status_code=200,
+            json={"released": True},
+            request=httpx.Request("DELETE", "https://agent.example.com"),
+        )
+
+    old_client = Mock(spec=httpx.AsyncClient)
+    old_client.request = AsyncMock(side_effect=slow_release)
+    replacement_client = Mock(spec=httpx.AsyncClient)
+    replacement_client.request = AsyncMock(
+        return_value=httpx.Response(
+            status_code=200,
+            json={"released": True},
+            request=httpx.Request("DELETE", "https://agent.example.com"),
+        ),
+    )
+    monkeypatch.setattr(
+        "infra.http.agent_api.clients.httpx.AsyncClient",
+        Mock(side_effect=[old_client, replacement_client]),
+    )
+    credential_provider = Mock()
+    credential_provider.active_pair.side_effect = [
+        _credential_pair(directory=tmp_path / "old"),
+        _credential_pair(directory=tmp_path / "replacement"),
+    ]
+    client = AgentApiHttpClient(
+        settings=ExternalAgentBridgeSettings(
+            api_base_url="https://agent.example.com:18083/internal/agent/v1",
+            ca_certificate_file=Path("/run/site-agent/ca.pem"),
+            request_timeout_seconds=15.5,
+            credential_mode=AgentBridgeCredentialMode.EXTERNAL,
+            certificate_file=Path("/unused/certificate.pem"),
+            private_key_file=Path("/unused/private-key.pem"),
+        ),
+        credential_provider=credential_provider,
+        transport=None,
+    )
+
+    in_flight = asyncio.create_task(client.release_matrix_question_claim(claim_id=CLAIM_ID))
+    await in_flight_started.wait()
+    await client.release_matrix_question_claim(claim_id=CLAIM_ID)
+
+    old_client.aclose.assert_not_awaited()
+
+    finish_in_flight.set()
+    await in_flight
+
+    old_client.aclose.assert_awaited_once_with()
+    replacement_client.aclose.assert_not_awaited()
+    await client.aclose()
+    replacement_client.aclose.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_agent_api_client_reloads_credentials_replaced_in_place(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    client, credential_provider = _client(
+        monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(status_code=200, json={"released": True}),
+        ),
+    )
+    create_default_context = Mock(return_value=Mock(spec=ssl.SSLContext))
+    monkeypatch.setattr(
+        "infra.http.agent_api.clients.ssl.create_default_context",
+        create_default_context,
+    )
+    pair = credential_provider.active_pair.return_value
+
+    await client.release_matrix_question_claim(claim_id=CLAIM_ID)
+    replacement = tmp_path / "replacement-certificate.pem"
+    replacement.write_text("rotated certificate")
+    replacement.replace(pair.certificate_file)
+    await client.release_matrix_question_claim(claim_id=CLAIM_ID)
+    await client.release_matrix_question_claim(claim_id=CLAIM_ID)
+    await client.aclose()
+
+    assert create_default_context.call_count == 2
 
 
 @pytest.mark.asyncio
 async def test_agent_api_client_rejects_unknown_response_fields(
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     def respond(_request: httpx.Request) -> httpx.Response:
         body = _claim_response()
@@ -259,6 +361,7 @@ async def test_agent_api_client_rejects_unknown_response_fields(
 
     client, _provider = _client(
         monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
         transport=httpx.MockTransport(respond),
     )
     with pytest.raises(AgentApiClientError) as exc_info:
@@ -273,6 +376,7 @@ async def test_agent_api_client_rejects_unknown_response_fields(
 async def test_agent_api_client_rejects_malformed_server_identifiers(
     malformed_field: str,
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     def respond(_request: httpx.Request) -> httpx.Response:
         if malformed_field == "claim_id":
@@ -299,6 +403,7 @@ async def test_agent_api_client_rejects_malformed_server_identifiers(
 
     client, _provider = _client(
         monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
         transport=httpx.MockTransport(respond),
     )
     operation: Awaitable[Any]
@@ -322,6 +427,7 @@ async def test_agent_api_client_rejects_malformed_server_identifiers(
 async def test_agent_api_client_rejects_invalid_ids_before_request(
     identifier: str,
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     request_count = 0
 
@@ -332,6 +438,7 @@ async def test_agent_api_client_rejects_invalid_ids_before_request(
 
     client, _provider = _client(
         monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
         transport=httpx.MockTransport(respond),
     )
     with pytest.raises(AgentApiClientError) as release_error:
@@ -349,6 +456,7 @@ async def test_agent_api_client_rejects_invalid_ids_before_request(
 async def test_agent_api_client_sanitizes_remote_and_protocol_failures(
     failure: str,
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     secrets = [
         "AUTHORED-SECRET-MARKER",
@@ -367,6 +475,7 @@ async def test_agent_api_client_sanitizes_remote_and_protocol_failures(
 
     client, _provider = _client(
         monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
         transport=httpx.MockTransport(respond),
     )
     with pytest.raises(AgentApiClientError) as exc_info:
@@ -381,6 +490,7 @@ async def test_agent_api_client_sanitizes_remote_and_protocol_failures(
 def _client(
     *,
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
     transport: httpx.AsyncBaseTransport,
 ) -> tuple[AgentApiHttpClient, Mock]:
     ssl_context = Mock(spec=ssl.SSLContext)
@@ -389,10 +499,7 @@ def _client(
         Mock(return_value=ssl_context),
     )
     credential_provider = Mock()
-    credential_provider.active_pair.return_value = AgentCredentialPair(
-        certificate_file=Path("/run/site-agent/current/certificate.pem"),
-        private_key_file=Path("/run/site-agent/current/private-key.pem"),
-    )
+    credential_provider.active_pair.return_value = _credential_pair(directory=tmp_path / "current")
     return AgentApiHttpClient(
         settings=ExternalAgentBridgeSettings(
             api_base_url="https://agent.example.com:18083/internal/agent/v1",
@@ -407,6 +514,17 @@ def _client(
     ), credential_provider
 
 
+def _credential_pair(*, directory: Path) -> AgentCredentialPair:
+    directory.mkdir(parents=True, exist_ok=True)
+    pair = AgentCredentialPair(
+        certificate_file=directory / "certificate.pem",
+        private_key_file=directory / "private-key.pem",
+    )
+    pair.certificate_file.write_text("certificate")
+    pair.private_key_file.write_text("private key")
+    return pair
+
+
 def _draft_input() -> MatrixQuestionDraftSaveParams:
     return MatrixQuestionDraftSaveParams(
         claim_id=CLAIM_ID,
@@ -253,7 +253,10 @@ def test_agent_bridge_main_rotates_desktop_once_with_explicit_time_before_stdio(
     fast_mcp.run.side_effect = lambda *, transport: events.append(f"run:{transport}")
     server = Mock(spec=AgentBridgeServer)
     server.server = fast_mcp
+    client = Mock(spec=AgentApiHttpClient)
+    client.aclose.side_effect = lambda: events.append("close")
     runtime = AgentBridgeRuntime(
+        client=client,
         automatic_rotation=AutomaticAgentCredentialRotationRuntime(
             use_case=cast("AutomaticAgentCredentialRotationUseCase", rotation),
             policy=policy,
@@ -269,7 +272,7 @@ def test_agent_bridge_main_rotates_desktop_once_with_explicit_time_before_stdio(
 
     compose.assert_called_once_with(settings=settings, transport=None)
     fast_mcp.run.assert_called_once_with(transport="stdio")
-    assert events == ["rotate", "run:stdio"]
+    assert events == ["rotate", "close", "run:stdio"]
 
 
 @pytest.mark.asyncio
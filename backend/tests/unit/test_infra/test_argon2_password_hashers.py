@@ -1,37 +1,66 @@
 # ruff: noqa: S106
+import threading
+from collections.abc import AsyncGenerator
 from unittest.mock import Mock
 
-import pytest
+import pytest_asyncio
 from argon2 import PasswordHasher
 from argon2.exceptions import VerificationError
 
+from core.auth.exceptions import PasswordHashingOverloadedError
 from infra.auth.password_hashers import Argon2PasswordHasher
+from infra.executors import BoundedThreadPoolExecutor
 
 
 class TestArgon2PasswordHasher:
-    @pytest.fixture(autouse=True)
-    def setup(self) -> None:
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self) -> AsyncGenerator[None]:
         self.context_mock = Mock(spec=PasswordHasher)
-        self.hasher = Argon2PasswordHasher(context=self.context_mock)
+        self.executor = BoundedThreadPoolExecutor(
+            max_workers=1,
+            max_queue_depth=1,
+            thread_name_prefix="password-hashing",
+            overloaded_error=PasswordHashingOverloadedError,
+            saturated_log_event="Password hashing queue is saturated",
+            slow_queue_wait_log_event="Slow password hashing queue wait",
+            slow_queue_wait_log_threshold_ms=100,
+        )
+        self.hasher = Argon2PasswordHasher(context=self.context_mock, executor=self.executor)
+        yield
+        self.executor.shutdown()
 
-    def test_hash_password(self) -> None:
+    async def test_hash_password(self) -> None:
         self.context_mock.hash.return_value = "hashed_password"
-        hash_ = self.hasher.hash_password("password")
+        hash_ = await self.hasher.hash_password("password")
         assert hash_ == "hashed_password"
 
-    def test_verify_password_returns_false_and_rehash_on_verification_error(self) -> None:
+    async def test_verify_password_returns_false_and_rehash_on_verification_error(self) -> None:
         self.context_mock.verify.side_effect = VerificationError
-        verified, need_rehash = self.hasher.verify_password(
+        verified, need_rehash = await self.hasher.verify_password(
             plain_password="password",
             hashed_password="hashed_password",
         )
         assert (verified, need_rehash) == (False, True)
 
-    def test_verify_password_returns_verification_and_rehash_flags(self) -> None:
+    async def test_verify_password_returns_verification_and_rehash_flags(self) -> None:
         self.context_mock.verify.return_value = True
         self.context_mock.check_needs_rehash.return_value = True
-        verified, need_rehash = self.hasher.verify_password(
+        verified, need_rehash = await self.hasher.verify_password(
             plain_password="password",
             hashed_password="hashed_password",
         )
         assert (verified, need_rehash) == (True, True)
+
+    async def test_hashing_runs_off_the_event_loop_thread(self) -> None:
+        threads: list[threading.Thread] = []
+
+        def hash_(_password: str) -> str:
+            threads.append(threading.current_thread())
+            return "hashed_password"
+
+        self.context_mock.hash.side_effect = hash_
+
+        await self.hasher.hash_password("password")
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
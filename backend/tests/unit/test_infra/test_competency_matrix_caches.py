@@ -0,0 +1,21 @@
+from unittest.mock import AsyncMock
+
+from core.competency_matrix.storages import CompetencyMatrixWorkspaceSummaryCache
+from infra.competency_matrix_caches import PostCommitCompetencyMatrixWorkspaceSummaryCache
+from infra.post_commit_actions import PostCommitActions
+
+
+class TestPostCommitCompetencyMatrixWorkspaceSummaryCache:
+    async def test_invalidates_only_after_commit(self) -> None:
+        cache = AsyncMock(spec=CompetencyMatrixWorkspaceSummaryCache)
+        post_commit_actions = PostCommitActions(actions=[])
+        request_cache = PostCommitCompetencyMatrixWorkspaceSummaryCache(
+            cache=cache,
+            post_commit_actions=post_commit_actions,
+        )
+
+        await request_cache.invalidate()
+
+        cache.invalidate.assert_not_awaited()
+        await post_commit_actions.run()
+        cache.invalidate.assert_awaited_once_with()
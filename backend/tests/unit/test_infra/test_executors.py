@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from core.exceptions import DomainError
+from infra.executors import BoundedThreadPoolExecutor, BoundedThreadPoolStats
+
+
+class OverloadedError(DomainError):
+    message = "Overloaded"
+
+
+class JobError(Exception): ...
+
+
+class TestBoundedThreadPoolExecutor:
+    def create_executor(
+        self,
+        *,
+        slow_queue_wait_log_threshold_ms: int = 60_000,
+    ) -> BoundedThreadPoolExecutor:
+        return BoundedThreadPoolExecutor(
+            max_workers=1,
+            max_queue_depth=1,
+            thread_name_prefix="test-executor",
+            overloaded_error=OverloadedError,
+            saturated_log_event="Test executor queue is saturated",
+            slow_queue_wait_log_event="Slow test executor queue wait",
+            slow_queue_wait_log_threshold_ms=slow_queue_wait_log_threshold_ms,
+        )
+
+    async def test_rejects_jobs_beyond_queue_depth_and_reports_stats(self) -> None:
+        executor = self.create_executor()
+        release = threading.Event()
+        try:
+            running = asyncio.ensure_future(executor.run(release.wait))
+            queued = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0)
+
+            with pytest.raises(OverloadedError):
+                await executor.run(release.wait)
+            assert executor.stats() == BoundedThreadPoolStats(
+                running=1,
+                queued=1,
+                completed=0,
+                failed=0,
+                rejected=1,
+                max_queued=1,
+            )
+
+            release.set()
+            assert await running is True
+            assert await queued is True
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert executor.stats() == BoundedThreadPoolStats(
+            running=0,
+            queued=0,
+            completed=2,
+            failed=0,
+            rejected=1,
+            max_queued=1,
+        )
+
+    async def test_counts_failed_jobs_apart_from_completed_jobs(self) -> None:
+        executor = self.create_executor()
+
+        def fail() -> None:
+            raise JobError
+
+        try:
+            with pytest.raises(JobError):
+                await executor.run(fail)
+            await executor.run(lambda: None)
+        finally:
+            executor.shutdown()
+
+        assert executor.stats() == BoundedThreadPoolStats(
+            running=0,
+            queued=0,
+            completed=1,
+            failed=1,
+            rejected=0,
+            max_queued=0,
+        )
+
+    async def test_runs_jobs_on_prefixed_worker_threads(self) -> None:
+        executor = self.create_executor()
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+
+        assert thread_name.startswith("test-executor")
+
+    async def test_logs_queue_depth_of_slow_queue_waits_without_rejection(self) -> None:
+        executor = self.create_executor(slow_queue_wait_log_threshold_ms=0)
+        release = threading.Event()
+        try:
+            with patch("infra.executors.logger") as mock_logger:
+                running = asyncio.ensure_future(executor.run(release.wait))
+                queued = asyncio.ensure_future(executor.run(release.wait))
+                await asyncio.sleep(0)
+                release.set()
+                await asyncio.gather(running, queued)
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert mock_logger.warning.call_count == 2
+        first_call = mock_logger.warning.call_args_list[0]
+        assert first_call.kwargs["event"] == "Slow test executor queue wait"
+        assert first_call.kwargs["threshold_ms"] == 0
+        assert first_call.kwargs["queued"] == 1
+        assert first_call.kwargs["max_queued"] == 1
+        assert first_call.kwargs["rejected"] == 0
+
+    async def test_fast_queue_wait_is_not_logged(self) -> None:
+        executor = self.create_executor()
+        try:
+            with patch("infra.executors.logger") as mock_logger:
+                await executor.run(lambda: None)
+        finally:
+            executor.shutdown()
+
+        mock_logger.warning.assert_not_called()
@@ -8,105 +8,116 @@ from PIL import Image
 from core.files.enums import FilePurpose
 from core.files.exceptions import FileImageOptimizationError
 from core.files.processors import FileContentProcessor
-from core.files.schemas import FileUploadParams
+from core.files.schemas import FileUploadParams, UploadContent
 from infra.files.processors import (
     ArticleContentImageContentProcessor,
     ArticleCoverImageContentProcessor,
     AttachmentContentProcessor,
+    ImageVariantRenderer,
     PillowImageProcessor,
+    PooledFileVariantGenerator,
+    PooledImageContentProcessor,
     PurposeFileContentProcessor,
 )
 from tests.test_cases import TestCase
+from tests.unit.mocks.image_processing import InlineImageProcessingPool
 
 
 class TestFileContentProcessors(TestCase):
     def setup_method(self) -> None:
         image_processor = PillowImageProcessor()
+        self.pool = InlineImageProcessingPool()
         self.processor = PurposeFileContentProcessor(
             processors={
-                FilePurpose.ARTICLE_COVER_IMAGE: ArticleCoverImageContentProcessor(
-                    image_processor=image_processor,
-                    max_width_px=160,
-                    max_height_px=90,
-                    webp_quality=82,
-                    webp_method=6,
-                    min_savings_ratio=0.10,
+                FilePurpose.ARTICLE_COVER_IMAGE: PooledImageContentProcessor(
+                    pool=self.pool.as_pool(),
+                    optimizer=ArticleCoverImageContentProcessor(
+                        image_processor=image_processor,
+                        max_width_px=160,
+                        max_height_px=90,
+                        webp_quality=82,
+                        webp_method=6,
+                        min_savings_ratio=0.10,
+                    ),
                 ),
-                FilePurpose.ARTICLE_CONTENT_IMAGE: ArticleContentImageContentProcessor(
-                    image_processor=image_processor,
-                    max_width_px=192,
-                    max_height_px=192,
-                    jpeg_webp_quality=88,
-                    webp_method=6,
-                    min_savings_ratio=0.10,
+                FilePurpose.ARTICLE_CONTENT_IMAGE: PooledImageContentProcessor(
+                    pool=self.pool.as_pool(),
+                    optimizer=ArticleContentImageContentProcessor(
+                        image_processor=image_processor,
+                        max_width_px=192,
+                        max_height_px=192,
+                        jpeg_webp_quality=88,
+                        webp_method=6,
+                        min_savings_ratio=0.10,
+                    ),
                 ),
                 FilePurpose.ATTACHMENT: AttachmentContentProcessor(),
             },
         )
 
-    def test_process_dispatches_cover_policy_to_sixteen_nine_webp(self) -> None:
+    async def test_process_dispatches_cover_policy_to_sixteen_nine_webp(self) -> None:
         original = create_rgb_png(width=640, height=480)
 
-        result = self.processor.process(
+        result = await self.processor.process(
             params=FileUploadParams(
                 id="file-id",
                 purpose=FilePurpose.ARTICLE_COVER_IMAGE,
                 name="Cover image",
                 original_name="cover.png",
                 mime_type="image/png",
-                content=original,
+                content=UploadContent.from_bytes(original),
             ),
         )
 
         assert result.mime_type == "image/webp"
         assert result.file_extension == ".webp"
         assert result.size_bytes <= int(len(original) * 0.90)
-        with Image.open(BytesIO(result.content)) as image:
+        with Image.open(result.content.rewind()) as image:
             assert image.format == "WEBP"
             assert image.width <= 160
             assert image.height <= 90
 
-    def test_process_dispatches_content_policy_with_larger_square_bound(self) -> None:
+    async def test_process_dispatches_content_policy_with_larger_square_bound(self) -> None:
         original = create_rgb_jpeg(width=640, height=480)
 
-        result = self.processor.process(
+        result = await self.processor.process(
             params=FileUploadParams(
                 id="file-id",
                 purpose=FilePurpose.ARTICLE_CONTENT_IMAGE,
                 name="Inline image",
                 original_name="inline.jpg",
                 mime_type="image/jpeg",
-                content=original,
+                content=UploadContent.from_bytes(original),
             ),
         )
 
         assert result.mime_type == "image/webp"
-        with Image.open(BytesIO(result.content)) as image:
+        with Image.open(result.content.rewind()) as image:
             assert image.format == "WEBP"
             assert image.width == 192
             assert image.height == 144
 
-    def test_process_converts_content_png_to_lossless_webp_when_smaller(self) -> None:
+    async def test_process_converts_content_png_to_lossless_webp_when_smaller(self) -> None:
         original = create_flat_png(width=64, height=64)
 
-        result = self.processor.process(
+        result = await self.processor.process(
             params=FileUploadParams(
                 id="file-id",
                 purpose=FilePurpose.ARTICLE_CONTENT_IMAGE,
                 name="Diagram",
                 original_name="diagram.png",
                 mime_type="image/png",
-                content=original,
+                content=UploadContent.from_bytes(original),
             ),
         )
 
         assert result.mime_type == "image/webp"
         assert result.size_bytes <= int(len(original) * 0.90)
-        with Image.open(BytesIO(original)) as source, Image.open(BytesIO(result.content)) as output:
+        with Image.open(BytesIO(original)) as source, Image.open(result.content.rewind()) as output:
             assert output.format == "WEBP"
             assert output.convert("RGBA").tobytes() == source.convert("RGBA").tobytes()
 
-    def test_process_keeps_tiny_content_webp_when_resize_is_not_needed(self) -> None:
+    async def test_process_keeps_tiny_content_webp_when_resize_is_not_needed(self) -> None:
         original = create_static_webp(width=4, height=4)
         params = FileUploadParams(
             id="file-id",
@@ -114,16 +125,16 @@ class TestFileContentProcessors(TestCase):
             name="Tiny image",
             original_name="tiny.webp",
             mime_type="image/webp",
-            content=original,
+            content=UploadContent.from_bytes(original),
         )
 
-        result = self.processor.process(params=params)
+        result = await self.processor.process(params=params)
 
         assert result is params
         assert result.mime_type == "image/webp"
-        assert result.content == original
+        assert result.content.read() == original
 
-    def test_process_validates_and_preserves_gif_without_conversion(self) -> None:
+    async def test_process_validates_and_preserves_gif_without_conversion(self) -> None:
         original = create_gif()
         params = FileUploadParams(
             id="file-id",
@@ -131,16 +142,16 @@ class TestFileContentProcessors(TestCase):
             name="Animation",
             original_name="animation.gif",
             mime_type="image/gif",
-            content=original,
+            content=UploadContent.from_bytes(original),
         )
 
-        result = self.processor.process(params=params)
+        result = await self.processor.process(params=params)
 
         assert result is params
         assert result.mime_type == "image/gif"
-        assert result.content == original
+        assert result.content.read() == original
 
-    def test_process_preserves_animated_webp_frames_without_conversion(self) -> None:
+    async def test_process_preserves_animated_webp_frames_without_conversion(self) -> None:
         original = create_animated_webp()
         params = FileUploadParams(
             id="file-id",
@@ -148,14 +159,14 @@ class TestFileContentProcessors(TestCase):
             name="Animated webp",
             original_name="animation.webp",
             mime_type="image/webp",
-            content=original,
+            content=UploadContent.from_bytes(original),
         )
 
-        result = self.processor.process(params=params)
+        result = await self.processor.process(params=params)
 
         assert result is params
-        assert result.content == original
-        with Image.open(BytesIO(result.content)) as image:
+        assert result.content.read() == original
+        with Image.open(result.content.rewind()) as image:
             animated_image = cast("Any", image)
             assert image.format == "WEBP"
             assert animated_image.is_animated
@@ -168,59 +179,59 @@ class TestFileContentProcessors(TestCase):
             ("image/webp", "fake.webp"),
         ],
     )
-    def test_process_rejects_fake_article_image_bytes(
+    async def test_process_rejects_fake_article_image_bytes(
         self,
         mime_type: str,
         original_name: str,
     ) -> None:
         with pytest.raises(FileImageOptimizationError):
-            self.processor.process(
+            await self.processor.process(
                 params=FileUploadParams(
                     id="file-id",
                     purpose=FilePurpose.ARTICLE_COVER_IMAGE,
                     name="Broken image",
                     original_name=original_name,
                     mime_type=mime_type,
-                    content=b"not an image",
+                    content=UploadContent.from_bytes(b"not an image"),
                 ),
             )
 
-    def test_process_rejects_mime_spoofed_article_image_bytes(self) -> None:
+    async def test_process_rejects_mime_spoofed_article_image_bytes(self) -> None:
         with pytest.raises(FileImageOptimizationError):
-            self.processor.process(
+            await self.processor.process(
                 params=FileUploadParams(
                     id="file-id",
                     purpose=FilePurpose.ARTICLE_CONTENT_IMAGE,
                     name="Spoofed image",
                     original_name="spoofed.gif",
                     mime_type="image/gif",
-                    content=create_rgb_png(width=16, height=16),
+                    content=UploadContent.from_bytes(create_rgb_png(width=16, height=16)),
                 ),
             )
 
-    def test_process_leaves_attachment_bytes_unchanged_without_image_validation(self) -> None:
+    async def test_process_leaves_attachment_bytes_unchanged_without_image_validation(self) -> None:
         params = FileUploadParams(
             id="file-id",
             purpose=FilePurpose.ATTACHMENT,
             name="Attachment",
             original_name="attachment.pdf",
             mime_type="application/pdf",
-            content=b"%PDF fake but good enough for attachment tests",
+            content=UploadContent.from_bytes(b"%PDF fake but good enough for attachment tests"),
         )
 
-        result = self.processor.process(params=params)
+        result = await self.processor.process(params=params)
 
         assert result is params
         assert result.content == params.content
 
-    def test_purpose_processor_can_dispatch_to_non_image_processors(self) -> None:
+    async def test_purpose_processor_can_dispatch_to_non_image_processors(self) -> None:
         params = FileUploadParams(
             id="file-id",
             purpose=FilePurpose.ATTACHMENT,
             name="Attachment",
             original_name="attachment.bin",
             mime_type="application/octet-stream",
-            content=b"source",
+            content=UploadContent.from_bytes(b"source"),
         )
         processor = PurposeFileContentProcessor(
             processors={
@@ -230,17 +241,64 @@ class TestFileContentProcessors(TestCase):
             },
         )
 
-        result = processor.process(params=params)
+        result = await processor.process(params=params)
 
-        assert result.content == b"processed"
+        assert result.content.read() == b"processed"
+
+
+class TestPooledFileVariantGenerator(TestCase):
+    def setup_method(self) -> None:
+        self.pool = InlineImageProcessingPool()
+        self.generator = PooledFileVariantGenerator(
+            pool=self.pool.as_pool(),
+            renderer=ImageVariantRenderer(
+                image_processor=PillowImageProcessor(),
+                webp_quality=80,
+                webp_method=4,
+                avif_quality=55,
+                avif_speed=8,
+            ),
+            widths_px=(32, 64, 128),
+        )
+
+    async def test_generate_renders_avif_and_webp_per_width_below_original(self) -> None:
+        renditions = await self.generator.generate(
+            content=create_rgb_png(width=100, height=50),
+            mime_type="image/png",
+        )
+
+        assert [
+            (rendition.width_px, rendition.height_px, rendition.mime_type)
+            for rendition in renditions
+        ] == [
+            (32, 16, "image/avif"),
+            (32, 16, "image/webp"),
+            (64, 32, "image/avif"),
+            (64, 32, "image/webp"),
+        ]
+        assert len(self.pool.jobs) == 3
+        for rendition in renditions:
+            with Image.open(BytesIO(rendition.content)) as image:
+                assert image.format == rendition.file_extension.removeprefix(".").upper()
+                assert image.size == (rendition.width_px, rendition.height_px)
+
+    async def test_generate_skips_gif_images(self) -> None:
+        assert await self.generator.generate(content=create_gif(), mime_type="image/gif") == ()
+
+    async def test_generate_rejects_mime_spoofed_bytes(self) -> None:
+        with pytest.raises(FileImageOptimizationError):
+            await self.generator.generate(
+                content=create_rgb_png(width=100, height=50),
+                mime_type="image/jpeg",
+            )
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RecordingContentProcessor(FileContentProcessor):
     result_content: bytes
 
-    def process(self, *, params: FileUploadParams) -> FileUploadParams:
-        return replace(params, content=self.result_content)
+    async def process(self, *, params: FileUploadParams) -> FileUploadParams:
+        return replace(params, content=UploadContent.from_bytes(self.result_content))
 
 
 def create_rgb_png(*, width: int, height: int) -> bytes:
@@ -0,0 +1,78 @@
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from core.files.exceptions import FileImageOptimizationError
+from infra.files.image_processing_pool import ImageProcessingPool, ImageProcessingStats
+
+
+def reject_image() -> None:
+    raise FileImageOptimizationError
+
+
+def burn_cpu() -> None:
+    while True:
+        pass
+
+
+def sleep_briefly() -> int:
+    time.sleep(0.2)
+    return os.getpid()
+
+
+def crash_worker() -> None:
+    os._exit(1)
+
+
+class TestImageProcessingPool:
+    @pytest_asyncio.fixture
+    async def pool(self) -> AsyncIterator[ImageProcessingPool]:
+        pool = ImageProcessingPool(max_workers=1, max_concurrent_jobs=1, cpu_time_limit_seconds=1)
+        try:
+            yield pool
+        finally:
+            pool.shutdown()
+
+    async def test_runs_jobs_in_worker_process(self, pool: ImageProcessingPool) -> None:
+        assert await pool.run(os.getpid) != os.getpid()
+
+    async def test_reraises_domain_errors_from_worker(self, pool: ImageProcessingPool) -> None:
+        with pytest.raises(FileImageOptimizationError):
+            await pool.run(reject_image)
+
+    async def test_caps_concurrent_jobs(self, pool: ImageProcessingPool) -> None:
+        first = asyncio.create_task(pool.run(sleep_briefly))
+        second = asyncio.create_task(pool.run(sleep_briefly))
+        await asyncio.sleep(0.05)
+
+        assert (pool.running, pool.waiting) == (1, 1)
+        assert await first == await second
+
+    async def test_stops_job_over_cpu_time_limit_and_keeps_worker(
+        self,
+        pool: ImageProcessingPool,
+    ) -> None:
+        worker_pid = await pool.run(os.getpid)
+
+        with pytest.raises(FileImageOptimizationError):
+            await pool.run(burn_cpu)
+
+        assert await pool.run(os.getpid) == worker_pid
+        assert pool.stats() == ImageProcessingStats(
+            running=0,
+            waiting=0,
+            completed=3,
+            cpu_time_exceeded=1,
+            pool_restarts=0,
+        )
+
+    async def test_restarts_pool_after_worker_crash(self, pool: ImageProcessingPool) -> None:
+        with pytest.raises(FileImageOptimizationError):
+            await pool.run(crash_worker)
+
+        assert await pool.run(os.getpid) != os.getpid()
+        assert pool.pool_restarts == 1
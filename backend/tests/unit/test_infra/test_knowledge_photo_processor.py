@@ -4,9 +4,11 @@ import pytest
 from PIL import Image
 
 from core.files.exceptions import FileImageOptimizationError
+from core.files.schemas import UploadContent
 from core.knowledge.files.enums import KnowledgeFileKind
 from core.knowledge.files.schemas import KnowledgeFileUploadParams
-from infra.files.processors import PersonPhotoContentProcessor
+from infra.files.processors import PersonPhotoContentProcessor, PooledKnowledgePhotoProcessor
+from tests.unit.mocks.image_processing import InlineImageProcessingPool
 
 
 def image_bytes(*, image_format: str, size: tuple[int, int] = (20, 10)) -> bytes:
@@ -17,15 +19,19 @@ def image_bytes(*, image_format: str, size: tuple[int, int] = (20, 10)) -> bytes
 
 class TestPersonPhotoContentProcessor:
     def setup_method(self) -> None:
-        self.processor = PersonPhotoContentProcessor(
-            max_width_px=8,
-            max_height_px=8,
-            webp_quality=82,
-            webp_method=6,
+        self.pool = InlineImageProcessingPool()
+        self.processor = PooledKnowledgePhotoProcessor(
+            pool=self.pool.as_pool(),
+            optimizer=PersonPhotoContentProcessor(
+                max_width_px=8,
+                max_height_px=8,
+                webp_quality=82,
+                webp_method=6,
+            ),
         )
 
-    def test_normalizes_supported_photo_to_bounded_webp(self) -> None:
-        result = self.processor.process(
+    async def test_normalizes_supported_photo_to_bounded_webp(self) -> None:
+        result = await self.processor.process(
             params=KnowledgeFileUploadParams(
                 id="1" * 32,
                 item_id="2" * 32,
@@ -34,19 +40,20 @@ class TestPersonPhotoContentProcessor:
                 name="Photo",
                 original_name="photo.png",
                 mime_type="image/png",
-                content=image_bytes(image_format="PNG"),
+                content=UploadContent.from_bytes(image_bytes(image_format="PNG")),
             ),
         )
 
         assert result.mime_type == "image/webp"
+        assert len(self.pool.jobs) == 1
         with Image.open(BytesIO(result.content)) as image:
             assert image.format == "WEBP"
             assert image.width <= 8
             assert image.height <= 8
 
-    def test_rejects_declared_mime_mismatch(self) -> None:
+    async def test_rejects_declared_mime_mismatch(self) -> None:
         with pytest.raises(FileImageOptimizationError):
-            self.processor.process(
+            await self.processor.process(
                 params=KnowledgeFileUploadParams(
                     id="1" * 32,
                     item_id="2" * 32,
@@ -55,11 +62,11 @@ class TestPersonPhotoContentProcessor:
                     name="Photo",
                     original_name="photo.jpg",
                     mime_type="image/jpeg",
-                    content=image_bytes(image_format="PNG"),
+                    content=UploadContent.from_bytes(image_bytes(image_format="PNG")),
                 ),
             )
 
-    def test_rejects_animated_webp(self) -> None:
+    async def test_rejects_animated_webp(self) -> None:
         output = BytesIO()
         frames = [
             Image.new("RGB", (4, 4), color=(255, 0, 0)),
@@ -75,7 +82,7 @@ class TestPersonPhotoContentProcessor:
         )
 
         with pytest.raises(FileImageOptimizationError):
-            self.processor.process(
+            await self.processor.process(
                 params=KnowledgeFileUploadParams(
                     id="1" * 32,
                     item_id="2" * 32,
@@ -84,6 +91,6 @@ class TestPersonPhotoContentProcessor:
                     name="Photo",
                     original_name="photo.webp",
                     mime_type="image/webp",
-                    content=output.getvalue(),
+                    content=UploadContent.from_bytes(output.getvalue()),
                 ),
             )
@@ -71,6 +71,22 @@ class TestPasetoTokenHandler:
             "username": "TEST",
             "session_id": "session-id",
         }
+        assert decoded_token.expires_at == expires_at
+
+    def test_keys_are_parsed_once_per_handler(self) -> None:
+        with patch("pyseto.Key.new", wraps=pyseto.Key.new) as key_new:
+            handler = PasetoTokenHandler(
+                public_key_pem=Secret(test_public_key_pem),
+                secret_key_pem=Secret(test_private_key_pem),
+                token_expire_seconds=60,
+            )
+            for _ in range(3):
+                token = handler.encode_token(
+                    payload=AccessTokenPayload(username="TEST", session_id="session-id"),
+                )
+                handler.decode_token(token)
+
+        assert key_new.call_count == 2
 
     def test_decode_token_rejects_payload_without_expiration(self) -> None:
         token = pyseto.encode(
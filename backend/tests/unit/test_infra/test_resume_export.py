@@ -1,15 +1,26 @@
 import io
 import re
+import threading
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field, replace
 from datetime import date
+from unittest.mock import Mock, patch
 from zipfile import ZipFile
 
+import pytest_asyncio
 from pypdf import PdfReader
 
 from core.i18n.enums import LanguageEnum
 from core.resumes.enums import ResumeCurrentStatusEnum, ResumeExportFormatEnum
-from core.resumes.schemas import ResumeExperienceItem, ResumeExportParams
+from core.resumes.exceptions import ResumeExportOverloadedError
+from core.resumes.exporters import ResumeExportCache
+from core.resumes.schemas import ResumeExperienceItem, ResumeExport, ResumeExportParams
 from infra.config.constants import constants
-from infra.resume_export.document_exporter import ResumeDocumentExporterImpl
+from infra.executors import BoundedThreadPoolExecutor
+from infra.resume_export.document_exporter import (
+    ResumeDocumentExporterImpl,
+    ResumeDocumentRenderer,
+)
 from tests.test_cases import TestCase
 
 
@@ -20,11 +31,11 @@ class TestResumeExportConstants:
         assert constants.resume_export.font_license_path.is_file()
 
 
-class TestResumeDocumentExporter(TestCase):
+class TestResumeDocumentRenderer(TestCase):
     def test_pdf_export_is_linear_and_ats_readable(self) -> None:
-        exporter = self._exporter()
+        renderer = self._renderer()
 
-        document = exporter.export_resume(
+        document = renderer.render(
             params=ResumeExportParams(
                 format=ResumeExportFormatEnum.PDF,
                 title="Backend resume",
@@ -67,9 +78,9 @@ class TestResumeDocumentExporter(TestCase):
         assert not re.search(r"(?m)^\s*•\s*$", text)
 
     def test_pdf_export_preserves_cyrillic_text_for_ru_resume(self) -> None:
-        exporter = self._exporter()
+        renderer = self._renderer()
 
-        document = exporter.export_resume(
+        document = renderer.render(
             params=ResumeExportParams(
                 format=ResumeExportFormatEnum.PDF,
                 title="Backend resume",
@@ -112,9 +123,9 @@ class TestResumeDocumentExporter(TestCase):
         )
 
     def test_docx_export_uses_plain_linear_structure(self) -> None:
-        exporter = self._exporter()
+        renderer = self._renderer()
 
-        document = exporter.export_resume(
+        document = renderer.render(
             params=ResumeExportParams(
                 format=ResumeExportFormatEnum.DOCX,
                 title="Backend resume",
@@ -162,9 +173,9 @@ class TestResumeDocumentExporter(TestCase):
         assert 'w:ascii="Arial"' in styles_xml
 
     def test_pdf_export_generates_pdf_bytes(self) -> None:
-        exporter = self._exporter()
+        renderer = self._renderer()
 
-        document = exporter.export_resume(
+        document = renderer.render(
             params=ResumeExportParams(
                 format=ResumeExportFormatEnum.PDF,
                 title="Backend resume",
@@ -181,9 +192,9 @@ class TestResumeDocumentExporter(TestCase):
         assert document.content.startswith(b"%PDF")
 
     def test_docx_export_generates_docx_with_resume_text(self) -> None:
-        exporter = self._exporter()
+        renderer = self._renderer()
 
-        document = exporter.export_resume(
+        document = renderer.render(
             params=ResumeExportParams(
                 format=ResumeExportFormatEnum.DOCX,
                 title="Backend resume",
@@ -202,8 +213,8 @@ class TestResumeDocumentExporter(TestCase):
         assert "Candidate Name" in document_xml
         assert "Builds reliable backend systems." in document_xml
 
-    def _exporter(self) -> ResumeDocumentExporterImpl:
-        return ResumeDocumentExporterImpl(
+    def _renderer(self) -> ResumeDocumentRenderer:
+        return ResumeDocumentRenderer(
             font_regular_path=constants.resume_export.font_regular_path,
             font_bold_path=constants.resume_export.font_bold_path,
             font_regular_name=constants.resume_export.font_regular_name,
@@ -223,3 +234,116 @@ class TestResumeDocumentExporter(TestCase):
             index = text.find(part, cursor)
             assert index >= 0, f"Expected {part!r} after offset {cursor} in:\n{text}"
             cursor = index + len(part)
+
+    def test_fonts_and_styles_are_built_once_per_renderer(self) -> None:
+        renderer = self._renderer()
+        params = ResumeExportParams(
+            format=ResumeExportFormatEnum.PDF,
+            title="Backend resume",
+            language=LanguageEnum.EN,
+            content=self.factory.core.resume_content(
+                full_name="Candidate Name",
+                role="Backend engineer",
+                summary="Builds reliable backend systems.",
+            ),
+        )
+
+        with (
+            patch("infra.resume_export.document_exporter.TTFont") as ttf_font,
+            patch("infra.resume_export.document_exporter.getSampleStyleSheet") as style_sheet,
+        ):
+            renderer.render(params=params)
+            renderer.render(params=params)
+
+        ttf_font.assert_not_called()
+        style_sheet.assert_not_called()
+
+
+@dataclass
+class InMemoryResumeExportCache(ResumeExportCache):
+    values: dict[str, bytes] = field(default_factory=dict)
+
+    async def get_content(self, *, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def save_content(self, *, key: str, content: bytes) -> None:
+        self.values[key] = content
+
+
+class TestResumeDocumentExporterImpl(TestCase):
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self) -> AsyncGenerator[None]:
+        self.render_threads: list[threading.Thread] = []
+        self.renderer = Mock(spec=ResumeDocumentRenderer)
+        self.renderer.render.side_effect = self.render
+        self.cache = InMemoryResumeExportCache()
+        self.executor = BoundedThreadPoolExecutor(
+            max_workers=1,
+            max_queue_depth=1,
+            thread_name_prefix="resume-export",
+            overloaded_error=ResumeExportOverloadedError,
+            saturated_log_event="Resume export queue is saturated",
+            slow_queue_wait_log_event="Slow resume export queue wait",
+            slow_queue_wait_log_threshold_ms=500,
+        )
+        self.exporter = self.build_exporter(renderer_version=1)
+        yield
+        self.executor.shutdown()
+
+    def build_exporter(self, *, renderer_version: int) -> ResumeDocumentExporterImpl:
+        return ResumeDocumentExporterImpl(
+            renderer=self.renderer,
+            executor=self.executor,
+            cache=self.cache,
+            renderer_version=renderer_version,
+        )
+
+    def render(self, *, params: ResumeExportParams) -> ResumeExport:
+        self.render_threads.append(threading.current_thread())
+        return ResumeExport(
+            format=params.format, content=f"{params.title}.{params.format}".encode()
+        )
+
+    def params(self, **overrides: object) -> ResumeExportParams:
+        params = ResumeExportParams(
+            format=ResumeExportFormatEnum.PDF,
+            title="Backend resume",
+            language=LanguageEnum.EN,
+            content=self.factory.core.resume_content(
+                full_name="Candidate Name",
+                role="Backend engineer",
+                summary="Builds reliable backend systems.",
+            ),
+        )
+        return replace(params, **overrides)  # type: ignore[arg-type]
+
+    async def test_renders_off_the_event_loop_and_caches_the_document(self) -> None:
+        document = await self.exporter.export_resume(params=self.params())
+
+        assert document == ResumeExport(
+            format=ResumeExportFormatEnum.PDF,
+            content=b"Backend resume.pdf",
+        )
+        assert len(self.render_threads) == 1
+        assert self.render_threads[0] is not threading.current_thread()
+        assert self.cache.values == {
+            self.exporter.cache_key(params=self.params()): b"Backend resume.pdf",
+        }
+
+    async def test_repeated_export_of_unchanged_resume_is_served_from_cache(self) -> None:
+        await self.exporter.export_resume(params=self.params())
+
+        document = await self.exporter.export_resume(params=self.params())
+
+        assert document.content == b"Backend resume.pdf"
+        self.renderer.render.assert_called_once()
+
+    async def test_format_content_and_renderer_version_change_the_cache_key(self) -> None:
+        key = self.exporter.cache_key(params=self.params())
+
+        assert key == self.exporter.cache_key(params=self.params())
+        assert key != self.exporter.cache_key(
+            params=self.params(format=ResumeExportFormatEnum.DOCX),
+        )
+        assert key != self.exporter.cache_key(params=self.params(title="Other resume"))
+        assert key != self.build_exporter(renderer_version=2).cache_key(params=self.params())
@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import patch
+
+from valkey.asyncio.connection import Connection
+
+from infra.valkey.connection_pools import (
+    MonitoredBlockingConnectionPool,
+    build_connection_checkout_log_payload,
+)
+
+
+class FakeConnection(Connection):
+    async def connect(self) -> None:
+        return None
+
+    async def can_read_destructive(self) -> bool:
+        return False
+
+    async def disconnect(self, nowait: bool = False) -> None:
+        return None
+
+
+class TestMonitoredBlockingConnectionPool:
+    async def test_logs_saturated_checkout_wait(self) -> None:
+        pool = MonitoredBlockingConnectionPool(
+            name="litestar_cache",
+            slow_checkout_log_threshold_ms=0,
+            max_connections=1,
+            timeout=1,
+            connection_class=FakeConnection,
+        )
+
+        with patch("infra.valkey.connection_pools.logger") as mock_logger:
+            connection = await pool.get_connection("GET")
+            waiting_checkout = asyncio.create_task(pool.get_connection("GET"))
+            await asyncio.sleep(0)
+            await pool.release(connection)
+            assert await waiting_checkout is connection
+
+        assert mock_logger.warning.call_count == 2
+        first_call, second_call = mock_logger.warning.call_args_list
+        assert first_call.kwargs["saturated"] is False
+        assert second_call.args == ("Slow Valkey connection checkout",)
+        assert second_call.kwargs["saturated"] is True
+        assert second_call.kwargs["in_use_connections"] == 1
+        assert second_call.kwargs["max_connections"] == 1
+
+    async def test_fast_checkout_is_not_logged(self) -> None:
+        pool = MonitoredBlockingConnectionPool(
+            name="litestar_cache",
+            slow_checkout_log_threshold_ms=60_000,
+            max_connections=2,
+            timeout=1,
+            connection_class=FakeConnection,
+        )
+
+        with patch("infra.valkey.connection_pools.logger") as mock_logger:
+            await pool.get_connection("GET")
+
+        mock_logger.warning.assert_not_called()
+        assert pool.in_use_connections == 1
+
+    def test_build_checkout_payload_reports_utilization(self) -> None:
+        assert build_connection_checkout_log_payload(
+            pool_name="litestar_cache",
+            wait_ms=12.345,
+            threshold_ms=10,
+            saturated=True,
+            in_use_connections=8,
+            max_connections=32,
+        ) == {
+            "pool": "litestar_cache",
+            "wait_ms": 12.35,
+            "threshold_ms": 10,
+            "saturated": True,
+            "in_use_connections": 8,
+            "max_connections": 32,
+            "utilization": 0.25,
+        }
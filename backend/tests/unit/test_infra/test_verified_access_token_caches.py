@@ -0,0 +1,223 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+import pytest
+from valkey.asyncio import Valkey
+from valkey.exceptions import ConnectionError as ValkeyConnectionError
+
+from core.auth.enums import RoleEnum
+from core.auth.schemas import User, VerifiedAccessToken, VerifiedAccessTokenInvalidation
+from core.auth.types import Token
+from core.schemas import Secret
+from entrypoints.litestar.lifespan.main import listen_for_verified_access_token_invalidations
+from infra.auth.token_caches import (
+    LocalVerifiedAccessTokenCache,
+    PostCommitVerifiedAccessTokenInvalidator,
+    ValkeyVerifiedAccessTokenInvalidationChannel,
+)
+from infra.config.constants import constants
+from infra.post_commit_actions import PostCommitActions
+
+NOW = datetime(2026, 7, 8, 11, 30, tzinfo=UTC)
+
+
+@dataclass
+class FakeClock:
+    value: float = 0.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+@dataclass
+class FakeValkey:
+    published: list[tuple[str, str]] = field(default_factory=list)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, message))
+
+
+@dataclass
+class FakeInvalidationChannel:
+    incoming: list[VerifiedAccessTokenInvalidation]
+    seen_entry_counts: list[int] = field(default_factory=list)
+    cache: LocalVerifiedAccessTokenCache | None = None
+
+    async def listen(self) -> AsyncIterator[VerifiedAccessTokenInvalidation]:
+        for invalidation in self.incoming:
+            yield invalidation
+            if self.cache is not None:
+                self.seen_entry_counts.append(len(self.cache.entries))
+        raise ValkeyConnectionError
+
+
+def verified_token(
+    *,
+    username: str = "Admin",
+    session_id: str = "session-id",
+    expires_at: datetime = NOW + timedelta(minutes=15),
+) -> VerifiedAccessToken:
+    return VerifiedAccessToken(
+        user=User(
+            username=username,
+            role=RoleEnum.ADMIN,
+            password_hash=Secret("hash"),
+            is_active=True,
+        ),
+        session_id=session_id,
+        expires_at=expires_at,
+    )
+
+
+class TestLocalVerifiedAccessTokenCache:
+    async def test_returns_entry_until_local_ttl_elapses(self) -> None:
+        clock = FakeClock()
+        cache = LocalVerifiedAccessTokenCache(max_entries=10, ttl_seconds=30, clock=clock)
+        await cache.set(token=Token(b"token"), verified_token=verified_token())
+
+        assert await cache.get(token=Token(b"token"), now=NOW) == verified_token()
+        clock.value = 30.0
+        assert await cache.get(token=Token(b"token"), now=NOW) is None
+        assert cache.entries == {}
+
+    async def test_drops_entry_once_token_or_session_expires(self) -> None:
+        cache = LocalVerifiedAccessTokenCache(max_entries=10, ttl_seconds=30, clock=FakeClock())
+        await cache.set(
+            token=Token(b"token"),
+            verified_token=verified_token(expires_at=NOW + timedelta(seconds=5)),
+        )
+
+        assert await cache.get(token=Token(b"token"), now=NOW + timedelta(seconds=5)) is None
+
+    async def test_evicts_least_recently_used_entry(self) -> None:
+        cache = LocalVerifiedAccessTokenCache(max_entries=2, ttl_seconds=30, clock=FakeClock())
+        await cache.set(token=Token(b"first"), verified_token=verified_token())
+        await cache.set(token=Token(b"second"), verified_token=verified_token())
+        await cache.get(token=Token(b"first"), now=NOW)
+        await cache.set(token=Token(b"third"), verified_token=verified_token())
+
+        assert list(cache.entries) == [Token(b"first").to_hash(), Token(b"third").to_hash()]
+
+    async def test_forgets_entries_by_token_session_and_username(self) -> None:
+        cache = LocalVerifiedAccessTokenCache(max_entries=10, ttl_seconds=30, clock=FakeClock())
+        await cache.set(token=Token(b"token"), verified_token=verified_token())
+        await cache.set(
+            token=Token(b"other-session"),
+            verified_token=verified_token(session_id="other-session"),
+        )
+        await cache.set(
+            token=Token(b"moderator"),
+            verified_token=verified_token(username="Moderator", session_id="moderator-session"),
+        )
+
+        cache.forget(invalidation=VerifiedAccessTokenInvalidation.for_token(token=Token(b"token")))
+        cache.forget(invalidation=VerifiedAccessTokenInvalidation.for_session(session_id="x"))
+        assert len(cache.entries) == 2
+        cache.forget(
+            invalidation=VerifiedAccessTokenInvalidation.for_session(session_id="other-session")
+        )
+        cache.forget(
+            invalidation=VerifiedAccessTokenInvalidation.for_username(username="moderator")
+        )
+
+        assert cache.entries == {}
+
+    async def test_invalidate_publishes_token_hash_instead_of_token(self) -> None:
+        valkey = FakeValkey()
+        cache = LocalVerifiedAccessTokenCache(
+            max_entries=10,
+            ttl_seconds=30,
+            invalidation_channel=ValkeyVerifiedAccessTokenInvalidationChannel(
+                valkey=cast("Valkey", valkey),
+                channel="invalidations",
+            ),
+        )
+        await cache.set(token=Token(b"token"), verified_token=verified_token())
+
+        await cache.invalidate(
+            invalidation=VerifiedAccessTokenInvalidation.for_token(token=Token(b"token")),
+        )
+
+        assert cache.entries == {}
+        assert valkey.published == [("invalidations", f"token:{Token(b'token').to_hash()}")]
+
+
+class TestValkeyVerifiedAccessTokenInvalidationChannel:
+    def test_round_trips_invalidations(self) -> None:
+        invalidation = VerifiedAccessTokenInvalidation.for_session(session_id="session:id")
+
+        encoded = ValkeyVerifiedAccessTokenInvalidationChannel.encode(invalidation=invalidation)
+
+        assert ValkeyVerifiedAccessTokenInvalidationChannel.decode(encoded) == invalidation
+
+    def test_ignores_unknown_messages(self) -> None:
+        assert ValkeyVerifiedAccessTokenInvalidationChannel.decode("tenant:value") is None
+        assert ValkeyVerifiedAccessTokenInvalidationChannel.decode("username:") is None
+
+
+class TestPostCommitVerifiedAccessTokenInvalidator:
+    async def test_forgets_locally_now_and_publishes_after_commit(self) -> None:
+        valkey = FakeValkey()
+        cache = LocalVerifiedAccessTokenCache(
+            max_entries=10,
+            ttl_seconds=30,
+            invalidation_channel=ValkeyVerifiedAccessTokenInvalidationChannel(
+                valkey=cast("Valkey", valkey),
+                channel="invalidations",
+            ),
+        )
+        await cache.set(token=Token(b"token"), verified_token=verified_token())
+        post_commit_actions = PostCommitActions(actions=[])
+        invalidator = PostCommitVerifiedAccessTokenInvalidator(
+            cache=cache,
+            post_commit_actions=post_commit_actions,
+        )
+
+        await invalidator.invalidate(
+            invalidation=VerifiedAccessTokenInvalidation.for_username(username="Admin"),
+        )
+
+        assert cache.entries == {}
+        assert valkey.published == []
+        await post_commit_actions.run()
+        assert valkey.published == [("invalidations", "username:Admin")]
+
+
+class TestVerifiedAccessTokenInvalidationListener:
+    async def test_applies_remote_invalidations_and_forgets_all_after_disconnect(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        channel = FakeInvalidationChannel(
+            incoming=[VerifiedAccessTokenInvalidation.for_session(session_id="session-id")],
+        )
+        cache = LocalVerifiedAccessTokenCache(
+            max_entries=10,
+            ttl_seconds=30,
+            invalidation_channel=cast("ValkeyVerifiedAccessTokenInvalidationChannel", channel),
+        )
+        channel.cache = cache
+        await cache.set(token=Token(b"token"), verified_token=verified_token())
+        await cache.set(
+            token=Token(b"other"),
+            verified_token=verified_token(session_id="other-session"),
+        )
+        sleep_calls: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleep_calls.append(delay)
+            raise asyncio.CancelledError
+
+        monkeypatch.setattr("entrypoints.litestar.lifespan.main.asyncio.sleep", fake_sleep)
+
+        with pytest.raises(asyncio.CancelledError):
+            await listen_for_verified_access_token_invalidations(cache)
+
+        assert channel.seen_entry_counts == [1]
+        assert cache.entries == {}
+        assert sleep_calls == [
+            constants.auth.authentication_invalidation_listener_retry_delay_seconds,
+        ]
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from io import BytesIO
 from unittest.mock import AsyncMock, Mock, patch
@@ -5,9 +6,13 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from botocore.exceptions import ClientError, EndpointConnectionError
 
-from core.files.exceptions import FileClientInternalError, NamespaceNotAllowedError
-from core.files.schemas import FileUploadResult
-from infra.s3.clients import S3ClientBundle, S3FileClient
+from core.files.exceptions import (
+    DirectUploadVerificationError,
+    FileClientInternalError,
+    NamespaceNotAllowedError,
+)
+from core.files.schemas import CompletedUploadPart, FileUploadResult, ObjectDigest
+from infra.s3.clients import S3ClientBundle, S3FileClient, S3MultipartUploadClient
 
 
 def create_client_error(code: str, operation_name: str = "HeadBucket") -> ClientError:
@@ -29,7 +34,9 @@ def create_s3_client_double() -> Mock:
     client.put_bucket_policy = AsyncMock()
     client.put_bucket_cors = AsyncMock()
     client.put_object = AsyncMock()
+    client.get_object = AsyncMock()
     client.delete_object = AsyncMock()
+    client.delete_objects = AsyncMock(return_value={})
     return client
 
 
@@ -87,7 +94,7 @@ class TestS3FileClient:
                 "CORSRules": [
                     {
                         "AllowedHeaders": ["*"],
-                        "AllowedMethods": ["GET"],
+                        "AllowedMethods": ["GET", "PUT"],
                         "AllowedOrigins": ["https://alittlemoron.ru"],
                         "ExposeHeaders": ["ETag"],
                         "MaxAgeSeconds": 300,
@@ -134,13 +141,43 @@ class TestS3FileClient:
         self.internal_client.put_object.assert_awaited_once_with(
             Bucket="media",
             Key=object_name,
-            Body=b"test content",
+            Body=file_data,
+            ContentLength=12,
             ContentType=content_type,
         )
         mock_settings.minio.get_object_url.assert_called_once_with(
             bucket="media",
             object_path=object_name,
         )
+        self.internal_client.head_bucket.assert_not_called()
+        self.internal_client.put_bucket_policy.assert_not_called()
+        self.internal_client.put_bucket_cors.assert_not_called()
+
+    @patch("infra.s3.clients.settings")
+    async def test_upload_file_provisions_bucket_and_retries_on_no_such_bucket(
+        self,
+        mock_settings: Mock,
+    ) -> None:
+        mock_settings.minio.get_object_url.return_value = "http://localhost/media/test.txt"
+        file_data = BytesIO(b"test content")
+        self.internal_client.head_bucket.side_effect = create_client_error("404")
+        self.internal_client.put_object.side_effect = [
+            create_client_error(code="NoSuchBucket", operation_name="PutObject"),
+            {},
+        ]
+
+        result = await self.storage.upload_file(
+            file_data=file_data,
+            object_name="test.txt",
+            namespace="media",
+            content_type="text/plain",
+        )
+
+        assert result.size == 12
+        self.internal_client.create_bucket.assert_awaited_once_with(Bucket="media")
+        self.internal_client.put_bucket_policy.assert_awaited_once()
+        assert self.internal_client.put_object.await_count == 2
+        assert file_data.tell() == 0
 
     async def test_ensure_namespace_valid(self) -> None:
         file_data = BytesIO(b"test content")
@@ -166,6 +203,28 @@ class TestS3FileClient:
                 namespace="media",
                 content_type="application/octet-stream",
             )
+        self.internal_client.put_object.assert_awaited_once()
+        self.internal_client.head_bucket.assert_not_called()
+
+    async def test_download_file_reads_and_closes_body(self) -> None:
+        body = Mock()
+        body.read = AsyncMock(return_value=b"content")
+        self.internal_client.get_object.return_value = {"Body": body}
+
+        content = await self.storage.download_file(object_name="test.png", namespace="media")
+
+        assert content == b"content"
+        self.internal_client.get_object.assert_awaited_once_with(Bucket="media", Key="test.png")
+        body.close.assert_called_once_with()
+
+    async def test_download_file_minio_exception(self) -> None:
+        self.internal_client.get_object.side_effect = create_client_error(
+            code="NoSuchKey",
+            operation_name="GetObject",
+        )
+
+        with pytest.raises(FileClientInternalError, match="File download failed"):
+            await self.storage.download_file(object_name="test.png", namespace="media")
 
     async def test_delete_file_success(self) -> None:
         await self.storage.delete_file(object_name="test.txt", namespace="media")
@@ -192,6 +251,29 @@ class TestS3FileClient:
         with pytest.raises(FileClientInternalError, match="File delete failed"):
             await self.storage.delete_file(object_name="test.txt", namespace="media")
 
+    async def test_delete_files_batches_keys_and_reports_per_key_failures(self) -> None:
+        object_names = tuple(f"file-{number}.png" for number in range(2001))
+        self.internal_client.delete_objects.side_effect = [
+            {"Errors": [{"Key": "file-7.png", "Code": "AccessDenied", "Message": "denied"}]},
+            create_client_error(code="500", operation_name="DeleteObjects"),
+            {},
+        ]
+
+        failed = await self.storage.delete_files(object_names=object_names, namespace="media")
+
+        assert failed == frozenset({"file-7.png", *object_names[1000:2000]})
+        calls = self.internal_client.delete_objects.await_args_list
+        assert [len(call.kwargs["Delete"]["Objects"]) for call in calls] == [1000, 1000, 1]
+        assert calls[0].kwargs["Bucket"] == "media"
+        assert calls[0].kwargs["Delete"]["Quiet"] is True
+        assert calls[2].kwargs["Delete"]["Objects"] == [{"Key": "file-2000.png"}]
+        self.internal_client.delete_object.assert_not_called()
+
+    async def test_delete_files_without_keys_skips_s3(self) -> None:
+        assert await self.storage.delete_files(object_names=(), namespace="media") == frozenset()
+
+        self.internal_client.delete_objects.assert_not_called()
+
     async def test_init_storage(self) -> None:
         with patch.object(self.storage, "ensure_namespace_exists") as mock_ensure:
             mock_ensure.return_value = None
@@ -212,3 +294,104 @@ class TestS3FileClient:
             bucket="media",
             object_path="test.txt",
         )
+
+
+class TestS3MultipartUploadClient:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.internal_client = create_s3_client_double()
+        self.public_client = create_s3_client_double()
+        self.client = S3MultipartUploadClient(
+            clients=S3ClientBundle(
+                internal=self.internal_client,
+                public=self.public_client,
+            ),
+            bucket_name="knowledge-private",
+            read_chunk_size_bytes=4,
+        )
+
+    async def test_presigns_parts_with_public_client(self) -> None:
+        self.public_client.generate_presigned_url = AsyncMock(
+            side_effect=lambda _operation, *, Params, **_: (  # noqa: N803
+                f"https://files.example/{Params['Key']}?part={Params['PartNumber']}"
+            ),
+        )
+
+        parts = await self.client.presign_part_urls(
+            object_name="attachments/video.mp4",
+            upload_id="upload-id",
+            part_count=2,
+            expires_in_seconds=600,
+        )
+
+        assert [(part.part_number, part.url) for part in parts] == [
+            (1, "https://files.example/attachments/video.mp4?part=1"),
+            (2, "https://files.example/attachments/video.mp4?part=2"),
+        ]
+        self.public_client.generate_presigned_url.assert_any_await(
+            "upload_part",
+            Params={
+                "Bucket": "knowledge-private",
+                "Key": "attachments/video.mp4",
+                "UploadId": "upload-id",
+                "PartNumber": 2,
+            },
+            ExpiresIn=600,
+        )
+
+    async def test_complete_sends_part_etags_and_returns_object_etag(self) -> None:
+        self.internal_client.complete_multipart_upload = AsyncMock(
+            return_value={"ETag": '"object-etag-2"'},
+        )
+
+        object_etag = await self.client.complete_upload(
+            object_name="attachments/video.mp4",
+            upload_id="upload-id",
+            parts=(CompletedUploadPart(part_number=1, etag='"etag"'),),
+        )
+
+        self.internal_client.complete_multipart_upload.assert_awaited_once_with(
+            Bucket="knowledge-private",
+            Key="attachments/video.mp4",
+            UploadId="upload-id",
+            MultipartUpload={"Parts": [{"PartNumber": 1, "ETag": '"etag"'}]},
+        )
+        assert object_etag == '"object-etag-2"'
+
+    @pytest.mark.parametrize(
+        ("code", "error"),
+        [
+            ("InvalidPart", DirectUploadVerificationError),
+            ("NoSuchUpload", DirectUploadVerificationError),
+            ("InternalError", FileClientInternalError),
+        ],
+    )
+    async def test_complete_maps_rejected_parts_to_verification_error(
+        self,
+        code: str,
+        error: type[Exception],
+    ) -> None:
+        self.internal_client.complete_multipart_upload = AsyncMock(
+            side_effect=create_client_error(code, "CompleteMultipartUpload"),
+        )
+
+        with pytest.raises(error):
+            await self.client.complete_upload(
+                object_name="attachments/video.mp4",
+                upload_id="upload-id",
+                parts=(CompletedUploadPart(part_number=1, etag='"etag"'),),
+            )
+
+    async def test_read_digest_streams_object_in_chunks(self) -> None:
+        body = Mock()
+        body.read = AsyncMock(side_effect=[b"larg", b"e fi", b"le", b""])
+        self.internal_client.get_object.return_value = {"Body": body}
+
+        digest = await self.client.read_digest(object_name="attachments/video.mp4")
+
+        assert digest == ObjectDigest(
+            size_bytes=10,
+            sha256=hashlib.sha256(b"large file").hexdigest(),
+        )
+        body.read.assert_awaited_with(4)
+        body.close.assert_called_once_with()
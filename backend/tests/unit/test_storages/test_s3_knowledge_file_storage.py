@@ -1,8 +1,11 @@
+from io import BytesIO
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from botocore.exceptions import ClientError
 
+from core.files.exceptions import FileClientInternalError
+from core.knowledge.files.schemas import ByteRange
 from infra.s3.clients import S3KnowledgeFileClient
 
 
@@ -52,6 +55,63 @@ class TestS3KnowledgeFileClient:
         assert "put_bucket_policy" not in {call[0] for call in self.s3.method_calls}
         assert "put_bucket_cors" not in {call[0] for call in self.s3.method_calls}
 
+    async def test_upload_puts_object_without_bucket_provisioning_and_returns_etag(self) -> None:
+        self.s3.put_object = AsyncMock(return_value={"ETag": '"object-etag"'})
+        content = BytesIO(b"private")
+
+        object_etag = await self.client.upload_file(
+            content=content,
+            object_name="attachments/private.bin",
+            content_type="application/octet-stream",
+        )
+
+        self.s3.put_object.assert_awaited_once_with(
+            Bucket="knowledge-private",
+            Key="attachments/private.bin",
+            Body=content,
+            ContentType="application/octet-stream",
+        )
+        assert [call[0] for call in self.s3.method_calls] == ["put_object"]
+        assert object_etag == '"object-etag"'
+
+    async def test_upload_provisions_bucket_and_retries_only_on_no_such_bucket(self) -> None:
+        self.s3.put_object = AsyncMock(
+            side_effect=[
+                client_error(code="NoSuchBucket", operation="PutObject"),
+                {"ETag": '"object-etag"'},
+            ],
+        )
+        self.s3.head_bucket = AsyncMock(
+            side_effect=client_error(code="NoSuchBucket", operation="HeadBucket"),
+        )
+        self.s3.create_bucket = AsyncMock()
+        self.s3.delete_bucket_policy = AsyncMock()
+        self.s3.delete_bucket_cors = AsyncMock()
+
+        await self.client.upload_file(
+            content=BytesIO(b"private"),
+            object_name="attachments/private.bin",
+            content_type="application/octet-stream",
+        )
+
+        self.s3.create_bucket.assert_awaited_once_with(Bucket="knowledge-private")
+        assert self.s3.put_object.await_count == 2
+
+    async def test_upload_does_not_retry_other_errors(self) -> None:
+        self.s3.put_object = AsyncMock(
+            side_effect=client_error(code="AccessDenied", operation="PutObject"),
+        )
+
+        with pytest.raises(FileClientInternalError, match="Private file upload failed"):
+            await self.client.upload_file(
+                content=BytesIO(b"private"),
+                object_name="attachments/private.bin",
+                content_type="application/octet-stream",
+            )
+
+        self.s3.put_object.assert_awaited_once()
+        assert [call[0] for call in self.s3.method_calls] == ["put_object"]
+
     async def test_stream_yields_multiple_chunks_and_always_closes_body(self) -> None:
         body = Mock()
         body.read = AsyncMock(side_effect=[b"one", b"two", b""])
@@ -65,15 +125,49 @@ class TestS3KnowledgeFileClient:
         assert chunks == [b"one", b"two"]
         assert body.read.await_count == 3
         body.close.assert_called_once_with()
+        self.s3.get_object.assert_awaited_once_with(
+            Bucket="knowledge-private",
+            Key="attachments/private.bin",
+        )
 
-    async def test_cleanup_swallows_object_failures(self) -> None:
-        self.s3.delete_object = AsyncMock(
-            side_effect=[
-                client_error(code="InternalError", operation="DeleteObject"),
-                None,
-            ],
+    async def test_stream_requests_byte_range_pinned_to_recorded_etag(self) -> None:
+        body = Mock()
+        body.read = AsyncMock(side_effect=[b"vate", b""])
+        body.close = Mock()
+        self.s3.get_object = AsyncMock(return_value={"Body": body})
+
+        chunks = [
+            chunk
+            async for chunk in self.client.stream_file(
+                object_name="attachments/private.bin",
+                byte_range=ByteRange(start=3, end=6),
+                object_etag='"object-etag"',
+            )
+        ]
+
+        assert chunks == [b"vate"]
+        self.s3.get_object.assert_awaited_once_with(
+            Bucket="knowledge-private",
+            Key="attachments/private.bin",
+            Range="bytes=3-6",
+            IfMatch='"object-etag"',
+        )
+
+    async def test_cleanup_deletes_objects_in_one_batch_and_swallows_failures(self) -> None:
+        self.s3.delete_objects = AsyncMock(
+            return_value={"Errors": [{"Key": "one", "Code": "InternalError"}]},
         )
 
         await self.client.cleanup_objects(object_names=("one", "two"))
 
-        assert self.s3.delete_object.await_count == 2
+        self.s3.delete_objects.assert_awaited_once_with(
+            Bucket="knowledge-private",
+            Delete={"Objects": [{"Key": "one"}, {"Key": "two"}], "Quiet": True},
+        )
+
+    async def test_cleanup_swallows_unexpected_errors(self) -> None:
+        self.s3.delete_objects = AsyncMock(side_effect=RuntimeError("unexpected"))
+
+        await self.client.cleanup_objects(object_names=("one",))
+
+        self.s3.delete_objects.assert_awaited_once()
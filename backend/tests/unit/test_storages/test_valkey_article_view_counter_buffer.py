@@ -0,0 +1,176 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import Any
+
+from core.articles.enums import ArticleViewSourceCategory
+from core.articles.schemas import ArticleDailyCounterIncrement
+from infra.valkey.storages import ValkeyArticleViewCounterBuffer
+
+ARTICLE_ID = "a" * 32
+VIEWED_ON = date(2026, 3, 4)
+FLUSH_LOCK_TTL_MILLISECONDS = 120_000
+
+
+class FakeValkey:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.strings: dict[str, str] = {}
+        self.registered_scripts: list[bytes] = []
+
+    async def hincrby(self, name: str, key: str, amount: int) -> int:
+        values = self.hashes.setdefault(name, {})
+        value = int(values.get(key.encode(), b"0")) + amount
+        values[key.encode()] = str(value).encode()
+        return value
+
+    async def set(self, name: str, value: str, *, nx: bool, px: int) -> bool:
+        assert nx is True
+        assert px == FLUSH_LOCK_TTL_MILLISECONDS
+        # Yield like a network round trip so concurrent claims interleave.
+        await asyncio.sleep(0)
+        if name in self.strings:
+            return False
+        self.strings[name] = value
+        return True
+
+    def register_script(self, script: bytes) -> Callable[..., Awaitable[Any]]:
+        self.registered_scripts.append(script)
+        if b"RENAME" in script:
+            return self.claim
+        return self.acknowledge
+
+    async def claim(self, *, keys: list[str], args: list[str]) -> list[bytes]:
+        active_key, pending_key = keys
+        assert args == []
+        if pending_key not in self.hashes:
+            if active_key not in self.hashes:
+                return []
+            self.hashes[pending_key] = self.hashes.pop(active_key)
+        return [item for pair in self.hashes[pending_key].items() for item in pair]
+
+    async def acknowledge(self, *, keys: list[str], args: list[str]) -> int:
+        lock_key, pending_key = keys
+        if self.strings.get(lock_key) != args[0]:
+            return 0
+        self.hashes.pop(pending_key, None)
+        del self.strings[lock_key]
+        return 1
+
+
+def build_buffer(*, valkey: FakeValkey) -> ValkeyArticleViewCounterBuffer:
+    return ValkeyArticleViewCounterBuffer(
+        valkey=valkey,  # type: ignore[arg-type]
+        namespace="ARTICLE_VIEW_COUNTERS",
+        flush_lock_ttl_milliseconds=FLUSH_LOCK_TTL_MILLISECONDS,
+    )
+
+
+class TestValkeyArticleViewCounterBuffer:
+    async def test_accumulates_views_per_article_day_and_source(self) -> None:
+        valkey = FakeValkey()
+        buffer = build_buffer(valkey=valkey)
+
+        for _ in range(3):
+            await buffer.increment_view(
+                article_id=ARTICLE_ID,
+                source_category=ArticleViewSourceCategory.SEARCH,
+                viewed_on=VIEWED_ON,
+            )
+        await buffer.increment_engaged_view(
+            article_id=ARTICLE_ID,
+            source_category=ArticleViewSourceCategory.SEARCH,
+            viewed_on=VIEWED_ON,
+        )
+        await buffer.increment_view(
+            article_id=ARTICLE_ID,
+            source_category=ArticleViewSourceCategory.DIRECT,
+            viewed_on=VIEWED_ON,
+        )
+
+        assert valkey.hashes["ARTICLE_VIEW_COUNTERS:active"] == {
+            f"{ARTICLE_ID}:2026-03-04:Search:views".encode(): b"3",
+            f"{ARTICLE_ID}:2026-03-04:Search:engaged_views".encode(): b"1",
+            f"{ARTICLE_ID}:2026-03-04:Direct:views".encode(): b"1",
+        }
+        assert sorted(await buffer.claim_pending(), key=lambda item: item.view_count) == [
+            ArticleDailyCounterIncrement(
+                article_id=ARTICLE_ID,
+                date=VIEWED_ON,
+                source_category=ArticleViewSourceCategory.DIRECT,
+                view_count=1,
+                engaged_view_count=0,
+            ),
+            ArticleDailyCounterIncrement(
+                article_id=ARTICLE_ID,
+                date=VIEWED_ON,
+                source_category=ArticleViewSourceCategory.SEARCH,
+                view_count=3,
+                engaged_view_count=1,
+            ),
+        ]
+
+    async def test_claimed_batch_is_retried_until_acknowledged(self) -> None:
+        valkey = FakeValkey()
+        buffer = build_buffer(valkey=valkey)
+        await buffer.increment_view(
+            article_id=ARTICLE_ID,
+            source_category=ArticleViewSourceCategory.SEARCH,
+            viewed_on=VIEWED_ON,
+        )
+
+        claimed = await buffer.claim_pending()
+        await buffer.increment_view(
+            article_id=ARTICLE_ID,
+            source_category=ArticleViewSourceCategory.SEARCH,
+            viewed_on=VIEWED_ON,
+        )
+        locked_out = await buffer.claim_pending()
+        del valkey.strings["ARTICLE_VIEW_COUNTERS:flush_lock"]
+        retried = await buffer.claim_pending()
+        await buffer.acknowledge_pending()
+        next_batch = await buffer.claim_pending()
+
+        assert locked_out == []
+        assert retried == claimed
+        assert [item.view_count for item in claimed] == [1]
+        assert [item.view_count for item in next_batch] == [1]
+
+    async def test_empty_buffer_claims_nothing_and_releases_flush_lock(self) -> None:
+        valkey = FakeValkey()
+        buffer = build_buffer(valkey=valkey)
+
+        assert await buffer.claim_pending() == []
+        assert valkey.strings == {}
+
+    async def test_concurrent_claims_hand_the_batch_to_one_flush(self) -> None:
+        valkey = FakeValkey()
+        first_worker = build_buffer(valkey=valkey)
+        second_worker = build_buffer(valkey=valkey)
+        await first_worker.increment_view(
+            article_id=ARTICLE_ID,
+            source_category=ArticleViewSourceCategory.SEARCH,
+            viewed_on=VIEWED_ON,
+        )
+
+        claims = await asyncio.gather(first_worker.claim_pending(), second_worker.claim_pending())
+        await second_worker.acknowledge_pending()
+
+        assert sorted(len(claim) for claim in claims) == [0, 1]
+        assert "ARTICLE_VIEW_COUNTERS:pending" in valkey.hashes
+
+    async def test_acknowledge_keeps_batch_claimed_by_another_flush(self) -> None:
+        valkey = FakeValkey()
+        buffer = build_buffer(valkey=valkey)
+        await buffer.increment_view(
+            article_id=ARTICLE_ID,
+            source_category=ArticleViewSourceCategory.SEARCH,
+            viewed_on=VIEWED_ON,
+        )
+        await buffer.claim_pending()
+        valkey.strings["ARTICLE_VIEW_COUNTERS:flush_lock"] = "other-flush"
+
+        await buffer.acknowledge_pending()
+
+        assert "ARTICLE_VIEW_COUNTERS:pending" in valkey.hashes
+        assert b"HGETALL" in valkey.registered_scripts[0]
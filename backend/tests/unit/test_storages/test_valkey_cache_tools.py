@@ -14,54 +14,66 @@ from infra.valkey.storages import (
 
 
 class TestValkeyResponseCacheStatusStorage:
-    async def test_counts_keys_and_ttl_states_across_scan_pages(self) -> None:
+    async def test_reads_counts_and_earliest_expiry_from_expiry_index(self) -> None:
         valkey = Mock(spec=Valkey)
-        valkey.scan = AsyncMock(
-            side_effect=[
-                (7, [b"LITESTAR_articles:first", b"LITESTAR_articles:second"]),
-                (
-                    0,
-                    [
-                        b"LITESTAR_articles:second",
-                        b"LITESTAR_articles:third",
-                        b"LITESTAR_articles:vanished",
-                    ],
-                ),
-            ],
+        pipeline = Mock()
+        pipeline.execute = AsyncMock(
+            return_value=[2, 3, 1, [(b"GET/api/articles", 1_030.5)]],
         )
-        first_pipeline = Mock()
-        first_pipeline.ttl = Mock()
-        first_pipeline.execute = AsyncMock(return_value=[120, -1])
-        second_pipeline = Mock()
-        second_pipeline.ttl = Mock()
-        second_pipeline.execute = AsyncMock(return_value=[30, -2])
-        valkey.pipeline.side_effect = [first_pipeline, second_pipeline]
+        valkey.pipeline.return_value = pipeline
         storage = ValkeyResponseCacheStatusStorage(
             valkey=valkey,
-            namespaces={CacheDomainEnum.ARTICLES: "LITESTAR_articles"},
-            scan_batch_size=200,
+            expiry_index_keys={CacheDomainEnum.ARTICLES: "LITESTAR_EXPIRY_INDEX:articles"},
+            clock=lambda: 1_000.0,
         )
 
         result = await storage.get_domain_status(domain=CacheDomainEnum.ARTICLES)
 
         assert result.domain is CacheDomainEnum.ARTICLES
         assert result.key_count == 3
-        assert result.minimum_remaining_ttl_seconds == 30
+        assert result.minimum_remaining_ttl_seconds == 31
+        assert result.non_expiring_key_count == 1
+        pipeline.zremrangebyscore.assert_called_once_with(
+            "LITESTAR_EXPIRY_INDEX:articles",
+            "-inf",
+            1_000.0,
+        )
+        pipeline.zcount.assert_called_once_with("LITESTAR_EXPIRY_INDEX:articles", "+inf", "+inf")
+        pipeline.zrange.assert_called_once_with(
+            "LITESTAR_EXPIRY_INDEX:articles",
+            0,
+            0,
+            withscores=True,
+        )
+        valkey.scan.assert_not_called()
+
+    async def test_non_expiring_only_domain_has_no_minimum_ttl(self) -> None:
+        valkey = Mock(spec=Valkey)
+        pipeline = Mock()
+        pipeline.execute = AsyncMock(
+            return_value=[0, 1, 1, [(b"GET/api/i18n/languages", float("inf"))]],
+        )
+        valkey.pipeline.return_value = pipeline
+        storage = ValkeyResponseCacheStatusStorage(
+            valkey=valkey,
+            expiry_index_keys={CacheDomainEnum.I18N: "LITESTAR_EXPIRY_INDEX:i18n"},
+            clock=lambda: 1_000.0,
+        )
+
+        result = await storage.get_domain_status(domain=CacheDomainEnum.I18N)
+
+        assert result.key_count == 1
+        assert result.minimum_remaining_ttl_seconds is None
         assert result.non_expiring_key_count == 1
-        assert valkey.scan.await_args_list[0].kwargs == {
-            "cursor": 0,
-            "match": "LITESTAR_articles:*",
-            "count": 200,
-        }
-        assert valkey.scan.await_args_list[1].kwargs["cursor"] == 7
 
     async def test_empty_domain_has_no_minimum_ttl(self) -> None:
         valkey = Mock(spec=Valkey)
-        valkey.scan = AsyncMock(return_value=(0, []))
+        pipeline = Mock()
+        pipeline.execute = AsyncMock(return_value=[0, 0, 0, []])
+        valkey.pipeline.return_value = pipeline
         storage = ValkeyResponseCacheStatusStorage(
             valkey=valkey,
-            namespaces={CacheDomainEnum.I18N: "LITESTAR_i18n"},
-            scan_batch_size=200,
+            expiry_index_keys={CacheDomainEnum.I18N: "LITESTAR_EXPIRY_INDEX:i18n"},
         )
 
         result = await storage.get_domain_status(domain=CacheDomainEnum.I18N)
@@ -69,7 +81,6 @@ class TestValkeyResponseCacheStatusStorage:
         assert result.key_count == 0
         assert result.minimum_remaining_ttl_seconds is None
         assert result.non_expiring_key_count == 0
-        valkey.pipeline.assert_not_called()
 
 
 class TestValkeyCacheWarmOperationStorage:
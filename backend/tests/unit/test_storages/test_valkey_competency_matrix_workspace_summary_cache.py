@@ -0,0 +1,139 @@
+from dataclasses import replace
+from typing import Self
+
+from valkey.exceptions import ConnectionError as ValkeyConnectionError
+
+from core.competency_matrix.enums import CompetencyMatrixWorkspaceSortEnum, GradeEnum
+from core.competency_matrix.schemas import (
+    CompetencyMatrixWorkspaceFilters,
+    CompetencyMatrixWorkspaceSummary,
+)
+from core.i18n.enums import LanguageEnum
+from infra.valkey.storages import ValkeyCompetencyMatrixWorkspaceSummaryCache
+
+
+class FakePipeline:
+    def __init__(self, *, valkey: FakeValkey) -> None:
+        self.valkey = valkey
+        self.commands: list[tuple[str, tuple[object, ...]]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+    def hset(self, name: str, key: str, value: str) -> None:
+        self.commands.append(("hset", (name, key, value)))
+
+    def expire(self, name: str, time: int, *, nx: bool) -> None:
+        self.commands.append(("expire", (name, time, nx)))
+
+    async def execute(self) -> None:
+        if not self.valkey.available:
+            raise ValkeyConnectionError
+        for command, args in self.commands:
+            if command == "hset":
+                name, key, value = args
+                self.valkey.hashes.setdefault(str(name), {})[str(key)] = str(value).encode()
+            else:
+                name, time, nx = args
+                if not nx or str(name) not in self.valkey.expirations:
+                    self.valkey.expirations[str(name)] = int(str(time))
+
+
+class FakeValkey:
+    def __init__(self, *, available: bool = True) -> None:
+        self.available = available
+        self.hashes: dict[str, dict[str, bytes]] = {}
+        self.expirations: dict[str, int] = {}
+
+    async def hget(self, name: str, key: str) -> bytes | None:
+        if not self.available:
+            raise ValkeyConnectionError
+        return self.hashes.get(name, {}).get(key)
+
+    def pipeline(self, *, transaction: bool) -> FakePipeline:
+        assert transaction is True
+        return FakePipeline(valkey=self)
+
+    async def unlink(self, name: str) -> None:
+        if not self.available:
+            raise ValkeyConnectionError
+        self.hashes.pop(name, None)
+        self.expirations.pop(name, None)
+
+
+def build_cache(*, valkey: FakeValkey) -> ValkeyCompetencyMatrixWorkspaceSummaryCache:
+    return ValkeyCompetencyMatrixWorkspaceSummaryCache(
+        valkey=valkey,  # type: ignore[arg-type]
+        namespace="MATRIX_WORKSPACE_SUMMARIES",
+        ttl_seconds=300,
+    )
+
+
+FILTERS = CompetencyMatrixWorkspaceFilters(
+    page=1,
+    page_size=20,
+    language=LanguageEnum.EN,
+    sort=CompetencyMatrixWorkspaceSortEnum.SECTION,
+    grades=(GradeEnum.JUNIOR,),
+)
+SUMMARY = CompetencyMatrixWorkspaceSummary(
+    total=12,
+    draft=5,
+    missing_draft=2,
+    dangerous_published=1,
+    ready_published=6,
+)
+
+
+class TestValkeyCompetencyMatrixWorkspaceSummaryCache:
+    async def test_summary_is_shared_across_pages_and_sorts_of_one_filter(self) -> None:
+        valkey = FakeValkey()
+        cache = build_cache(valkey=valkey)
+
+        await cache.save_summary(filters=FILTERS, summary=SUMMARY)
+
+        assert valkey.expirations == {"MATRIX_WORKSPACE_SUMMARIES:summaries": 300}
+        assert (
+            await cache.get_summary(
+                filters=replace(
+                    FILTERS,
+                    page=4,
+                    page_size=50,
+                    sort=CompetencyMatrixWorkspaceSortEnum.NEWEST,
+                ),
+            )
+            == SUMMARY
+        )
+        assert await cache.get_summary(filters=replace(FILTERS, grades=())) is None
+        assert await cache.get_summary(filters=replace(FILTERS, language=LanguageEnum.RU)) is None
+
+    async def test_later_writes_keep_the_first_expiry(self) -> None:
+        valkey = FakeValkey()
+        cache = build_cache(valkey=valkey)
+        valkey.expirations["MATRIX_WORKSPACE_SUMMARIES:summaries"] = 42
+
+        await cache.save_summary(filters=FILTERS, summary=SUMMARY)
+
+        assert valkey.expirations == {"MATRIX_WORKSPACE_SUMMARIES:summaries": 42}
+
+    async def test_invalidate_drops_every_cached_summary(self) -> None:
+        valkey = FakeValkey()
+        cache = build_cache(valkey=valkey)
+        await cache.save_summary(filters=FILTERS, summary=SUMMARY)
+        await cache.save_summary(filters=replace(FILTERS, grades=()), summary=SUMMARY)
+
+        await cache.invalidate()
+
+        assert valkey.hashes == {}
+        assert await cache.get_summary(filters=FILTERS) is None
+
+    async def test_outage_falls_back_to_cache_miss(self) -> None:
+        cache = build_cache(valkey=FakeValkey(available=False))
+
+        await cache.save_summary(filters=FILTERS, summary=SUMMARY)
+        await cache.invalidate()
+
+        assert await cache.get_summary(filters=FILTERS) is None
@@ -0,0 +1,59 @@
+from datetime import UTC, datetime
+
+from core.files.schemas import DirectUploadParams, DirectUploadSession
+from infra.valkey.storages import ValkeyDirectUploadSessionStorage
+
+
+class FakeValkey:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.expirations: dict[str, int] = {}
+
+    async def set(self, name: str, value: bytes, *, ex: int) -> None:
+        self.values[name] = value
+        self.expirations[name] = ex
+
+    async def getdel(self, name: str) -> bytes | None:
+        return self.values.pop(name, None)
+
+
+SESSION = DirectUploadSession(
+    id="session-id",
+    owner_username="admin",
+    scope="knowledge:item-id",
+    upload_id="upload-id",
+    object_name="attachments/video.mp4",
+    params=DirectUploadParams(
+        name="Recording",
+        original_name="video.mp4",
+        mime_type="video/mp4",
+        size_bytes=104_857_600,
+        sha256="0" * 64,
+    ),
+    expires_at=datetime(2026, 7, 3, 12, 0, tzinfo=UTC),
+)
+
+
+class TestValkeyDirectUploadSessionStorage:
+    async def test_round_trips_session_under_namespace_with_ttl(self) -> None:
+        client = FakeValkey()
+        storage = ValkeyDirectUploadSessionStorage(
+            valkey=client,  # type: ignore[arg-type]
+            namespace="DIRECT_UPLOAD_SESSIONS",
+        )
+
+        await storage.save_session(session=SESSION, ttl_seconds=7_200)
+
+        assert client.expirations == {"DIRECT_UPLOAD_SESSIONS:session-id": 7_200}
+        assert await storage.take_session(session_id="session-id") == SESSION
+
+    async def test_session_can_be_taken_only_once(self) -> None:
+        storage = ValkeyDirectUploadSessionStorage(
+            valkey=FakeValkey(),  # type: ignore[arg-type]
+            namespace="DIRECT_UPLOAD_SESSIONS",
+        )
+        await storage.save_session(session=SESSION, ttl_seconds=7_200)
+
+        await storage.take_session(session_id="session-id")
+
+        assert await storage.take_session(session_id="session-id") is None
@@ -0,0 +1,57 @@
+from valkey.exceptions import ConnectionError as ValkeyConnectionError
+
+from infra.valkey.storages import ValkeyResumeExportCache
+
+
+class FakeValkey:
+    def __init__(self, *, available: bool = True) -> None:
+        self.available = available
+        self.values: dict[str, bytes] = {}
+        self.expirations: dict[str, int] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        if not self.available:
+            raise ValkeyConnectionError
+        return self.values.get(name)
+
+    async def set(self, name: str, value: bytes, *, ex: int) -> None:
+        if not self.available:
+            raise ValkeyConnectionError
+        self.values[name] = value
+        self.expirations[name] = ex
+
+
+def build_cache(*, valkey: FakeValkey) -> ValkeyResumeExportCache:
+    return ValkeyResumeExportCache(
+        valkey=valkey,  # type: ignore[arg-type]
+        namespace="RESUME_EXPORTS",
+        ttl_seconds=86_400,
+        max_size_bytes=8,
+    )
+
+
+class TestValkeyResumeExportCache:
+    async def test_round_trips_content_under_namespace_with_ttl(self) -> None:
+        valkey = FakeValkey()
+        cache = build_cache(valkey=valkey)
+
+        await cache.save_content(key="digest", content=b"%PDF")
+
+        assert valkey.expirations == {"RESUME_EXPORTS:digest": 86_400}
+        assert await cache.get_content(key="digest") == b"%PDF"
+        assert await cache.get_content(key="other") is None
+
+    async def test_skips_documents_above_size_limit(self) -> None:
+        valkey = FakeValkey()
+        cache = build_cache(valkey=valkey)
+
+        await cache.save_content(key="digest", content=b"123456789")
+
+        assert valkey.values == {}
+
+    async def test_outage_falls_back_to_cache_miss(self) -> None:
+        cache = build_cache(valkey=FakeValkey(available=False))
+
+        await cache.save_content(key="digest", content=b"%PDF")
+
+        assert await cache.get_content(key="digest") is None
@@ -0,0 +1,121 @@
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from core.sitemaps.schemas import SitemapDocument
+from infra.valkey.storages import ValkeySitemapStorage
+
+LAST_MODIFIED = datetime(2026, 3, 4, 5, 6, 7, tzinfo=UTC)
+
+
+type Command = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+class FakePipeline:
+    def __init__(self, *, apply: Callable[[list[Command]], None]) -> None:
+        self.apply = apply
+        self.commands: list[Command] = []
+
+    def hset(self, name: str, *, mapping: dict[str, str | bytes]) -> None:
+        self.commands.append(("hset", (name,), {"mapping": mapping}))
+
+    def delete(self, name: str) -> None:
+        self.commands.append(("delete", (name,), {}))
+
+    def sadd(self, name: str, *values: str) -> None:
+        self.commands.append(("sadd", (name, *values), {}))
+
+    async def execute(self) -> None:
+        self.apply(self.commands)
+
+
+class FakeValkey:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.executed_pipelines = 0
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(name, {}))
+
+    async def smembers(self, name: str) -> set[bytes]:
+        return set(self.sets.get(name, set()))
+
+    def pipeline(self, *, transaction: bool) -> FakePipeline:
+        assert transaction
+        return FakePipeline(apply=self.apply)
+
+    def apply(self, commands: list[Command]) -> None:
+        self.executed_pipelines += 1
+        for command, args, kwargs in commands:
+            getattr(self, f"apply_{command}")(*args, **kwargs)
+
+    def apply_hset(self, name: str, *, mapping: dict[str, str | bytes]) -> None:
+        self.hashes.setdefault(name, {}).update(
+            {
+                key.encode(): value if isinstance(value, bytes) else value.encode()
+                for key, value in mapping.items()
+            },
+        )
+
+    def apply_delete(self, name: str) -> None:
+        self.hashes.pop(name, None)
+        self.sets.pop(name, None)
+
+    def apply_sadd(self, name: str, *values: str) -> None:
+        self.sets.setdefault(name, set()).update(value.encode() for value in values)
+
+
+def build_storage(*, valkey: FakeValkey) -> ValkeySitemapStorage:
+    return ValkeySitemapStorage(
+        valkey=valkey,  # type: ignore[arg-type]
+        namespace="SITEMAPS",
+    )
+
+
+def build_document(*, name: str, content: bytes = b"\x1f\x8bcontent") -> SitemapDocument:
+    return SitemapDocument(
+        name=name,
+        content=content,
+        entity_tag=f'W/"{name}"',
+        last_modified=LAST_MODIFIED,
+    )
+
+
+class TestValkeySitemapStorage:
+    async def test_returns_none_for_missing_document(self) -> None:
+        storage = build_storage(valkey=FakeValkey())
+
+        assert await storage.get_document(name="sitemap.xml") is None
+
+    async def test_round_trips_compressed_bytes_and_validators(self) -> None:
+        valkey = FakeValkey()
+        storage = build_storage(valkey=valkey)
+        document = build_document(name="sitemap.xml")
+
+        await storage.replace_documents(documents=[document])
+
+        assert await storage.get_document(name="sitemap.xml") == document
+        assert valkey.executed_pipelines == 1
+
+    async def test_replacing_documents_drops_stale_pages(self) -> None:
+        valkey = FakeValkey()
+        storage = build_storage(valkey=valkey)
+        await storage.replace_documents(
+            documents=[
+                build_document(name="sitemap-1.xml"),
+                build_document(name="sitemap-2.xml"),
+                build_document(name="sitemap.xml"),
+            ],
+        )
+
+        await storage.replace_documents(
+            documents=[build_document(name="sitemap.xml", content=b"single")],
+        )
+
+        assert await storage.get_document(name="sitemap-1.xml") is None
+        assert await storage.get_document(name="sitemap-2.xml") is None
+        document = await storage.get_document(name="sitemap.xml")
+        assert document is not None
+        assert document.content == b"single"
+        assert valkey.sets["SITEMAPS:names"] == {b"sitemap.xml"}
@@ -0,0 +1,43 @@
+from typing import Any, cast
+from unittest.mock import Mock
+
+from core.articles.storages import ArticleViewCounterBuffer
+from core.articles.use_cases import ArticleAnalyticsUseCase
+from entrypoints.taskiq.articles import tasks as article_tasks_module
+from infra.post_commit_actions import PostCommitActions
+
+
+async def test_article_view_counter_flush_acknowledges_batch_after_commit() -> None:
+    use_case = Mock(spec=ArticleAnalyticsUseCase)
+    use_case.flush_view_counters.return_value = 4
+    view_counter_buffer = Mock(spec=ArticleViewCounterBuffer)
+    post_commit_actions = PostCommitActions(actions=[])
+
+    injected_func = cast("Any", article_tasks_module.flush_article_view_counters.original_func)
+    result = await injected_func.__dishka_orig_func__(
+        use_case=use_case,
+        view_counter_buffer=view_counter_buffer,
+        post_commit_actions=post_commit_actions,
+    )
+
+    assert result == {"flushedCount": 4}
+    view_counter_buffer.acknowledge_pending.assert_not_called()
+    await post_commit_actions.run()
+    view_counter_buffer.acknowledge_pending.assert_awaited_once_with()
+
+
+async def test_article_view_counter_flush_without_claimed_batch_does_not_acknowledge() -> None:
+    use_case = Mock(spec=ArticleAnalyticsUseCase)
+    use_case.flush_view_counters.return_value = 0
+    view_counter_buffer = Mock(spec=ArticleViewCounterBuffer)
+    post_commit_actions = PostCommitActions(actions=[])
+
+    injected_func = cast("Any", article_tasks_module.flush_article_view_counters.original_func)
+    await injected_func.__dishka_orig_func__(
+        use_case=use_case,
+        view_counter_buffer=view_counter_buffer,
+        post_commit_actions=post_commit_actions,
+    )
+    await post_commit_actions.run()
+
+    view_counter_buffer.acknowledge_pending.assert_not_called()
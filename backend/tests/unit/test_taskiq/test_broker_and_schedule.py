@@ -12,9 +12,11 @@ from core.agent_access.use_cases import AgentAuditCleanupUseCase
 from entrypoints.taskiq import broker as taskiq_broker_module
 from entrypoints.taskiq import worker as taskiq_worker_module
 from entrypoints.taskiq.agent_access import tasks as agent_access_tasks_module
+from entrypoints.taskiq.articles import tasks as article_tasks_module
 from entrypoints.taskiq.auth import tasks as auth_tasks_module
 from entrypoints.taskiq.cache_warm import tasks as cache_warm_tasks_module
 from entrypoints.taskiq.files import tasks as file_tasks_module
+from entrypoints.taskiq.sitemaps import tasks as sitemap_tasks_module
 from infra.config.constants import constants
 from infra.config.settings import settings
 
@@ -133,6 +135,28 @@ class TestTaskiqScheduleConfiguration:
         ]
         assert "cron" not in schedule[0]
 
+    def test_article_view_counter_flush_has_exactly_one_interval_schedule(self) -> None:
+        schedule = article_tasks_module.flush_article_view_counters.labels["schedule"]
+
+        assert schedule == [
+            {
+                "schedule_id": "article_view_counter_flush",
+                "interval": settings.taskiq.article_view_counter_flush_interval_seconds,
+            },
+        ]
+        assert "cron" not in schedule[0]
+
+    def test_sitemap_refresh_has_exactly_one_interval_schedule(self) -> None:
+        schedule = sitemap_tasks_module.refresh_sitemap.labels["schedule"]
+
+        assert schedule == [
+            {
+                "schedule_id": "sitemap_refresh",
+                "interval": settings.taskiq.sitemap_refresh_interval_seconds,
+            },
+        ]
+        assert "cron" not in schedule[0]
+
     def test_tasks_use_dishka_taskiq_middleware(self) -> None:
         assert any(
             isinstance(middleware, dishka_taskiq.ContainerMiddleware)
@@ -170,3 +194,13 @@ class TestTaskiqScheduleConfiguration:
             taskiq_worker_module.broker.find_task(constants.taskiq.file_orphan_prune_task_name)
             is file_tasks_module.prune_file_orphans
         )
+        assert (
+            taskiq_worker_module.broker.find_task(
+                constants.taskiq.article_view_counter_flush_task_name,
+            )
+            is article_tasks_module.flush_article_view_counters
+        )
+        assert (
+            taskiq_worker_module.broker.find_task(constants.taskiq.sitemap_refresh_task_name)
+            is sitemap_tasks_module.refresh_sitemap
+        )
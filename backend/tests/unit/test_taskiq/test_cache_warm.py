@@ -1,3 +1,6 @@
+import hashlib
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import cast
@@ -6,16 +9,26 @@ import msgspec
 import pytest
 from litestar.stores.base import Store
 
+from core.articles.exceptions import ArticleNotFoundError
 from core.articles.schemas import ArticleFilters, ArticleTree
 from core.articles.use_cases import ArticlesUseCase
 from core.competency_matrix.schemas import (
     CompetencyMatrixItemBySlugGetParams,
     CompetencyMatrixItemFilters,
+    CompetencyMatrixItemGetParams,
 )
 from core.competency_matrix.use_cases import CompetencyMatrixUseCase
 from core.i18n.enums import LanguageEnum
 from entrypoints.litestar.api.articles.schemas import ArticleDetailResponseSchema
-from entrypoints.litestar.response_cache import ResponseCacheDomain, ResponseCacheDomainStore
+from entrypoints.litestar.response_cache import (
+    ResponseCacheCollection,
+    ResponseCacheDependencies,
+    ResponseCacheDomain,
+    ResponseCacheDomainStore,
+    ResponseCacheEntry,
+    ResponseCacheValue,
+)
+from entrypoints.taskiq.cache_warm.scopes import CacheWarmCollectorScopes
 from entrypoints.taskiq.cache_warm.service import CacheWarmSummary, ResponseCacheWarmService
 from entrypoints.taskiq.cache_warm.targets import (
     ArticlesCacheWarmTargetCollector,
@@ -25,7 +38,7 @@ from entrypoints.taskiq.cache_warm.targets import (
     I18nCacheWarmTargetCollector,
     ResponseCacheWarmTargetCollector,
 )
-from entrypoints.taskiq.cache_warm.writer import ResponseCacheWarmWriter
+from entrypoints.taskiq.cache_warm.writer import CacheWarmTimings, ResponseCacheWarmWriter
 from infra.config.constants import constants
 from infra.config.settings import settings
 from tests.helpers.factory import FactoryHelper
@@ -62,6 +75,41 @@ class FakeStore:
         return 60 if key in self.values else None
 
 
+@dataclass
+class FakeBatchStore:
+    batches: list[list[ResponseCacheEntry]] = field(default_factory=list)
+
+    async def set_many(self, *, entries: list[ResponseCacheEntry], expires_in: int) -> None:
+        assert expires_in == constants.response_cache.default_ttl_seconds
+        self.batches.append(entries)
+
+
+@dataclass
+class FakeCollectorScopes(CacheWarmCollectorScopes):
+    collector: ResponseCacheWarmTargetCollector
+    opened: int = 0
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[ResponseCacheWarmTargetCollector]:
+        self.opened += 1
+        yield self.collector
+
+
+@dataclass
+class FakeClock:
+    step: float = 0.001
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+async def stream_targets(targets: Iterable[CacheWarmTarget]) -> AsyncIterator[CacheWarmTarget]:
+    for target in targets:
+        yield target
+
+
 class FakeArticlesUseCase:
     def __init__(self, factory: FactoryHelper) -> None:
         self.factory = factory
@@ -69,6 +117,7 @@ class FakeArticlesUseCase:
         self.list_tree_languages: list[LanguageEnum] = []
         self.list_tags_calls: list[tuple[LanguageEnum, bool]] = []
         self.detail_slugs: list[str] = []
+        self.detail_chunk_sizes: list[int] = []
         self.articles = [
             factory.core.article(slug="first-article"),
             factory.core.article(slug="second-article"),
@@ -92,9 +141,17 @@ class FakeArticlesUseCase:
         self.list_tags_calls.append((language, only_with_published_articles))
         return self.factory.core.tags(values=[self.factory.core.tag(tag_id=1)])
 
+    async def iter_published_articles(self, *, chunk_size: int):
+        for start in range(0, len(self.articles), chunk_size):
+            chunk = self.articles[start : start + chunk_size]
+            self.detail_chunk_sizes.append(len(chunk))
+            yield chunk
+
     async def get_article(self, *, slug: str, only_published: bool):
         assert only_published is True
         self.detail_slugs.append(slug)
+        if slug == "missing-article":
+            raise ArticleNotFoundError
         return self.factory.core.article(slug=slug)
 
 
@@ -117,9 +174,10 @@ class FakeCompetencyMatrixUseCase:
                 sheet="Python",
             ),
         ]
+        self.sheets = factory.core.sheets(values=["Python"])
 
     async def list_sheets(self):
-        return self.factory.core.sheets(values=["Python"])
+        return self.sheets
 
     async def list_items(self, *, filters: CompetencyMatrixItemFilters):
         self.list_items_filters.append(filters)
@@ -130,6 +188,9 @@ class FakeCompetencyMatrixUseCase:
         self.public_detail_slugs.append(params.slug)
         return next(item for item in self.items if item.slug == params.slug)
 
+    async def get_item(self, *, params: CompetencyMatrixItemGetParams):
+        return next(item for item in self.items if item.id == params.item_id)
+
 
 class TestCacheWarmTargetGeneration(TestCase):
     async def test_collects_canonical_targets_for_both_languages(
@@ -152,13 +213,16 @@ class TestCacheWarmTargetGeneration(TestCase):
             ),
         )
 
-        targets = await collector.collect(
-            domains=(
-                ResponseCacheDomain.I18N,
-                ResponseCacheDomain.ARTICLES,
-                ResponseCacheDomain.COMPETENCY_MATRIX,
-            ),
-        )
+        targets = [
+            target
+            async for target in collector.collect(
+                domains=(
+                    ResponseCacheDomain.I18N,
+                    ResponseCacheDomain.ARTICLES,
+                    ResponseCacheDomain.COMPETENCY_MATRIX,
+                ),
+            )
+        ]
         target_paths = {(target.domain, target.path, target.query) for target in targets}
 
         for language in LanguageEnum:
@@ -258,15 +322,136 @@ class TestCacheWarmTargetGeneration(TestCase):
             ),
         )
 
-        targets = await collector.collect(
-            domains=(ResponseCacheDomain.ARTICLES,),
-        )
+        targets = [
+            target
+            async for target in collector.collect(
+                domains=(ResponseCacheDomain.ARTICLES,),
+            )
+        ]
 
         assert {target.domain for target in targets} == {ResponseCacheDomain.ARTICLES}
         assert articles_use_case.list_articles_filters
         assert matrix_use_case.list_items_filters == []
 
 
+class TestCacheWarmDependencyTargets(TestCase):
+    def create_collector(
+        self,
+        *,
+        articles_use_case: FakeArticlesUseCase,
+        matrix_use_case: FakeCompetencyMatrixUseCase,
+    ) -> ResponseCacheWarmTargetCollector:
+        query_builder = CacheWarmQueryBuilder()
+        return ResponseCacheWarmTargetCollector(
+            i18n_collector=I18nCacheWarmTargetCollector(),
+            articles_collector=ArticlesCacheWarmTargetCollector(
+                articles_use_case=cast("ArticlesUseCase", articles_use_case),
+                query_builder=query_builder,
+            ),
+            matrix_collector=CompetencyMatrixCacheWarmTargetCollector(
+                matrix_use_case=cast("CompetencyMatrixUseCase", matrix_use_case),
+                query_builder=query_builder,
+            ),
+        )
+
+    async def test_article_mutation_rewarms_collections_and_touched_details_only(self) -> None:
+        articles_use_case = FakeArticlesUseCase(factory=self.factory)
+        collector = self.create_collector(
+            articles_use_case=articles_use_case,
+            matrix_use_case=FakeCompetencyMatrixUseCase(factory=self.factory),
+        )
+
+        targets = [
+            target
+            async for target in collector.collect_dependencies(
+                domain=ResponseCacheDomain.ARTICLES,
+                dependencies=ResponseCacheDependencies.for_article_mutation(
+                    slugs=("first-article", "missing-article"),
+                ),
+            )
+        ]
+
+        assert sorted({target.path for target in targets}) == [
+            "/api/articles",
+            "/api/articles/detail/first-article",
+            "/api/articles/tags",
+            "/api/articles/tree",
+        ]
+        assert len(targets) == 4 * len(LanguageEnum)
+        assert articles_use_case.detail_slugs == ["first-article", "missing-article"]
+        detail_target = next(target for target in targets if "/detail/" in target.path)
+        assert detail_target.dependencies.article_slugs == {"first-article"}
+
+    async def test_tag_only_dependencies_skip_tree_and_details(self) -> None:
+        articles_use_case = FakeArticlesUseCase(factory=self.factory)
+        collector = self.create_collector(
+            articles_use_case=articles_use_case,
+            matrix_use_case=FakeCompetencyMatrixUseCase(factory=self.factory),
+        )
+
+        targets = [
+            target
+            async for target in collector.collect_dependencies(
+                domain=ResponseCacheDomain.ARTICLES,
+                dependencies=ResponseCacheDependencies(tag_ids=frozenset({"tag-id"})),
+            )
+        ]
+
+        assert {target.path for target in targets} == {"/api/articles", "/api/articles/tags"}
+        assert articles_use_case.list_tree_languages == []
+        assert articles_use_case.detail_slugs == []
+
+    async def test_matrix_item_mutation_rewarms_its_sheet_and_detail_only(self) -> None:
+        matrix_use_case = FakeCompetencyMatrixUseCase(factory=self.factory)
+        collector = self.create_collector(
+            articles_use_case=FakeArticlesUseCase(factory=self.factory),
+            matrix_use_case=matrix_use_case,
+        )
+        item = matrix_use_case.items[0]
+
+        targets = [
+            target
+            async for target in collector.collect_dependencies(
+                domain=ResponseCacheDomain.COMPETENCY_MATRIX,
+                dependencies=ResponseCacheDependencies(matrix_item_ids=frozenset({item.id})),
+            )
+        ]
+
+        assert {target.path for target in targets} == {
+            "/api/competency-matrix/items",
+            "/api/competency-matrix/items/public/first-question",
+        }
+        assert matrix_use_case.public_detail_slugs == ["first-question", "first-question"]
+        items_target = next(target for target in targets if target.path.endswith("/items"))
+        assert items_target.dependencies.collections == {ResponseCacheCollection.MATRIX_ITEMS}
+        assert items_target.dependencies.matrix_sheet_keys == {"python"}
+
+    async def test_lowered_sheet_key_rewarms_sheet_under_its_stored_key(self) -> None:
+        matrix_use_case = FakeCompetencyMatrixUseCase(factory=self.factory)
+        matrix_use_case.sheets = self.factory.core.sheets(
+            values=[self.factory.core.sheet(key="Python")],
+        )
+        collector = self.create_collector(
+            articles_use_case=FakeArticlesUseCase(factory=self.factory),
+            matrix_use_case=matrix_use_case,
+        )
+
+        targets = [
+            target
+            async for target in collector.collect_dependencies(
+                domain=ResponseCacheDomain.COMPETENCY_MATRIX,
+                dependencies=ResponseCacheDependencies(matrix_sheet_keys=frozenset({"python"})),
+            )
+        ]
+
+        assert {target.query for target in targets} == {
+            (("language", language.value), ("sheetKey", "Python")) for language in LanguageEnum
+        }
+        assert {target.dependencies.matrix_sheet_keys for target in targets} == {
+            frozenset({"python"}),
+        }
+
+
 class TestCacheWarmWriter(TestCase):
     async def test_writes_litestar_compatible_payload_to_domain_store(self) -> None:
         articles_store = FakeStore()
@@ -286,7 +471,7 @@ class TestCacheWarmWriter(TestCase):
 
         await ResponseCacheWarmWriter(
             store=store,
-        ).write_target(target)
+        ).write_stream(stream_targets([target]), timings=CacheWarmTimings(clock=FakeClock()))
 
         assert target.build_cache_key() == (
             "articles:GET/api/articles/detail/first-articlelanguage=en"
@@ -295,16 +480,24 @@ class TestCacheWarmWriter(TestCase):
         assert articles_store.set_calls[0][2] == constants.response_cache.default_ttl_seconds
         payload = articles_store.set_calls[0][1]
         assert isinstance(payload, bytes)
-        messages = msgspec.msgpack.decode(payload)
+        body = response.model_dump_json(by_alias=True).encode()
+        cached_value = ResponseCacheValue.from_stored(payload)
+        entity_tag = f'"{hashlib.sha256(body).hexdigest()}"'
+        assert cached_value.entity_tag == entity_tag
+        messages = msgspec.msgpack.decode(cached_value.messages)
         assert messages == [
             {
                 "type": "http.response.start",
                 "status": 200,
-                "headers": [[b"content-type", b"application/json"]],
+                "headers": [
+                    [b"content-type", b"application/json"],
+                    [b"content-length", str(len(body)).encode()],
+                    [b"etag", entity_tag.encode()],
+                ],
             },
             {
                 "type": "http.response.body",
-                "body": response.model_dump_json(by_alias=True).encode(),
+                "body": body,
             },
         ]
 
@@ -361,6 +554,135 @@ class TestCacheWarmWriter(TestCase):
         )
 
         assert summary == CacheWarmSummary(attempted=0, written=0, skipped=1)
-        assert summary.as_dict() == {"attempted": 0, "written": 0, "skipped": 1}
+        assert summary.as_dict() == {
+            "attempted": 0,
+            "written": 0,
+            "skipped": 1,
+            "collect_ms": 0,
+            "write_ms": 0,
+        }
         assert articles_use_case.list_articles_filters == []
         assert matrix_use_case.list_items_filters == []
+
+    async def test_write_stream_flushes_fixed_size_batches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(constants.response_cache, "warm_write_batch_size", 2)
+        store = FakeBatchStore()
+        targets = [
+            CacheWarmTarget(
+                domain=ResponseCacheDomain.I18N,
+                path=f"/api/i18n/bundles/{language}",
+                query=(),
+                response=ArticleDetailResponseSchema.from_domain_schema(
+                    schema=self.factory.core.article(slug="first-article"),
+                    language=LanguageEnum.EN,
+                ),
+            )
+            for language in ("en", "ru", "de")
+        ]
+
+        timings = CacheWarmTimings(clock=FakeClock())
+        written = await ResponseCacheWarmWriter(
+            store=cast("ResponseCacheDomainStore", store),
+        ).write_stream(stream_targets(targets), timings=timings)
+
+        assert written == 3
+        assert timings.write_ms > 0
+        assert sorted(len(batch) for batch in store.batches) == [1, 2]
+        assert {entry.key for batch in store.batches for entry in batch} == {
+            target.build_cache_key() for target in targets
+        }
+
+    async def test_phase_timing_is_wall_clock_span_of_concurrent_tasks(self) -> None:
+        clock = FakeClock(step=0)
+        timings = CacheWarmTimings(clock=clock)
+        first_flush = timings.measure_write()
+        second_flush = timings.measure_write()
+
+        await first_flush.__aenter__()
+        clock.now = 1
+        await second_flush.__aenter__()
+        clock.now = 3
+        await first_flush.__aexit__(None, None, None)
+        clock.now = 4
+        await second_flush.__aexit__(None, None, None)
+
+        assert timings.write_ms == 4_000
+        assert timings.collect_ms == 0
+
+    async def test_collects_partitions_in_separate_scopes_and_reports_phase_timing(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings.cache_warm, "articles_page_size", 10)
+        articles_use_case = FakeArticlesUseCase(factory=self.factory)
+        matrix_use_case = FakeCompetencyMatrixUseCase(factory=self.factory)
+        query_builder = CacheWarmQueryBuilder()
+        target_collector = ResponseCacheWarmTargetCollector(
+            i18n_collector=I18nCacheWarmTargetCollector(),
+            articles_collector=ArticlesCacheWarmTargetCollector(
+                articles_use_case=cast("ArticlesUseCase", articles_use_case),
+                query_builder=query_builder,
+            ),
+            matrix_collector=CompetencyMatrixCacheWarmTargetCollector(
+                matrix_use_case=cast("CompetencyMatrixUseCase", matrix_use_case),
+                query_builder=query_builder,
+            ),
+        )
+        scopes = FakeCollectorScopes(collector=target_collector)
+        store = FakeBatchStore()
+        service = ResponseCacheWarmService(
+            target_collector=target_collector,
+            writer=ResponseCacheWarmWriter(store=cast("ResponseCacheDomainStore", store)),
+            use_cache=True,
+            supported_domains=(ResponseCacheDomain.I18N, ResponseCacheDomain.ARTICLES),
+            collector_scopes=scopes,
+            clock=FakeClock(),
+        )
+
+        summary = await service.warm_all()
+
+        expected_targets = [
+            target
+            async for target in target_collector.collect(
+                domains=(ResponseCacheDomain.I18N, ResponseCacheDomain.ARTICLES),
+            )
+        ]
+        assert scopes.opened == 1 + len(LanguageEnum)
+        assert (summary.attempted, summary.written, summary.skipped) == (
+            len(expected_targets),
+            len(expected_targets),
+            0,
+        )
+        assert summary.collect_ms > 0
+        assert summary.write_ms > 0
+        assert sorted(entry.key for batch in store.batches for entry in batch) == sorted(
+            target.build_cache_key() for target in expected_targets
+        )
+
+    async def test_article_details_stream_in_keyset_chunks(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings.cache_warm, "articles_page_size", 10)
+        monkeypatch.setattr(constants.response_cache, "warm_detail_chunk_size", 1)
+        articles_use_case = FakeArticlesUseCase(factory=self.factory)
+        collector = ArticlesCacheWarmTargetCollector(
+            articles_use_case=cast("ArticlesUseCase", articles_use_case),
+            query_builder=CacheWarmQueryBuilder(),
+        )
+
+        targets = collector.collect_language(language=LanguageEnum.EN)
+        collection_paths = [(await anext(targets)).path for _ in range(3)]
+
+        assert collection_paths == ["/api/articles/tags", "/api/articles/tree", "/api/articles"]
+        assert articles_use_case.detail_chunk_sizes == []
+        detail_paths = [target.path async for target in targets]
+        assert detail_paths == [
+            "/api/articles/detail/first-article",
+            "/api/articles/detail/second-article",
+        ]
+        assert articles_use_case.detail_chunk_sizes == [1, 1]
+        assert articles_use_case.detail_slugs == []
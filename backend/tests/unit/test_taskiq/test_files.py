@@ -1,35 +1,99 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, call, patch
 
 from core.files.schemas import FileOrphanCleanupResult
-from core.files.services import FileOrphanCleanupService
+from core.files.services import FileOrphanCleanupService, FileVariantService
 from entrypoints.taskiq.files import tasks as file_tasks_module
+from infra.config.constants import constants
 from infra.config.settings import settings
+from tests.helpers.factories.core import CoreFactoryHelper
 
 
-async def test_file_orphan_prune_uses_retention_cutoff_and_returns_camel_case_counts() -> None:
+@dataclass
+class FakeFileOrphanCleanupScopes:
+    service: Mock
+    opened_count: int = 0
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[FileOrphanCleanupService]:
+        self.opened_count += 1
+        yield cast("FileOrphanCleanupService", self.service)
+
+
+async def test_file_orphan_prune_drains_batches_in_separate_scopes() -> None:
     current_datetime = datetime(2026, 8, 5, 12, 30, tzinfo=UTC)
     service = Mock(spec=FileOrphanCleanupService)
-    service.prune.return_value = FileOrphanCleanupResult(
-        scanned_count=4,
-        deleted_count=2,
-        failed_count=1,
-        skipped_in_use_count=1,
-    )
+    service.prune.side_effect = [
+        FileOrphanCleanupResult(
+            scanned_count=2,
+            deleted_count=1,
+            failed_count=0,
+            skipped_in_use_count=1,
+            has_more=True,
+        ),
+        FileOrphanCleanupResult(
+            scanned_count=1,
+            deleted_count=0,
+            failed_count=1,
+            skipped_in_use_count=0,
+        ),
+    ]
+    scopes = FakeFileOrphanCleanupScopes(service=service)
 
     injected_func = cast("Any", file_tasks_module.prune_file_orphans.original_func)
     result = await injected_func.__dishka_orig_func__(
-        service=service,
+        scopes=scopes,
         current_datetime=current_datetime,
     )
 
-    service.prune.assert_awaited_once_with(
-        cutoff=current_datetime - timedelta(seconds=settings.files.orphan_retention_seconds),
-    )
+    cutoff = current_datetime - timedelta(seconds=settings.files.orphan_retention_seconds)
+    assert service.prune.await_args_list == [call(cutoff=cutoff), call(cutoff=cutoff)]
+    assert scopes.opened_count == 2
     assert result == {
-        "scannedCount": 4,
-        "deletedCount": 2,
+        "batchCount": 2,
+        "scannedCount": 3,
+        "deletedCount": 1,
         "failedCount": 1,
         "skippedInUseCount": 1,
     }
+
+
+async def test_file_orphan_prune_stops_at_batch_limit() -> None:
+    service = Mock(spec=FileOrphanCleanupService)
+    service.prune.return_value = FileOrphanCleanupResult(
+        scanned_count=1,
+        deleted_count=1,
+        failed_count=0,
+        skipped_in_use_count=0,
+        has_more=True,
+    )
+    scopes = FakeFileOrphanCleanupScopes(service=service)
+
+    injected_func = cast("Any", file_tasks_module.prune_file_orphans.original_func)
+    with patch.object(constants.files, "orphan_cleanup_max_batches_per_run", 3):
+        result = await injected_func.__dishka_orig_func__(
+            scopes=scopes,
+            current_datetime=datetime(2026, 8, 5, 12, 30, tzinfo=UTC),
+        )
+
+    assert service.prune.await_count == 3
+    assert result["batchCount"] == 3
+    assert result["deletedCount"] == 3
+
+
+async def test_generate_file_variants_returns_camel_case_variant_count() -> None:
+    service = Mock(spec=FileVariantService)
+    service.generate_variants.return_value = (
+        CoreFactoryHelper.file_variant(mime_type="image/avif"),
+        CoreFactoryHelper.file_variant(),
+    )
+
+    injected_func = cast("Any", file_tasks_module.generate_file_variants.original_func)
+    result = await injected_func.__dishka_orig_func__(file_id="file-id", service=service)
+
+    service.generate_variants.assert_awaited_once_with(file_id="file-id")
+    assert result == {"variantCount": 2}
@@ -0,0 +1,102 @@
+import gzip
+from datetime import UTC, datetime
+from typing import Any, cast
+from unittest.mock import Mock
+
+import pytest
+
+from core.articles.schemas import PublishedArticleForSeo, PublishedArticlesForSeo
+from core.articles.use_cases import ArticlesUseCase
+from core.competency_matrix.schemas import PublishedCompetencyMatrixItemsForSeo
+from core.competency_matrix.use_cases import CompetencyMatrixUseCase
+from core.enums import PublishStatusEnum
+from core.sitemaps.schemas import SitemapDocument
+from core.sitemaps.storages import SitemapStorage
+from entrypoints.litestar.public.sitemaps import SitemapPublisher
+from entrypoints.taskiq.sitemaps import tasks as sitemap_tasks_module
+from infra.config.constants import constants
+
+CURRENT_DATETIME = datetime(2026, 3, 4, 5, 6, 7, 891, tzinfo=UTC)
+
+
+def build_publisher(*, article_slugs: list[str]) -> tuple[SitemapPublisher, Mock]:
+    articles_use_case = Mock(spec=ArticlesUseCase)
+    articles_use_case.list_published_articles_for_seo.return_value = PublishedArticlesForSeo(
+        values=[
+            PublishedArticleForSeo(
+                slug=slug,
+                publish_status=PublishStatusEnum.PUBLISHED,
+                updated_at=CURRENT_DATETIME,
+            )
+            for slug in article_slugs
+        ],
+    )
+    matrix_use_case = Mock(spec=CompetencyMatrixUseCase)
+    matrix_use_case.list_published_items_for_seo.return_value = (
+        PublishedCompetencyMatrixItemsForSeo(values=[])
+    )
+    storage = Mock(spec=SitemapStorage)
+    storage.get_document.return_value = None
+    publisher = SitemapPublisher(
+        articles_use_case=articles_use_case,
+        matrix_use_case=matrix_use_case,
+        storage=storage,
+    )
+    return publisher, storage
+
+
+def stored_documents(storage: Mock) -> list[SitemapDocument]:
+    return cast("list[SitemapDocument]", storage.replace_documents.await_args.kwargs["documents"])
+
+
+async def test_refresh_sitemap_task_stores_a_single_compressed_urlset() -> None:
+    publisher, storage = build_publisher(article_slugs=["typed-articles"])
+
+    injected_func = cast("Any", sitemap_tasks_module.refresh_sitemap.original_func)
+    result = await injected_func.__dishka_orig_func__(
+        publisher=publisher,
+        current_datetime=CURRENT_DATETIME,
+    )
+
+    assert result == {"documentCount": 1}
+    [document] = stored_documents(storage)
+    assert document.name == constants.sitemaps.index_name
+    assert document.entity_tag.startswith('W/"')
+    assert document.last_modified == CURRENT_DATETIME.replace(microsecond=0)
+    content = gzip.decompress(document.content).decode()
+    assert content.startswith('<?xml version="1.0" encoding="UTF-8"?>')
+    assert "<urlset" in content
+    assert "/articles/typed-articles</loc>" in content
+
+
+async def test_refresh_splits_large_sitemaps_into_pages_and_an_index(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(constants.sitemaps, "max_urls_per_sitemap", 4)
+    publisher, storage = build_publisher(article_slugs=["first", "second", "third"])
+
+    documents = await publisher.refresh(current_datetime=CURRENT_DATETIME)
+
+    assert documents == stored_documents(storage)
+    names = [document.name for document in documents]
+    pages = [gzip.decompress(document.content).decode() for document in documents[:-1]]
+    index = gzip.decompress(documents[-1].content).decode()
+    assert names[-1] == constants.sitemaps.index_name
+    assert names[:-1] == [f"sitemap-{page}.xml" for page in range(1, len(names))]
+    assert all(page.count("<url>") <= 4 for page in pages)
+    assert sum(page.count("<url>") for page in pages) > 4
+    assert "<sitemapindex" in index
+    for page in range(1, len(names)):
+        assert f"<loc>http://localhost:8000/sitemap.xml?page={page}</loc>" in index
+
+
+async def test_refresh_keeps_last_modified_for_unchanged_content() -> None:
+    publisher, storage = build_publisher(article_slugs=["typed-articles"])
+    [previous] = await publisher.refresh(current_datetime=CURRENT_DATETIME)
+    storage.get_document.return_value = previous
+
+    [document] = await publisher.refresh(
+        current_datetime=datetime(2026, 3, 5, tzinfo=UTC),
+    )
+
+    assert document == previous
@@ -95,6 +95,8 @@ require_environment() {
         "TASKIQ_AGENT_AUDIT_PRUNE_INTERVAL_SECONDS"
         "TASKIQ_CACHE_WARM_INTERVAL_SECONDS"
         "TASKIQ_FILE_ORPHAN_PRUNE_INTERVAL_SECONDS"
+        "TASKIQ_ARTICLE_VIEW_COUNTER_FLUSH_INTERVAL_SECONDS"
+        "TASKIQ_SITEMAP_REFRESH_INTERVAL_SECONDS"
         "TASKIQ_RESULT_EXPIRE_SECONDS"
         "CACHE_WARM_ARTICLES_PAGE_SIZE"
         "LE_EMAIL"
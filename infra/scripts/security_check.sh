@@ -334,6 +334,8 @@ export_test_runtime_environment() {
     export TASKIQ_AGENT_AUDIT_PRUNE_INTERVAL_SECONDS="86400"
     export TASKIQ_CACHE_WARM_INTERVAL_SECONDS="3600"
     export TASKIQ_FILE_ORPHAN_PRUNE_INTERVAL_SECONDS="86400"
+    export TASKIQ_ARTICLE_VIEW_COUNTER_FLUSH_INTERVAL_SECONDS="60"
+    export TASKIQ_SITEMAP_REFRESH_INTERVAL_SECONDS="3600"
     export TASKIQ_RESULT_EXPIRE_SECONDS="3600"
     export VALKEY_HOST="valkey"
     export VALKEY_PORT="6379"